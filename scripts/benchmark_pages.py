@@ -0,0 +1,276 @@
+#!/usr/bin/env python
+"""
+Benchmark what a rerun of each session page costs.
+
+Loads every session*/Home.py and session*/pages/*.py with Streamlit's
+AppTest and replays a fixed script of reruns: the first render, a switch to
+each tab_router section, and in every section a change to the first few
+sliders and select boxes and a click on the first few buttons. Login is
+bypassed. For each rerun it records the wall time (median over --repeat
+passes), the peak memory allocated while it ran (tracemalloc, in a separate
+pass so tracing does not skew the timings) and the size of the delta
+messages sent to the browser.
+
+Results are compared against a stored baseline and the script exits with
+status 1 when a rerun got slower, heavier or larger than the baseline by
+more than --tolerance. Record the baseline on the machine that runs the
+comparison, since wall times do not carry over between machines.
+
+Each page runs in its own interpreter, so imports and caches of one page
+do not leak into the next.
+
+Usage:
+    python scripts/benchmark_pages.py [--repeat 3] [--tolerance 0.25] [--json] [PAGE ...]
+    python scripts/benchmark_pages.py --save-baseline [PAGE ...]
+"""
+
+import argparse
+import gc
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+BASELINE_FILE = REPO_DIR / "benchmarks" / "page_baseline.json"
+
+# Widgets of each kind driven per section, in page order
+WIDGETS_PER_KIND = 2
+BUTTONS_PER_SECTION = 3
+
+# Differences below these are noise, whatever the relative change
+NOISE_FLOOR = {"seconds": 0.05, "peak_kib": 512, "delta_bytes": 1024}
+
+
+def _patch_runtime() -> Callable[[], int]:
+    """Prepare AppTest for running the session pages outside a server.
+
+    Bypasses the Cognito login, gives st.context a host header, and hooks
+    the local script runner so the delta payload of each run can be read.
+
+    Returns:
+        Function returning the delta bytes sent by the last run
+    """
+    import streamlit.runtime.context as context
+    from streamlit.testing.v1.local_script_runner import LocalScriptRunner
+
+    import utils.authenticate as authenticate
+
+    authenticate.login = lambda: True
+    context.ContextProxy.headers = property(lambda self: {"host": "localhost:8501"})
+
+    last_payload = [0]
+    forward_msgs = LocalScriptRunner.forward_msgs
+
+    def measured_forward_msgs(self):
+        msgs = forward_msgs(self)
+        last_payload[0] = sum(msg.ByteSize() for msg in msgs if msg.WhichOneof("type") == "delta")
+        return msgs
+
+    LocalScriptRunner.forward_msgs = measured_forward_msgs
+    return lambda: last_payload[0]
+
+
+def _tab_router(at) -> Optional[Any]:
+    """The page's tab_router control, if it has one."""
+    for widget in at.get("button_group"):
+        if (widget.key or "").startswith("_tab_router_") and not widget.key.endswith("_last"):
+            return widget
+    return None
+
+
+def _sections(router) -> List[str]:
+    """Section labels of a tab_router control, icons included, as the page defines them."""
+    return [f"{option.content_icon} {option.content}" if option.content_icon else option.content
+            for option in router.proto.options]
+
+
+def _interactions(at) -> List[tuple]:
+    """Widget changes replayed in the current section, as (step, action) pairs."""
+    steps = []
+    for index, slider in enumerate(at.main.slider[:WIDGETS_PER_KIND]):
+        if not isinstance(slider.value, (tuple, list)):
+            steps.append((f"slider {index + 1}: {slider.label}",
+                          lambda at, i=index: _move_slider(at.main.slider[i])))
+    for index, selectbox in enumerate(at.main.selectbox[:WIDGETS_PER_KIND]):
+        if len(selectbox.options) > 1:
+            steps.append((f"selectbox {index + 1}: {selectbox.label}",
+                          lambda at, i=index: at.main.selectbox[i].select_index(len(at.main.selectbox[i].options) - 1)))
+    for index, button in enumerate(at.main.button[:BUTTONS_PER_SECTION]):
+        steps.append((f"button {index + 1}: {button.label}", lambda at, i=index: at.main.button[i].click()))
+    return steps
+
+
+def _move_slider(slider):
+    """Move a slider to the other end of its range."""
+    return slider.set_value(slider.max if slider.value != slider.max else slider.min)
+
+
+def _replay(page: Path, payload: Callable[[], int], timeout: float) -> List[Dict[str, Any]]:
+    """Run one pass of the rerun script over a fresh session of the page."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(page), default_timeout=timeout)
+    steps: List[Dict[str, Any]] = []
+
+    def measure(step: str, action: Callable[[], Any]) -> bool:
+        gc.collect()
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        error = ""
+        try:
+            action()
+        except Exception as e:  # a widget that cannot be driven is reported, not fatal
+            error = f"{type(e).__name__}: {e}"
+        elapsed = time.perf_counter() - start
+        if not error and at.exception:
+            error = at.exception[0].message.strip().splitlines()[-1]
+        record = {"step": step, "seconds": elapsed, "delta_bytes": payload(), "error": error[:300]}
+        if tracemalloc.is_tracing():
+            record["peak_kib"] = (tracemalloc.get_traced_memory()[1] - baseline) / 1024
+        steps.append(record)
+        return not error
+
+    if not measure("initial render", at.run):
+        return steps
+
+    router = _tab_router(at)
+    sections = _sections(router) if router else [None]
+    for section in sections:
+        prefix = f"{section} / " if section else ""
+        if section and section != _tab_router(at).value:
+            if not measure(f"tab: {section}", lambda section=section: _tab_router(at).set_value(section).run()):
+                continue
+        for step, action in _interactions(at):
+            if not measure(prefix + step, lambda action=action: action(at).run()):
+                break
+    return steps
+
+
+def run_page(page: Path, repeat: int, timeout: float) -> Dict[str, Any]:
+    """Benchmark one page in the current interpreter.
+
+    Runs the rerun script ``repeat`` times for timings and payload sizes,
+    then once more under tracemalloc for peak memory.
+    """
+    app_dir = page.parent if page.name == "Home.py" else page.parent.parent
+    os.chdir(app_dir)
+    sys.path.insert(0, str(app_dir))
+    payload = _patch_runtime()
+
+    passes = [_replay(page, payload, timeout) for _ in range(repeat)]
+    tracemalloc.start()
+    traced = _replay(page, payload, timeout)
+    tracemalloc.stop()
+
+    peaks = {record["step"]: record["peak_kib"] for record in traced}
+    steps = []
+    for record in passes[-1]:
+        timings = [r["seconds"] for p in passes for r in p if r["step"] == record["step"]]
+        steps.append({
+            "step": record["step"],
+            "seconds": statistics.median(timings),
+            "peak_kib": peaks.get(record["step"], 0.0),
+            "delta_bytes": record["delta_bytes"],
+            "error": record["error"],
+        })
+    return {"page": str(page.relative_to(REPO_DIR)), "steps": steps}
+
+
+def benchmark_page(page: Path, repeat: int, timeout: float) -> Dict[str, Any]:
+    """Benchmark one page in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, __file__, "--run-page", str(page), "--repeat", str(repeat), "--timeout", str(timeout)],
+        capture_output=True, text=True,
+    )
+    lines = result.stdout.strip().splitlines()
+    if result.returncode or not lines:
+        error = (result.stderr.strip().splitlines() or ["no output"])[-1]
+        return {"page": str(page.relative_to(REPO_DIR)), "steps": [], "error": error}
+    return json.loads(lines[-1])
+
+
+def compare(reports: List[Dict[str, Any]], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Reruns that regressed against the baseline, as readable lines."""
+    regressions = []
+    for report in reports:
+        base_steps = {step["step"]: step for step in baseline.get(report["page"], {}).get("steps", [])}
+        for step in report["steps"]:
+            base = base_steps.get(step["step"])
+            if base is None:
+                continue
+            name = f"{report['page']} [{step['step']}]"
+            if step["error"] and not base["error"]:
+                regressions.append(f"{name}: now fails with {step['error']}")
+                continue
+            for metric, floor in NOISE_FLOOR.items():
+                before, after = base.get(metric, 0), step[metric]
+                if after - before > floor and after > before * (1 + tolerance):
+                    change = f"+{(after / before - 1) * 100:.0f}%" if before else "new"
+                    regressions.append(f"{name}: {metric} {before:.3f} -> {after:.3f} ({change})")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pages", nargs="*", help="Pages to benchmark (defaults to every session page)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed passes per page; the median is reported")
+    parser.add_argument("--timeout", type=float, default=60, help="Seconds allowed per rerun")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE, help="Baseline file to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Relative increase over the baseline reported as a regression")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    parser.add_argument("--run-page", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_page:
+        print(json.dumps(run_page(args.run_page.resolve(), args.repeat, args.timeout)))
+        return 0
+
+    pages = [Path(page).resolve() for page in args.pages] or (
+        sorted(REPO_DIR.glob("session*/Home.py")) + sorted(REPO_DIR.glob("session*/pages/*.py")))
+    reports = [benchmark_page(page, args.repeat, args.timeout) for page in pages]
+
+    if args.save_baseline:
+        baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+        baseline.update({report["page"]: {"steps": report["steps"]} for report in reports})
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"Saved {len(reports)} pages to {args.baseline}")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    regressions = compare(reports, baseline, args.tolerance)
+
+    if args.json:
+        print(json.dumps({"pages": reports, "regressions": regressions}, indent=2))
+        return 1 if regressions else 0
+
+    for report in reports:
+        print(report["page"])
+        if report.get("error"):
+            print(f"    error: {report['error']}")
+        for step in report["steps"]:
+            print(f"    {step['seconds']:6.3f}s {step['peak_kib'] / 1024:7.1f} MiB {step['delta_bytes'] / 1024:8.1f} KiB"
+                  f"  {step['step']}")
+            if step["error"]:
+                print(f"{'':36}error: {step['error']}")
+    reruns = sum(len(report["steps"]) for report in reports)
+    print(f"{len(reports)} pages, {reruns} reruns")
+    if not baseline:
+        print(f"No baseline at {args.baseline}; run with --save-baseline to record one")
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
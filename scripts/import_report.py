@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+"""
+Report what each session page costs to import on a cold worker.
+
+Runs the module-level code of every session*/Home.py and session*/pages/*.py
+(imports, constants and function definitions, but not main()) in a fresh
+interpreter with ``python -X importtime``, the way the first request after
+a deploy or worker restart does. Streamlit itself is imported beforehand,
+as the server has already loaded it by then. For each page it prints the time taken,
+the heavy libraries that were loaded eagerly, and the slowest top-level
+imports. Libraries deferred with common.lazy_import() only show up here if
+the page touches them at module level.
+
+Usage:
+    python scripts/import_report.py [--top 5] [--json] [PAGE ...]
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+# Libraries worth deferring; reported when a page loads them at import time
+HEAVY_MODULES = [
+    "pandas", "numpy", "pyarrow", "plotly.express", "plotly.graph_objects",
+    "plotly.subplots", "redis", "langchain_core", "langchain_aws", "langchain_community",
+]
+
+_RUNNER = """
+import json, os, runpy, sys, time
+import streamlit  # already loaded by the server before any page runs
+page, app_dir = sys.argv[1], sys.argv[2]
+os.chdir(app_dir)
+sys.path.insert(0, app_dir)
+before = set(sys.modules)
+start = time.perf_counter()
+error = ""
+try:
+    runpy.run_path(page, run_name="__import_report__")
+except Exception as e:
+    error = f"{type(e).__name__}: {e}"
+elapsed = time.perf_counter() - start
+heavy = [m for m in json.loads(sys.argv[3]) if m in sys.modules and m not in before]
+print(json.dumps({"seconds": elapsed, "eager": heavy, "error": error}))
+"""
+
+# Imported by the interpreter and the runner before the page runs
+_PRELOADED_MODULES = {"site", "encodings", "_frozen_importlib_external", "zipimport", "codecs", "io", "abc",
+                      "streamlit"}
+
+_IMPORTTIME = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)")
+
+
+def _slowest_imports(stderr: str, top: int) -> List[Dict[str, Any]]:
+    """Top-level imports from -X importtime output, slowest first."""
+    imports = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME.match(line)
+        if match and len(match.group(3)) == 1 and match.group(4) not in _PRELOADED_MODULES:
+            imports.append({"module": match.group(4), "seconds": int(match.group(2)) / 1e6})
+    imports.sort(key=lambda entry: entry["seconds"], reverse=True)
+    return imports[:top]
+
+
+def profile_page(page: Path, top: int) -> Dict[str, Any]:
+    """Import one page in a fresh interpreter and collect its import costs."""
+    app_dir = page.parent if page.name == "Home.py" else page.parent.parent
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _RUNNER, str(page), str(app_dir), json.dumps(HEAVY_MODULES)],
+        capture_output=True, text=True,
+    )
+    lines = result.stdout.strip().splitlines()
+    report = json.loads(lines[-1]) if lines else {"seconds": 0.0, "eager": [], "error": "no output"}
+    report["page"] = str(page.relative_to(REPO_DIR))
+    report["slowest"] = _slowest_imports(result.stderr, top)
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pages", nargs="*", help="Pages to profile (defaults to every session page)")
+    parser.add_argument("--top", type=int, default=5, help="Slowest top-level imports listed per page")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    pages = [Path(page).resolve() for page in args.pages] or (
+        sorted(REPO_DIR.glob("session*/Home.py")) + sorted(REPO_DIR.glob("session*/pages/*.py")))
+    reports = [profile_page(page, args.top) for page in pages]
+
+    if args.json:
+        print(json.dumps(reports, indent=2))
+        return 0
+
+    for report in reports:
+        eager = ", ".join(report["eager"]) or "none"
+        print(f"{report['seconds']:6.2f}s  {report['page']}")
+        print(f"         heavy modules loaded at import: {eager}")
+        for entry in report["slowest"]:
+            print(f"         {entry['seconds']:6.3f}s  {entry['module']}")
+        if report["error"]:
+            print(f"         error: {report['error']}")
+    total = sum(report["seconds"] for report in reports)
+    print(f"{len(reports)} pages, {total:.2f}s of import-time work")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,398 @@
+#!/usr/bin/env python
+"""
+Load-test a running session app with concurrent Streamlit sessions.
+
+Opens N websocket sessions against an app started by setup.sh (or
+``streamlit run``) and has each one replay an interaction trace, like a
+learner clicking through a page: switching tabs, moving sliders, picking
+options and clicking buttons, with a think time between steps. Each step
+sends the same rerun request the browser sends. Its latency is measured
+until the server reports that the rerun finished. Widgets inside
+common.fragment() calculators trigger fragment reruns, as they do in the
+browser.
+
+The test runs once per concurrency level. For each level it reports the
+p50/p95/p99 rerun latency, reruns per second and the server's resident
+memory. RSS is read from /proc, so it needs Linux and a server on this
+machine. Use --pid, or let the script find the process started with
+--server.port.
+
+Connect through localhost so the pages skip the Cognito login, as they
+do on a developer machine.
+
+Start the app with DVA_AWS_BACKEND=local (see scripts/local_aws.py) so
+the pages' AWS calls go to a local emulator, not to AWS.
+
+A trace is a JSON list of steps, replayed in a loop:
+
+    [
+      {"tab": "Storage Classes"},
+      {"slider": "File Size", "value": 500},
+      {"selectbox": "Region", "index": 2},
+      {"button": "Simulate"},
+      {"wait": 2}
+    ]
+
+"tab" selects a tab_router section, or the one after the current section
+with "next". A slider moves to "value" or to the other end of its range; a
+select box picks "index" or its last option. Labels match
+case-insensitively on a substring of the widget label, and "*" takes the
+first widget of that kind in the main area. Steps whose widget is not on
+screen are skipped and counted. Without --trace, DEFAULT_TRACE cycles
+through the tabs and touches the first slider, select box and button of
+each.
+
+Usage:
+    python scripts/load_test.py --url http://localhost:8095 --page Amazon_S3 [--sessions 1 5 10 20]
+        [--duration 60] [--think 1.0] [--trace trace.json] [--pid PID] [--json]
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+try:
+    import websockets
+except ImportError:  # installed with Streamlit releases that run on Starlette
+    websockets = None
+
+DEFAULT_TRACE = [
+    {"tab": "next"},
+    {"slider": "*"},
+    {"selectbox": "*"},
+    {"button": "*"},
+]
+
+# Delta paths start with the root container; 0 is the main area, 1 the sidebar
+MAIN_CONTAINER = 0
+
+# Seconds between concurrency levels, letting the server drop closed sessions
+LEVEL_PAUSE = 3
+
+RSS_SAMPLE_INTERVAL = 0.5
+
+WIDGET_TYPES = ("button", "button_group", "selectbox", "slider")
+
+
+class LearnerSession:
+    """One simulated learner: a websocket session replaying a trace."""
+
+    def __init__(self, url: str, page: str, query: str, timeout: float):
+        parts = urlsplit(url)
+        scheme = "wss" if parts.scheme == "https" else "ws"
+        self.stream_url = f"{scheme}://{parts.netloc}{parts.path.rstrip('/')}/_stcore/stream"
+        self.page = page
+        self.query = query
+        self.timeout = timeout
+        self.connection = None
+        # Widgets on screen after the last rerun, in page order, keyed by widget id
+        self.widgets: Dict[str, Dict[str, Any]] = {}
+        # Values this learner has set, sent with every rerun like the browser does
+        self.widget_states: Dict[str, WidgetState] = {}
+        self.latencies: List[float] = []
+        self.first_render: Optional[float] = None
+        self.errors: List[str] = []
+        self.skipped = 0
+
+    async def connect(self) -> None:
+        self.connection = await websockets.connect(
+            self.stream_url, subprotocols=["streamlit"], max_size=None, open_timeout=self.timeout)
+        self.first_render = await self.rerun()
+
+    async def close(self) -> None:
+        if self.connection is not None:
+            await self.connection.close()
+
+    async def rerun(self, changed: Optional[WidgetState] = None, fragment_id: str = "") -> float:
+        """Request a rerun and wait for it to finish.
+
+        Returns:
+            Seconds from the request to the server's script_finished message
+        """
+        msg = BackMsg()
+        client_state = msg.rerun_script
+        client_state.query_string = self.query
+        client_state.page_name = self.page
+        client_state.fragment_id = fragment_id
+        states = dict(self.widget_states)
+        if changed is not None:
+            states[changed.id] = changed
+        client_state.widget_states.widgets.extend(states.values())
+
+        start = time.perf_counter()
+        await self.connection.send(msg.SerializeToString())
+        seen: Dict[str, Dict[str, Any]] = {}
+        while True:
+            data = await asyncio.wait_for(self.connection.recv(), self.timeout)
+            forward_msg = ForwardMsg()
+            forward_msg.ParseFromString(data)
+            kind = forward_msg.WhichOneof("type")
+            if kind == "delta":
+                self._read_delta(forward_msg, seen)
+            elif kind == "new_session":
+                seen.clear()
+            elif kind == "script_finished" and forward_msg.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                break
+        elapsed = time.perf_counter() - start
+
+        if fragment_id:
+            self.widgets.update(seen)
+        else:
+            self.widgets = seen
+            for widget_id in list(self.widget_states):
+                if widget_id not in seen:
+                    del self.widget_states[widget_id]
+        return elapsed
+
+    def _read_delta(self, forward_msg: ForwardMsg, seen: Dict[str, Dict[str, Any]]) -> None:
+        """Note widgets and exceptions sent in a delta."""
+        delta = forward_msg.delta
+        if delta.WhichOneof("type") != "new_element":
+            return
+        kind = delta.new_element.WhichOneof("type")
+        if kind == "exception":
+            self.errors.append(delta.new_element.exception.message.strip()[:200])
+        elif kind in WIDGET_TYPES:
+            proto = getattr(delta.new_element, kind)
+            path = forward_msg.metadata.delta_path
+            seen[proto.id] = {"type": kind, "label": proto.label, "proto": proto,
+                              "main": bool(path) and path[0] == MAIN_CONTAINER, "fragment_id": delta.fragment_id}
+
+    def _find(self, kind: str, label: Any) -> Optional[Dict[str, Any]]:
+        """First widget of a kind on screen whose label contains ``label`` ("*" for any)."""
+        for widget in self.widgets.values():
+            if widget["type"] != kind or not widget["main"]:
+                continue
+            if kind == "button_group" and "_tab_router_" not in widget["proto"].id:
+                continue
+            if label == "*" or kind == "button_group" or str(label).lower() in widget["label"].lower():
+                return widget
+        return None
+
+    def _widget_state(self, step: Dict[str, Any]) -> Optional[tuple]:
+        """The widget a step changes and its new state, or None if it is not on screen."""
+        kind = next((key for key in ("tab", "slider", "selectbox", "button") if key in step), None)
+        widget = self._find("button_group" if kind == "tab" else kind, step.get(kind))
+        if widget is None:
+            return None
+        proto = widget["proto"]
+        state = WidgetState(id=proto.id)
+
+        if kind == "tab":
+            sections = [f"{option.content_icon} {option.content}" if option.content_icon else option.content
+                        for option in proto.options]
+            current = self.widget_states.get(proto.id)
+            current = current.string_array_value.data[0] if current else sections[proto.default[0] if proto.default else 0]
+            if step["tab"] == "next":
+                section = sections[(sections.index(current) + 1) % len(sections)] if current in sections else sections[0]
+            else:
+                section = next((s for s in sections if str(step["tab"]).lower() in s.lower()), None)
+                if section is None:
+                    return None
+            state.string_array_value.data[:] = [section]
+        elif kind == "slider":
+            current = self.widget_states.get(proto.id)
+            values = list(current.double_array_value.data) if current else list(proto.default)
+            if "value" in step:
+                target = step["value"] if isinstance(step["value"], list) else [step["value"]]
+            elif len(values) == 2:
+                target = [proto.min, proto.max]
+            else:
+                target = [proto.min if values and values[0] == proto.max else proto.max]
+            state.double_array_value.data[:] = target
+        elif kind == "selectbox":
+            if not proto.options:
+                return None
+            index = step.get("index", len(proto.options) - 1)
+            state.string_value = proto.options[index]
+        else:
+            state.trigger_value = True
+
+        if kind != "button":
+            self.widget_states[proto.id] = state
+        return state, widget["fragment_id"]
+
+    async def replay(self, trace: List[Dict[str, Any]], stop_at: float, think: float) -> None:
+        """Replay the trace in a loop until ``stop_at`` (event loop time)."""
+        loop = asyncio.get_running_loop()
+        while loop.time() < stop_at:
+            for step in trace:
+                if loop.time() >= stop_at:
+                    return
+                await asyncio.sleep(step["wait"] if "wait" in step else think * random.uniform(0.5, 1.5))
+                if "wait" in step:
+                    continue
+                change = self._widget_state(step)
+                if change is None:
+                    self.skipped += 1
+                    continue
+                self.latencies.append(await self.rerun(*change))
+
+
+def _percentile(values: List[float], percent: float) -> Optional[float]:
+    """Nearest-rank percentile; None for no values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(percent / 100 * len(ordered)) - 1)]
+
+
+def find_server_pid(port: int) -> Optional[int]:
+    """PID of the local streamlit process started with --server.port ``port``."""
+    for cmdline_file in Path("/proc").glob("[0-9]*/cmdline"):
+        try:
+            args = cmdline_file.read_bytes().decode("utf-8", "replace").split("\0")
+        except OSError:
+            continue
+        if not any("streamlit" in arg for arg in args):
+            continue
+        for index, arg in enumerate(args):
+            if arg == f"--server.port={port}" or (arg == "--server.port" and args[index + 1:index + 2] == [str(port)]):
+                return int(cmdline_file.parent.name)
+    return None
+
+
+def read_rss_mib(pid: int) -> Optional[float]:
+    """Resident memory of a process in MiB, from /proc/<pid>/status."""
+    try:
+        for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+async def _sample_rss(pid: Optional[int], samples: List[float], done: asyncio.Event) -> None:
+    while pid is not None and not done.is_set():
+        rss = read_rss_mib(pid)
+        if rss is not None:
+            samples.append(rss)
+        try:
+            await asyncio.wait_for(done.wait(), RSS_SAMPLE_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def _run_learner(learner: LearnerSession, trace: List[Dict[str, Any]], stop_at: float,
+                       think: float, delay: float) -> None:
+    await asyncio.sleep(delay)
+    try:
+        await learner.connect()
+        await learner.replay(trace, stop_at, think)
+    except (OSError, asyncio.TimeoutError, websockets.WebSocketException) as e:
+        learner.errors.append(f"{type(e).__name__}: {e}")
+    finally:
+        await learner.close()
+
+
+async def run_level(args: argparse.Namespace, sessions: int, trace: List[Dict[str, Any]],
+                    pid: Optional[int]) -> Dict[str, Any]:
+    """Run one concurrency level and summarize it."""
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    stop_at = start + args.ramp + args.duration
+    learners = [LearnerSession(args.url, args.page, args.query, args.timeout) for _ in range(sessions)]
+
+    rss_samples: List[float] = []
+    done = asyncio.Event()
+    sampler = asyncio.create_task(_sample_rss(pid, rss_samples, done))
+    await asyncio.gather(*(
+        _run_learner(learner, trace, stop_at, args.think, args.ramp * index / sessions)
+        for index, learner in enumerate(learners)))
+    elapsed = loop.time() - start
+    done.set()
+    await sampler
+
+    latencies = [latency for learner in learners for latency in learner.latencies]
+    first_renders = [learner.first_render for learner in learners if learner.first_render is not None]
+    errors = [error for learner in learners for error in learner.errors]
+    return {
+        "sessions": sessions,
+        "reruns": len(latencies),
+        "throughput": len(latencies) / elapsed if elapsed else 0.0,
+        "p50": _percentile(latencies, 50),
+        "p95": _percentile(latencies, 95),
+        "p99": _percentile(latencies, 99),
+        "first_render_p50": _percentile(first_renders, 50),
+        "errors": len(errors),
+        "error_samples": sorted(set(errors))[:5],
+        "skipped_steps": sum(learner.skipped for learner in learners),
+        "rss_mib_max": max(rss_samples) if rss_samples else None,
+        "rss_mib_end": rss_samples[-1] if rss_samples else None,
+    }
+
+
+async def run(args: argparse.Namespace, trace: List[Dict[str, Any]], pid: Optional[int]) -> List[Dict[str, Any]]:
+    results = []
+    for index, sessions in enumerate(args.sessions):
+        if index:
+            await asyncio.sleep(LEVEL_PAUSE)
+        results.append(await run_level(args, sessions, trace, pid))
+        if not args.json:
+            _print_level(results[-1], header=index == 0)
+    return results
+
+
+def _ms(value: Optional[float]) -> str:
+    return f"{value * 1000:8.0f}" if value is not None else f"{'-':>8}"
+
+
+def _print_level(result: Dict[str, Any], header: bool) -> None:
+    if header:
+        print(f"{'sessions':>8} {'reruns':>7} {'rerun/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+              f" {'first ms':>8} {'errors':>6} {'RSS MiB':>8}")
+    rss = f"{result['rss_mib_max']:8.0f}" if result["rss_mib_max"] is not None else f"{'-':>8}"
+    print(f"{result['sessions']:8d} {result['reruns']:7d} {result['throughput']:8.1f} {_ms(result['p50'])}"
+          f" {_ms(result['p95'])} {_ms(result['p99'])} {_ms(result['first_render_p50'])} {result['errors']:6d} {rss}")
+    for error in result["error_samples"]:
+        print(f"{'':9}error: {error}")
+    if result["skipped_steps"]:
+        print(f"{'':9}{result['skipped_steps']} trace steps skipped (widget not on screen)")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:8091", help="Base URL of the running app")
+    parser.add_argument("--page", default="", help="Page URL name, e.g. Amazon_S3 (defaults to Home)")
+    parser.add_argument("--query", default="", help="Query string sent with each rerun, e.g. tab=storage-classes")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 5, 10, 20],
+                        help="Concurrency levels to run, in order")
+    parser.add_argument("--duration", type=float, default=60, help="Seconds each level runs after the ramp-up")
+    parser.add_argument("--ramp", type=float, default=5, help="Seconds over which a level's sessions connect")
+    parser.add_argument("--think", type=float, default=1.0, help="Mean think time between steps, in seconds")
+    parser.add_argument("--timeout", type=float, default=60, help="Seconds allowed per rerun")
+    parser.add_argument("--trace", type=Path, help="JSON trace to replay (defaults to DEFAULT_TRACE)")
+    parser.add_argument("--pid", type=int, help="Server process for RSS (defaults to the one on the URL's port)")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    args = parser.parse_args()
+
+    if websockets is None:
+        print("The websockets package is required: pip install websockets", file=sys.stderr)
+        return 2
+
+    trace = json.loads(args.trace.read_text()) if args.trace else DEFAULT_TRACE
+    port = urlsplit(args.url).port or (443 if args.url.startswith("https") else 80)
+    pid = args.pid or find_server_pid(port)
+    if pid is None and not args.json:
+        print(f"No local streamlit process found on port {port}; RSS is not reported")
+
+    results = asyncio.run(run(args, trace, pid))
+    if args.json:
+        print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+"""
+Run a local AWS emulator for the session apps and seed it.
+
+Starts a moto server and creates the queues, topics, event bus, buckets,
+tables, log groups and secret the pages expect (LOCAL_RESOURCES in
+dva_shared/local_backend.py), then serves until interrupted. Point the apps
+at it with:
+
+    export DVA_AWS_BACKEND=local
+    export DVA_LOCAL_ENDPOINT_URL=http://127.0.0.1:5000
+
+Every app started with these settings shares the emulator, so a message
+sent on one page can be received on another and a load test never reaches
+AWS. Without DVA_LOCAL_ENDPOINT_URL each app starts its own in-process
+emulator instead.
+
+With --seed-only, seeds an emulator that is already running (moto_server,
+LocalStack or an earlier run of this script) and exits. The emulator must
+run as account 875692608981 (MOTO_ACCOUNT_ID for moto) for the pages'
+hard-coded queue URLs and topic ARNs to resolve.
+
+Requires the "local" extra: pip install -e "shared[local]"
+
+Usage:
+    python scripts/local_aws.py [--host 127.0.0.1] [--port 5000]
+    python scripts/local_aws.py --seed-only --endpoint-url http://127.0.0.1:4566
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+from dva_shared import local_backend
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1", help="Address the emulator listens on")
+    parser.add_argument("--port", type=int, default=5000, help="Port the emulator listens on")
+    parser.add_argument("--seed-only", action="store_true", help="Seed a running emulator and exit")
+    parser.add_argument("--endpoint-url", help="Emulator to seed with --seed-only (defaults to --host and --port)")
+    args = parser.parse_args()
+
+    url = args.endpoint_url or f"http://{args.host}:{args.port}"
+    if args.seed_only:
+        created = local_backend.seed(url)
+        print(f"Seeded {url}: {', '.join(created)}")
+        return 0
+
+    os.environ.setdefault("MOTO_ACCOUNT_ID", local_backend.LOCAL_ACCOUNT_ID)
+    try:
+        from moto.server import ThreadedMotoServer
+    except ImportError:
+        print('moto is required: pip install -e "shared[local]"', file=sys.stderr)
+        return 2
+
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+    server = ThreadedMotoServer(ip_address=args.host, port=args.port, verbose=False)
+    server.start()
+    created = local_backend.seed(url)
+    print(f"Local AWS emulator running at {url}, seeded: {', '.join(created)}")
+    print(f"\n    export DVA_AWS_BACKEND=local\n    export DVA_LOCAL_ENDPOINT_URL={url}\n")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
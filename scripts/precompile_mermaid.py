@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+"""
+Precompile the static Mermaid diagrams of every session app to SVG.
+
+Walks session*/Home.py and session*/pages/*.py, finds every common.mermaid()
+call whose source is a constant (a string literal, a local variable holding
+one, or a create_*() function that returns one), and renders it with the
+Mermaid CLI (mmdc). Each app's diagrams are rendered with the Mermaid
+settings it passes to configure() in its utils/common.py, or with
+MERMAID_CONFIG from shared/dva_shared/common.py when it passes none.
+SVGs are written to mermaid_cache/<config hash>-<source hash>.svg, so
+unchanged diagrams are skipped on later runs and apps with different
+settings never share an SVG. At runtime dva_shared.common.mermaid() inlines
+the cached SVG and only falls back to client-side rendering for diagrams
+built at runtime.
+
+The session5 image build runs it in a Mermaid CLI stage, and each
+session's setup.sh runs it before starting the app when mmdc or npx is
+available.
+
+Usage:
+    python scripts/precompile_mermaid.py [--mmdc "npx -y @mermaid-js/mermaid-cli"] [--jobs 4]
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import shlex
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+CACHE_DIR = Path(os.getenv("MERMAID_SVG_CACHE_DIR", REPO_DIR / "mermaid_cache"))
+SHARED_COMMON = REPO_DIR / "shared" / "dva_shared" / "common.py"
+
+
+def source_hash(code: str) -> str:
+    """Hash of a diagram source; must match _mermaid_source_hash() in shared/dva_shared/common.py."""
+    return hashlib.sha256(code.strip().encode("utf-8")).hexdigest()[:16]
+
+
+def config_hash(config: Dict[str, Any]) -> str:
+    """Hash of Mermaid settings; must match _mermaid_config_hash() in shared/dva_shared/common.py."""
+    return hashlib.sha256(json.dumps(config, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def default_config() -> Dict[str, Any]:
+    """MERMAID_CONFIG as assigned in shared/dva_shared/common.py."""
+    tree = ast.parse(SHARED_COMMON.read_text(encoding="utf-8"), filename=str(SHARED_COMMON))
+    for node in tree.body:
+        if (isinstance(node, ast.Assign) and len(node.targets) == 1
+                and isinstance(node.targets[0], ast.Name) and node.targets[0].id == "MERMAID_CONFIG"):
+            return ast.literal_eval(node.value)
+    raise ValueError(f"MERMAID_CONFIG not found in {SHARED_COMMON}")
+
+
+def app_config(app_dir: Path, default: Dict[str, Any]) -> Dict[str, Any]:
+    """The mermaid_config an app passes to configure() in its utils/common.py, or the default."""
+    shim = app_dir / "utils" / "common.py"
+    if not shim.exists():
+        return default
+    for node in ast.walk(ast.parse(shim.read_text(encoding="utf-8"), filename=str(shim))):
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr == "configure":
+            for keyword in node.keywords:
+                if keyword.arg == "mermaid_config":
+                    return ast.literal_eval(keyword.value)
+    return default
+
+
+def _constant_str(node: Optional[ast.AST]) -> Optional[str]:
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return None
+
+
+def _constant_returns(tree: ast.Module) -> Dict[str, str]:
+    """Map functions whose body is just ``return "<literal>"`` to that literal."""
+    functions = {}
+    for node in tree.body:
+        if not isinstance(node, ast.FunctionDef) or node.args.args:
+            continue
+        body = node.body
+        if body and isinstance(body[0], ast.Expr) and _constant_str(body[0].value) is not None:
+            body = body[1:]  # docstring
+        if len(body) == 1 and isinstance(body[0], ast.Return):
+            value = _constant_str(body[0].value)
+            if value is not None:
+                functions[node.name] = value
+    return functions
+
+
+def _is_mermaid_call(node: ast.AST) -> bool:
+    return (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == "mermaid"
+        and isinstance(node.func.value, ast.Name)
+        and node.func.value.id == "common"
+    )
+
+
+def _string_constants(scope: ast.AST) -> Dict[str, str]:
+    """Names bound exactly once in a scope, to a string literal."""
+    assigned: Dict[str, List[Optional[str]]] = {}
+    for node in ast.walk(scope):
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            assigned.setdefault(node.targets[0].id, []).append(_constant_str(node.value))
+    return {name: values[0] for name, values in assigned.items() if len(values) == 1 and values[0]}
+
+
+def extract_sources(path: Path) -> List[str]:
+    """Return the constant Mermaid sources rendered by a page."""
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    functions = _constant_returns(tree)
+    sources = []
+
+    def visit(node: ast.AST, constants: Dict[str, str]) -> None:
+        if isinstance(node, ast.FunctionDef):
+            constants = _string_constants(node)
+        if _is_mermaid_call(node) and node.args:
+            arg = node.args[0]
+            code = _constant_str(arg)
+            if code is None and isinstance(arg, ast.Name):
+                code = constants.get(arg.id)
+            if code is None and isinstance(arg, ast.Call) and isinstance(arg.func, ast.Name) and not arg.args:
+                code = functions.get(arg.func.id)
+            if code is not None:
+                sources.append(code)
+        for child in ast.iter_child_nodes(node):
+            visit(child, constants)
+
+    visit(tree, {})
+    return sources
+
+
+def render(code: str, digest: str, mmdc: List[str], config_path: str) -> Optional[str]:
+    """Render one diagram to CACHE_DIR/<digest>.svg and return an error message on failure."""
+    target = CACHE_DIR / f"{digest}.svg"
+    with tempfile.TemporaryDirectory() as tmp:
+        source_file = Path(tmp) / f"{digest}.mmd"
+        source_file.write_text(code.strip() + "\n", encoding="utf-8")
+        output_file = Path(tmp) / f"{digest}.svg"
+        result = subprocess.run(
+            mmdc + ["-i", str(source_file), "-o", str(output_file), "-c", config_path,
+                    "-b", "transparent", "-I", f"mermaid-{digest}"],
+            capture_output=True, text=True,
+        )
+        if result.returncode != 0 or not output_file.exists():
+            return ((result.stderr or result.stdout).strip().splitlines() or ["mmdc failed"])[-1]
+        target.write_text(output_file.read_text(encoding="utf-8"), encoding="utf-8")
+    return None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mmdc", default=os.getenv("MMDC", "mmdc"), help="Mermaid CLI command")
+    parser.add_argument("--jobs", type=int, default=4, help="Diagrams rendered in parallel")
+    parser.add_argument("--force", action="store_true", help="Re-render diagrams that are already cached")
+    args = parser.parse_args()
+
+    default = default_config()
+    configs: Dict[str, Dict[str, Any]] = {}
+    # Cache file name -> (diagram source, hash of the settings to render it with)
+    sources: Dict[str, Tuple[str, str]] = {}
+    page_count = 0
+    for app_dir in sorted(path.parent for path in REPO_DIR.glob("session*/Home.py")):
+        config = app_config(app_dir, default)
+        settings = config_hash(config)
+        configs[settings] = config
+        pages = [app_dir / "Home.py"] + sorted(app_dir.glob("pages/*.py"))
+        page_count += len(pages)
+        for page in pages:
+            for code in extract_sources(page):
+                sources.setdefault(f"{settings}-{source_hash(code)}", (code, settings))
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    pending = [(digest, code, settings) for digest, (code, settings) in sources.items()
+               if args.force or not (CACHE_DIR / f"{digest}.svg").exists()]
+    print(f"{len(sources)} static diagrams in {page_count} pages, {len(pending)} to render")
+
+    config_paths = {}
+    for settings, config in configs.items():
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as config_file:
+            json.dump(config, config_file)
+        config_paths[settings] = config_file.name
+    mmdc = shlex.split(args.mmdc)
+    failures = 0
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+            results = pool.map(lambda job: render(job[1], job[0], mmdc, config_paths[job[2]]), pending)
+            for (digest, _, _), error in zip(pending, results):
+                if error:
+                    failures += 1
+                    print(f"  failed {digest}: {error}")
+    finally:
+        for path in config_paths.values():
+            os.unlink(path)
+
+    # Drop SVGs for diagrams that no longer exist
+    for svg in CACHE_DIR.glob("*.svg"):
+        if svg.stem not in sources:
+            svg.unlink()
+
+    print(f"Rendered {len(pending) - failures}, failed {failures}, cache: {CACHE_DIR}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+"""
+Vendor the pinned Mermaid bundle for the session apps.
+
+Downloads mermaid.min.js for MERMAID_VERSION into vendor/mermaid/ and writes
+a manifest.json with the file name and its Subresource Integrity hash. At
+runtime dva_shared/common.py copies the bundle into each app's static/
+folder, serves it from there and checks it against the integrity hash, so
+diagrams render without reaching a CDN.
+
+The bundle and manifest are committed. After vendoring another version, set
+MERMAID_VERSION and MERMAID_INTEGRITY in dva_shared/common.py to the printed
+values; the CDN fallback is checked against that hash.
+
+Usage:
+    python scripts/vendor_mermaid.py [--version 11.4.1] [--source URL_OR_PATH]
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import sys
+import urllib.request
+from pathlib import Path
+
+MERMAID_VERSION = "11.4.1"
+CDN_URL_TEMPLATE = "https://cdn.jsdelivr.net/npm/mermaid@{version}/dist/mermaid.min.js"
+VENDOR_DIR = Path(__file__).resolve().parent.parent / "vendor" / "mermaid"
+
+
+def sri_hash(data: bytes) -> str:
+    """Return the sha384 Subresource Integrity string for a file body."""
+    return "sha384-" + base64.b64encode(hashlib.sha384(data).digest()).decode("ascii")
+
+
+def fetch(source: str) -> bytes:
+    """Read the bundle from a URL or a local file."""
+    if source.startswith(("http://", "https://")):
+        with urllib.request.urlopen(source, timeout=60) as response:
+            return response.read()
+    return Path(source).read_bytes()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--version", default=MERMAID_VERSION, help="Mermaid version to vendor")
+    parser.add_argument("--source", help="URL or local path of mermaid.min.js (defaults to jsDelivr)")
+    args = parser.parse_args()
+
+    source = args.source or CDN_URL_TEMPLATE.format(version=args.version)
+    data = fetch(source)
+
+    file_name = f"mermaid-{args.version}.min.js"
+    VENDOR_DIR.mkdir(parents=True, exist_ok=True)
+    for old in VENDOR_DIR.glob("mermaid-*.min.js"):
+        if old.name != file_name:
+            old.unlink()
+    (VENDOR_DIR / file_name).write_bytes(data)
+
+    manifest = {
+        "version": args.version,
+        "file": file_name,
+        "integrity": sri_hash(data),
+        "source": source,
+    }
+    (VENDOR_DIR / "manifest.json").write_text(json.dumps(manifest, indent=2) + "\n")
+
+    print(f"Vendored Mermaid {args.version} ({len(data) / 1024:.0f} KiB) -> {VENDOR_DIR / file_name}")
+    print(f"Integrity: {manifest['integrity']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,11 @@
 
 import streamlit as st
-import pandas as pd
 import utils.common as common
 import utils.authenticate as authenticate
 
+# Heavy libraries are imported when a tab first uses them
+pd = common.lazy_import("pandas")
+
 
 # Page configuration
 st.set_page_config(
@@ -13,11 +15,11 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+@common.profiled
 def main():
 
     # Custom CSS for AWS styling
-    st.markdown("""
-    <style>
+    common.stylesheet("""
     /* AWS Color Scheme */
     :root {
         --aws-orange: #FF9900;
@@ -124,8 +126,7 @@ def main():
         padding-right: 1rem;
         max-width: none;
     }
-    </style>
-    """, unsafe_allow_html=True)
+    """)
 
     common.initialize_session_state()
 
@@ -1,13 +1,15 @@
 
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import utils.common as common
+import utils.catalog as catalog
 import utils.authenticate as authenticate
 
+# Heavy libraries are imported when a tab first uses them
+np = common.lazy_import("numpy")
+px = common.lazy_import("plotly.express")
+go = common.lazy_import("plotly.graph_objects")
+make_subplots = common.lazy_import("plotly.subplots", "make_subplots")
+
 # Page configuration
 st.set_page_config(
     page_title="AWS Global Infrastructure Hub",
@@ -29,8 +31,7 @@ AWS_COLORS = {
 
 def apply_custom_styles():
     """Apply custom CSS styling with AWS color scheme"""
-    st.markdown(f"""
-    <style>
+    common.stylesheet(f"""
         .main {{
             background-color: {AWS_COLORS['light_gray']};
         }}
@@ -128,8 +129,7 @@ def apply_custom_styles():
             border: 2px solid {AWS_COLORS['light_blue']};
             margin: 15px 0;
         }}
-    </style>
-    """, unsafe_allow_html=True)
+    """)
 
 def create_sidebar():
     """Create sidebar with app information and controls"""
@@ -275,6 +275,7 @@ def create_regional_edge_cache_mermaid():
         style H fill:#232F3E,stroke:#FF9900,color:#fff
     """
 
+@common.profiled
 def aws_regions_tab():
     """Content for AWS Regions tab"""
     st.markdown("## 🌍 AWS Regions")
@@ -291,61 +292,8 @@ def aws_regions_tab():
     
     # Interactive Region Map
     st.markdown("### 🗺️ Global Region Distribution")
-    regions_data_x = {
-    'Region': [
-        'us-east-1', 'us-east-2', 'us-west-1', 'us-west-2',
-        'ca-central-1', 'ca-west-1',
-        'eu-north-1', 'eu-west-1', 'eu-west-2', 'eu-west-3', 'eu-central-1', 'eu-central-2', 'eu-south-1', 'eu-south-2',
-        'ap-northeast-1', 'ap-northeast-2', 'ap-northeast-3', 'ap-southeast-1', 'ap-southeast-2', 'ap-southeast-3', 'ap-southeast-4', 'ap-south-1', 'ap-south-2', 'ap-east-1',
-        'sa-east-1',
-        'af-south-1',
-        'me-south-1', 'me-central-1',
-        'il-central-1'
-    ],
-    'Location': [
-        'N. Virginia', 'Ohio', 'N. California', 'Oregon',
-        'Central Canada', 'Calgary',
-        'Stockholm', 'Ireland', 'London', 'Paris', 'Frankfurt', 'Zurich', 'Milan', 'Spain',
-        'Tokyo', 'Seoul', 'Osaka', 'Singapore', 'Sydney', 'Jakarta', 'Melbourne', 'Mumbai', 'Hyderabad', 'Hong Kong',
-        'São Paulo',
-        'Cape Town',
-        'Bahrain', 'UAE',
-        'Tel Aviv'
-    ],
-    'Lat': [
-        38.9, 39.9, 37.4, 45.5,
-        43.7, 51.0,
-        59.3, 53.3, 51.5, 48.9, 50.1, 47.4, 45.5, 40.4,
-        35.7, 37.6, 34.7, 1.3, -33.9, -6.2, -37.8, 19.1, 17.4, 22.3,
-        -23.5,
-        -33.9,
-        26.2, 24.5,
-        32.1
-    ],
-    'Lon': [
-        -77.0, -82.9, -122.1, -121.3,
-        -79.4, -114.1,
-        18.1, -6.2, -0.1, 2.3, 8.7, 8.5, 9.2, -3.7,
-        139.7, 126.9, 135.5, 103.8, 151.2, 106.8, 144.9, 72.9, 78.5, 114.2,
-        -46.6,
-        18.4,
-        50.6, 54.4,
-        34.8
-    ],
-    'AZ_Count': [
-        6, 3, 3, 4,
-        3, 3,
-        3, 3, 3, 3, 3, 3, 3, 3,
-        4, 4, 3, 3, 3, 3, 3, 3, 3, 3,
-        3,
-        3,
-        3, 3,
-        3
-    ]
-}
-
     
-    df_regions = pd.DataFrame(regions_data_x)
+    df_regions = catalog.table("aws_regions.region_locations")
     
     fig = px.scatter_mapbox(df_regions, lat="Lat", lon="Lon", hover_name="Region",
                            hover_data=["Location", "AZ_Count"], size="AZ_Count",
@@ -385,16 +333,7 @@ def aws_regions_tab():
     st.markdown("### 🗺️ Interactive Region Explorer")
     
     # Sample region data
-    regions_data = {
-        'Region Name': ['US East (N. Virginia)', 'US West (Oregon)', 'EU (Ireland)', 
-                       'Asia Pacific (Singapore)', 'Asia Pacific (Tokyo)', 'South America (São Paulo)'],
-        'Region Code': ['us-east-1', 'us-west-2', 'eu-west-1', 'ap-southeast-1', 'ap-northeast-1', 'sa-east-1'],
-        'Availability Zones': [6, 4, 3, 3, 4, 3],
-        'Launch Year': [2006, 2011, 2007, 2010, 2011, 2011],
-        'Services Available': ['200+', '190+', '200+', '180+', '190+', '150+']
-    }
-    
-    df_regions = pd.DataFrame(regions_data)
+    df_regions = catalog.table("aws_regions.regions")
     
     selected_region = st.selectbox("Select a Region to Explore:", df_regions['Region Name'])
     
@@ -471,14 +410,7 @@ def aws_regions_tab():
     # Regional Pricing Comparison
     st.markdown("### 💰 Regional Pricing Comparison")
     
-    pricing_data = {
-        'Region': ['us-east-1', 'us-west-2', 'eu-west-1', 'ap-southeast-1'],
-        'EC2 t3.micro': [0.0104, 0.0104, 0.0116, 0.0116],
-        'S3 Standard': [0.023, 0.023, 0.025, 0.025],
-        'Data Transfer': [0.09, 0.09, 0.09, 0.09]
-    }
-    
-    df_pricing = pd.DataFrame(pricing_data)
+    df_pricing = catalog.table("aws_regions.pricing")
     
     fig = px.bar(df_pricing, x='Region', y=['EC2 t3.micro', 'S3 Standard'], 
                  title='Regional Pricing Comparison (USD per hour/GB)',
@@ -557,6 +489,7 @@ print("Deployment Results:", results)
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def availability_zones_tab():
     """Content for Availability Zones tab"""
     st.markdown("## 🏢 AWS Availability Zones")
@@ -664,36 +597,14 @@ def availability_zones_tab():
     # Service Types by AZ
     st.markdown("### 🎯 Service Types by Availability Zone")
     
-    service_types_data = {
-        'Service Type': ['Zonal Services', 'Regional Services', 'Global Services'],
-        'Description': [
-            'Run in specific AZ - you choose',
-            'Automatically distributed across AZs',  
-            'Run across multiple regions globally'
-        ],
-        'Examples': [
-            'EC2, EBS, RDS',
-            'DynamoDB, S3, ALB',
-            'IAM, Route 53, WAF'
-        ],
-        'Availability': ['Single AZ', 'Multi-AZ', 'Global']
-    }
-    
-    df_services = pd.DataFrame(service_types_data)
+    df_services = catalog.table("availability_zones.service_types")
     st.dataframe(df_services, use_container_width=True)
     
     # AZ Latency Simulation
     st.markdown("### ⚡ AZ Network Performance Simulation")
     
     # Simulate network latencies
-    latency_data = {
-        'Connection Type': ['Within same AZ', 'Between AZs (same region)', 'Between regions'],
-        'Typical Latency': [0.1, 0.8, 45.0],
-        'Max Latency': [0.2, 1.5, 120.0],
-        'Bandwidth': ['25 Gbps', '100 Gbps', '10 Gbps']
-    }
-    
-    df_latency = pd.DataFrame(latency_data)
+    df_latency = catalog.table("availability_zones.latency")
     
     fig = px.bar(df_latency, x='Connection Type', y='Typical Latency',
                  title='Network Latency Comparison (milliseconds)',
@@ -819,6 +730,7 @@ print(result['message'])
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def points_of_presence_tab():
     """Content for Points of Presence tab"""
     st.markdown("## 📍 Points of Presence (PoP)")
@@ -965,20 +877,7 @@ def points_of_presence_tab():
     # Services Using PoPs
     st.markdown("### 🛠️ AWS Services Using Points of Presence")
     
-    services_data = {
-        'Service': ['Amazon CloudFront', 'Amazon Route 53', 'AWS WAF', 'AWS Shield', 'AWS Global Accelerator'],
-        'Function': ['Content Delivery', 'DNS Resolution', 'Web Application Firewall', 'DDoS Protection', 'Network Acceleration'],
-        'Edge Locations': ['✅ Yes', '✅ Yes', '✅ Yes', '✅ Yes', '✅ Yes'],
-        'Primary Use Case': [
-            'Static/Dynamic content caching',
-            'Fast DNS lookups worldwide', 
-            'Filter malicious traffic',
-            'Absorb DDoS attacks',
-            'Optimize network paths'
-        ]
-    }
-    
-    df_services = pd.DataFrame(services_data)
+    df_services = catalog.table("points_of_presence.services")
     st.dataframe(df_services, use_container_width=True)
     
     # Performance Comparison
@@ -1114,6 +1013,7 @@ invalidate_edge_cache('E1234567890ABC', ['/index.html', '/css/*', '/js/*'])
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def cloudfront_tab():
     """Content for Amazon CloudFront tab"""
     st.markdown("## ⚡ Amazon CloudFront")
@@ -1265,73 +1165,70 @@ def cloudfront_tab():
     # Use Cases
     st.markdown("### 🌟 Common CloudFront Use Cases")
     
-    use_cases_data = {
-        'Use Case': ['Static Website', 'API Acceleration', 'Video Streaming', 'Software Distribution', 'E-commerce'],
-        'Content Type': ['HTML, CSS, JS, Images', 'JSON API Responses', 'Video Files, HLS', 'Software Packages', 'Product Images, CSS'],
-        'Cache Strategy': ['Long TTL (1 day)', 'Short TTL (5 min)', 'Long TTL + Streaming', 'Very Long TTL (1 week)', 'Mixed TTL'],
-        'Key Benefit': ['Fast Page Loads', 'Reduced API Latency', 'Global Video Delivery', 'Faster Downloads', 'Better User Experience']
-    }
-    
-    df_use_cases = pd.DataFrame(use_cases_data)
+    df_use_cases = catalog.table("cloudfront.use_cases")
     st.dataframe(df_use_cases, use_container_width=True)
     
     # Performance Simulation
     st.markdown("### 📊 Performance Impact Simulation")
     
     # Interactive performance calculator
-    st.markdown("### 🧮 Performance Calculator")
+    @common.fragment
+    def performance_calculator():
+        st.markdown("### 🧮 Performance Calculator")
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        file_size = st.slider("Average File Size (MB):", 0.1, 100.0, 2.0)
-        users_per_day = st.slider("Daily Users:", 1000, 1000000, 10000)
-        origin_location = st.selectbox("Origin Server Location:", [
-            "us-east-1 (Virginia)", "eu-west-1 (Ireland)", "ap-southeast-1 (Singapore)"
-        ])
-    
-    with col2:
-        user_location = st.selectbox("Primary User Base:", [
-            "Global", "North America", "Europe", "Asia Pacific"
-        ])
-        
-        cache_hit_rate = st.slider("Expected Cache Hit Rate (%):", 50, 95, 85)
+        col1, col2 = st.columns(2)
     
-    # Calculate performance metrics
-    if st.button("📊 Calculate Performance Impact"):
-        # Simulate latency improvements
-        without_cdn_latency = np.random.uniform(800, 2000)  # ms
-        with_cdn_latency = np.random.uniform(50, 200)  # ms
-        
-        # Calculate bandwidth savings
-        total_requests = users_per_day * 10  # Assume 10 requests per user
-        cached_requests = total_requests * (cache_hit_rate / 100)
-        origin_requests = total_requests - cached_requests
-        
-        bandwidth_saved = (cached_requests * file_size) / 1024  # GB
-        cost_savings = bandwidth_saved * 0.09  # Assume $0.09/GB origin cost
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
         with col1:
-            st.metric("Latency Reduction", 
-                     f"{with_cdn_latency:.0f}ms", 
-                     f"-{without_cdn_latency - with_cdn_latency:.0f}ms")
-        
+            file_size = st.slider("Average File Size (MB):", 0.1, 100.0, 2.0)
+            users_per_day = st.slider("Daily Users:", 1000, 1000000, 10000)
+            origin_location = st.selectbox("Origin Server Location:", [
+                "us-east-1 (Virginia)", "eu-west-1 (Ireland)", "ap-southeast-1 (Singapore)"
+            ])
+    
         with col2:
-            st.metric("Speed Improvement", 
-                     f"{(without_cdn_latency/with_cdn_latency):.1f}x", 
-                     "Faster")
-        
-        with col3:
-            st.metric("Bandwidth Saved", 
-                     f"{bandwidth_saved:.1f} GB/day", 
-                     f"{cache_hit_rate}% cache hit")
+            user_location = st.selectbox("Primary User Base:", [
+                "Global", "North America", "Europe", "Asia Pacific"
+            ])
         
-        with col4:
-            st.metric("Cost Savings", 
-                     f"${cost_savings:.2f}/day", 
-                     "Origin bandwidth")
+            cache_hit_rate = st.slider("Expected Cache Hit Rate (%):", 50, 95, 85)
+    
+        # Calculate performance metrics
+        if st.button("📊 Calculate Performance Impact"):
+            # Simulate latency improvements
+            without_cdn_latency = np.random.uniform(800, 2000)  # ms
+            with_cdn_latency = np.random.uniform(50, 200)  # ms
+        
+            # Calculate bandwidth savings
+            total_requests = users_per_day * 10  # Assume 10 requests per user
+            cached_requests = total_requests * (cache_hit_rate / 100)
+            origin_requests = total_requests - cached_requests
+        
+            bandwidth_saved = (cached_requests * file_size) / 1024  # GB
+            cost_savings = bandwidth_saved * 0.09  # Assume $0.09/GB origin cost
+        
+            col1, col2, col3, col4 = st.columns(4)
+        
+            with col1:
+                st.metric("Latency Reduction", 
+                         f"{with_cdn_latency:.0f}ms", 
+                         f"-{without_cdn_latency - with_cdn_latency:.0f}ms")
+        
+            with col2:
+                st.metric("Speed Improvement", 
+                         f"{(without_cdn_latency/with_cdn_latency):.1f}x", 
+                         "Faster")
+        
+            with col3:
+                st.metric("Bandwidth Saved", 
+                         f"{bandwidth_saved:.1f} GB/day", 
+                         f"{cache_hit_rate}% cache hit")
+        
+            with col4:
+                st.metric("Cost Savings", 
+                         f"${cost_savings:.2f}/day", 
+                         "Origin bandwidth")
+
+    performance_calculator()
     
     # Code Example
     st.markdown("### 💻 Code Example: CloudFront Distribution Management")
@@ -1518,6 +1415,7 @@ if distribution_id:
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def regional_edge_caches_tab():
     """Content for Regional Edge Caches tab"""
     st.markdown("## 🏪 Regional Edge Caches")
@@ -1579,94 +1477,80 @@ def regional_edge_caches_tab():
         st.markdown('</div>', unsafe_allow_html=True)
     
     # Interactive Cache Performance Simulator
-    st.markdown("### 🎮 Interactive Cache Performance Simulator")
-    
-    col1, col2 = st.columns(2)
+    @common.fragment
+    def interactive_cache_performance_simulator():
+        st.markdown("### 🎮 Interactive Cache Performance Simulator")
     
-    with col1:
-        st.markdown("### 📊 Content Characteristics")
-        content_type = st.selectbox("Content Type:", [
-            "Popular Static Assets (CSS, JS, Images)",
-            "User Generated Content (Photos, Videos)", 
-            "E-commerce Product Images",
-            "News Articles and Blog Posts",
-            "Software Downloads",
-            "API Responses"
-        ])
-        
-        content_size = st.slider("Average Content Size (MB):", 0.1, 500.0, 5.0)
-        popularity_score = st.slider("Content Popularity (1-10):", 1, 10, 5)
+        col1, col2 = st.columns(2)
     
-    with col2:
-        st.markdown("### 🌍 Traffic Patterns")
-        total_requests = st.slider("Daily Requests:", 1000, 1000000, 50000)
-        geographic_spread = st.selectbox("Geographic Distribution:", [
-            "Global (Worldwide)", "Regional (Continent)", "Local (Country/State)"
-        ])
-        
-        time_pattern = st.selectbox("Access Pattern:", [
-            "Consistent (24/7)", "Business Hours Peak", "Event-Driven Spikes"
-        ])
+        with col1:
+            st.markdown("### 📊 Content Characteristics")
+            content_type = st.selectbox("Content Type:", [
+                "Popular Static Assets (CSS, JS, Images)",
+                "User Generated Content (Photos, Videos)", 
+                "E-commerce Product Images",
+                "News Articles and Blog Posts",
+                "Software Downloads",
+                "API Responses"
+            ])
+        
+            content_size = st.slider("Average Content Size (MB):", 0.1, 500.0, 5.0)
+            popularity_score = st.slider("Content Popularity (1-10):", 1, 10, 5)
     
-    if st.button("🚀 Simulate Cache Performance", use_container_width=True):
-        # Calculate cache efficiency based on inputs
-        if popularity_score >= 8:
-            edge_hit_rate = np.random.uniform(85, 95)
-            regional_hit_rate = np.random.uniform(5, 10)
-            origin_hit_rate = np.random.uniform(0, 5)
-        elif popularity_score >= 5:
-            edge_hit_rate = np.random.uniform(60, 80)
-            regional_hit_rate = np.random.uniform(15, 25)
-            origin_hit_rate = np.random.uniform(5, 15)
-        else:
-            edge_hit_rate = np.random.uniform(30, 50)
-            regional_hit_rate = np.random.uniform(30, 50)
-            origin_hit_rate = np.random.uniform(20, 40)
-        
-        # Calculate performance metrics
-        avg_latency = (edge_hit_rate * 15 + regional_hit_rate * 45 + origin_hit_rate * 200) / 100
-        bandwidth_saved = total_requests * content_size * (edge_hit_rate + regional_hit_rate) / 100 / 1024  # GB
-        cost_savings = bandwidth_saved * 0.05  # Estimated origin bandwidth cost
-        
-        st.markdown('<div class="highlight-box">', unsafe_allow_html=True)
-        st.markdown(f"""
-        ### 📊 Cache Performance Results
-        
-        **Hit Rates:**
-        - **Edge Location**: {edge_hit_rate:.1f}% (fastest response)
-        - **Regional Cache**: {regional_hit_rate:.1f}% (fast response)
-        - **Origin Server**: {origin_hit_rate:.1f}% (slowest response)
-        
-        **Performance Metrics:**
-        - **Average Latency**: {avg_latency:.1f}ms
-        - **Bandwidth Saved**: {bandwidth_saved:.1f} GB/day
-        - **Estimated Savings**: ${cost_savings:.2f}/day
-        - **User Experience**: {'Excellent' if avg_latency < 50 else 'Good' if avg_latency < 100 else 'Needs Improvement'}
-        """)
-        st.markdown('</div>', unsafe_allow_html=True)
+        with col2:
+            st.markdown("### 🌍 Traffic Patterns")
+            total_requests = st.slider("Daily Requests:", 1000, 1000000, 50000)
+            geographic_spread = st.selectbox("Geographic Distribution:", [
+                "Global (Worldwide)", "Regional (Continent)", "Local (Country/State)"
+            ])
+        
+            time_pattern = st.selectbox("Access Pattern:", [
+                "Consistent (24/7)", "Business Hours Peak", "Event-Driven Spikes"
+            ])
+    
+        if st.button("🚀 Simulate Cache Performance", use_container_width=True):
+            # Calculate cache efficiency based on inputs
+            if popularity_score >= 8:
+                edge_hit_rate = np.random.uniform(85, 95)
+                regional_hit_rate = np.random.uniform(5, 10)
+                origin_hit_rate = np.random.uniform(0, 5)
+            elif popularity_score >= 5:
+                edge_hit_rate = np.random.uniform(60, 80)
+                regional_hit_rate = np.random.uniform(15, 25)
+                origin_hit_rate = np.random.uniform(5, 15)
+            else:
+                edge_hit_rate = np.random.uniform(30, 50)
+                regional_hit_rate = np.random.uniform(30, 50)
+                origin_hit_rate = np.random.uniform(20, 40)
+        
+            # Calculate performance metrics
+            avg_latency = (edge_hit_rate * 15 + regional_hit_rate * 45 + origin_hit_rate * 200) / 100
+            bandwidth_saved = total_requests * content_size * (edge_hit_rate + regional_hit_rate) / 100 / 1024  # GB
+            cost_savings = bandwidth_saved * 0.05  # Estimated origin bandwidth cost
+        
+            st.markdown('<div class="highlight-box">', unsafe_allow_html=True)
+            st.markdown(f"""
+            ### 📊 Cache Performance Results
+        
+            **Hit Rates:**
+            - **Edge Location**: {edge_hit_rate:.1f}% (fastest response)
+            - **Regional Cache**: {regional_hit_rate:.1f}% (fast response)
+            - **Origin Server**: {origin_hit_rate:.1f}% (slowest response)
+        
+            **Performance Metrics:**
+            - **Average Latency**: {avg_latency:.1f}ms
+            - **Bandwidth Saved**: {bandwidth_saved:.1f} GB/day
+            - **Estimated Savings**: ${cost_savings:.2f}/day
+            - **User Experience**: {'Excellent' if avg_latency < 50 else 'Good' if avg_latency < 100 else 'Needs Improvement'}
+            """)
+            st.markdown('</div>', unsafe_allow_html=True)
+
+    interactive_cache_performance_simulator()
     
     # Content Types and Caching Strategy
     st.markdown("### 📁 Content Types & Optimal Caching Strategies")
     
-    caching_strategies = {
-        'Content Type': [
-            'Static Assets (CSS, JS)', 'Product Images', 'User Photos/Videos', 
-            'News Articles', 'API Responses', 'Software Downloads'
-        ],
-        'Edge Cache TTL': ['7 days', '1 day', '6 hours', '2 hours', '5 minutes', '30 days'],
-        'Regional Cache Benefit': ['Low', 'High', 'Very High', 'High', 'Medium', 'Very High'],
-        'Primary Cache Tier': ['Edge', 'Regional', 'Regional', 'Regional', 'Edge', 'Regional'],
-        'Use Case': [
-            'Fast website loading',
-            'E-commerce performance', 
-            'Social media platforms',
-            'News/blog websites',
-            'API acceleration',
-            'Software distribution'
-        ]
-    }
-    
-    df_strategies = pd.DataFrame(caching_strategies)
+    df_strategies = catalog.table("regional_edge_caches.caching_strategies")
     st.dataframe(df_strategies, use_container_width=True)
     
     # Regional Edge Cache Benefits
@@ -1711,34 +1595,7 @@ def regional_edge_caches_tab():
     # When Regional Caches Help Most
     st.markdown("### 🎯 When Regional Edge Caches Help Most")
     
-    scenarios_data = {
-        'Scenario': [
-            'User Generated Content',
-            'E-commerce Catalogs', 
-            'News & Media Sites',
-            'Software Distribution',
-            'Educational Content',
-            'Enterprise Applications'
-        ],
-        'Why Regional Caches Help': [
-            'Content not popular enough for edge cache',
-            'Large product images need longer retention',
-            'Articles become less popular over time', 
-            'Large files need persistent caching',
-            'Seasonal access patterns',
-            'Internal content with varying popularity'
-        ],
-        'Expected Improvement': [
-            '40-60% faster delivery',
-            '50-70% origin load reduction',
-            '30-50% improved cache hit rate',
-            '60-80% bandwidth savings',
-            '35-55% performance boost',
-            '45-65% reduced latency'
-        ]
-    }
-    
-    df_scenarios = pd.DataFrame(scenarios_data)
+    df_scenarios = catalog.table("regional_edge_caches.scenarios")
     st.dataframe(df_scenarios, use_container_width=True)
     
     # Monitoring and Optimization
@@ -1767,7 +1624,6 @@ def regional_edge_caches_tab():
     st.code('''
 # Monitor Regional Edge Cache performance and optimize content delivery
 import boto3
-import pandas as pd
 from datetime import datetime, timedelta
 
 def analyze_cache_performance(distribution_id, days=7):
@@ -1944,6 +1800,7 @@ cache_analysis = generate_cache_report(distribution_id)
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def main():
     """Main application function"""
     # Apply styling
@@ -1966,28 +1823,13 @@ def main():
                 </div>""", unsafe_allow_html=True)
     
     # Create tabs
-    tab1, tab2, tab3, tab4, tab5 = st.tabs([
-        "🌍 AWS Regions", 
-        "🏢 Availability Zones", 
-        "📍 Points of Presence",
-        "⚡ Amazon CloudFront",
-        "🏪 Regional Edge Caches"
-    ])
-    
-    with tab1:
-        aws_regions_tab()
-    
-    with tab2:
-        availability_zones_tab()
-    
-    with tab3:
-        points_of_presence_tab()
-    
-    with tab4:
-        cloudfront_tab()
-        
-    with tab5:
-        regional_edge_caches_tab()
+    common.tab_router({
+        "🌍 AWS Regions": aws_regions_tab,
+        "🏢 Availability Zones": availability_zones_tab,
+        "📍 Points of Presence": points_of_presence_tab,
+        "⚡ Amazon CloudFront": cloudfront_tab,
+        "🏪 Regional Edge Caches": regional_edge_caches_tab,
+    })
     
     # Footer
     st.markdown("""
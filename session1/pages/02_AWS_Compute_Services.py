@@ -1,15 +1,17 @@
 
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import utils.common as common
+import utils.catalog as catalog
 import utils.authenticate as authenticate
 from datetime import datetime, timedelta
 import time
 
+# Heavy libraries are imported when a tab first uses them
+np = common.lazy_import("numpy")
+px = common.lazy_import("plotly.express")
+go = common.lazy_import("plotly.graph_objects")
+make_subplots = common.lazy_import("plotly.subplots", "make_subplots")
+
 # Page configuration
 st.set_page_config(
     page_title="AWS Compute Services Hub",
@@ -31,8 +33,7 @@ AWS_COLORS = {
 
 def apply_custom_styles():
     """Apply custom CSS styling with AWS color scheme"""
-    st.markdown(f"""
-    <style>
+    common.stylesheet(f"""
         .main {{
             background-color: {AWS_COLORS['light_gray']};
         }}
@@ -132,8 +133,7 @@ def apply_custom_styles():
             border: 2px solid {AWS_COLORS['light_blue']};
             margin: 15px 0;
         }}
-    </style>
-    """, unsafe_allow_html=True)
+    """)
 
 def create_sidebar():
     """Create sidebar with app information and controls"""
@@ -322,6 +322,7 @@ def create_load_balancer_mermaid():
         style E fill:#FF6B35,stroke:#232F3E,color:#fff
     """
 
+@common.profiled
 def aws_compute_offerings_tab():
     """Content for AWS Compute Offerings tab"""
     st.markdown("## ⚡ AWS Compute Offerings")
@@ -429,22 +430,7 @@ def aws_compute_offerings_tab():
     # Detailed Service Comparison
     st.markdown("### 📊 Detailed Service Comparison")
     
-    comparison_data = {
-        'Service': ['Amazon EC2', 'Amazon ECS', 'AWS Fargate', 'AWS Lambda'],
-        'Control Level': ['High', 'Medium', 'Low', 'Very Low'],
-        'Management Overhead': ['High', 'Medium', 'Low', 'Very Low'],
-        'Pricing Model': ['Hourly/Monthly', 'Hourly + Task', 'Per Task', 'Per Invocation'],
-        'Best For': [
-            'Traditional applications, full control needed',
-            'Containerized apps, service orchestration',
-            'Serverless containers, reduced management',
-            'Event-driven functions, microservices'
-        ],
-        'Max Runtime': ['Unlimited', 'Unlimited', 'Unlimited', '15 minutes'],
-        'Cold Start': ['N/A', 'Seconds', 'Seconds', 'Milliseconds']
-    }
-    
-    df_comparison = pd.DataFrame(comparison_data)
+    df_comparison = catalog.table("aws_compute_offerings.comparison")
     st.dataframe(df_comparison, use_container_width=True)
     
     # Use Case Examples
@@ -824,6 +810,7 @@ for benefit in recommendation['details']['benefits']:
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def amazon_machine_images_tab():
     """Content for Amazon Machine Images tab"""
     st.markdown("## 🖼️ Amazon Machine Images (AMI)")
@@ -930,22 +917,7 @@ def amazon_machine_images_tab():
     # AMI Types Comparison
     st.markdown("### 📊 AMI Types and Sources")
     
-    ami_types_data = {
-        'AMI Source': ['AWS Quick Start', 'AWS Marketplace', 'Community AMIs', 'Custom AMIs'],
-        'Provider': ['Amazon', '3rd Party Vendors', 'Community', 'You/Your Team'],
-        'Cost': ['Free', 'Paid (hourly)', 'Free', 'Storage only'],
-        'Support': ['AWS Support', 'Vendor Support', 'Community', 'Self-Support'],
-        'Security Updates': ['AWS Managed', 'Vendor Managed', 'Community', 'Self Managed'],
-        'Customization': ['Limited', 'Some', 'Variable', 'Full Control'],
-        'Best For': [
-            'Quick starts, testing',
-            'Enterprise software',
-            'Specialized configs',
-            'Production workloads'
-        ]
-    }
-    
-    df_ami_types = pd.DataFrame(ami_types_data)
+    df_ami_types = catalog.table("amazon_machine_images.ami_types")
     st.dataframe(df_ami_types, use_container_width=True)
     
     # AMI Lifecycle Management
@@ -1013,15 +985,7 @@ def amazon_machine_images_tab():
     # Regional AMI Management
     st.markdown("### 🌍 Cross-Region AMI Management")
     
-    regions_data = {
-        'Region': ['us-east-1', 'us-west-2', 'eu-west-1', 'ap-southeast-1'],
-        'AMI Status': ['✅ Primary', '🔄 Copied', '🔄 Copied', '❌ Not Available'],
-        'Last Updated': ['2024-07-10', '2024-07-10', '2024-07-09', 'N/A'],
-        'Copy Cost': ['$0.00', '$0.05', '$0.05', '$0.05'],
-        'Use Case': ['Primary deployment', 'DR site', 'EU compliance', 'Future expansion']
-    }
-    
-    df_regions = pd.DataFrame(regions_data)
+    df_regions = catalog.table("amazon_machine_images.regions")
     st.dataframe(df_regions, use_container_width=True)
     
     # AMI Security Best Practices
@@ -1273,6 +1237,7 @@ class AMIManager:
             return report
 
 # Example usage
+@common.profiled
 def main():
     # Initialize AMI manager
     ami_manager = AMIManager(region='us-east-1')
@@ -1316,6 +1281,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def ec2_instance_storage_tab():
     """Content for EC2 Instance Storage Options tab"""
     st.markdown("## 💾 Amazon EC2 Instance Storage Options")
@@ -1422,22 +1388,7 @@ def ec2_instance_storage_tab():
     # Detailed Storage Comparison
     st.markdown("### 📊 Detailed Storage Comparison")
     
-    storage_data = {
-        'Storage Type': ['EBS gp3', 'EBS io2', 'Instance Store', 'EFS', 'S3'],
-        'Persistence': ['Persistent', 'Persistent', 'Temporary', 'Persistent', 'Persistent'],
-        'Performance (IOPS)': ['3,000-16,000', '100-256,000', '100,000+', '7,000+', 'N/A'],
-        'Durability': ['99.999%', '99.999%', 'Instance lifecycle', '99.999999999%', '99.999999999%'],
-        'Use Case': [
-            'General purpose workloads',
-            'High-performance databases',
-            'Caching, temporary data',
-            'Shared file systems',
-            'Object storage, backups'
-        ],
-        'Cost ($/GB/month)': ['$0.08', '$0.125', 'Included', '$0.30', '$0.023']
-    }
-    
-    df_storage = pd.DataFrame(storage_data)
+    df_storage = catalog.table("ec2_instance_storage.storage")
     st.dataframe(df_storage, use_container_width=True)
     
     # EBS Volume Types Deep Dive
@@ -1570,20 +1521,7 @@ def ec2_instance_storage_tab():
     st.markdown('</div>', unsafe_allow_html=True)
     
     # Instance Store by Instance Type
-    instance_store_data = {
-        'Instance Type': ['m5d.large', 'm5d.xlarge', 'r5d.large', 'c5d.large', 'i3.large'],
-        'Instance Store': ['1x 75 GB NVMe', '1x 150 GB NVMe', '1x 75 GB NVMe', '1x 50 GB NVMe', '1x 475 GB NVMe'],
-        'Network Performance': ['Up to 10 Gbps', 'Up to 10 Gbps', 'Up to 10 Gbps', 'Up to 10 Gbps', 'Up to 10 Gbps'],
-        'Use Case': [
-            'General purpose with local storage',
-            'Larger general purpose workloads', 
-            'Memory-intensive with local storage',
-            'Compute-intensive with local storage',
-            'Storage-optimized applications'
-        ]
-    }
-    
-    df_instance_store = pd.DataFrame(instance_store_data)
+    df_instance_store = catalog.table("ec2_instance_storage.instance_store")
     st.dataframe(df_instance_store, use_container_width=True)
     
     # Storage Best Practices
@@ -1887,6 +1825,7 @@ class EC2StorageManager:
         return recommendations
 
 # Example usage
+@common.profiled
 def main():
     storage_manager = EC2StorageManager()
     
@@ -1921,6 +1860,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def ec2_auto_scaling_tab():
     """Content for Amazon EC2 Auto Scaling tab"""
     st.markdown("## 📈 Amazon EC2 Auto Scaling")
@@ -2553,6 +2493,7 @@ class AutoScalingManager:
         return recommendations
 
 # Example usage
+@common.profiled
 def main():
     asg_manager = AutoScalingManager()
     
@@ -2623,6 +2564,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def elastic_load_balancing_tab():
     """Content for Elastic Load Balancing tab"""
     st.markdown("## ⚖️ Elastic Load Balancing")
@@ -2735,35 +2677,7 @@ def elastic_load_balancing_tab():
     # Detailed Comparison
     st.markdown("### 📊 Load Balancer Detailed Comparison")
     
-    comparison_data = {
-        'Feature': [
-            'OSI Layer', 'Protocols', 'Targets', 'Routing', 'Performance',
-            'Static IP', 'SSL Termination', 'WebSocket', 'Container Support',
-            'Pricing Model', 'Best For'
-        ],
-        'Application LB': [
-            'Layer 7', 'HTTP/HTTPS', 'EC2, ECS, Lambda, IP', 'Content-based',
-            'High', 'No', 'Yes', 'Yes', 'Native',
-            'LCU-based', 'Web applications'
-        ],
-        'Network LB': [
-            'Layer 4', 'TCP/UDP/TLS', 'EC2, ECS, IP', 'Flow hash',
-            'Ultra High', 'Yes', 'TLS only', 'No', 'Via IP',
-            'LCU-based', 'High performance'
-        ],
-        'Gateway LB': [
-            'Layer 3', 'All IP packets', 'EC2, IP', 'Flow hash',
-            'High', 'No', 'No', 'No', 'Via IP',
-            'LCU-based', '3rd party appliances'
-        ],
-        'Classic LB': [
-            'Layer 4/7', 'HTTP/HTTPS/TCP', 'EC2 only', 'Basic',
-            'Medium', 'No', 'Yes', 'No', 'Limited',
-            'Hour + Data', 'Legacy (deprecated)'
-        ]
-    }
-    
-    df_comparison = pd.DataFrame(comparison_data)
+    df_comparison = catalog.table("elastic_load_balancing.comparison")
     st.dataframe(df_comparison, use_container_width=True)
     
     # Health Checks Deep Dive
@@ -2916,76 +2830,80 @@ def elastic_load_balancing_tab():
         st.markdown('</div>', unsafe_allow_html=True)
     
     # Load Balancer Pricing Calculator
-    st.markdown("### 💰 Load Balancer Cost Calculator")
+    @common.fragment
+    def load_balancer_cost_calculator():
+        st.markdown("### 💰 Load Balancer Cost Calculator")
     
-    col1, col2 = st.columns(2)
+        col1, col2 = st.columns(2)
     
-    with col1:
-        lb_type_calc = st.selectbox("Load Balancer Type:", ["Application", "Network", "Gateway", "Classic"])
-        data_processed_gb = st.slider("Data Processed per Month (GB):", 1, 10000, 1000)
-        new_connections = st.slider("New Connections per Second:", 1, 100000, 1000)
+        with col1:
+            lb_type_calc = st.selectbox("Load Balancer Type:", ["Application", "Network", "Gateway", "Classic"])
+            data_processed_gb = st.slider("Data Processed per Month (GB):", 1, 10000, 1000)
+            new_connections = st.slider("New Connections per Second:", 1, 100000, 1000)
     
-    with col2:
-        active_connections = st.slider("Active Connections (concurrent):", 1, 1000000, 10000)
-        rule_evaluations = st.slider("Rule Evaluations per Second:", 1, 100000, 5000)
-    
-    if st.button("💰 Calculate Monthly Cost"):
-        # Simplified pricing calculations (actual prices vary by region)
-        if lb_type_calc == "Application":
-            fixed_cost = 22.50  # $0.0225/hour * 24 * 30
-            lcu_cost = max(
-                new_connections / 25,  # New connections dimension
-                active_connections / 3000,  # Active connections dimension
-                data_processed_gb / 1000,  # Bandwidth dimension
-                rule_evaluations / 1000   # Rule evaluations dimension
-            )
-            variable_cost = lcu_cost * 0.008 * 24 * 30  # $0.008 per LCU-hour
-            total_cost = fixed_cost + variable_cost
-            
-        elif lb_type_calc == "Network":
-            fixed_cost = 22.50
-            nlcu_cost = max(
-                new_connections / 800,  # New flows dimension
-                active_connections / 100000,  # Active flows dimension
-                data_processed_gb / 1000   # Bandwidth dimension
-            )
-            variable_cost = nlcu_cost * 0.006 * 24 * 30  # $0.006 per NLCU-hour
-            total_cost = fixed_cost + variable_cost
-            
-        elif lb_type_calc == "Classic":
-            fixed_cost = 18.00  # $0.025/hour * 24 * 30
-            data_cost = data_processed_gb * 0.008
-            total_cost = fixed_cost + data_cost
-            
-        else:  # Gateway
-            fixed_cost = 22.50
-            glcu_cost = max(
-                new_connections / 800,
-                active_connections / 100000,
-                data_processed_gb / 1000
-            )
-            variable_cost = glcu_cost * 0.006 * 24 * 30
-            total_cost = fixed_cost + variable_cost
+        with col2:
+            active_connections = st.slider("Active Connections (concurrent):", 1, 1000000, 10000)
+            rule_evaluations = st.slider("Rule Evaluations per Second:", 1, 100000, 5000)
+    
+        if st.button("💰 Calculate Monthly Cost"):
+            # Simplified pricing calculations (actual prices vary by region)
+            if lb_type_calc == "Application":
+                fixed_cost = 22.50  # $0.0225/hour * 24 * 30
+                lcu_cost = max(
+                    new_connections / 25,  # New connections dimension
+                    active_connections / 3000,  # Active connections dimension
+                    data_processed_gb / 1000,  # Bandwidth dimension
+                    rule_evaluations / 1000   # Rule evaluations dimension
+                )
+                variable_cost = lcu_cost * 0.008 * 24 * 30  # $0.008 per LCU-hour
+                total_cost = fixed_cost + variable_cost
+            
+            elif lb_type_calc == "Network":
+                fixed_cost = 22.50
+                nlcu_cost = max(
+                    new_connections / 800,  # New flows dimension
+                    active_connections / 100000,  # Active flows dimension
+                    data_processed_gb / 1000   # Bandwidth dimension
+                )
+                variable_cost = nlcu_cost * 0.006 * 24 * 30  # $0.006 per NLCU-hour
+                total_cost = fixed_cost + variable_cost
+            
+            elif lb_type_calc == "Classic":
+                fixed_cost = 18.00  # $0.025/hour * 24 * 30
+                data_cost = data_processed_gb * 0.008
+                total_cost = fixed_cost + data_cost
+            
+            else:  # Gateway
+                fixed_cost = 22.50
+                glcu_cost = max(
+                    new_connections / 800,
+                    active_connections / 100000,
+                    data_processed_gb / 1000
+                )
+                variable_cost = glcu_cost * 0.006 * 24 * 30
+                total_cost = fixed_cost + variable_cost
         
-        # Create cost breakdown chart
-        cost_breakdown = {
-            'Cost Component': ['Fixed Cost', 'Variable Cost'],
-            'Amount': [fixed_cost, variable_cost if lb_type_calc != "Classic" else data_cost]
-        }
+            # Create cost breakdown chart
+            cost_breakdown = {
+                'Cost Component': ['Fixed Cost', 'Variable Cost'],
+                'Amount': [fixed_cost, variable_cost if lb_type_calc != "Classic" else data_cost]
+            }
         
-        fig = px.pie(values=cost_breakdown['Amount'], names=cost_breakdown['Cost Component'],
-                     title=f'{lb_type_calc} Load Balancer - Monthly Cost Breakdown',
-                     color_discrete_sequence=[AWS_COLORS['primary'], AWS_COLORS['light_blue']])
+            fig = px.pie(values=cost_breakdown['Amount'], names=cost_breakdown['Cost Component'],
+                         title=f'{lb_type_calc} Load Balancer - Monthly Cost Breakdown',
+                         color_discrete_sequence=[AWS_COLORS['primary'], AWS_COLORS['light_blue']])
         
-        st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, use_container_width=True)
         
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Fixed Cost", f"${fixed_cost:.2f}/month")
-        with col2:
-            st.metric("Variable Cost", f"${variable_cost if lb_type_calc != 'Classic' else data_cost:.2f}/month")
-        with col3:
-            st.metric("Total Cost", f"${total_cost:.2f}/month")
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Fixed Cost", f"${fixed_cost:.2f}/month")
+            with col2:
+                st.metric("Variable Cost", f"${variable_cost if lb_type_calc != 'Classic' else data_cost:.2f}/month")
+            with col3:
+                st.metric("Total Cost", f"${total_cost:.2f}/month")
+
+    load_balancer_cost_calculator()
     
     # Best Practices
     st.markdown("### 💡 Load Balancer Best Practices")
@@ -3307,6 +3225,7 @@ class LoadBalancerManager:
         return created_alarms
 
 # Example usage
+@common.profiled
 def main():
     lb_manager = LoadBalancerManager()
     
@@ -3390,6 +3309,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def main():
     """Main application function"""
     # Apply styling
@@ -3412,28 +3332,13 @@ def main():
                 </div>""", unsafe_allow_html=True)
     
     # Create tabs
-    tab1, tab2, tab3, tab4, tab5 = st.tabs([
-        "⚡ AWS Compute Offerings", 
-        "🖼️ Amazon Machine Images (AMI)", 
-        "💾 EC2 Instance Storage Options",
-        "📈 Amazon EC2 Auto Scaling",
-        "⚖️ Elastic Load Balancing"
-    ])
-    
-    with tab1:
-        aws_compute_offerings_tab()
-    
-    with tab2:
-        amazon_machine_images_tab()
-    
-    with tab3:
-        ec2_instance_storage_tab()
-    
-    with tab4:
-        ec2_auto_scaling_tab()
-        
-    with tab5:
-        elastic_load_balancing_tab()
+    common.tab_router({
+        "⚡ AWS Compute Offerings": aws_compute_offerings_tab,
+        "🖼️ Amazon Machine Images (AMI)": amazon_machine_images_tab,
+        "💾 EC2 Instance Storage Options": ec2_instance_storage_tab,
+        "📈 Amazon EC2 Auto Scaling": ec2_auto_scaling_tab,
+        "⚖️ Elastic Load Balancing": elastic_load_balancing_tab,
+    })
     
     # Footer
     st.markdown("""
@@ -1,13 +1,15 @@
 
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import utils.common as common
+import utils.catalog as catalog
 import utils.authenticate as authenticate
 
+# Heavy libraries are imported when a tab first uses them
+np = common.lazy_import("numpy")
+px = common.lazy_import("plotly.express")
+go = common.lazy_import("plotly.graph_objects")
+make_subplots = common.lazy_import("plotly.subplots", "make_subplots")
+
 # Page configuration
 st.set_page_config(
     page_title="AWS Container Services Hub",
@@ -29,8 +31,7 @@ AWS_COLORS = {
 
 def apply_custom_styles():
     """Apply custom CSS styling with AWS color scheme"""
-    st.markdown(f"""
-    <style>
+    common.stylesheet(f"""
         .main {{
             background-color: {AWS_COLORS['light_gray']};
         }}
@@ -130,8 +131,7 @@ def apply_custom_styles():
             border: 2px solid {AWS_COLORS['light_blue']};
             margin: 15px 0;
         }}
-    </style>
-    """, unsafe_allow_html=True)
+    """)
 
 def create_sidebar():
     """Create sidebar with app information and controls"""
@@ -293,6 +293,7 @@ def create_fargate_architecture_mermaid():
         style K fill:#232F3E,stroke:#FF9900,color:#fff
     """
 
+@common.profiled
 def amazon_ecs_tab():
     """Content for Amazon ECS tab"""
     st.markdown("## 📦 Amazon Elastic Container Service (ECS)")
@@ -466,27 +467,14 @@ def amazon_ecs_tab():
     # ECS Use Cases
     st.markdown("### 🌟 Common ECS Use Cases")
     
-    use_cases_data = {
-        'Use Case': ['Web Applications', 'Microservices', 'Batch Processing', 'CI/CD Pipelines', 'API Services'],
-        'Architecture Pattern': ['Multi-tier app', 'Service mesh', 'Job queues', 'Build automation', 'RESTful APIs'],
-        'Launch Type': ['Fargate/EC2', 'Fargate', 'EC2', 'Fargate', 'Fargate'],
-        'Key Benefit': ['Auto scaling', 'Service isolation', 'Cost efficiency', 'Fast deployment', 'High availability']
-    }
-    
-    df_use_cases = pd.DataFrame(use_cases_data)
+    df_use_cases = catalog.table("amazon_ecs.use_cases")
     st.dataframe(df_use_cases, use_container_width=True)
     
     # Performance Metrics Visualization
     st.markdown("### 📊 ECS Performance Metrics")
     
     # Simulate performance data
-    metrics_data = {
-        'Metric': ['Task Start Time', 'CPU Utilization', 'Memory Utilization', 'Request Latency'],
-        'EC2 Launch Type': [45, 65, 70, 120],
-        'Fargate Launch Type': [30, 60, 68, 110]
-    }
-    
-    df_metrics = pd.DataFrame(metrics_data)
+    df_metrics = catalog.table("amazon_ecs.metrics")
     
     fig = px.bar(df_metrics, x='Metric', y=['EC2 Launch Type', 'Fargate Launch Type'],
                  title='Performance Comparison: EC2 vs Fargate Launch Types',
@@ -757,6 +745,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def amazon_eks_tab():
     """Content for Amazon EKS tab"""
     st.markdown("## ☸️ Amazon Elastic Kubernetes Service (EKS)")
@@ -894,27 +883,7 @@ def amazon_eks_tab():
     # Kubernetes vs EKS Benefits
     st.markdown("### 🆚 Self-Managed Kubernetes vs Amazon EKS")
     
-    comparison_data = {
-        'Aspect': ['Control Plane Management', 'High Availability', 'Security Updates', 'Monitoring', 'Integration', 'Cost'],
-        'Self-Managed K8s': [
-            'You manage masters', 
-            'Manual HA setup',
-            'Manual patching',
-            'Setup monitoring stack',
-            'Manual AWS integration',
-            'Infrastructure + Management'
-        ],
-        'Amazon EKS': [
-            'AWS manages for you',
-            'Multi-AZ by default', 
-            'Automatic patching',
-            'CloudWatch integration',
-            'Native AWS services',
-            '$0.10/hour + worker nodes'
-        ]
-    }
-    
-    df_comparison = pd.DataFrame(comparison_data)
+    df_comparison = catalog.table("amazon_eks.comparison")
     st.dataframe(df_comparison, use_container_width=True)
     
     # EKS Add-ons
@@ -958,25 +927,7 @@ def amazon_eks_tab():
     # EKS vs ECS Decision Matrix
     st.markdown("### 🤔 When to Choose EKS vs ECS")
     
-    decision_data = {
-        'Criteria': ['Team Kubernetes Experience', 'Application Complexity', 'Multi-Cloud Strategy', 'Ecosystem Requirements', 'Learning Curve'],
-        'Choose EKS If': [
-            'High - experienced with K8s',
-            'Complex microservices',
-            'Need portability',
-            'Rich K8s ecosystem needed',
-            'Team willing to learn K8s'
-        ],
-        'Choose ECS If': [
-            'Low - want simple container service',
-            'Simple containerized apps',
-            'AWS-only deployment',
-            'Basic orchestration sufficient',
-            'Want AWS-native simplicity'
-        ]
-    }
-    
-    df_decision = pd.DataFrame(decision_data)
+    df_decision = catalog.table("amazon_eks.decision")
     st.dataframe(df_decision, use_container_width=True)
     
     # Code Example
@@ -1294,6 +1245,7 @@ def monitor_cluster_health(cluster_name):
         return False
 
 # Example usage - Complete EKS deployment workflow
+@common.profiled
 def main():
     cluster_name = "my-production-cluster"
     
@@ -1346,6 +1298,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def aws_fargate_tab():
     """Content for AWS Fargate tab"""
     st.markdown("## 🚀 AWS Fargate")
@@ -1403,151 +1356,120 @@ def aws_fargate_tab():
         st.markdown('</div>', unsafe_allow_html=True)
     
     # Interactive Fargate Cost Calculator
-    st.markdown("### 💰 Interactive Fargate Cost Calculator")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("### ⚙️ Resource Configuration")
-        
-        # vCPU options: 0.25, 0.5, 1, 2, 4, 8, 16
-        vcpu = st.selectbox("vCPU:", [0.25, 0.5, 1, 2, 4, 8, 16])
-        
-        # Memory options depend on vCPU
-        memory_options = {
-            0.25: [0.5, 1, 2],
-            0.5: [1, 2, 3, 4],
-            1: [2, 3, 4, 5, 6, 7, 8],
-            2: [4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16],
-            4: [8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30],
-            8: [16, 17, 18, 19, 20, 25, 30, 35, 40, 45, 50, 55, 60],
-            16: [32, 40, 48, 56, 64, 72, 80, 88, 96, 104, 112, 120]
-        }
+    @common.fragment
+    def interactive_fargate_cost_calculator():
+        st.markdown("### 💰 Interactive Fargate Cost Calculator")
+    
+        col1, col2 = st.columns(2)
+    
+        with col1:
+            st.markdown("### ⚙️ Resource Configuration")
+        
+            # vCPU options: 0.25, 0.5, 1, 2, 4, 8, 16
+            vcpu = st.selectbox("vCPU:", [0.25, 0.5, 1, 2, 4, 8, 16])
+        
+            # Memory options depend on vCPU
+            memory_options = {
+                0.25: [0.5, 1, 2],
+                0.5: [1, 2, 3, 4],
+                1: [2, 3, 4, 5, 6, 7, 8],
+                2: [4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16],
+                4: [8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30],
+                8: [16, 17, 18, 19, 20, 25, 30, 35, 40, 45, 50, 55, 60],
+                16: [32, 40, 48, 56, 64, 72, 80, 88, 96, 104, 112, 120]
+            }
         
-        memory_gb = st.selectbox("Memory (GB):", memory_options[vcpu])
+            memory_gb = st.selectbox("Memory (GB):", memory_options[vcpu])
         
-        tasks_count = st.slider("Number of Tasks:", 1, 50, 5)
-        hours_per_day = st.slider("Hours per Day:", 1, 24, 12)
+            tasks_count = st.slider("Number of Tasks:", 1, 50, 5)
+            hours_per_day = st.slider("Hours per Day:", 1, 24, 12)
     
-    with col2:
-        st.markdown("### 📊 Usage Patterns")
+        with col2:
+            st.markdown("### 📊 Usage Patterns")
         
-        architecture = st.selectbox("Architecture:", ["Linux/x64", "Linux/ARM64", "Windows/x64"])
+            architecture = st.selectbox("Architecture:", ["Linux/x64", "Linux/ARM64", "Windows/x64"])
         
-        usage_pattern = st.selectbox("Usage Pattern:", [
-            "Consistent (24/7)", "Business Hours (8h/day)", "Peak Hours (4h/day)", "Batch Jobs (Variable)"
-        ])
+            usage_pattern = st.selectbox("Usage Pattern:", [
+                "Consistent (24/7)", "Business Hours (8h/day)", "Peak Hours (4h/day)", "Batch Jobs (Variable)"
+            ])
         
-        region = st.selectbox("AWS Region:", [
-            "us-east-1 (N. Virginia)", "us-west-2 (Oregon)", "eu-west-1 (Ireland)", "ap-southeast-1 (Singapore)"
-        ])
+            region = st.selectbox("AWS Region:", [
+                "us-east-1 (N. Virginia)", "us-west-2 (Oregon)", "eu-west-1 (Ireland)", "ap-southeast-1 (Singapore)"
+            ])
     
-    if st.button("💵 Calculate Fargate Costs", use_container_width=True):
-        # Fargate pricing (simplified - actual prices vary by region)
-        if "ARM64" in architecture:
-            vcpu_price_per_hour = 0.03238  # ARM64 vCPU pricing
-            memory_price_per_gb_hour = 0.00356  # ARM64 memory pricing
-            performance_note = "20% better price performance vs x86"
-        else:
-            vcpu_price_per_hour = 0.04048  # x86 vCPU pricing
-            memory_price_per_gb_hour = 0.004445  # x86 memory pricing
-            performance_note = "Standard x86 performance"
+        if st.button("💵 Calculate Fargate Costs", use_container_width=True):
+            # Fargate pricing (simplified - actual prices vary by region)
+            if "ARM64" in architecture:
+                vcpu_price_per_hour = 0.03238  # ARM64 vCPU pricing
+                memory_price_per_gb_hour = 0.00356  # ARM64 memory pricing
+                performance_note = "20% better price performance vs x86"
+            else:
+                vcpu_price_per_hour = 0.04048  # x86 vCPU pricing
+                memory_price_per_gb_hour = 0.004445  # x86 memory pricing
+                performance_note = "Standard x86 performance"
+        
+            # Windows pricing is higher
+            if "Windows" in architecture:
+                vcpu_price_per_hour *= 2.0
+                memory_price_per_gb_hour *= 2.0
+                performance_note = "Windows containers (higher pricing)"
+        
+            # Calculate costs
+            hourly_cost = (vcpu * vcpu_price_per_hour) + (memory_gb * memory_price_per_gb_hour)
+            daily_cost = hourly_cost * hours_per_day * tasks_count
+            monthly_cost = daily_cost * 30
+        
+            # Compare with EC2 equivalent
+            ec2_hourly_costs = {
+                0.25: 0.0104,  # t3.micro
+                0.5: 0.0208,   # t3.small
+                1: 0.0416,     # t3.medium
+                2: 0.0832,     # t3.large
+                4: 0.1664,     # t3.xlarge
+                8: 0.3328,     # t3.2xlarge
+                16: 0.6656     # t3.4xlarge (approximate)
+            }
         
-        # Windows pricing is higher
-        if "Windows" in architecture:
-            vcpu_price_per_hour *= 2.0
-            memory_price_per_gb_hour *= 2.0
-            performance_note = "Windows containers (higher pricing)"
+            equivalent_ec2_cost = ec2_hourly_costs.get(vcpu, 0.1) * 24 * 30  # Monthly
+            savings_percentage = ((equivalent_ec2_cost - monthly_cost) / equivalent_ec2_cost) * 100
         
-        # Calculate costs
-        hourly_cost = (vcpu * vcpu_price_per_hour) + (memory_gb * memory_price_per_gb_hour)
-        daily_cost = hourly_cost * hours_per_day * tasks_count
-        monthly_cost = daily_cost * 30
-        
-        # Compare with EC2 equivalent
-        ec2_hourly_costs = {
-            0.25: 0.0104,  # t3.micro
-            0.5: 0.0208,   # t3.small
-            1: 0.0416,     # t3.medium
-            2: 0.0832,     # t3.large
-            4: 0.1664,     # t3.xlarge
-            8: 0.3328,     # t3.2xlarge
-            16: 0.6656     # t3.4xlarge (approximate)
-        }
+            st.markdown('<div class="highlight-box">', unsafe_allow_html=True)
+            st.markdown(f"""
+            ### 💰 Fargate Cost Analysis
         
-        equivalent_ec2_cost = ec2_hourly_costs.get(vcpu, 0.1) * 24 * 30  # Monthly
-        savings_percentage = ((equivalent_ec2_cost - monthly_cost) / equivalent_ec2_cost) * 100
+            **Resource Configuration:**
+            - **vCPU**: {vcpu} 
+            - **Memory**: {memory_gb} GB
+            - **Architecture**: {architecture}
+            - **Tasks**: {tasks_count}
+            - **Runtime**: {hours_per_day} hours/day
         
-        st.markdown('<div class="highlight-box">', unsafe_allow_html=True)
-        st.markdown(f"""
-        ### 💰 Fargate Cost Analysis
+            **Cost Breakdown:**
+            - **Hourly Cost per Task**: ${hourly_cost:.4f}
+            - **Daily Cost**: ${daily_cost:.2f}
+            - **Monthly Cost**: ${monthly_cost:.2f}
         
-        **Resource Configuration:**
-        - **vCPU**: {vcpu} 
-        - **Memory**: {memory_gb} GB
-        - **Architecture**: {architecture}
-        - **Tasks**: {tasks_count}
-        - **Runtime**: {hours_per_day} hours/day
+            **Comparison with EC2:**
+            - **EC2 Monthly Cost**: ${equivalent_ec2_cost:.2f} (24/7 runtime)
+            - **Fargate Savings**: {abs(savings_percentage):.1f}% {'💰 Cheaper' if savings_percentage > 0 else '📈 More Expensive'}
         
-        **Cost Breakdown:**
-        - **Hourly Cost per Task**: ${hourly_cost:.4f}
-        - **Daily Cost**: ${daily_cost:.2f}
-        - **Monthly Cost**: ${monthly_cost:.2f}
-        
-        **Comparison with EC2:**
-        - **EC2 Monthly Cost**: ${equivalent_ec2_cost:.2f} (24/7 runtime)
-        - **Fargate Savings**: {abs(savings_percentage):.1f}% {'💰 Cheaper' if savings_percentage > 0 else '📈 More Expensive'}
-        
-        **Performance**: {performance_note}
-        """)
-        st.markdown('</div>', unsafe_allow_html=True)
+            **Performance**: {performance_note}
+            """)
+            st.markdown('</div>', unsafe_allow_html=True)
+
+    interactive_fargate_cost_calculator()
     
     # Fargate vs EC2 Comparison
     st.markdown("### ⚖️ AWS Fargate vs EC2 Launch Type Comparison")
     
-    comparison_data = {
-        'Aspect': ['Server Management', 'Scaling', 'Pricing Model', 'Cold Start Time', 'Resource Utilization', 'Best For'],
-        'AWS Fargate': [
-            'Serverless - AWS manages',
-            'Automatic, instant',
-            'Pay per task (vCPU + memory)',
-            '1-2 minutes',
-            'Right-sized per task',
-            'Variable workloads, microservices'
-        ],
-        'EC2 Launch Type': [
-            'You manage instances',
-            'Manual or Auto Scaling Groups',
-            'Pay for EC2 instances',
-            '30-60 seconds (warm instances)',
-            'May have unused capacity',
-            'Consistent workloads, cost optimization'
-        ]
-    }
-    
-    df_comparison = pd.DataFrame(comparison_data)
+    df_comparison = catalog.table("aws_fargate.comparison")
     st.dataframe(df_comparison, use_container_width=True)
     
     # Fargate Task Configuration
     st.markdown("### 🎛️ Fargate Task Size Options")
     
     # Create visualization for Fargate task sizes
-    task_sizes = {
-        'vCPU': [0.25, 0.5, 1, 2, 4, 8, 16],
-        'Min Memory (GB)': [0.5, 1, 2, 4, 8, 16, 32],
-        'Max Memory (GB)': [2, 4, 8, 16, 30, 60, 120],
-        'Use Case': [
-            'Light web services',
-            'API endpoints', 
-            'Web applications',
-            'Backend services',
-            'Batch processing',
-            'Data processing',
-            'ML workloads'
-        ]
-    }
-    
-    df_sizes = pd.DataFrame(task_sizes)
+    df_sizes = catalog.table("aws_fargate.task_sizes")
     
     fig = px.scatter(df_sizes, x='vCPU', y='Max Memory (GB)', 
                      size='Max Memory (GB)', 
@@ -1594,13 +1516,7 @@ def aws_fargate_tab():
     # Real-world Performance Metrics
     st.markdown("### 📊 Fargate Performance Characteristics")
     
-    performance_data = {
-        'Metric': ['Cold Start Time', 'Task Launch Speed', 'Network Performance', 'Storage Performance'],
-        'Fargate': ['60-120 seconds', 'Fast (pre-warmed)', '10 Gbps network', 'EBS optimized'],
-        'EC2 (warm)': ['5-30 seconds', 'Very fast', '10+ Gbps (instance dependent)', 'Instance store available']
-    }
-    
-    df_performance = pd.DataFrame(performance_data)
+    df_performance = catalog.table("aws_fargate.performance")
     st.dataframe(df_performance, use_container_width=True)
     
     # Code Example
@@ -1954,6 +1870,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def main():
     """Main application function"""
     # Apply styling
@@ -2018,20 +1935,11 @@ def main():
         st.markdown('</div>', unsafe_allow_html=True)
     
     # Create tabs
-    tab1, tab2, tab3 = st.tabs([
-        "📦 Amazon ECS", 
-        "☸️ Amazon EKS", 
-        "🚀 AWS Fargate"
-    ])
-    
-    with tab1:
-        amazon_ecs_tab()
-    
-    with tab2:
-        amazon_eks_tab()
-    
-    with tab3:
-        aws_fargate_tab()
+    common.tab_router({
+        "📦 Amazon ECS": amazon_ecs_tab,
+        "☸️ Amazon EKS": amazon_eks_tab,
+        "🚀 AWS Fargate": aws_fargate_tab,
+    })
     
     # Footer
     st.markdown("""
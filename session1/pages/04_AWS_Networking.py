@@ -1,13 +1,16 @@
 
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import utils.common as common
+import utils.catalog as catalog
 import utils.authenticate as authenticate
 
+# Heavy libraries are imported when a tab first uses them
+pd = common.lazy_import("pandas")
+np = common.lazy_import("numpy")
+px = common.lazy_import("plotly.express")
+go = common.lazy_import("plotly.graph_objects")
+make_subplots = common.lazy_import("plotly.subplots", "make_subplots")
+
 # Page configuration
 st.set_page_config(
     page_title="AWS Networking Essentials Hub",
@@ -29,8 +32,7 @@ AWS_COLORS = {
 
 def apply_custom_styles():
     """Apply custom CSS styling with AWS color scheme"""
-    st.markdown(f"""
-    <style>
+    common.stylesheet(f"""
         .main {{
             background-color: {AWS_COLORS['light_gray']};
         }}
@@ -146,8 +148,7 @@ def apply_custom_styles():
             border-radius: 8px;
             margin: 5px;
         }}
-    </style>
-    """, unsafe_allow_html=True)
+    """)
 
 def create_sidebar():
     """Create sidebar with app information and controls"""
@@ -274,6 +275,7 @@ def create_route53_dns_flow_mermaid():
         style Server4 fill:#3FB34F,stroke:#232F3E,color:#fff
     """
 
+@common.profiled
 def vpc_tab():
     """Content for Amazon VPC tab"""
     st.markdown("## 🌐 Amazon Virtual Private Cloud (VPC)")
@@ -478,24 +480,7 @@ def vpc_tab():
     # VPC Connectivity Options
     st.markdown("### 🔗 VPC Connectivity Options")
     
-    connectivity_options = {
-        'Connection Type': [
-            'Internet Gateway', 'NAT Gateway', 'VPC Peering', 
-            'Transit Gateway', 'VPN Gateway', 'Direct Connect'
-        ],
-        'Purpose': [
-            'Public internet access',
-            'Outbound internet for private resources',
-            'Connect two VPCs privately',
-            'Hub for multiple VPC connections',
-            'On-premises VPN connection',
-            'Dedicated network connection'
-        ],
-        'Cost': ['Free', 'Hourly + Data', 'Free', 'Hourly + Data', 'Hourly', 'Monthly + Data'],
-        'Bandwidth': ['Unlimited', '5-45 Gbps', 'Unlimited', 'Up to 50 Gbps', 'Up to 1.25 Gbps', 'Up to 100 Gbps']
-    }
-    
-    df_connectivity = pd.DataFrame(connectivity_options)
+    df_connectivity = catalog.table("vpc.connectivity_options")
     st.dataframe(df_connectivity, use_container_width=True)
     
     # Best Practices
@@ -818,6 +803,7 @@ if vpc_config:
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def privatelink_tab():
     """Content for AWS PrivateLink tab"""
     st.markdown("## 🔗 AWS PrivateLink")
@@ -1019,32 +1005,7 @@ def privatelink_tab():
     # Supported Services
     st.markdown("### 🛠️ Popular Services Supporting PrivateLink")
     
-    services_data = {
-        'Service': [
-            'Amazon S3', 'Amazon DynamoDB', 'Amazon ECS', 'Amazon ECR',
-            'AWS Secrets Manager', 'Amazon CloudWatch', 'AWS Systems Manager', 'Amazon Kinesis'
-        ],
-        'Endpoint Type': [
-            'Gateway', 'Gateway', 'Interface', 'Interface',
-            'Interface', 'Interface', 'Interface', 'Interface'
-        ],
-        'Cost': [
-            'Free', 'Free', 'Hourly + Data', 'Hourly + Data',
-            'Hourly + Data', 'Hourly + Data', 'Hourly + Data', 'Hourly + Data'
-        ],
-        'Common Use Case': [
-            'Private bucket access',
-            'Database operations',
-            'Container management',
-            'Container image registry',
-            'Secure credential access',
-            'Private monitoring',
-            'Instance management',
-            'Stream processing'
-        ]
-    }
-    
-    df_services = pd.DataFrame(services_data)
+    df_services = catalog.table("privatelink.services")
     st.dataframe(df_services, use_container_width=True)
     
     # Security Benefits
@@ -1356,6 +1317,7 @@ endpoints = setup_private_aws_access()
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def route53_tab():
     """Content for Amazon Route 53 tab"""
     st.markdown("## 🌍 Amazon Route 53")
@@ -1497,28 +1459,7 @@ def route53_tab():
     # Routing Policies Deep Dive
     st.markdown("### 🎯 Route 53 Routing Policies Explained")
     
-    routing_policies_data = {
-        'Policy': [
-            'Simple', 'Weighted', 'Latency-based', 'Failover',
-            'Geolocation', 'Geoproximity', 'Multivalue'
-        ],
-        'Use Case': [
-            'Single web server',
-            'A/B testing, gradual deployments',
-            'Global applications with regional servers',
-            'Active-passive disaster recovery',
-            'Content localization, legal compliance',
-            'Load balancing with geographic bias',
-            'Load balancing with health checks'
-        ],
-        'Health Checks': [
-            'Optional', 'Recommended', 'Recommended', 'Required',
-            'Optional', 'Optional', 'Required'
-        ],
-        'Max Records': ['1', 'Multiple', 'Multiple', '2', 'Multiple', 'Multiple', '8']
-    }
-    
-    df_policies = pd.DataFrame(routing_policies_data)
+    df_policies = catalog.table("route53.routing_policies")
     st.dataframe(df_policies, use_container_width=True)
     
     # Routing Policy Examples
@@ -1970,6 +1911,7 @@ dns_config = setup_production_dns()
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def main():
     """Main application function"""
     # Apply styling
@@ -1989,20 +1931,11 @@ def main():
                 </div>""", unsafe_allow_html=True)
     
     # Create tabs
-    tab1, tab2, tab3 = st.tabs([
-        "🌐 Amazon VPC", 
-        "🔗 AWS PrivateLink", 
-        "🌍 Amazon Route 53"
-    ])
-    
-    with tab1:
-        vpc_tab()
-    
-    with tab2:
-        privatelink_tab()
-    
-    with tab3:
-        route53_tab()
+    common.tab_router({
+        "🌐 Amazon VPC": vpc_tab,
+        "🔗 AWS PrivateLink": privatelink_tab,
+        "🌍 Amazon Route 53": route53_tab,
+    })
     
     # Footer
     st.markdown("""
@@ -1,13 +1,16 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import utils.common as common
+import utils.catalog as catalog
 import utils.authenticate as authenticate
 import json
 
+# Heavy libraries are imported when a tab first uses them
+pd = common.lazy_import("pandas")
+np = common.lazy_import("numpy")
+px = common.lazy_import("plotly.express")
+go = common.lazy_import("plotly.graph_objects")
+make_subplots = common.lazy_import("plotly.subplots", "make_subplots")
+
 # Page configuration
 st.set_page_config(
     page_title="AWS Identity and Access Management Hub",
@@ -29,8 +32,7 @@ AWS_COLORS = {
 
 def apply_custom_styles():
     """Apply custom CSS styling with AWS color scheme"""
-    st.markdown(f"""
-    <style>
+    common.stylesheet(f"""
         .main {{
             background-color: {AWS_COLORS['light_gray']};
         }}
@@ -148,8 +150,7 @@ def apply_custom_styles():
             border-left: 4px solid {AWS_COLORS['warning']};
             margin: 10px 0;
         }}
-    </style>
-    """, unsafe_allow_html=True)
+    """)
 
 def create_sidebar():
     """Create sidebar with app information and controls"""
@@ -288,6 +289,7 @@ def create_policy_evaluation_mermaid():
         style J fill:#FF6B35,stroke:#232F3E,color:#fff
     """
 
+@common.profiled
 def aws_iam_tab():
     """Content for AWS Identity and Access Management tab"""
     st.markdown("## 🔐 AWS Identity and Access Management")
@@ -449,28 +451,7 @@ def aws_iam_tab():
     # IAM Best Practices
     st.markdown("### 💡 IAM Security Best Practices")
     
-    best_practices_data = {
-        'Practice': [
-            'Principle of Least Privilege',
-            'Use IAM Roles for Applications', 
-            'Enable Multi-Factor Authentication',
-            'Rotate Credentials Regularly',
-            'Use Groups for User Management',
-            'Monitor and Audit Access'
-        ],
-        'Description': [
-            'Grant only the permissions needed to perform tasks',
-            'Avoid embedding long-term credentials in applications',
-            'Add extra layer of security for sensitive operations',
-            'Change access keys and passwords regularly',
-            'Manage permissions at group level, not individual users',
-            'Use CloudTrail and Access Analyzer for monitoring'
-        ],
-        'Security Impact': ['High', 'Very High', 'High', 'Medium', 'Medium', 'High'],
-        'Implementation Difficulty': ['Medium', 'Low', 'Low', 'Medium', 'Low', 'Medium']
-    }
-    
-    df_practices = pd.DataFrame(best_practices_data)
+    df_practices = catalog.table("aws_iam.best_practices")
     st.dataframe(df_practices, use_container_width=True)
     
     # IAM Policy Types
@@ -764,6 +745,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def iam_roles_tab():
     """Content for IAM Roles tab"""
     st.markdown("## 👤 IAM Roles")
@@ -987,42 +969,7 @@ def iam_roles_tab():
     # Common Role Patterns
     st.markdown("### 🎯 Common IAM Role Patterns")
     
-    role_patterns = {
-        'Pattern': [
-            'EC2 Instance Role',
-            'Lambda Execution Role',
-            'Cross-Account Access',
-            'CI/CD Pipeline Role',
-            'Data Processing Role',
-            'Monitoring Role'
-        ],
-        'Trusted Entity': [
-            'ec2.amazonaws.com',
-            'lambda.amazonaws.com', 
-            'External AWS Account',
-            'CodeBuild/CodePipeline',
-            'glue.amazonaws.com',
-            'monitoring.amazonaws.com'
-        ],
-        'Common Permissions': [
-            'S3 access, CloudWatch logs',
-            'Basic execution, VPC access',
-            'Specific resource access',
-            'Deploy permissions, S3 artifacts',
-            'Data lake access, ETL permissions',
-            'CloudWatch metrics, SNS alerts'
-        ],
-        'Security Considerations': [
-            'Least privilege, instance profile',
-            'VPC security, resource-based policies',
-            'External ID, MFA requirements',
-            'Temporary credentials, audit logs',
-            'Data encryption, access patterns',
-            'Read-only where possible'
-        ]
-    }
-    
-    df_patterns = pd.DataFrame(role_patterns)
+    df_patterns = catalog.table("iam_roles.role_patterns")
     st.dataframe(df_patterns, use_container_width=True)
     
     # Code Example
@@ -1307,6 +1254,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def security_token_service_tab():
     """Content for Security Token Service (STS) tab"""
     st.markdown("## 🎫 Security Token Service (STS)")
@@ -1390,73 +1338,77 @@ def security_token_service_tab():
         st.markdown('</div>', unsafe_allow_html=True)
     
     # Interactive STS Token Simulator
-    st.markdown("### 🎮 Interactive STS Token Simulator")
+    @common.fragment
+    def interactive_sts_token_simulator():
+        st.markdown("### 🎮 Interactive STS Token Simulator")
     
-    col1, col2 = st.columns(2)
+        col1, col2 = st.columns(2)
     
-    with col1:
-        st.markdown("### 🔧 Token Request Configuration")
-        operation_type = st.selectbox("STS Operation:", [
-            "AssumeRole", "AssumeRoleWithWebIdentity", "AssumeRoleWithSAML", "GetSessionToken"
-        ])
+        with col1:
+            st.markdown("### 🔧 Token Request Configuration")
+            operation_type = st.selectbox("STS Operation:", [
+                "AssumeRole", "AssumeRoleWithWebIdentity", "AssumeRoleWithSAML", "GetSessionToken"
+            ])
         
-        if operation_type == "AssumeRole":
-            role_arn = st.text_input("Role ARN:", "arn:aws:iam::123456789012:role/MyApplicationRole")
-            session_name = st.text_input("Session Name:", "MyAppSession")
-            external_id = st.text_input("External ID (optional):", "")
-        elif operation_type == "AssumeRoleWithWebIdentity":
-            role_arn = st.text_input("Role ARN:", "arn:aws:iam::123456789012:role/WebIdentityRole")
-            web_identity_token = st.text_area("Web Identity Token:", "eyJhbGciOiJSUzI1NiIsInR5cCI6IkpXVCJ9...")
-        elif operation_type == "GetSessionToken":
-            duration = st.slider("Session Duration (seconds):", 900, 129600, 3600)
+            if operation_type == "AssumeRole":
+                role_arn = st.text_input("Role ARN:", "arn:aws:iam::123456789012:role/MyApplicationRole")
+                session_name = st.text_input("Session Name:", "MyAppSession")
+                external_id = st.text_input("External ID (optional):", "")
+            elif operation_type == "AssumeRoleWithWebIdentity":
+                role_arn = st.text_input("Role ARN:", "arn:aws:iam::123456789012:role/WebIdentityRole")
+                web_identity_token = st.text_area("Web Identity Token:", "eyJhbGciOiJSUzI1NiIsInR5cCI6IkpXVCJ9...")
+            elif operation_type == "GetSessionToken":
+                duration = st.slider("Session Duration (seconds):", 900, 129600, 3600)
             
-        session_duration = st.slider("Session Duration (hours):", 1, 12, 1)
+            session_duration = st.slider("Session Duration (hours):", 1, 12, 1)
     
-    with col2:
-        st.markdown("### 🔒 Security Settings")
-        require_mfa = st.checkbox("Require MFA", value=False)
+        with col2:
+            st.markdown("### 🔒 Security Settings")
+            require_mfa = st.checkbox("Require MFA", value=False)
         
-        if require_mfa:
-            mfa_serial = st.text_input("MFA Device Serial:", "arn:aws:iam::123456789012:mfa/user")
-            mfa_token = st.text_input("MFA Token:", "123456")
+            if require_mfa:
+                mfa_serial = st.text_input("MFA Device Serial:", "arn:aws:iam::123456789012:mfa/user")
+                mfa_token = st.text_input("MFA Token:", "123456")
         
-        source_ip_condition = st.checkbox("Restrict Source IP")
-        if source_ip_condition:
-            allowed_ip = st.text_input("Allowed IP/CIDR:", "203.0.113.0/24")
+            source_ip_condition = st.checkbox("Restrict Source IP")
+            if source_ip_condition:
+                allowed_ip = st.text_input("Allowed IP/CIDR:", "203.0.113.0/24")
         
-        time_condition = st.checkbox("Time-based Restriction")
-        if time_condition:
-            allowed_time_range = st.text_input("Allowed Hours (UTC):", "09:00-17:00")
+            time_condition = st.checkbox("Time-based Restriction")
+            if time_condition:
+                allowed_time_range = st.text_input("Allowed Hours (UTC):", "09:00-17:00")
     
-    if st.button("🎫 Generate STS Token", use_container_width=True):
-        # Simulate token generation
-        import time
-        access_key = f"ASIA{''.join(np.random.choice(list('ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'), 16))}"
-        secret_key = f"{''.join(np.random.choice(list('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/'), 40))}"
-        session_token = f"{''.join(np.random.choice(list('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/'), 400))}"
+        if st.button("🎫 Generate STS Token", use_container_width=True):
+            # Simulate token generation
+            import time
+            access_key = f"ASIA{''.join(np.random.choice(list('ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'), 16))}"
+            secret_key = f"{''.join(np.random.choice(list('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/'), 40))}"
+            session_token = f"{''.join(np.random.choice(list('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/'), 400))}"
         
-        expiration_time = pd.Timestamp.now() + pd.Timedelta(hours=session_duration)
+            expiration_time = pd.Timestamp.now() + pd.Timedelta(hours=session_duration)
         
-        st.markdown('<div class="highlight-box">', unsafe_allow_html=True)
-        st.markdown(f"""
-        ### ✅ STS Token Generated Successfully!
-        
-        **Token Details:**
-        - **Operation**: {operation_type}
-        - **Access Key ID**: {access_key}
-        - **Secret Access Key**: {secret_key[:10]}...
-        - **Session Token**: {session_token[:50]}...
-        - **Expiration**: {expiration_time.strftime('%Y-%m-%d %H:%M:%S UTC')}
-        
-        **Security Features:**
-        - **MFA Protected**: {'✅ Yes' if require_mfa else '❌ No'}
-        - **IP Restricted**: {'✅ Yes' if source_ip_condition else '❌ No'}
-        - **Time Limited**: {session_duration} hours
-        - **Token Size**: ~{len(session_token)} characters
-        
-        ⚠️ **Important**: Store these credentials securely and never commit to version control!
-        """)
-        st.markdown('</div>', unsafe_allow_html=True)
+            st.markdown('<div class="highlight-box">', unsafe_allow_html=True)
+            st.markdown(f"""
+            ### ✅ STS Token Generated Successfully!
+        
+            **Token Details:**
+            - **Operation**: {operation_type}
+            - **Access Key ID**: {access_key}
+            - **Secret Access Key**: {secret_key[:10]}...
+            - **Session Token**: {session_token[:50]}...
+            - **Expiration**: {expiration_time.strftime('%Y-%m-%d %H:%M:%S UTC')}
+        
+            **Security Features:**
+            - **MFA Protected**: {'✅ Yes' if require_mfa else '❌ No'}
+            - **IP Restricted**: {'✅ Yes' if source_ip_condition else '❌ No'}
+            - **Time Limited**: {session_duration} hours
+            - **Token Size**: ~{len(session_token)} characters
+        
+            ⚠️ **Important**: Store these credentials securely and never commit to version control!
+            """)
+            st.markdown('</div>', unsafe_allow_html=True)
+
+    interactive_sts_token_simulator()
     
     # Temporary Credentials Properties
     st.markdown("### 🔍 Temporary Credentials Properties")
@@ -1514,35 +1466,7 @@ def security_token_service_tab():
     # STS Use Cases
     st.markdown("### 🎯 Common STS Use Cases")
     
-    use_cases_data = {
-        'Use Case': [
-            'Cross-Account Access',
-            'Service-to-Service Auth',
-            'Mobile Applications', 
-            'Web Federation',
-            'Enterprise SSO',
-            'CI/CD Pipelines'
-        ],
-        'STS Operation': [
-            'AssumeRole',
-            'AssumeRole',
-            'AssumeRoleWithWebIdentity',
-            'AssumeRoleWithWebIdentity', 
-            'AssumeRoleWithSAML',
-            'AssumeRole'
-        ],
-        'Duration': ['1-12 hours', '15 min-1 hour', '1-12 hours', '1-12 hours', '1-12 hours', '15 min-1 hour'],
-        'Security Features': [
-            'External ID, MFA',
-            'Service principals',
-            'App-specific tokens',
-            'OAuth/OIDC integration',
-            'SAML assertions',
-            'Time-limited access'
-        ]
-    }
-    
-    df_use_cases = pd.DataFrame(use_cases_data)
+    df_use_cases = catalog.table("security_token_service.use_cases")
     st.dataframe(df_use_cases, use_container_width=True)
     
     # Token Rotation and Best Practices
@@ -1884,6 +1808,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def policy_interpretation_tab():
     """Content for Policy Interpretation tab"""
     st.markdown("## 📜 Policy Interpretation")
@@ -2156,42 +2081,7 @@ def policy_interpretation_tab():
     # Common Policy Patterns
     st.markdown("### 🎯 Common Policy Patterns")
     
-    pattern_data = {
-        'Pattern': [
-            'Least Privilege',
-            'Resource-Based Restriction',
-            'Time-Based Access',
-            'IP-Based Access',
-            'MFA Requirement',
-            'Tag-Based Access'
-        ],
-        'Use Case': [
-            'Grant minimal required permissions',
-            'Restrict access to specific resources',
-            'Allow access only during business hours',
-            'Restrict access from specific networks',
-            'Require MFA for sensitive operations',
-            'Control access based on resource tags'
-        ],
-        'Example Condition': [
-            'No wildcards in actions',
-            'Specific ARN in Resource',
-            'aws:CurrentTime condition',
-            'aws:SourceIp condition',
-            'aws:MultiFactorAuthPresent',
-            'ResourceTag conditions'
-        ],
-        'Security Benefit': [
-            'Minimizes attack surface',
-            'Prevents lateral movement',
-            'Reduces off-hours risks',
-            'Prevents external access',
-            'Adds authentication layer',
-            'Enables fine-grained control'
-        ]
-    }
-    
-    df_patterns = pd.DataFrame(pattern_data)
+    df_patterns = catalog.table("policy_interpretation.pattern")
     st.dataframe(df_patterns, use_container_width=True)
     
     # Policy Troubleshoting
@@ -2620,6 +2510,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def iam_permissions_tab():
     """Content for IAM Permissions tab"""
     st.markdown("## 🛡️ IAM Permissions")
@@ -2866,35 +2757,7 @@ def iam_permissions_tab():
     # Permission Evaluation Matrix
     st.markdown("### 📊 Permission Evaluation Matrix")
     
-    evaluation_data = {
-        'Scenario': [
-            'Identity Policy: Allow, Resource Policy: Allow',
-            'Identity Policy: Allow, Resource Policy: Deny',
-            'Identity Policy: Deny, Resource Policy: Allow',
-            'Identity Policy: Allow, No Resource Policy',
-            'No Identity Policy, Resource Policy: Allow',
-            'Permission Boundary: Deny'
-        ],
-        'Result': ['✅ Allow', '❌ Deny', '❌ Deny', '✅ Allow', '✅ Allow', '❌ Deny'],
-        'Explanation': [
-            'Both policies allow the action',
-            'Explicit deny in resource policy takes precedence',
-            'Explicit deny in identity policy takes precedence',
-            'Identity policy allows, no resource policy restrictions',
-            'Resource policy allows cross-account/service access',
-            'Permission boundary sets maximum permissions'
-        ],
-        'Common Use Case': [
-            'Normal authorized access',
-            'Resource protection override',
-            'User restriction override',
-            'Standard user permissions',
-            'Cross-account resource sharing',
-            'Developer environment restrictions'
-        ]
-    }
-    
-    df_evaluation = pd.DataFrame(evaluation_data)
+    df_evaluation = catalog.table("iam_permissions.evaluation")
     st.dataframe(df_evaluation, use_container_width=True)
     
     # Advanced Permission Concepts
@@ -2945,42 +2808,7 @@ def iam_permissions_tab():
     # Permission Monitoring
     st.markdown("### 📊 Permission Monitoring and Auditing")
     
-    monitoring_tools = {
-        'Tool': [
-            'AWS CloudTrail',
-            'IAM Access Advisor',
-            'IAM Access Analyzer',
-            'AWS Config',
-            'IAM Policy Simulator',
-            'AWS Well-Architected Tool'
-        ],
-        'Purpose': [
-            'API call logging and auditing',
-            'Service access analysis',
-            'External access identification',
-            'Compliance monitoring',
-            'Permission testing',
-            'Security best practices'
-        ],
-        'Key Features': [
-            'Real-time logging, searchable events',
-            'Last accessed timestamps, unused permissions',
-            'External access paths, policy validation',
-            'Configuration drift, compliance rules',
-            'What-if scenarios, policy testing',
-            'Security pillar recommendations'
-        ],
-        'Best For': [
-            'Incident investigation, audit trails',
-            'Permission cleanup, least privilege',
-            'External access review, security',
-            'Continuous compliance, governance',
-            'Policy development, troubleshooting',
-            'Overall security posture'
-        ]
-    }
-    
-    df_monitoring = pd.DataFrame(monitoring_tools)
+    df_monitoring = catalog.table("iam_permissions.monitoring_tools")
     st.dataframe(df_monitoring, use_container_width=True)
     
     # Code Example
@@ -3335,6 +3163,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def main():
     """Main application function"""
     # Apply styling
@@ -3357,28 +3186,13 @@ def main():
                 </div>""", unsafe_allow_html=True)
     
     # Create tabs
-    tab1, tab2, tab3, tab4, tab5 = st.tabs([
-        "🔐 AWS Identity and Access Management", 
-        "👤 IAM Roles", 
-        "🎫 Security Token Service (STS)",
-        "📜 Policy Interpretation",
-        "🛡️ IAM Permissions"
-    ])
-    
-    with tab1:
-        aws_iam_tab()
-    
-    with tab2:
-        iam_roles_tab()
-    
-    with tab3:
-        security_token_service_tab()
-    
-    with tab4:
-        policy_interpretation_tab()
-        
-    with tab5:
-        iam_permissions_tab()
+    common.tab_router({
+        "🔐 AWS Identity and Access Management": aws_iam_tab,
+        "👤 IAM Roles": iam_roles_tab,
+        "🎫 Security Token Service (STS)": security_token_service_tab,
+        "📜 Policy Interpretation": policy_interpretation_tab,
+        "🛡️ IAM Permissions": iam_permissions_tab,
+    })
     
     # Footer
     st.markdown("""
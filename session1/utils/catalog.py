@@ -0,0 +1,13 @@
+"""
+Reference tables for the Session 1 app, read from data/catalog.json.
+
+The implementation lives in the shared dva_shared package (shared/ at the
+repository root); this module binds it to this app's data folder.
+"""
+from pathlib import Path
+
+from dva_shared import catalog as _catalog
+
+_catalog.configure(Path(__file__).resolve().parent.parent / "data")
+
+from dva_shared.catalog import *  # noqa: E402,F401,F403
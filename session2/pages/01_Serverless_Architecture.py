@@ -1,14 +1,16 @@
 
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import utils.common as common
+import utils.catalog as catalog
 import utils.authenticate as authenticate
 import json
 
+# Heavy libraries are imported when a tab first uses them
+np = common.lazy_import("numpy")
+px = common.lazy_import("plotly.express")
+go = common.lazy_import("plotly.graph_objects")
+make_subplots = common.lazy_import("plotly.subplots", "make_subplots")
+
 # Page configuration
 st.set_page_config(
     page_title="AWS Development with Services Hub",
@@ -30,8 +32,7 @@ AWS_COLORS = {
 
 def apply_custom_styles():
     """Apply custom CSS styling with AWS color scheme"""
-    st.markdown(f"""
-    <style>
+    common.stylesheet(f"""
         .main {{
             background-color: {AWS_COLORS['light_gray']};
         }}
@@ -131,8 +132,7 @@ def apply_custom_styles():
             border: 2px solid {AWS_COLORS['light_blue']};
             margin: 15px 0;
         }}
-    </style>
-    """, unsafe_allow_html=True)
+    """)
 
 def create_sidebar():
     """Create sidebar with app information and controls"""
@@ -357,6 +357,7 @@ def create_step_functions_workflow_mermaid():
         style M fill:#3FB34F,stroke:#232F3E,color:#fff
     """
 
+@common.profiled
 def architecture_comparison_tab():
     """Content for Server-Based vs Serverless Architecture tab"""
     st.markdown("## 🏗️ Server-Based vs Serverless Architecture")
@@ -480,29 +481,7 @@ def architecture_comparison_tab():
     # Detailed comparison table
     st.markdown("### ⚖️ Detailed Architecture Comparison")
     
-    comparison_data = {
-        'Aspect': [
-            'Infrastructure Management', 'Scaling', 'Cost Model', 'Performance', 
-            'Development Speed', 'Vendor Lock-in', 'Monitoring', 'Security'
-        ],
-        'Server-Based': [
-            'Manual setup & maintenance', 'Manual/ASG configuration', 'Fixed costs (instances running 24/7)', 
-            'Consistent, predictable', 'Slower (infrastructure setup)', 'Low (standard APIs)', 
-            'CloudWatch + custom tools', 'Full control, more complexity'
-        ],
-        'Serverless': [
-            'Fully managed by AWS', 'Automatic, instant', 'Pay-per-use (execution time)', 
-            'Variable (cold starts)', 'Faster (focus on business logic)', 'Higher (AWS-specific services)', 
-            'Built-in monitoring', 'Shared responsibility model'
-        ],
-        'Best For': [
-            'Complex enterprise apps', 'Predictable workloads', 'Steady traffic patterns',
-            'Latency-sensitive apps', 'Legacy system migrations', 'Multi-cloud strategy',
-            'Detailed system insights', 'Compliance-heavy industries'
-        ]
-    }
-    
-    df_comparison = pd.DataFrame(comparison_data)
+    df_comparison = catalog.table("architecture_comparison.comparison")
     st.dataframe(df_comparison, use_container_width=True)
     
     # Code Examples
@@ -655,6 +634,7 @@ print(f"Deployed: {serverless}")
         ''', language='python')
         st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def api_gateway_tab():
     """Content for Amazon API Gateway tab"""
     st.markdown("## 🌐 Amazon API Gateway")
@@ -834,27 +814,7 @@ def api_gateway_tab():
     # Endpoint Types Explanation  
     st.markdown("### 📍 API Gateway Endpoint Types")
     
-    endpoint_data = {
-        'Endpoint Type': ['Edge-Optimized', 'Regional', 'Private'],
-        'Best For': [
-            'Global users, geographically distributed',
-            'Clients in same region as API',
-            'Internal applications, VPC access only'
-        ],
-        'Performance': [
-            'Cached at CloudFront edge locations',
-            'Lower latency for regional clients',
-            'Lowest latency for VPC clients'
-        ],
-        'Use Cases': [
-            'Public APIs, mobile apps, web frontends',
-            'Regional microservices, B2B APIs',
-            'Internal services, enterprise apps'
-        ],
-        'Cost Impact': ['Higher (CloudFront costs)', 'Standard', 'Lower (no CloudFront)']
-    }
-    
-    df_endpoints = pd.DataFrame(endpoint_data)
+    df_endpoints = catalog.table("api_gateway.endpoint")
     st.dataframe(df_endpoints, use_container_width=True)
     
     # Stage Management
@@ -1178,6 +1138,7 @@ class DecimalEncoder(json.JSONEncoder):
         ''', language='python')
         st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def lambda_tab():
     """Content for AWS Lambda tab"""
     st.markdown("## ⚡ AWS Lambda")
@@ -1353,15 +1314,7 @@ def lambda_tab():
     # Memory vs Performance Analysis
     st.markdown("### 📊 Memory vs Performance Analysis")
     
-    performance_data = {
-        'Memory (MB)': [128, 256, 512, 1024, 1536, 3008],
-        'vCPU Allocation': [0.07, 0.14, 0.29, 0.58, 0.87, 1.70],
-        'Typical Duration (ms)': [5000, 2500, 1250, 625, 420, 300],
-        'Cost per Invocation ($)': [0.0000208, 0.0000417, 0.0000834, 0.0001668, 0.0002501, 0.0005001],
-        'Cost per Duration ($)': [0.0000042, 0.0000104, 0.0000104, 0.0000104, 0.0000105, 0.0000150]
-    }
-    
-    df_performance = pd.DataFrame(performance_data)
+    df_performance = catalog.table("lambda.performance")
     
     fig = make_subplots(
         rows=1, cols=2,
@@ -2201,6 +2154,7 @@ def critical_business_logic(data):
         ''', language='python')
         st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def dynamodb_tab():
     """Content for Amazon DynamoDB tab"""
     st.markdown("## 🗃️ Amazon DynamoDB")
@@ -2411,25 +2365,7 @@ def dynamodb_tab():
     # Capacity Modes Comparison
     st.markdown("### ⚖️ Capacity Modes Comparison")
     
-    capacity_data = {
-        'Feature': ['Pricing Model', 'Scaling', 'Performance', 'Use Case', 'Cost Predictability'],
-        'Provisioned Mode': [
-            'Fixed hourly rate based on provisioned capacity',
-            'Manual scaling or Auto Scaling',
-            'Consistent performance, predictable latency',
-            'Predictable traffic patterns, cost optimization',
-            'High - fixed monthly costs'
-        ],
-        'On-Demand Mode': [
-            'Pay-per-request pricing',
-            'Automatic scaling (instant)',
-            'Variable performance, handles traffic spikes',
-            'Unpredictable traffic, new applications',
-            'Low - costs vary with usage'
-        ]
-    }
-    
-    df_capacity = pd.DataFrame(capacity_data)
+    df_capacity = catalog.table("dynamodb.capacity")
     st.dataframe(df_capacity, use_container_width=True)
     
     # DynamoDB vs RDS Comparison  
@@ -3505,6 +3441,7 @@ if __name__ == "__main__":
         ''', language='python')
         st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def step_functions_tab():
     """Content for AWS Step Functions tab"""
     st.markdown("## 🔄 AWS Step Functions")
@@ -3723,30 +3660,7 @@ def step_functions_tab():
     # Use Cases and Patterns
     st.markdown("### 🌟 Common Use Cases & Patterns")
     
-    use_cases_data = {
-        'Use Case': [
-            'Order Processing', 'Data Processing Pipeline', 'Image/Video Processing',
-            'Human Approval Workflow', 'Batch Job Orchestration', 'Microservices Coordination'
-        ],
-        'Workflow Type': [
-            'Standard', 'Express/Standard', 'Express',
-            'Standard', 'Standard', 'Express'
-        ],
-        'Key Services': [
-            'Lambda, DynamoDB, SNS, SQS',
-            'Lambda, Glue, S3, Athena',
-            'Lambda, S3, Rekognition, MediaConvert',
-            'Lambda, SNS, SES',
-            'Batch, ECS, Lambda, CloudWatch',
-            'Lambda, API Gateway, DynamoDB'
-        ],
-        'Duration': [
-            'Minutes to Hours', 'Hours to Days', 'Minutes',
-            'Days to Weeks', 'Hours to Days', 'Seconds to Minutes'
-        ]
-    }
-    
-    df_use_cases = pd.DataFrame(use_cases_data)
+    df_use_cases = catalog.table("step_functions.use_cases")
     st.dataframe(df_use_cases, use_container_width=True)
     
     # Best Practices
@@ -4845,6 +4759,7 @@ if __name__ == "__main__":
         ''', language='python')
         st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def main():
     """Main application function"""
     # Apply styling
@@ -4866,28 +4781,13 @@ def main():
                 </div>""", unsafe_allow_html=True)
     
     # Create tabs
-    tab1, tab2, tab3, tab4, tab5 = st.tabs([
-        "🏗️ Server-Based vs Serverless", 
-        "🌐 Amazon API Gateway", 
-        "⚡ AWS Lambda",
-        "🗃️ Amazon DynamoDB",
-        "🔄 AWS Step Functions"
-    ])
-    
-    with tab1:
-        architecture_comparison_tab()
-    
-    with tab2:
-        api_gateway_tab()
-    
-    with tab3:
-        lambda_tab()
-    
-    with tab4:
-        dynamodb_tab()
-        
-    with tab5:
-        step_functions_tab()
+    common.tab_router({
+        "🏗️ Server-Based vs Serverless": architecture_comparison_tab,
+        "🌐 Amazon API Gateway": api_gateway_tab,
+        "⚡ AWS Lambda": lambda_tab,
+        "🗃️ Amazon DynamoDB": dynamodb_tab,
+        "🔄 AWS Step Functions": step_functions_tab,
+    })
     
     # Footer
     st.markdown("""
@@ -1,13 +1,15 @@
 
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import utils.common as common
+import utils.catalog as catalog
 import utils.authenticate as authenticate
 
+# Heavy libraries are imported when a tab first uses them
+np = common.lazy_import("numpy")
+px = common.lazy_import("plotly.express")
+go = common.lazy_import("plotly.graph_objects")
+make_subplots = common.lazy_import("plotly.subplots", "make_subplots")
+
 # Page configuration
 st.set_page_config(
     page_title="AWS Database Offerings Hub",
@@ -29,8 +31,7 @@ AWS_COLORS = {
 
 def apply_custom_styles():
     """Apply custom CSS styling with AWS color scheme"""
-    st.markdown(f"""
-    <style>
+    common.stylesheet(f"""
         .main {{
             background-color: {AWS_COLORS['light_gray']};
         }}
@@ -130,8 +131,7 @@ def apply_custom_styles():
             border: 2px solid {AWS_COLORS['light_blue']};
             margin: 15px 0;
         }}
-    </style>
-    """, unsafe_allow_html=True)
+    """)
 
 def create_sidebar():
     """Create sidebar with app information and controls"""
@@ -271,6 +271,7 @@ def create_dynamodb_architecture_mermaid():
         style B4 fill:#3FB34F,stroke:#232F3E,color:#fff
     """
 
+@common.profiled
 def aws_database_ecosystem_tab():
     """Content for AWS Database Ecosystem tab"""
     st.markdown("## 🗄️ AWS Database Ecosystem")
@@ -439,39 +440,7 @@ def aws_database_ecosystem_tab():
     # Database Services Overview
     st.markdown("### 📋 AWS Database Services Detailed Overview")
     
-    database_data = {
-        'Database Service': [
-            'Amazon RDS', 'Amazon Aurora', 'Amazon DynamoDB', 
-            'Amazon DocumentDB', 'Amazon ElastiCache', 'Amazon Neptune'
-        ],
-        'Database Type': [
-            'Relational', 'Relational', 'NoSQL Key-Value', 
-            'NoSQL Document', 'In-Memory Cache', 'Graph Database'
-        ],
-        'Engine Options': [
-            'MySQL, PostgreSQL, MariaDB, Oracle, SQL Server',
-            'MySQL-compatible, PostgreSQL-compatible',
-            'Proprietary NoSQL',
-            'MongoDB-compatible',
-            'Redis, Memcached',
-            'Gremlin, SPARQL'
-        ],
-        'Primary Use Cases': [
-            'Traditional applications, data warehousing',
-            'High-performance applications, cloud-native',
-            'Web/mobile apps, gaming, IoT',
-            'Content management, catalogs',
-            'Caching, session store, real-time analytics',
-            'Social networks, fraud detection, recommendations'
-        ],
-        'Scaling Model': [
-            'Vertical + Read Replicas', 'Auto-scaling storage + Read Replicas',
-            'Auto-scaling + On-demand', 'Horizontal scaling',
-            'Cluster scaling', 'Auto-scaling'
-        ]
-    }
-    
-    df_databases = pd.DataFrame(database_data)
+    df_databases = catalog.table("aws_database_ecosystem.database")
     st.dataframe(df_databases, use_container_width=True)
     
     # Migration Paths
@@ -714,6 +683,44 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.cached_figure
+def create_performance_radar_chart():
+    """Radar chart of relational vs NoSQL performance characteristics."""
+    # Create comparison charts
+    metrics = ['Read Latency', 'Write Latency', 'Query Complexity', 'Scaling Ease', 'Consistency']
+    relational_scores = [7, 6, 9, 4, 10]
+    nosql_scores = [9, 9, 4, 9, 6]
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scatterpolar(
+        r=relational_scores,
+        theta=metrics,
+        fill='toself',
+        name='Relational (RDS/Aurora)',
+        fillcolor='rgba(75, 158, 219, 0.3)',
+        line=dict(color='rgb(75, 158, 219)')
+    ))
+    fig.add_trace(go.Scatterpolar(
+        r=nosql_scores,
+        theta=metrics,
+        fill='toself',
+        name='NoSQL (DynamoDB)',
+        fillcolor='rgba(63, 179, 79, 0.3)',
+        line=dict(color='rgb(63, 179, 79)')
+    ))
+    
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 10]
+            )),
+        showlegend=True,
+        title="Database Performance Characteristics (1-10 scale)"
+    )
+    return fig
+
+@common.profiled
 def relational_vs_nonrelational_tab():
     """Content for Relational vs Non-Relational Databases tab"""
     st.markdown("## ⚖️ Relational vs Non-Relational Databases")
@@ -736,34 +743,7 @@ def relational_vs_nonrelational_tab():
     # Detailed comparison table
     st.markdown("### 📊 Detailed Feature Comparison")
     
-    comparison_data = {
-        'Characteristic': [
-            'Data Model', 'Schema', 'Query Language', 'Consistency', 
-            'Scaling', 'Transactions', 'Performance', 'Use Cases'
-        ],
-        'Relational (RDBMS)': [
-            'Tables with rows and columns',
-            'Fixed schema with relationships',
-            'SQL (Structured Query Language)',
-            'Strong consistency (ACID)',
-            'Vertical scaling, read replicas',
-            'Multi-row ACID transactions',
-            'Complex queries, joins',
-            'Traditional applications, reporting'
-        ],
-        'Non-Relational (NoSQL)': [
-            'Key-value, document, graph, column',
-            'Flexible or schema-less',
-            'API-based or query languages',
-            'Eventual consistency (configurable)',
-            'Horizontal scaling, distributed',
-            'Limited or single-item transactions',
-            'Simple queries, high throughput',
-            'Web/mobile apps, real-time, IoT'
-        ]
-    }
-    
-    df_comparison = pd.DataFrame(comparison_data)
+    df_comparison = catalog.table("relational_vs_nonrelational.comparison")
     st.dataframe(df_comparison, use_container_width=True)
     
     # Interactive Decision Tree
@@ -967,40 +947,7 @@ def relational_vs_nonrelational_tab():
     # Performance comparison visualization
     st.markdown("### 📊 Performance Characteristics Comparison")
     
-    # Create comparison charts
-    metrics = ['Read Latency', 'Write Latency', 'Query Complexity', 'Scaling Ease', 'Consistency']
-    relational_scores = [7, 6, 9, 4, 10]
-    nosql_scores = [9, 9, 4, 9, 6]
-    
-    fig = go.Figure()
-    fig.add_trace(go.Scatterpolar(
-        r=relational_scores,
-        theta=metrics,
-        fill='toself',
-        name='Relational (RDS/Aurora)',
-        fillcolor='rgba(75, 158, 219, 0.3)',
-        line=dict(color='rgb(75, 158, 219)')
-    ))
-    fig.add_trace(go.Scatterpolar(
-        r=nosql_scores,
-        theta=metrics,
-        fill='toself',
-        name='NoSQL (DynamoDB)',
-        fillcolor='rgba(63, 179, 79, 0.3)',
-        line=dict(color='rgb(63, 179, 79)')
-    ))
-    
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, 10]
-            )),
-        showlegend=True,
-        title="Database Performance Characteristics (1-10 scale)"
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(create_performance_radar_chart(), use_container_width=True)
     
     # Code Example
     st.markdown("### 💻 Code Example: Database Selection and Implementation")
@@ -1299,6 +1246,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def main():
     """Main application function"""
     # Apply styling
@@ -1318,16 +1266,10 @@ def main():
                 </div>""", unsafe_allow_html=True)
     
     # Create tabs
-    tab1, tab2 = st.tabs([
-        "🗄️ AWS Database Ecosystem", 
-        "⚖️ Relational vs Non-Relational"
-    ])
-    
-    with tab1:
-        aws_database_ecosystem_tab()
-    
-    with tab2:
-        relational_vs_nonrelational_tab()
+    common.tab_router({
+        "🗄️ AWS Database Ecosystem": aws_database_ecosystem_tab,
+        "⚖️ Relational vs Non-Relational": relational_vs_nonrelational_tab,
+    })
     
     # Footer
     st.markdown("""
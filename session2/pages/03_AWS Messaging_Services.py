@@ -1,15 +1,17 @@
 
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import utils.common as common
+import utils.catalog as catalog
 import utils.authenticate as authenticate
 import json
 import time
 
+# Heavy libraries are imported when a tab first uses them
+np = common.lazy_import("numpy")
+px = common.lazy_import("plotly.express")
+go = common.lazy_import("plotly.graph_objects")
+make_subplots = common.lazy_import("plotly.subplots", "make_subplots")
+
 # Page configuration
 st.set_page_config(
     page_title="AWS Messaging Services Hub",
@@ -18,6 +20,11 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Simulated messages kept in the session; the oldest are dropped first
+MAX_SIMULATED_MESSAGES = 100
+common.declare_session_key("sqs_messages", max_items=MAX_SIMULATED_MESSAGES)
+common.declare_session_key("sns_published", max_items=MAX_SIMULATED_MESSAGES)
+
 # AWS Color Scheme
 AWS_COLORS = {
     'primary': '#FF9900',
@@ -31,8 +38,7 @@ AWS_COLORS = {
 
 def apply_custom_styles():
     """Apply custom CSS styling with AWS color scheme"""
-    st.markdown(f"""
-    <style>
+    common.stylesheet(f"""
         .main {{
             background-color: {AWS_COLORS['light_gray']};
         }}
@@ -141,8 +147,7 @@ def apply_custom_styles():
             margin: 10px 0;
             box-shadow: 0 2px 6px rgba(0,0,0,0.1);
         }}
-    </style>
-    """, unsafe_allow_html=True)
+    """)
 
 def create_sidebar():
     """Create sidebar with app information and controls"""
@@ -302,6 +307,7 @@ def create_message_channels_mermaid():
         style note2 fill:#232F3E,stroke:#FF9900,color:#fff
     """
 
+@common.profiled
 def sqs_tab():
     """Content for Amazon SQS tab"""
     st.markdown("## 🔄 Amazon Simple Queue Service (SQS)")
@@ -344,85 +350,89 @@ def sqs_tab():
     common.mermaid(create_sqs_architecture_mermaid(), height=400)
     
     # Interactive SQS Queue Simulator
-    st.markdown("### 🎮 Interactive SQS Queue Simulator")
+    @common.fragment
+    def interactive_sqs_queue_simulator():
+        st.markdown("### 🎮 Interactive SQS Queue Simulator")
     
-    col1, col2 = st.columns(2)
+        col1, col2 = st.columns(2)
     
-    with col1:
-        st.markdown("### 📊 Queue Configuration")
-        queue_type = st.selectbox("Queue Type:", [
-            "Standard Queue (High Throughput)",
-            "FIFO Queue (Exactly-Once Processing)"
-        ])
+        with col1:
+            st.markdown("### 📊 Queue Configuration")
+            queue_type = st.selectbox("Queue Type:", [
+                "Standard Queue (High Throughput)",
+                "FIFO Queue (Exactly-Once Processing)"
+            ])
         
-        visibility_timeout = st.slider("Visibility Timeout (seconds):", 1, 900, 30)
-        message_retention = st.slider("Message Retention (days):", 1, 14, 4)
-        receive_wait_time = st.slider("Long Polling Wait Time (seconds):", 0, 20, 0)
+            visibility_timeout = st.slider("Visibility Timeout (seconds):", 1, 900, 30)
+            message_retention = st.slider("Message Retention (days):", 1, 14, 4)
+            receive_wait_time = st.slider("Long Polling Wait Time (seconds):", 0, 20, 0)
     
-    with col2:
-        st.markdown("### 📨 Message Properties")
-        message_content = st.text_area("Message Body:", "Hello from SQS!", height=100)
-        delay_seconds = st.slider("Delivery Delay (seconds):", 0, 900, 0)
-        
-        if queue_type == "FIFO Queue (Exactly-Once Processing)":
-            group_id = st.text_input("Message Group ID:", "order-processing")
-            dedup_id = st.text_input("Deduplication ID:", "msg-001")
-    
-    # Message sending simulation
-    if st.button("📤 Send Message to Queue", use_container_width=True):
-        if 'sqs_messages' not in st.session_state:
-            st.session_state.sqs_messages = []
-        
-        message = {
-            'id': f"msg-{len(st.session_state.sqs_messages) + 1:04d}",
-            'body': message_content,
-            'timestamp': time.time(),
-            'visible_after': time.time() + delay_seconds,
-            'queue_type': queue_type,
-            'retention_until': time.time() + (message_retention * 86400)
-        }
+        with col2:
+            st.markdown("### 📨 Message Properties")
+            message_content = st.text_area("Message Body:", "Hello from SQS!", height=100)
+            delay_seconds = st.slider("Delivery Delay (seconds):", 0, 900, 0)
         
-        if queue_type == "FIFO Queue (Exactly-Once Processing)":
-            message['group_id'] = group_id
-            message['dedup_id'] = dedup_id
+            if queue_type == "FIFO Queue (Exactly-Once Processing)":
+                group_id = st.text_input("Message Group ID:", "order-processing")
+                dedup_id = st.text_input("Deduplication ID:", "msg-001")
+    
+        # Message sending simulation
+        if st.button("📤 Send Message to Queue", use_container_width=True):
+            if 'sqs_messages' not in st.session_state:
+                st.session_state.sqs_messages = common.BoundedList(max_items=MAX_SIMULATED_MESSAGES)
         
-        st.session_state.sqs_messages.append(message)
+            message = {
+                'id': f"msg-{len(st.session_state.sqs_messages) + 1:04d}",
+                'body': message_content,
+                'timestamp': time.time(),
+                'visible_after': time.time() + delay_seconds,
+                'queue_type': queue_type,
+                'retention_until': time.time() + (message_retention * 86400)
+            }
         
-        st.markdown('<div class="highlight-box">', unsafe_allow_html=True)
-        st.markdown(f"""
-        ### ✅ Message Sent Successfully!
+            if queue_type == "FIFO Queue (Exactly-Once Processing)":
+                message['group_id'] = group_id
+                message['dedup_id'] = dedup_id
         
-        **Message Details:**
-        - **Message ID**: {message['id']}
-        - **Queue Type**: {queue_type}
-        - **Delivery Delay**: {delay_seconds} seconds
-        - **Retention Period**: {message_retention} days
-        - **Visibility Timeout**: {visibility_timeout} seconds
+            st.session_state.sqs_messages.append(message)
         
-        🎯 **Status**: Message queued for processing
-        """)
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Display queued messages
-    if 'sqs_messages' in st.session_state and st.session_state.sqs_messages:
-        st.markdown("### 📋 Messages in Queue")
-        
-        current_time = time.time()
-        visible_messages = [msg for msg in st.session_state.sqs_messages if msg['visible_after'] <= current_time]
-        delayed_messages = [msg for msg in st.session_state.sqs_messages if msg['visible_after'] > current_time]
+            st.markdown('<div class="highlight-box">', unsafe_allow_html=True)
+            st.markdown(f"""
+            ### ✅ Message Sent Successfully!
         
-        if visible_messages:
-            st.markdown("**Available Messages:**")
-            for msg in visible_messages[-5:]:  # Show last 5 messages
-                st.markdown('<div class="message-card">', unsafe_allow_html=True)
-                st.markdown(f"""
-                **{msg['id']}** | {msg['queue_type']}<br>
-                Body: {msg['body'][:50]}{'...' if len(msg['body']) > 50 else ''}
-                """)
-                st.markdown('</div>', unsafe_allow_html=True)
+            **Message Details:**
+            - **Message ID**: {message['id']}
+            - **Queue Type**: {queue_type}
+            - **Delivery Delay**: {delay_seconds} seconds
+            - **Retention Period**: {message_retention} days
+            - **Visibility Timeout**: {visibility_timeout} seconds
         
-        if delayed_messages:
-            st.markdown(f"**Delayed Messages**: {len(delayed_messages)} waiting for delivery")
+            🎯 **Status**: Message queued for processing
+            """)
+            st.markdown('</div>', unsafe_allow_html=True)
+    
+        # Display queued messages
+        if 'sqs_messages' in st.session_state and st.session_state.sqs_messages:
+            st.markdown("### 📋 Messages in Queue")
+        
+            current_time = time.time()
+            visible_messages = [msg for msg in st.session_state.sqs_messages if msg['visible_after'] <= current_time]
+            delayed_messages = [msg for msg in st.session_state.sqs_messages if msg['visible_after'] > current_time]
+        
+            if visible_messages:
+                st.markdown("**Available Messages:**")
+                for msg in visible_messages[-5:]:  # Show last 5 messages
+                    st.markdown('<div class="message-card">', unsafe_allow_html=True)
+                    st.markdown(f"""
+                    **{msg['id']}** | {msg['queue_type']}<br>
+                    Body: {msg['body'][:50]}{'...' if len(msg['body']) > 50 else ''}
+                    """)
+                    st.markdown('</div>', unsafe_allow_html=True)
+        
+            if delayed_messages:
+                st.markdown(f"**Delayed Messages**: {len(delayed_messages)} waiting for delivery")
+
+    interactive_sqs_queue_simulator()
     
     # SQS Queue Types Comparison
     st.markdown("### ⚖️ Standard vs FIFO Queues")
@@ -470,38 +480,7 @@ def sqs_tab():
     # SQS Features Deep Dive
     st.markdown("### 🔧 SQS Key Features")
     
-    features_data = {
-        'Feature': [
-            'Visibility Timeout', 'Message Retention', 'Long Polling', 
-            'Dead Letter Queue', 'Message Attributes', 'Batch Operations'
-        ],
-        'Description': [
-            'Hide messages during processing',
-            'Store messages for up to 14 days',
-            'Reduce polling costs and latency',
-            'Handle failed message processing',
-            'Add metadata to messages',
-            'Send/receive up to 10 messages at once'
-        ],
-        'Use Case': [
-            'Prevent duplicate processing',
-            'Reliable message delivery',
-            'Cost optimization',
-            'Error handling and debugging',
-            'Message routing and filtering',
-            'Performance optimization'
-        ],
-        'Configuration': [
-            '30 seconds (default)',
-            '4 days (default, max 14)',
-            '0-20 seconds wait time',
-            'Separate DLQ after retries',
-            'Up to 10 attributes per message',
-            '1-10 messages per API call'
-        ]
-    }
-    
-    df_features = pd.DataFrame(features_data)
+    df_features = catalog.table("sqs.features")
     st.dataframe(df_features, use_container_width=True)
     
     # Best Practices
@@ -740,6 +719,7 @@ def continuous_message_processor(queue_url):
         print(f"❌ Unexpected error: {e}")
 
 # Example usage
+@common.profiled
 def main():
     queue_url = "https://sqs.us-east-1.amazonaws.com/123456789012/my-test-queue"
     processor = SQSMessageProcessor(queue_url)
@@ -776,6 +756,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def sns_tab():
     """Content for Amazon SNS tab"""
     st.markdown("## 📢 Amazon Simple Notification Service (SNS)")
@@ -929,112 +910,91 @@ def sns_tab():
         st.markdown('</div>', unsafe_allow_html=True)
     
     # Message Publishing Simulator
-    st.markdown("### 📤 Message Publishing Simulator")
-    
-    st.markdown('<div class="queue-simulator">', unsafe_allow_html=True)
-    
-    col5, col6 = st.columns(2)
-    
-    with col5:
-        st.markdown("### 📨 Message Content")
-        message_subject = st.text_input("Message Subject:", "New Order Notification")
-        message_body = st.text_area("Message Body:", """
-{
-    "order_id": "ORD-12345",
-    "customer_id": "CUST-001", 
-    "amount": 199.99,
-    "status": "placed",
-    "timestamp": "2025-07-15T10:30:00Z"
-}
-        """.strip(), height=120)
-    
-    with col6:
-        st.markdown("### 🏷️ Message Attributes")
-        attr_event_type = st.text_input("event_type:", "order_placed")
-        attr_priority = st.selectbox("priority:", ["low", "medium", "high"])
-        attr_region = st.text_input("region:", "us-east-1")
-    
-    if st.button("📡 Publish Message to Topic", use_container_width=True):
-        if 'sns_published' not in st.session_state:
-            st.session_state.sns_published = []
-        
-        message = {
-            'id': f"msg-{len(st.session_state.sns_published) + 1:04d}",
-            'subject': message_subject,
-            'body': message_body,
-            'attributes': {
-                'event_type': attr_event_type,
-                'priority': attr_priority,
-                'region': attr_region
-            },
-            'timestamp': time.time(),
-            'subscribers_notified': len(subscription_types)
-        }
+    @common.fragment
+    def message_publishing_simulator():
+        st.markdown("### 📤 Message Publishing Simulator")
+    
+        st.markdown('<div class="queue-simulator">', unsafe_allow_html=True)
+    
+        col5, col6 = st.columns(2)
+    
+        with col5:
+            st.markdown("### 📨 Message Content")
+            message_subject = st.text_input("Message Subject:", "New Order Notification")
+            message_body = st.text_area("Message Body:", """
+    {
+        "order_id": "ORD-12345",
+        "customer_id": "CUST-001", 
+        "amount": 199.99,
+        "status": "placed",
+        "timestamp": "2025-07-15T10:30:00Z"
+    }
+            """.strip(), height=120)
+    
+        with col6:
+            st.markdown("### 🏷️ Message Attributes")
+            attr_event_type = st.text_input("event_type:", "order_placed")
+            attr_priority = st.selectbox("priority:", ["low", "medium", "high"])
+            attr_region = st.text_input("region:", "us-east-1")
+    
+        if st.button("📡 Publish Message to Topic", use_container_width=True):
+            if 'sns_published' not in st.session_state:
+                st.session_state.sns_published = common.BoundedList(max_items=MAX_SIMULATED_MESSAGES)
+        
+            message = {
+                'id': f"msg-{len(st.session_state.sns_published) + 1:04d}",
+                'subject': message_subject,
+                'body': message_body,
+                'attributes': {
+                    'event_type': attr_event_type,
+                    'priority': attr_priority,
+                    'region': attr_region
+                },
+                'timestamp': time.time(),
+                'subscribers_notified': len(subscription_types)
+            }
         
-        st.session_state.sns_published.append(message)
-        
-        # Show delivery simulation
-        st.success("📡 Message published successfully!")
-        
-        for sub_type in subscription_types:
-            with st.expander(f"📬 Delivered to {sub_type}", expanded=False):
-                if "SQS" in sub_type:
-                    st.write("✅ Message queued in SQS for reliable processing")
-                elif "Lambda" in sub_type:
-                    st.write("⚡ Lambda function triggered with message payload")
-                elif "HTTP" in sub_type:
-                    st.write("🌐 HTTP POST request sent to endpoint")
-                elif "Email" in sub_type:
-                    st.write("📧 Email notification sent to subscribers")
-                elif "SMS" in sub_type:
-                    st.write("📱 SMS message sent to phone numbers")
-                elif "Push" in sub_type:
-                    st.write("📲 Mobile push notification delivered")
+            st.session_state.sns_published.append(message)
+        
+            # Show delivery simulation
+            st.success("📡 Message published successfully!")
+        
+            for sub_type in subscription_types:
+                with st.expander(f"📬 Delivered to {sub_type}", expanded=False):
+                    if "SQS" in sub_type:
+                        st.write("✅ Message queued in SQS for reliable processing")
+                    elif "Lambda" in sub_type:
+                        st.write("⚡ Lambda function triggered with message payload")
+                    elif "HTTP" in sub_type:
+                        st.write("🌐 HTTP POST request sent to endpoint")
+                    elif "Email" in sub_type:
+                        st.write("📧 Email notification sent to subscribers")
+                    elif "SMS" in sub_type:
+                        st.write("📱 SMS message sent to phone numbers")
+                    elif "Push" in sub_type:
+                        st.write("📲 Mobile push notification delivered")
     
-    st.markdown('</div>', unsafe_allow_html=True)
+        st.markdown('</div>', unsafe_allow_html=True)
     
-    # Message history
-    if 'sns_published' in st.session_state and st.session_state.sns_published:
-        st.markdown("### 📊 Recent Publications")
+        # Message history
+        if 'sns_published' in st.session_state and st.session_state.sns_published:
+            st.markdown("### 📊 Recent Publications")
         
-        for msg in st.session_state.sns_published[-3:]:  # Show last 3 messages
-            st.markdown('<div class="message-card">', unsafe_allow_html=True)
-            st.markdown(f"""
-            **{msg['id']}** - {msg['subject']}<br>
-            **Delivered to**: {msg['subscribers_notified']} subscriber(s)<br>
-            **Attributes**: {', '.join([f"{k}={v}" for k, v in msg['attributes'].items()])}
-            """)
-            st.markdown('</div>', unsafe_allow_html=True)
+            for msg in st.session_state.sns_published[-3:]:  # Show last 3 messages
+                st.markdown('<div class="message-card">', unsafe_allow_html=True)
+                st.markdown(f"""
+                **{msg['id']}** - {msg['subject']}<br>
+                **Delivered to**: {msg['subscribers_notified']} subscriber(s)<br>
+                **Attributes**: {', '.join([f"{k}={v}" for k, v in msg['attributes'].items()])}
+                """)
+                st.markdown('</div>', unsafe_allow_html=True)
+
+    message_publishing_simulator()
     
     # SNS Integration Patterns
     st.markdown("### 🔗 Common SNS Integration Patterns")
     
-    patterns_data = {
-        'Pattern': ['Fanout', 'Event-driven Processing', 'Application Alerts', 'User Notifications', 'System Integration'],
-        'Description': [
-            'Distribute single message to multiple subscribers',
-            'Trigger multiple processing workflows',
-            'Send alerts when system events occur',
-            'Notify users via email, SMS, or push',
-            'Integrate disparate systems and services'
-        ],
-        'Use Case': [
-            'Order processing, data replication',
-            'Image processing, data analytics',
-            'CloudWatch alarms, security events',
-            'Account changes, promotional offers',
-            'Legacy system modernization'
-        ],
-        'Subscribers': [
-            'Multiple SQS queues, Lambda functions',
-            'Lambda, SQS, HTTP endpoints',
-            'Email, SMS, PagerDuty integration',
-            'Email, mobile push, in-app notifications',
-            'HTTP endpoints, message queues'
-        ]
-    }
-    
-    df_patterns = pd.DataFrame(patterns_data)
+    df_patterns = catalog.table("sns.patterns")
     st.dataframe(df_patterns, use_container_width=True)
     
     # Code Example
@@ -1327,6 +1287,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def sns_fanout_tab():
     """Content for Common Amazon SNS Scenario - Fanout tab"""
     st.markdown("## 🌟 Common Amazon SNS Scenario - Fanout")
@@ -1513,42 +1474,7 @@ def sns_fanout_tab():
     # Real-world Fanout Examples
     st.markdown("### 🌍 Real-world Fanout Use Cases")
     
-    use_cases_data = {
-        'Use Case': [
-            'E-commerce Order Processing',
-            'User Registration Pipeline', 
-            'IoT Data Processing',
-            'Content Publishing',
-            'Financial Transactions',
-            'System Monitoring'
-        ],
-        'Event Trigger': [
-            'Order placed by customer',
-            'New user signs up',
-            'Sensor sends data reading',
-            'Blog post published',
-            'Payment processed',
-            'System alarm triggered'
-        ],
-        'Fanout Destinations': [
-            'Order fulfillment, inventory, analytics, notifications',
-            'Welcome email, user profile, analytics, CRM sync',
-            'Real-time dashboard, data lake, alerting, ML pipeline',
-            'Email subscribers, social media, search index',
-            'Fraud detection, accounting, notifications, reporting',
-            'PagerDuty, email, Slack, ticket creation'
-        ],
-        'Business Value': [
-            'Faster order processing, better customer experience',
-            'Improved onboarding, data consistency',
-            'Real-time insights, predictive maintenance',
-            'Broader reach, better engagement',
-            'Enhanced security, regulatory compliance',
-            'Faster incident response, reduced downtime'
-        ]
-    }
-    
-    df_use_cases = pd.DataFrame(use_cases_data)
+    df_use_cases = catalog.table("sns_fanout.use_cases")
     st.dataframe(df_use_cases, use_container_width=True)
     
     # Message Flow Simulation
@@ -1991,6 +1917,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def message_channels_tab():
     """Content for Message Channels tab"""
     st.markdown("## 📨 Message Channels")
@@ -2185,22 +2112,7 @@ def message_channels_tab():
     # Pattern Features Comparison Table
     st.markdown("### 🔍 Feature Comparison Matrix")
     
-    comparison_data = {
-        'Feature': [
-            'Message Delivery', 'Consumer Model', 'Message Persistence', 'Delivery Method',
-            'Scaling', 'Cost Model', 'Throughput', 'Use Case Fit'
-        ],
-        'Point-to-Point (SQS)': [
-            'One consumer per message', 'Pull-based polling', 'Up to 14 days', 'Consumer pulls messages',
-            'Add more consumers', 'Per message + requests', '120K msg/sec', 'Work queues, task processing'
-        ],
-        'Publish-Subscribe (SNS)': [
-            'All subscribers get message', 'Push-based delivery', 'No persistence (delivery only)', 'Push to subscribers',
-            'Add more subscribers', 'Per message + deliveries', '300K publishes/sec', 'Events, notifications, broadcasting'
-        ]
-    }
-    
-    df_comparison = pd.DataFrame(comparison_data)
+    df_comparison = catalog.table("message_channels.comparison")
     st.dataframe(df_comparison, use_container_width=True)
     
     # Real-world Usage Scenarios
@@ -2746,6 +2658,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def main():
     """Main application function"""
     # Apply styling
@@ -2767,24 +2680,12 @@ def main():
                 </div>""", unsafe_allow_html=True)
     
     # Create tabs
-    tab1, tab2, tab3, tab4 = st.tabs([
-        "🔄 Amazon SQS", 
-        "📢 Amazon SNS", 
-        "🌟 SNS Fanout Scenario",
-        "📨 Message Channels"
-    ])
-    
-    with tab1:
-        sqs_tab()
-    
-    with tab2:
-        sns_tab()
-    
-    with tab3:
-        sns_fanout_tab()
-    
-    with tab4:
-        message_channels_tab()
+    common.tab_router({
+        "🔄 Amazon SQS": sqs_tab,
+        "📢 Amazon SNS": sns_tab,
+        "🌟 SNS Fanout Scenario": sns_fanout_tab,
+        "📨 Message Channels": message_channels_tab,
+    })
     
     # Footer
     st.markdown("""
@@ -1,5 +1,4 @@
 import streamlit as st
-import boto3
 import json
 import time
 from PIL import Image
@@ -32,7 +31,7 @@ class CloudWatchLogger:
         
         # Initialize CloudWatch client
         try:
-            self.cloudwatch_client = boto3.client('logs', region_name='ap-southeast-1')
+            self.cloudwatch_client = common.aws_client('logs', region_name='ap-southeast-1')
             self._setup_cloudwatch_logging()
         except Exception as e:
             print(f"Failed to initialize CloudWatch logging: {e}")
@@ -160,8 +159,7 @@ def get_logger():
 logger = get_logger()
 
 # Custom CSS for modern UI with support for three columns
-st.markdown("""
-<style>
+common.stylesheet("""
     .main-header {
         background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
         padding: 2rem;
@@ -252,8 +250,7 @@ st.markdown("""
         border-radius: 8px;
         margin-top: 1rem;
     }
-</style>
-""", unsafe_allow_html=True)
+""")
 
 class ImageProcessor:
     """Handles AWS operations for image processing with logging"""
@@ -275,7 +272,7 @@ class ImageProcessor:
         """Initialize AWS clients with error handling and logging"""
         try:
             self.logger.info("Initializing AWS clients...")
-            self.s3_client = boto3.client('s3', region_name='ap-southeast-1')
+            self.s3_client = common.aws_client('s3', region_name='ap-southeast-1')
             
             # Get bucket names from environment or Streamlit secrets
             self.bucket_name = st.secrets.get("S3_UPLOAD_BUCKET", "demo-875692608981")
@@ -525,6 +522,7 @@ def render_processed_images(processor, filename: str, processed_images: Dict[str
     if st.button("📥 Download All Variants", type="secondary"):
         st.info("Individual downloads available above. Bulk download feature coming soon!")
 
+@common.profiled
 def main():
     """Main Streamlit application with comprehensive logging"""
     initialize_session()
@@ -2,19 +2,26 @@
 # Streamlit Chat with DynamoDB Memory - Amazon Bedrock and LangChain
 # ------------------------------------------------------------------------
 import streamlit as st
-import boto3
 import botocore
 import uuid
-from langchain_core.output_parsers import StrOutputParser
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.prompts import MessagesPlaceholder
-from langchain_core.runnables.history import RunnableWithMessageHistory
-# from langchain_community.chat_models import BedrockChat
-from langchain_aws import ChatBedrock
-from langchain_community.chat_message_histories import DynamoDBChatMessageHistory
 import utils.common as common
 import utils.authenticate as authenticate
 
+# LangChain is imported once the chat is first built, after login
+StrOutputParser = common.lazy_import("langchain_core.output_parsers", "StrOutputParser")
+ChatPromptTemplate = common.lazy_import("langchain_core.prompts", "ChatPromptTemplate")
+MessagesPlaceholder = common.lazy_import("langchain_core.prompts", "MessagesPlaceholder")
+RunnableWithMessageHistory = common.lazy_import("langchain_core.runnables.history", "RunnableWithMessageHistory")
+# from langchain_community.chat_models import BedrockChat
+ChatBedrock = common.lazy_import("langchain_aws", "ChatBedrock")
+DynamoDBChatMessageHistory = common.lazy_import("langchain_community.chat_message_histories",
+                                                "DynamoDBChatMessageHistory")
+
+# Chat messages shown in the session; the full history stays in DynamoDB
+MAX_CHAT_MESSAGES = 100
+common.declare_session_key("messages", max_items=MAX_CHAT_MESSAGES)
+
+@common.profiled
 def main():
     """Main application function"""
     # Page title
@@ -32,10 +39,7 @@ def main():
 
     # ------------------------------------------------------------------------
     # Amazon Bedrock Settings
-    bedrock_runtime = boto3.client(
-        service_name="bedrock-runtime",
-        region_name="us-east-1",
-    )
+    bedrock_runtime = common.aws_client("bedrock-runtime", region_name="us-east-1")
 
     model_kwargs = {}
 
@@ -90,9 +94,9 @@ def main():
     # ------------------------------------------------------------------------
     # DynamoDB Setup
     TableName = "SessionTable"
-    boto3_session = boto3.Session(region_name="us-east-1")
-    client = boto3_session.client('dynamodb')
-    dynamodb = boto3_session.resource("dynamodb")
+    boto3_session = common.aws_session(region_name="us-east-1")
+    client = common.aws_client('dynamodb', region_name="us-east-1")
+    dynamodb = common.aws_resource("dynamodb", region_name="us-east-1")
     table = dynamodb.Table(TableName)
 
     # ------------------------------------------------------------------------
@@ -120,6 +124,7 @@ def main():
         lambda session_id: DynamoDBChatMessageHistory(
             table_name="SessionTable", 
             session_id=session_id, 
+            endpoint_url=common.aws_endpoint_url(),
             boto3_session=boto3_session
         ),
         input_messages_key="question",
@@ -1,12 +1,14 @@
 
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime, timedelta
 import utils.common as common
 import utils.authenticate as authenticate
 
+# Heavy libraries are imported when a tab first uses them
+pd = common.lazy_import("pandas")
+go = common.lazy_import("plotly.graph_objects")
+px = common.lazy_import("plotly.express")
+
 # Page configuration
 st.set_page_config(
     page_title="AWS Developer Associate - Session 3",
@@ -19,10 +21,10 @@ common.initialize_session_state()
 with st.sidebar:
     common.render_sidebar()
 
+@common.profiled
 def main():
     # Custom CSS for AWS styling
-    st.markdown("""
-    <style>
+    common.stylesheet("""
     /* AWS Color Scheme */
     :root {
         --aws-orange: #FF9900;
@@ -134,8 +136,7 @@ def main():
         margin: 1rem 0;
         font-family: monospace;
     }
-    </style>
-    """, unsafe_allow_html=True)
+    """)
 
 def render_overview():
     # Main header
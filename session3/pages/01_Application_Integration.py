@@ -1,14 +1,17 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import utils.common as common
+import utils.catalog as catalog
 import utils.authenticate as authenticate
 import json
 from datetime import datetime, timedelta
 
+# Heavy libraries are imported when a tab first uses them
+pd = common.lazy_import("pandas")
+np = common.lazy_import("numpy")
+px = common.lazy_import("plotly.express")
+go = common.lazy_import("plotly.graph_objects")
+make_subplots = common.lazy_import("plotly.subplots", "make_subplots")
+
 # Page configuration
 st.set_page_config(
     page_title="AWS Development with AWS Services",
@@ -30,8 +33,7 @@ AWS_COLORS = {
 
 def apply_custom_styles():
     """Apply custom CSS styling with AWS color scheme"""
-    st.markdown(f"""
-    <style>
+    common.stylesheet(f"""
         .main {{
             background-color: {AWS_COLORS['light_gray']};
         }}
@@ -132,8 +134,7 @@ def apply_custom_styles():
             margin: 15px 0;
             box-shadow: 0 4px 12px rgba(0,0,0,0.1);
         }}
-    </style>
-    """, unsafe_allow_html=True)
+    """)
 
 def create_sidebar():
     """Create sidebar with app information and controls"""
@@ -281,6 +282,7 @@ def create_appsync_architecture_mermaid():
         style L fill:#232F3E,stroke:#FF9900,color:#fff
     """
 
+@common.profiled
 def sqs_tab():
     """Content for Amazon SQS tab"""
     st.markdown("## 📨 Amazon Simple Queue Service (SQS)")
@@ -461,15 +463,7 @@ def sqs_tab():
     # SQS with Lambda Integration
     st.markdown("### ⚡ SQS with AWS Lambda Integration")
     
-    lambda_integration_data = {
-        'Integration Type': ['Event Source Mapping', 'Standard Queue', 'FIFO Queue'],
-        'Polling Method': ['Long Polling', 'Automatic', 'Automatic'],
-        'Batch Size': ['1-10 messages', '1-10 messages', '1-10 messages'],
-        'Concurrency': ['Up to 1,000', 'Up to 1,000', 'Sequential processing'],
-        'Use Case': ['Real-time processing', 'High throughput jobs', 'Ordered processing']
-    }
-    
-    df_lambda = pd.DataFrame(lambda_integration_data)
+    df_lambda = catalog.table("sqs.lambda_integration")
     st.dataframe(df_lambda, use_container_width=True)
     
     # Performance Monitoring
@@ -820,6 +814,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def sns_tab():
     """Content for Amazon SNS tab"""
     st.markdown("## 📢 Amazon Simple Notification Service (SNS)")
@@ -1063,23 +1058,7 @@ def sns_tab():
     # SNS Subscription Types
     st.markdown("### 📡 SNS Subscription Types & Use Cases")
     
-    subscription_data = {
-        'Subscription Type': ['Email', 'SMS', 'HTTP/HTTPS', 'SQS', 'Lambda', 'Mobile Push', 'Kinesis Data Firehose'],
-        'Delivery Method': ['SMTP', 'SMS Gateway', 'HTTP POST', 'Queue Message', 'Function Invoke', 'Push Service', 'Data Stream'],
-        'Use Case': [
-            'Admin notifications',
-            'User alerts & OTP',
-            'Webhook integration', 
-            'Async processing',
-            'Event processing',
-            'App notifications',
-            'Data analytics'
-        ],
-        'Cost (per 1M)': ['$2.00', '$0.75', '$0.60', '$0.50', '$0.20', '$0.50', '$0.50'],
-        'Max Message Size': ['256KB', '1600 chars', '256KB', '256KB', '256KB', '4KB', '256KB']
-    }
-    
-    df_subscriptions = pd.DataFrame(subscription_data)
+    df_subscriptions = catalog.table("sns.subscription")
     st.dataframe(df_subscriptions, use_container_width=True)
     
     # Code Example
@@ -1433,6 +1412,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def eventbridge_tab():
     """Content for Amazon EventBridge tab"""
     st.markdown("## 📅 Amazon EventBridge")
@@ -1603,42 +1583,7 @@ def eventbridge_tab():
     # EventBridge Use Cases
     st.markdown("### 🌟 Common EventBridge Use Cases")
     
-    use_cases_data = {
-        'Use Case': [
-            'Application Integration',
-            'Microservices Orchestration', 
-            'Data Pipeline Automation',
-            'Security Monitoring',
-            'Customer Experience',
-            'DevOps Automation'
-        ],
-        'Event Source': [
-            'Custom Applications',
-            'AWS Services',
-            'S3, DynamoDB, Kinesis',
-            'CloudTrail, GuardDuty',
-            'SaaS Partners',
-            'CodePipeline, CodeBuild'
-        ],
-        'Common Targets': [
-            'Lambda, SQS, Step Functions',
-            'ECS, Lambda, SNS',
-            'Lambda, Step Functions, Glue',
-            'SNS, Lambda, Security Hub',
-            'SNS, SES, Lambda',
-            'Lambda, SNS, Step Functions'
-        ],
-        'Business Value': [
-            'Loose coupling, scalability',
-            'Event-driven architecture',
-            'Automated data processing',
-            'Real-time threat response',
-            'Personalized experiences',
-            'Automated deployments'
-        ]
-    }
-    
-    df_use_cases = pd.DataFrame(use_cases_data)
+    df_use_cases = catalog.table("eventbridge.use_cases")
     st.dataframe(df_use_cases, use_container_width=True)
     
     # EventBridge Patterns
@@ -1687,72 +1632,58 @@ def eventbridge_tab():
     # Event Filtering Examples
     st.markdown("### 🔍 Advanced Event Filtering Examples")
     
-    filtering_examples = {
-        'Filter Type': ['Exact Match', 'Prefix Match', 'Numeric Range', 'Exists Check', 'Complex Logic'],
-        'JSON Pattern': [
-            '{"account": ["123456789012"]}',
-            '{"detail": {"bucket": {"name": [{"prefix": "images-"}]}}}',
-            '{"detail": {"temperature": [{"numeric": [">", 25, "<=", 100]}]}}',
-            '{"detail": {"error": [{"exists": true}]}}',
-            '{"$or": [{"account": ["123"]}, {"source": ["myapp"]}]}'
-        ],
-        'Use Case': [
-            'Account-specific processing',
-            'Bucket prefix filtering',
-            'Temperature monitoring',
-            'Error event detection', 
-            'Multiple condition matching'
-        ]
-    }
-    
-    df_filtering = pd.DataFrame(filtering_examples)
+    df_filtering = catalog.table("eventbridge.filtering_examples")
     st.dataframe(df_filtering, use_container_width=True)
     
     # Real-time Event Simulator
-    st.markdown("### 🎮 Real-time Event Processing Simulator")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("### 📊 Event Generation")
-        event_rate = st.slider("Events per second:", 1, 100, 10)
-        event_types = st.multiselect("Event Types:", [
-            "user-signup", "order-placed", "payment-processed", "inventory-low", "error-occurred"
-        ], default=["user-signup", "order-placed"])
-    
-    with col2:
-        st.markdown("### ⚙️ Processing Configuration")
-        target_lambda = st.checkbox("Process with Lambda", value=True)
-        store_in_sqs = st.checkbox("Store in SQS", value=True)
-        alert_on_error = st.checkbox("SNS alerts for errors", value=True)
-    
-    if st.button("▶️ Start Event Simulation", use_container_width=True):
-        # Simulate event processing metrics
-        processing_time = np.random.uniform(10, 100, len(event_types))
-        success_rate = np.random.uniform(95, 99.9, len(event_types))
-        
-        simulation_data = {
-            'Event Type': event_types,
-            'Processing Time (ms)': [f"{t:.1f}" for t in processing_time],
-            'Success Rate (%)': [f"{s:.1f}" for s in success_rate],
-            'Throughput (TPS)': [f"{event_rate * s/100:.1f}" for s in success_rate]
-        }
+    @common.fragment
+    def real_time_event_processing_simulator():
+        st.markdown("### 🎮 Real-time Event Processing Simulator")
+    
+        col1, col2 = st.columns(2)
+    
+        with col1:
+            st.markdown("### 📊 Event Generation")
+            event_rate = st.slider("Events per second:", 1, 100, 10)
+            event_types = st.multiselect("Event Types:", [
+                "user-signup", "order-placed", "payment-processed", "inventory-low", "error-occurred"
+            ], default=["user-signup", "order-placed"])
+    
+        with col2:
+            st.markdown("### ⚙️ Processing Configuration")
+            target_lambda = st.checkbox("Process with Lambda", value=True)
+            store_in_sqs = st.checkbox("Store in SQS", value=True)
+            alert_on_error = st.checkbox("SNS alerts for errors", value=True)
+    
+        if st.button("▶️ Start Event Simulation", use_container_width=True):
+            # Simulate event processing metrics
+            processing_time = np.random.uniform(10, 100, len(event_types))
+            success_rate = np.random.uniform(95, 99.9, len(event_types))
+        
+            simulation_data = {
+                'Event Type': event_types,
+                'Processing Time (ms)': [f"{t:.1f}" for t in processing_time],
+                'Success Rate (%)': [f"{s:.1f}" for s in success_rate],
+                'Throughput (TPS)': [f"{event_rate * s/100:.1f}" for s in success_rate]
+            }
         
-        df_simulation = pd.DataFrame(simulation_data)
+            df_simulation = pd.DataFrame(simulation_data)
         
-        st.markdown('<div class="highlight-box">', unsafe_allow_html=True)
-        st.markdown(f"""
-        ### 🎯 Event Processing Simulation Results
+            st.markdown('<div class="highlight-box">', unsafe_allow_html=True)
+            st.markdown(f"""
+            ### 🎯 Event Processing Simulation Results
         
-        **Configuration:**
-        - **Event Rate**: {event_rate} events/second
-        - **Active Targets**: {sum([target_lambda, store_in_sqs, alert_on_error])}
-        - **Event Types**: {len(event_types)}
+            **Configuration:**
+            - **Event Rate**: {event_rate} events/second
+            - **Active Targets**: {sum([target_lambda, store_in_sqs, alert_on_error])}
+            - **Event Types**: {len(event_types)}
         
-        **Performance Metrics:**
-        """)
-        st.dataframe(df_simulation, use_container_width=True)
-        st.markdown('</div>', unsafe_allow_html=True)
+            **Performance Metrics:**
+            """)
+            st.dataframe(df_simulation, use_container_width=True)
+            st.markdown('</div>', unsafe_allow_html=True)
+
+    real_time_event_processing_simulator()
     
     # Code Example
     st.markdown("### 💻 Code Example: Complete EventBridge Implementation")
@@ -2205,6 +2136,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def appsync_tab():
     """Content for AWS AppSync tab"""
     st.markdown("## 🚀 AWS AppSync")
@@ -2565,34 +2497,7 @@ type Subscription {
     # Real-time Features Deep Dive
     st.markdown("### ⚡ Real-time Subscriptions in AppSync")
     
-    subscription_examples = {
-        'Use Case': [
-            'Live Chat', 'Real-time Comments', 'Live Dashboard', 'IoT Sensor Data', 'Collaborative Editing'
-        ],
-        'Subscription Pattern': [
-            'onMessageSent(roomId: ID!)',
-            'onCommentAdded(postId: ID!)', 
-            'onMetricUpdate(dashboardId: ID!)',
-            'onSensorReading(deviceId: ID!)',
-            'onDocumentChanged(docId: ID!)'
-        ],
-        'Update Frequency': [
-            'High (100+ per minute)',
-            'Medium (10-50 per minute)',
-            'Low (1-10 per minute)', 
-            'Very High (1000+ per minute)',
-            'Medium (keystroke-based)'
-        ],
-        'Connection Management': [
-            'Per chat room',
-            'Per blog post',
-            'Per user dashboard',
-            'Per device type',
-            'Per document'
-        ]
-    }
-    
-    df_subscriptions = pd.DataFrame(subscription_examples)
+    df_subscriptions = catalog.table("appsync.subscription_examples")
     st.dataframe(df_subscriptions, use_container_width=True)
     
     # Performance Optimization
@@ -3178,6 +3083,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def main():
     """Main application function"""
     # Apply styling
@@ -3204,24 +3110,12 @@ def main():
     common.mermaid(create_messaging_overview_mermaid(), height=350)
     
     # Create tabs
-    tab1, tab2, tab3, tab4 = st.tabs([
-        "📨 Amazon SQS", 
-        "📢 Amazon SNS", 
-        "📅 Amazon EventBridge",
-        "🚀 AWS AppSync"
-    ])
-    
-    with tab1:
-        sqs_tab()
-    
-    with tab2:
-        sns_tab()
-    
-    with tab3:
-        eventbridge_tab()
-    
-    with tab4:
-        appsync_tab()
+    common.tab_router({
+        "📨 Amazon SQS": sqs_tab,
+        "📢 Amazon SNS": sns_tab,
+        "📅 Amazon EventBridge": eventbridge_tab,
+        "🚀 AWS AppSync": appsync_tab,
+    })
     
     # Footer
     st.markdown("""
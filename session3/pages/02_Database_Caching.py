@@ -1,12 +1,15 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import utils.common as common
+import utils.catalog as catalog
 import utils.authenticate as authenticate
 
+# Heavy libraries are imported when a tab first uses them
+pd = common.lazy_import("pandas")
+np = common.lazy_import("numpy")
+px = common.lazy_import("plotly.express")
+go = common.lazy_import("plotly.graph_objects")
+make_subplots = common.lazy_import("plotly.subplots", "make_subplots")
+
 # Page configuration
 st.set_page_config(
     page_title="AWS Database Caching Hub",
@@ -28,8 +31,7 @@ AWS_COLORS = {
 
 def apply_custom_styles():
     """Apply custom CSS styling with AWS color scheme"""
-    st.markdown(f"""
-    <style>
+    common.stylesheet(f"""
         .main {{
             background-color: {AWS_COLORS['light_gray']};
         }}
@@ -129,8 +131,7 @@ def apply_custom_styles():
             border: 2px solid {AWS_COLORS['light_blue']};
             margin: 15px 0;
         }}
-    </style>
-    """, unsafe_allow_html=True)
+    """)
 
 def create_sidebar():
     """Create sidebar with app information and controls"""
@@ -263,6 +264,7 @@ def create_redis_vs_memcached_mermaid():
         style C3 fill:#3FB34F,stroke:#232F3E,color:#fff
     """
 
+@common.profiled
 def amazon_elasticache_tab():
     """Content for Amazon ElastiCache overview tab"""
     st.markdown("## 🗄️ Amazon ElastiCache")
@@ -606,6 +608,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def redis_vs_memcached_tab():
     """Content for Redis vs Memcached comparison tab"""
     st.markdown("## ⚖️ Redis vs. Memcached")
@@ -735,27 +738,7 @@ def redis_vs_memcached_tab():
     # Detailed Feature Comparison
     st.markdown("### 📋 Detailed Feature Comparison")
     
-    comparison_data = {
-        'Feature': [
-            'Data Structures', 'Persistence', 'Replication', 'Transactions', 
-            'Pub/Sub', 'Multi-threading', 'Memory Usage', 'Snapshots',
-            'Partitioning', 'Lua Scripts', 'Geospatial', 'Clustering'
-        ],
-        'Redis': [
-            '✅ Lists, Sets, Hashes, etc.', '✅ RDB & AOF', '✅ Master-Slave', 
-            '✅ MULTI/EXEC', '✅ Built-in', '❌ Single-threaded', 
-            'Higher', '✅ Point-in-time', '✅ Hash-based', 
-            '✅ Server-side scripting', '✅ Geographic data', '✅ Redis Cluster'
-        ],
-        'Memcached': [
-            '❌ Key-Value only', '❌ No persistence', '❌ No replication',
-            '❌ No transactions', '❌ No pub/sub', '✅ Multi-threaded',
-            'Lower', '❌ No snapshots', '✅ Consistent hashing',
-            '❌ No scripting', '❌ No geospatial', '❌ Simple scaling'
-        ]
-    }
-    
-    df_comparison = pd.DataFrame(comparison_data)
+    df_comparison = catalog.table("redis_vs_memcached.comparison")
     st.dataframe(df_comparison, use_container_width=True)
     
     # Performance Benchmarks
@@ -1140,6 +1123,7 @@ print(f"Cache Statistics: {stats}")
         ''', language='python')
         st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def use_cases_tab():
     """Content for ElastiCache use cases tab"""
     st.markdown("## 🎯 Amazon ElastiCache - Use Cases")
@@ -1294,14 +1278,7 @@ def use_cases_tab():
             st.markdown('</div>', unsafe_allow_html=True)
         
         # E-commerce metrics
-        ecommerce_metrics = {
-            'Metric': ['Page Load Time', 'Database Load', 'Cart Abandonment', 'Conversion Rate'],
-            'Before Cache': ['3.2s', '85%', '68%', '2.1%'],
-            'After Cache': ['0.8s', '25%', '45%', '3.8%'],
-            'Improvement': ['75% faster', '60% reduction', '23% reduction', '81% increase']
-        }
-        
-        df_ecommerce = pd.DataFrame(ecommerce_metrics)
+        df_ecommerce = catalog.table("use_cases.ecommerce_metrics")
         st.dataframe(df_ecommerce, use_container_width=True)
     
     with use_case_tabs[1]:  # Gaming
@@ -1364,24 +1341,28 @@ def use_cases_tab():
             st.markdown('</div>', unsafe_allow_html=True)
         
         # Gaming performance simulation
-        st.markdown("### 🎮 Gaming Performance Simulator")
-        
-        player_count = st.slider("Concurrent Players:", 1000, 1000000, 50000)
-        update_frequency = st.slider("Updates per Second:", 10, 1000, 100)
-        
-        # Calculate gaming metrics
-        total_operations = player_count * update_frequency
-        cache_memory = (player_count * 2) / 1024  # 2KB per player profile
-        estimated_latency = max(1, 50 - (np.log10(player_count) * 5))  # Logarithmic scaling
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.metric("Operations/Second", f"{total_operations:,}")
-        with col2:
-            st.metric("Memory Required", f"{cache_memory:.1f} GB")
-        with col3:
-            st.metric("Estimated Latency", f"{estimated_latency:.1f}ms")
+        @common.fragment
+        def gaming_performance_simulator():
+            st.markdown("### 🎮 Gaming Performance Simulator")
+        
+            player_count = st.slider("Concurrent Players:", 1000, 1000000, 50000)
+            update_frequency = st.slider("Updates per Second:", 10, 1000, 100)
+        
+            # Calculate gaming metrics
+            total_operations = player_count * update_frequency
+            cache_memory = (player_count * 2) / 1024  # 2KB per player profile
+            estimated_latency = max(1, 50 - (np.log10(player_count) * 5))  # Logarithmic scaling
+        
+            col1, col2, col3 = st.columns(3)
+        
+            with col1:
+                st.metric("Operations/Second", f"{total_operations:,}")
+            with col2:
+                st.metric("Memory Required", f"{cache_memory:.1f} GB")
+            with col3:
+                st.metric("Estimated Latency", f"{estimated_latency:.1f}ms")
+
+        gaming_performance_simulator()
     
     with use_case_tabs[2]:  # Social Media
         st.markdown("### 📱 Social Media Applications")
@@ -1627,58 +1608,63 @@ def use_cases_tab():
             st.markdown('</div>', unsafe_allow_html=True)
     
     # ROI Calculator
-    st.markdown("### 💰 ElastiCache ROI Calculator")
-    
-    col1, col2 = st.columns(2)
+    @common.fragment
+    def elasticache_roi_calculator():
+        st.markdown("### 💰 ElastiCache ROI Calculator")
     
-    with col1:
-        st.markdown("#### 📊 Current Infrastructure")
-        database_queries_per_second = st.number_input("Database Queries/Second:", 100, 100000, 1000)
-        average_query_time = st.number_input("Average Query Time (ms):", 10, 1000, 100)
-        database_server_cost = st.number_input("Monthly Database Server Cost ($):", 100, 10000, 500)
-        
-    with col2:
-        st.markdown("#### ⚡ With ElastiCache")
-        cache_hit_rate = st.slider("Expected Cache Hit Rate (%):", 50, 95, 80)
-        cache_response_time = st.number_input("Cache Response Time (ms):", 0.1, 10.0, 1.0)
-        elasticache_cost = st.number_input("Monthly ElastiCache Cost ($):", 50, 2000, 200)
+        col1, col2 = st.columns(2)
     
-    if st.button("💰 Calculate ROI", use_container_width=True):
-        # Calculate performance improvements
-        cached_queries = database_queries_per_second * (cache_hit_rate / 100)
-        database_queries = database_queries_per_second * ((100 - cache_hit_rate) / 100)
-        
-        # Average response time with cache
-        avg_response_with_cache = (cached_queries * cache_response_time + database_queries * average_query_time) / database_queries_per_second
-        
-        # Performance improvement
-        performance_improvement = ((average_query_time - avg_response_with_cache) / average_query_time) * 100
-        
-        # Cost analysis
-        total_monthly_cost = database_server_cost + elasticache_cost
-        cost_per_query_improvement = (performance_improvement / 100) * database_server_cost
+        with col1:
+            st.markdown("#### 📊 Current Infrastructure")
+            database_queries_per_second = st.number_input("Database Queries/Second:", 100, 100000, 1000)
+            average_query_time = st.number_input("Average Query Time (ms):", 10, 1000, 100)
+            database_server_cost = st.number_input("Monthly Database Server Cost ($):", 100, 10000, 500)
         
-        st.markdown('<div class="highlight-box">', unsafe_allow_html=True)
-        st.markdown(f"""
-        ### 💰 ROI Analysis Results
-        
-        **Performance Improvements:**
-        - **Response Time**: {average_query_time:.1f}ms → {avg_response_with_cache:.1f}ms
-        - **Performance Improvement**: {performance_improvement:.1f}% faster
-        - **Database Load Reduction**: {cache_hit_rate}% of queries served from cache
-        
-        **Cost Analysis:**
-        - **Total Monthly Cost**: ${total_monthly_cost:.2f}
-        - **Additional Cost**: ${elasticache_cost:.2f} for ElastiCache
-        - **Performance per Dollar**: {performance_improvement/elasticache_cost:.2f}% improvement per $
-        
-        **Business Impact:**
-        - **User Experience**: {performance_improvement:.1f}% faster application
-        - **Scalability**: Handle {cache_hit_rate}% more users with same database
-        - **Cost Efficiency**: Reduce database infrastructure needs
-        """)
-        st.markdown('</div>', unsafe_allow_html=True)
+        with col2:
+            st.markdown("#### ⚡ With ElastiCache")
+            cache_hit_rate = st.slider("Expected Cache Hit Rate (%):", 50, 95, 80)
+            cache_response_time = st.number_input("Cache Response Time (ms):", 0.1, 10.0, 1.0)
+            elasticache_cost = st.number_input("Monthly ElastiCache Cost ($):", 50, 2000, 200)
+    
+        if st.button("💰 Calculate ROI", use_container_width=True):
+            # Calculate performance improvements
+            cached_queries = database_queries_per_second * (cache_hit_rate / 100)
+            database_queries = database_queries_per_second * ((100 - cache_hit_rate) / 100)
+        
+            # Average response time with cache
+            avg_response_with_cache = (cached_queries * cache_response_time + database_queries * average_query_time) / database_queries_per_second
+        
+            # Performance improvement
+            performance_improvement = ((average_query_time - avg_response_with_cache) / average_query_time) * 100
+        
+            # Cost analysis
+            total_monthly_cost = database_server_cost + elasticache_cost
+            cost_per_query_improvement = (performance_improvement / 100) * database_server_cost
+        
+            st.markdown('<div class="highlight-box">', unsafe_allow_html=True)
+            st.markdown(f"""
+            ### 💰 ROI Analysis Results
+        
+            **Performance Improvements:**
+            - **Response Time**: {average_query_time:.1f}ms → {avg_response_with_cache:.1f}ms
+            - **Performance Improvement**: {performance_improvement:.1f}% faster
+            - **Database Load Reduction**: {cache_hit_rate}% of queries served from cache
+        
+            **Cost Analysis:**
+            - **Total Monthly Cost**: ${total_monthly_cost:.2f}
+            - **Additional Cost**: ${elasticache_cost:.2f} for ElastiCache
+            - **Performance per Dollar**: {performance_improvement/elasticache_cost:.2f}% improvement per $
+        
+            **Business Impact:**
+            - **User Experience**: {performance_improvement:.1f}% faster application
+            - **Scalability**: Handle {cache_hit_rate}% more users with same database
+            - **Cost Efficiency**: Reduce database infrastructure needs
+            """)
+            st.markdown('</div>', unsafe_allow_html=True)
+
+    elasticache_roi_calculator()
 
+@common.profiled
 def strategies_tab():
     """Content for ElastiCache strategies tab"""
     st.markdown("## 📋 Amazon ElastiCache - Strategies")
@@ -3345,16 +3331,7 @@ if __name__ == "__main__":
     # Strategy Comparison Summary
     st.markdown("### 📊 Strategy Comparison Summary")
     
-    comparison_data = {
-        'Strategy': ['Lazy Loading', 'Write Through', 'Write Behind', 'Refresh Ahead'],
-        'Write Latency': ['N/A (Read-only)', 'High', 'Very Low', 'N/A (Read-only)'],
-        'Read Latency': ['Medium (cache miss)', 'Low', 'Low', 'Very Low'],
-        'Data Consistency': ['Eventual', 'Strong', 'Eventual', 'Eventual'],
-        'Implementation': ['Simple', 'Medium', 'Complex', 'Complex'],
-        'Use Case': ['Read-heavy', 'Transactional', 'High-write volume', 'Predictable access']
-    }
-    
-    df_comparison = pd.DataFrame(comparison_data)
+    df_comparison = catalog.table("strategies.comparison")
     st.dataframe(df_comparison, use_container_width=True)
     
     # Best Practices
@@ -3379,6 +3356,7 @@ if __name__ == "__main__":
     """)
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def main():
     """Main application function"""
     # Apply styling
@@ -3401,24 +3379,12 @@ def main():
                 </div>""", unsafe_allow_html=True)
     
     # Create tabs
-    tab1, tab2, tab3, tab4 = st.tabs([
-        "🗄️ Amazon ElastiCache", 
-        "⚖️ Redis vs. Memcached", 
-        "🎯 Use Cases",
-        "📋 Caching Strategies"
-    ])
-    
-    with tab1:
-        amazon_elasticache_tab()
-    
-    with tab2:
-        redis_vs_memcached_tab()
-    
-    with tab3:
-        use_cases_tab()
-    
-    with tab4:
-        strategies_tab()
+    common.tab_router({
+        "🗄️ Amazon ElastiCache": amazon_elasticache_tab,
+        "⚖️ Redis vs. Memcached": redis_vs_memcached_tab,
+        "🎯 Use Cases": use_cases_tab,
+        "📋 Caching Strategies": strategies_tab,
+    })
     
     # Footer
     st.markdown("""
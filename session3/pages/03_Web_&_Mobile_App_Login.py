@@ -1,16 +1,19 @@
 
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import utils.common as common
+import utils.catalog as catalog
 import utils.authenticate as authenticate
 import json
 import base64
 from datetime import datetime, timedelta
 
+# Heavy libraries are imported when a tab first uses them
+pd = common.lazy_import("pandas")
+np = common.lazy_import("numpy")
+px = common.lazy_import("plotly.express")
+go = common.lazy_import("plotly.graph_objects")
+make_subplots = common.lazy_import("plotly.subplots", "make_subplots")
+
 # Page configuration
 st.set_page_config(
     page_title="AWS Cognito Authentication Hub",
@@ -32,8 +35,7 @@ AWS_COLORS = {
 
 def apply_custom_styles():
     """Apply custom CSS styling with AWS color scheme"""
-    st.markdown(f"""
-    <style>
+    common.stylesheet(f"""
         .main {{
             background-color: {AWS_COLORS['light_gray']};
         }}
@@ -149,8 +151,7 @@ def apply_custom_styles():
             color: white;
             margin: 10px 0;
         }}
-    </style>
-    """, unsafe_allow_html=True)
+    """)
 
 def create_sidebar():
     """Create sidebar with app information and controls"""
@@ -288,6 +289,7 @@ def create_user_pool_features_mermaid():
         style L fill:#2196F3,stroke:#1565C0,color:#fff
     """
 
+@common.profiled
 def aws_cognito_tab():
     """Content for AWS Cognito tab"""
     st.markdown("## 🔐 AWS Cognito")
@@ -481,83 +483,67 @@ def aws_cognito_tab():
     # Token Types Explanation
     st.markdown("### 🎫 JWT Token Types in Cognito")
     
-    token_data = {
-        'Token Type': ['ID Token', 'Access Token', 'Refresh Token'],
-        'Purpose': [
-            'Contains user identity information',
-            'Grants access to protected resources',
-            'Obtains new access and ID tokens'
-        ],
-        'Validity': ['1 hour (configurable)', '1 hour (configurable)', '30 days (configurable)'],
-        'Contains': [
-            'User attributes, claims',
-            'Scopes, permissions',
-            'Long-lived credential'
-        ],
-        'Usage': [
-            'User profile, personalization',
-            'API calls, resource access',
-            'Token renewal, long sessions'
-        ]
-    }
-    
-    df_tokens = pd.DataFrame(token_data)
+    df_tokens = catalog.table("aws_cognito.token")
     st.dataframe(df_tokens, use_container_width=True)
     
     # Cost Calculator
-    st.markdown("### 💰 Cognito Cost Calculator")
+    @common.fragment
+    def cognito_cost_calculator():
+        st.markdown("### 💰 Cognito Cost Calculator")
     
-    col1, col2 = st.columns(2)
+        col1, col2 = st.columns(2)
     
-    with col1:
-        monthly_active_users = st.slider("Monthly Active Users (MAUs):", 0, 100000, 5000, step=500)
-        mfa_users = st.slider("Users with MFA (%):", 0, 100, 30)
-        sms_mfa_messages = st.slider("SMS MFA messages per user/month:", 0, 20, 5)
+        with col1:
+            monthly_active_users = st.slider("Monthly Active Users (MAUs):", 0, 100000, 5000, step=500)
+            mfa_users = st.slider("Users with MFA (%):", 0, 100, 30)
+            sms_mfa_messages = st.slider("SMS MFA messages per user/month:", 0, 20, 5)
     
-    with col2:
-        social_logins = st.slider("Social identity federation (%):", 0, 100, 20)
-        saml_users = st.slider("SAML/OIDC users (%):", 0, 100, 0)
-        advanced_security = st.checkbox("Advanced Security Features", value=False)
+        with col2:
+            social_logins = st.slider("Social identity federation (%):", 0, 100, 20)
+            saml_users = st.slider("SAML/OIDC users (%):", 0, 100, 0)
+            advanced_security = st.checkbox("Advanced Security Features", value=False)
     
-    if st.button("💵 Calculate Monthly Cost"):
-        # Cost calculation based on AWS Cognito pricing
-        base_cost = monthly_active_users * 0.0055  # $0.0055 per MAU
+        if st.button("💵 Calculate Monthly Cost"):
+            # Cost calculation based on AWS Cognito pricing
+            base_cost = monthly_active_users * 0.0055  # $0.0055 per MAU
         
-        # MFA SMS costs
-        mfa_cost = (monthly_active_users * mfa_users / 100) * (sms_mfa_messages * 0.05)
+            # MFA SMS costs
+            mfa_cost = (monthly_active_users * mfa_users / 100) * (sms_mfa_messages * 0.05)
         
-        # Advanced security
-        advanced_cost = monthly_active_users * 0.05 if advanced_security else 0
+            # Advanced security
+            advanced_cost = monthly_active_users * 0.05 if advanced_security else 0
         
-        total_cost = base_cost + mfa_cost + advanced_cost
+            total_cost = base_cost + mfa_cost + advanced_cost
         
-        # Display cost breakdown
-        col1, col2, col3, col4 = st.columns(4)
+            # Display cost breakdown
+            col1, col2, col3, col4 = st.columns(4)
         
-        with col1:
-            st.metric("Base Cost", f"${base_cost:.2f}", "User Pool MAUs")
+            with col1:
+                st.metric("Base Cost", f"${base_cost:.2f}", "User Pool MAUs")
         
-        with col2:
-            st.metric("MFA SMS Cost", f"${mfa_cost:.2f}", "SMS Messages")
+            with col2:
+                st.metric("MFA SMS Cost", f"${mfa_cost:.2f}", "SMS Messages")
         
-        with col3:
-            st.metric("Advanced Security", f"${advanced_cost:.2f}", "Optional Feature")
+            with col3:
+                st.metric("Advanced Security", f"${advanced_cost:.2f}", "Optional Feature")
         
-        with col4:
-            st.metric("Total Monthly Cost", f"${total_cost:.2f}", f"for {monthly_active_users:,} MAUs")
+            with col4:
+                st.metric("Total Monthly Cost", f"${total_cost:.2f}", f"for {monthly_active_users:,} MAUs")
         
-        # Cost breakdown chart
-        if total_cost > 0:
-            cost_breakdown = pd.DataFrame({
-                'Component': ['Base User Pool', 'MFA SMS', 'Advanced Security'],
-                'Cost': [base_cost, mfa_cost, advanced_cost]
-            })
+            # Cost breakdown chart
+            if total_cost > 0:
+                cost_breakdown = pd.DataFrame({
+                    'Component': ['Base User Pool', 'MFA SMS', 'Advanced Security'],
+                    'Cost': [base_cost, mfa_cost, advanced_cost]
+                })
             
-            fig = px.pie(cost_breakdown, values='Cost', names='Component', 
-                        title='Monthly Cost Breakdown',
-                        color_discrete_sequence=[AWS_COLORS['primary'], AWS_COLORS['light_blue'], AWS_COLORS['warning']])
+                fig = px.pie(cost_breakdown, values='Cost', names='Component', 
+                            title='Monthly Cost Breakdown',
+                            color_discrete_sequence=[AWS_COLORS['primary'], AWS_COLORS['light_blue'], AWS_COLORS['warning']])
             
-            st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(fig, use_container_width=True)
+
+    cognito_cost_calculator()
     
     # Code Example
     st.markdown("### 💻 Code Example: Basic Cognito Setup")
@@ -879,6 +865,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def main():
     """Main application function"""
     # Apply styling
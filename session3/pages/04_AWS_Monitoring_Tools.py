@@ -1,15 +1,18 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import boto3
 import json
 from datetime import datetime, timedelta
 import utils.common as common
+import utils.catalog as catalog
 import utils.authenticate as authenticate
 
+# Heavy libraries are imported when a tab first uses them
+pd = common.lazy_import("pandas")
+np = common.lazy_import("numpy")
+px = common.lazy_import("plotly.express")
+go = common.lazy_import("plotly.graph_objects")
+make_subplots = common.lazy_import("plotly.subplots", "make_subplots")
+
 # Page configuration
 st.set_page_config(
     page_title="AWS Monitoring Tools Hub",
@@ -32,8 +35,7 @@ AWS_COLORS = {
 
 def apply_custom_styles():
     """Apply custom CSS styling with AWS color scheme"""
-    st.markdown(f"""
-    <style>
+    common.stylesheet(f"""
         .main {{
             background-color: {AWS_COLORS['light_gray']};
         }}
@@ -144,8 +146,7 @@ def apply_custom_styles():
             margin: 10px 0;
             box-shadow: 0 2px 8px rgba(0,0,0,0.1);
         }}
-    </style>
-    """, unsafe_allow_html=True)
+    """)
 
 def create_sidebar():
     """Create sidebar with app information and controls"""
@@ -243,6 +244,7 @@ def create_monitoring_flow_mermaid():
         style G fill:#232F3E,stroke:#FF9900,color:#fff
     """
 
+@common.profiled
 def cloudtrail_tab():
     """Content for AWS CloudTrail tab"""
     st.markdown("## 🔍 AWS CloudTrail")
@@ -427,34 +429,7 @@ def cloudtrail_tab():
     # CloudTrail Best Practices
     st.markdown("### 💡 CloudTrail Best Practices")
     
-    practices_data = {
-        'Best Practice': [
-            'Enable in All Regions',
-            'Use Organization Trail',
-            'Enable Log File Validation',
-            'Encrypt CloudTrail Logs',
-            'Set Up Log Monitoring',
-            'Regular Access Review'
-        ],
-        'Why Important': [
-            'Complete visibility across all AWS regions',
-            'Centralized logging for multiple accounts',
-            'Detect tampering or corruption',
-            'Protect sensitive audit information',
-            'Real-time security alerting',
-            'Ensure least privilege access'
-        ],
-        'Implementation': [
-            'Create multi-region trail',
-            'Enable organizational CloudTrail',
-            'Turn on log file validation',
-            'Use KMS encryption keys',
-            'CloudWatch Logs integration',
-            'Automated access reviews'
-        ]
-    }
-    
-    df_practices = pd.DataFrame(practices_data)
+    df_practices = catalog.table("cloudtrail.practices")
     st.dataframe(df_practices, use_container_width=True)
     
     # Security Monitoring Scenario
@@ -482,52 +457,56 @@ def cloudtrail_tab():
     st.markdown('</div>', unsafe_allow_html=True)
     
     # Interactive CloudTrail Cost Calculator
-    st.markdown("### 💰 CloudTrail Cost Calculator")
+    @common.fragment
+    def cloudtrail_cost_calculator():
+        st.markdown("### 💰 CloudTrail Cost Calculator")
     
-    col1, col2 = st.columns(2)
+        col1, col2 = st.columns(2)
     
-    with col1:
-        management_events = st.slider("Management Events per Month (thousands):", 10, 1000, 100)
-        data_events = st.slider("Data Events per Month (millions):", 0, 100, 10)
-        retention_months = st.slider("Log Retention (months):", 1, 120, 12)
+        with col1:
+            management_events = st.slider("Management Events per Month (thousands):", 10, 1000, 100)
+            data_events = st.slider("Data Events per Month (millions):", 0, 100, 10)
+            retention_months = st.slider("Log Retention (months):", 1, 120, 12)
     
-    with col2:
-        regions_enabled = st.slider("Number of Regions:", 1, 20, 3)
-        encryption_enabled = st.checkbox("KMS Encryption", value=True)
-        insights_enabled = st.checkbox("CloudTrail Insights", value=False)
+        with col2:
+            regions_enabled = st.slider("Number of Regions:", 1, 20, 3)
+            encryption_enabled = st.checkbox("KMS Encryption", value=True)
+            insights_enabled = st.checkbox("CloudTrail Insights", value=False)
     
-    if st.button("💰 Calculate CloudTrail Costs", use_container_width=True):
-        # CloudTrail pricing calculations
-        management_cost = 0  # First copy of management events is free
-        data_events_cost = (data_events * 1_000_000 / 100_000) * 0.10  # $0.10 per 100,000 events
+        if st.button("💰 Calculate CloudTrail Costs", use_container_width=True):
+            # CloudTrail pricing calculations
+            management_cost = 0  # First copy of management events is free
+            data_events_cost = (data_events * 1_000_000 / 100_000) * 0.10  # $0.10 per 100,000 events
         
-        # Storage costs (S3)
-        avg_event_size_kb = 1.5  # Average CloudTrail event size
-        total_events = (management_events * 1000) + (data_events * 1_000_000)
-        storage_gb_per_month = (total_events * avg_event_size_kb) / (1024 * 1024)
-        storage_cost = storage_gb_per_month * 0.023 * retention_months  # S3 Standard pricing
+            # Storage costs (S3)
+            avg_event_size_kb = 1.5  # Average CloudTrail event size
+            total_events = (management_events * 1000) + (data_events * 1_000_000)
+            storage_gb_per_month = (total_events * avg_event_size_kb) / (1024 * 1024)
+            storage_cost = storage_gb_per_month * 0.023 * retention_months  # S3 Standard pricing
         
-        # KMS encryption costs
-        kms_cost = 100 * 0.03 if encryption_enabled else 0  # $0.03 per 10,000 requests
+            # KMS encryption costs
+            kms_cost = 100 * 0.03 if encryption_enabled else 0  # $0.03 per 10,000 requests
         
-        # CloudTrail Insights
-        insights_cost = data_events * 0.35 if insights_enabled else 0  # $0.35 per 100,000 events
+            # CloudTrail Insights
+            insights_cost = data_events * 0.35 if insights_enabled else 0  # $0.35 per 100,000 events
         
-        total_monthly_cost = data_events_cost + (storage_cost / retention_months) + kms_cost + insights_cost
+            total_monthly_cost = data_events_cost + (storage_cost / retention_months) + kms_cost + insights_cost
         
-        col1, col2, col3, col4 = st.columns(4)
+            col1, col2, col3, col4 = st.columns(4)
         
-        with col1:
-            st.metric("Data Events", f"${data_events_cost:.2f}/month", "Per 100K events")
+            with col1:
+                st.metric("Data Events", f"${data_events_cost:.2f}/month", "Per 100K events")
         
-        with col2:
-            st.metric("Storage (S3)", f"${storage_cost/retention_months:.2f}/month", f"{storage_gb_per_month:.1f} GB")
+            with col2:
+                st.metric("Storage (S3)", f"${storage_cost/retention_months:.2f}/month", f"{storage_gb_per_month:.1f} GB")
         
-        with col3:
-            st.metric("KMS Encryption", f"${kms_cost:.2f}/month", "If enabled")
+            with col3:
+                st.metric("KMS Encryption", f"${kms_cost:.2f}/month", "If enabled")
         
-        with col4:
-            st.metric("Total Monthly", f"${total_monthly_cost:.2f}", f"Annual: ${total_monthly_cost * 12:.2f}")
+            with col4:
+                st.metric("Total Monthly", f"${total_monthly_cost:.2f}", f"Annual: ${total_monthly_cost * 12:.2f}")
+
+    cloudtrail_cost_calculator()
     
     # Code Example
     st.markdown("### 💻 Code Example: CloudTrail Setup and Monitoring")
@@ -765,6 +744,7 @@ if setup_result:
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def cloudwatch_tab():
     """Content for Amazon CloudWatch tab"""
     st.markdown("## 📊 Amazon CloudWatch")
@@ -1043,26 +1023,7 @@ def cloudwatch_tab():
     st.markdown("### 📊 CloudWatch Dashboards")
     
     # Sample dashboard metrics
-    dashboard_data = {
-        'Widget Type': ['Line Graph', 'Number', 'Bar Chart', 'Log Insights', 'Alarm Status'],
-        'Best For': [
-            'Time-series metrics over time',
-            'Current metric values',
-            'Comparing multiple metrics',
-            'Log query results',
-            'Quick status overview'
-        ],
-        'Example Use Case': [
-            'CPU utilization trends',
-            'Current active connections',
-            'Error rates by service',
-            'Recent application logs',
-            'Infrastructure health status'
-        ],
-        'Refresh Rate': ['1 minute', 'Real-time', '5 minutes', '1 minute', 'Real-time']
-    }
-    
-    df_dashboard = pd.DataFrame(dashboard_data)
+    df_dashboard = catalog.table("cloudwatch.dashboard")
     st.dataframe(df_dashboard, use_container_width=True)
     
     # Monitoring Scenario Demonstration
@@ -1070,48 +1031,52 @@ def cloudwatch_tab():
     common.mermaid(create_monitoring_flow_mermaid(), height=800)
     
     # CloudWatch Pricing Calculator
-    st.markdown("### 💰 CloudWatch Pricing Calculator")
+    @common.fragment
+    def cloudwatch_pricing_calculator():
+        st.markdown("### 💰 CloudWatch Pricing Calculator")
     
-    col1, col2 = st.columns(2)
+        col1, col2 = st.columns(2)
     
-    with col1:
-        custom_metrics = st.slider("Custom Metrics per Month:", 0, 10000, 1000)
-        api_requests = st.slider("API Requests (thousands):", 0, 1000, 100)
-        dashboard_count = st.slider("Number of Dashboards:", 0, 50, 5)
+        with col1:
+            custom_metrics = st.slider("Custom Metrics per Month:", 0, 10000, 1000)
+            api_requests = st.slider("API Requests (thousands):", 0, 1000, 100)
+            dashboard_count = st.slider("Number of Dashboards:", 0, 50, 5)
     
-    with col2:
-        log_ingestion_gb = st.slider("Log Ingestion (GB/month):", 0, 1000, 100)
-        log_storage_gb = st.slider("Log Storage (GB):", 0, 5000, 500)
-        alarms_count = st.slider("Number of Alarms:", 0, 1000, 50)
-    
-    if st.button("💰 Calculate CloudWatch Costs", use_container_width=True):
-        # CloudWatch pricing (US East 1)
-        metrics_cost = max(0, custom_metrics - 10) * 0.30  # First 10 free
-        api_cost = max(0, (api_requests * 1000) - 1_000_000) * 0.01 / 1000  # First 1M free
-        dashboard_cost = max(0, dashboard_count - 3) * 3.00  # First 3 free
-        
-        log_ingestion_cost = log_ingestion_gb * 0.50
-        log_storage_cost = log_storage_gb * 0.03
-        alarms_cost = max(0, alarms_count - 10) * 0.10  # First 10 free
-        
-        total_cost = metrics_cost + api_cost + dashboard_cost + log_ingestion_cost + log_storage_cost + alarms_cost
-        
-        # Display cost breakdown
-        cost_data = {
-            'Component': ['Custom Metrics', 'API Requests', 'Dashboards', 'Log Ingestion', 'Log Storage', 'Alarms'],
-            'Quantity': [custom_metrics, f"{api_requests}K", dashboard_count, f"{log_ingestion_gb} GB", f"{log_storage_gb} GB", alarms_count],
-            'Monthly Cost': [f"${metrics_cost:.2f}", f"${api_cost:.2f}", f"${dashboard_cost:.2f}", 
-                           f"${log_ingestion_cost:.2f}", f"${log_storage_cost:.2f}", f"${alarms_cost:.2f}"]
-        }
+        with col2:
+            log_ingestion_gb = st.slider("Log Ingestion (GB/month):", 0, 1000, 100)
+            log_storage_gb = st.slider("Log Storage (GB):", 0, 5000, 500)
+            alarms_count = st.slider("Number of Alarms:", 0, 1000, 50)
+    
+        if st.button("💰 Calculate CloudWatch Costs", use_container_width=True):
+            # CloudWatch pricing (US East 1)
+            metrics_cost = max(0, custom_metrics - 10) * 0.30  # First 10 free
+            api_cost = max(0, (api_requests * 1000) - 1_000_000) * 0.01 / 1000  # First 1M free
+            dashboard_cost = max(0, dashboard_count - 3) * 3.00  # First 3 free
+        
+            log_ingestion_cost = log_ingestion_gb * 0.50
+            log_storage_cost = log_storage_gb * 0.03
+            alarms_cost = max(0, alarms_count - 10) * 0.10  # First 10 free
+        
+            total_cost = metrics_cost + api_cost + dashboard_cost + log_ingestion_cost + log_storage_cost + alarms_cost
+        
+            # Display cost breakdown
+            cost_data = {
+                'Component': ['Custom Metrics', 'API Requests', 'Dashboards', 'Log Ingestion', 'Log Storage', 'Alarms'],
+                'Quantity': [custom_metrics, f"{api_requests}K", dashboard_count, f"{log_ingestion_gb} GB", f"{log_storage_gb} GB", alarms_count],
+                'Monthly Cost': [f"${metrics_cost:.2f}", f"${api_cost:.2f}", f"${dashboard_cost:.2f}", 
+                               f"${log_ingestion_cost:.2f}", f"${log_storage_cost:.2f}", f"${alarms_cost:.2f}"]
+            }
         
-        df_costs = pd.DataFrame(cost_data)
-        st.dataframe(df_costs, use_container_width=True)
+            df_costs = pd.DataFrame(cost_data)
+            st.dataframe(df_costs, use_container_width=True)
         
-        col1, col2 = st.columns(2)
-        with col1:
-            st.metric("Total Monthly Cost", f"${total_cost:.2f}")
-        with col2:
-            st.metric("Annual Cost", f"${total_cost * 12:.2f}")
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Total Monthly Cost", f"${total_cost:.2f}")
+            with col2:
+                st.metric("Annual Cost", f"${total_cost * 12:.2f}")
+
+    cloudwatch_pricing_calculator()
     
     # Code Example
     st.markdown("### 💻 Code Example: Complete CloudWatch Setup")
@@ -1405,6 +1370,7 @@ if setup_result:
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def main():
     """Main application function"""
     # Apply styling
@@ -1427,16 +1393,10 @@ def main():
                 </div>""", unsafe_allow_html=True)
     
     # Create tabs
-    tab1, tab2 = st.tabs([
-        "🔍 AWS CloudTrail", 
-        "📊 Amazon CloudWatch"
-    ])
-    
-    with tab1:
-        cloudtrail_tab()
-    
-    with tab2:
-        cloudwatch_tab()
+    common.tab_router({
+        "🔍 AWS CloudTrail": cloudtrail_tab,
+        "📊 Amazon CloudWatch": cloudwatch_tab,
+    })
     
     # Footer
     st.markdown("""
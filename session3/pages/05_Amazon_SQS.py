@@ -20,6 +20,10 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Received messages kept in the session; the oldest are dropped first
+MAX_RECEIVED_MESSAGES = 200
+common.declare_session_key("received_messages", max_items=MAX_RECEIVED_MESSAGES)
+
 # Custom CSS for modern UI
 def load_css():
     """Load custom CSS for modern UI/UX"""
@@ -108,13 +112,14 @@ def initialize_session_state():
     if 'messages_received' not in st.session_state:
         st.session_state.messages_received = 0
     if 'received_messages' not in st.session_state:
-        st.session_state.received_messages = []
-    if 'sqs_service' not in st.session_state:
-        config = load_aws_config()
-        st.session_state.sqs_service = SQSService(config)
+        st.session_state.received_messages = common.BoundedList(max_items=MAX_RECEIVED_MESSAGES)
     if 'queue_stats' not in st.session_state:
         st.session_state.queue_stats = {}
 
+def get_sqs_service() -> SQSService:
+    """The session's SQS service, built on first use and dropped when the session goes idle"""
+    return common.session_resource("sqs_service", lambda: SQSService(load_aws_config()))
+
 def render_header():
     """Render the application header"""
     st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
@@ -131,6 +136,7 @@ def render_sidebar():
     with st.sidebar:
         common.render_sidebar()
 
+@common.profiled
 def render_producer_tab():
     """Render the producer tab"""
     st.markdown("## 📤 Message Producer")
@@ -181,7 +187,7 @@ def render_producer_tab():
             
             if st.button("🚀 Send Sample Message", type="primary"):
                 with st.spinner("Sending message..."):
-                    result = st.session_state.sqs_service.send_message(
+                    result = get_sqs_service().send_message(
                         SAMPLE_MESSAGES[selected_sample]
                     )
                     
@@ -201,6 +207,22 @@ def render_producer_tab():
                             ❌ Failed to send message: {result.get('error', 'Unknown error')}
                         </div>
                         """, unsafe_allow_html=True)
+            
+            # Bulk send through SendMessageBatch, up to 10 messages per call
+            batch_count = st.number_input("Copies to send as a batch", min_value=1, max_value=100, value=10)
+            if st.button("📦 Send Batch"):
+                with st.spinner(f"Sending {batch_count} messages..."):
+                    results = get_sqs_service().send_messages(
+                        [SAMPLE_MESSAGES[selected_sample]] * int(batch_count)
+                    )
+                
+                sent = sum(1 for result in results if result.get('success'))
+                st.session_state.messages_sent += sent
+                if sent == len(results):
+                    st.success(f"✅ Sent {sent} messages in batches of up to 10")
+                else:
+                    errors = sorted({result.get('error', 'Unknown error') for result in results if not result.get('success')})
+                    st.error(f"❌ Sent {sent} of {len(results)} messages: {'; '.join(errors)}")
     
     with col2:
         st.markdown("### Custom Message")
@@ -235,7 +257,7 @@ def render_producer_tab():
                     }
                     
                     with st.spinner("Sending custom message..."):
-                        result = st.session_state.sqs_service.send_message(custom_message)
+                        result = get_sqs_service().send_message(custom_message)
                         
                         if result.get('success'):
                             st.session_state.messages_sent += 1
@@ -246,6 +268,7 @@ def render_producer_tab():
                 except json.JSONDecodeError:
                     st.error("❌ Invalid JSON format in message data")
 
+@common.profiled
 def render_consumer_tab():
     """Render the consumer tab"""
     st.markdown("## 📥 Message Consumer")
@@ -258,7 +281,7 @@ def render_consumer_tab():
     
     if st.button("🔄 Refresh Queue Stats"):
         with st.spinner("Fetching queue attributes..."):
-            attrs = st.session_state.sqs_service.get_queue_attributes()
+            attrs = get_sqs_service().get_queue_attributes()
             if attrs:
                 st.session_state.queue_stats = attrs
                 st.success("✅ Queue stats refreshed")
@@ -295,26 +318,62 @@ def render_consumer_tab():
     
     col1, col2 = st.columns([1, 1])
     
+    # The auto-delete option is read by the consume button, so it is rendered first
+    with col2:
+        if st.button("🗑️ Clear Received Messages"):
+            st.session_state.received_messages = common.BoundedList(max_items=MAX_RECEIVED_MESSAGES)
+            st.success("✅ Cleared all received messages")
+        
+        auto_delete = st.checkbox("🔄 Auto-delete after processing", value=True)
+        background = st.toggle("📡 Background long polling", value=False,
+                               help="Take messages a shared poller has already received with 20 second "
+                                    "long polls, instead of calling SQS on every click. It keeps as many "
+                                    "messages buffered as the last click took")
+    
     with col1:
         max_messages = st.slider("Max messages to receive", 1, 10, 5)
         
         if st.button("🔄 Consume Messages", type="primary"):
             with st.spinner("Consuming messages..."):
-                messages = st.session_state.sqs_service.receive_messages(max_messages)
+                sqs_service = get_sqs_service()
+                if background:
+                    messages = sqs_service.take_buffered_messages(max_messages)
+                else:
+                    messages = sqs_service.receive_messages(max_messages)
                 
                 if messages:
+                    if auto_delete:
+                        # Acknowledged in one DeleteMessageBatch call
+                        for message in messages:
+                            sqs_service.acknowledge(message['receipt_handle'])
+                        deleted = set(sqs_service.flush_acknowledgements()['deleted_handles'])
+                        for message in messages:
+                            message['deleted'] = message['receipt_handle'] in deleted
                     st.session_state.received_messages.extend(messages)
                     st.session_state.messages_received += len(messages)
                     st.success(f"✅ Received {len(messages)} message(s)")
+                    undeleted = sum(1 for message in messages if auto_delete and not message['deleted'])
+                    if undeleted:
+                        st.warning(f"⚠️ {undeleted} message(s) could not be deleted and will "
+                                   "return to the queue after their visibility timeout")
+                elif background:
+                    st.info("📭 No messages buffered yet; the background poller is now receiving, "
+                            "consume again in a moment")
                 else:
                     st.info("📭 No messages available in the queue")
     
-    with col2:
-        if st.button("🗑️ Clear Received Messages"):
-            st.session_state.received_messages = []
-            st.success("✅ Cleared all received messages")
-        
-        auto_delete = st.checkbox("🔄 Auto-delete after processing", value=True)
+    if background:
+        # Reading the metrics does not start the poller; only a consume does
+        poller = get_sqs_service().background_consumer().metrics()
+        col_rate, col_empty, col_depth = st.columns(3)
+        with col_rate:
+            st.metric("📡 Receive Rate", f"{poller['receive_rate']:.2f} msg/s", border=True)
+        with col_empty:
+            st.metric("🕳️ Empty Receives", f"{poller['empty_ratio']:.0%}", border=True)
+        with col_depth:
+            st.metric("📦 Buffered", f"{poller['depth']} / {poller['capacity']}", border=True)
+        if poller['last_error']:
+            st.caption(f"⚠️ Last receive error: {poller['last_error']}")
     
     # Display received messages
     if st.session_state.received_messages:
@@ -337,7 +396,8 @@ def render_consumer_tab():
                 
                 with col_actions:
                     if st.button(f"🗑️ Delete", key=f"delete_{idx}"):
-                        success = st.session_state.sqs_service.delete_message(
+                        # Auto-deleted messages are already gone from the queue
+                        success = message.get('deleted') or get_sqs_service().delete_message(
                             message['receipt_handle']
                         )
                         if success:
@@ -357,6 +417,7 @@ def render_footer():
     </div>
     """, unsafe_allow_html=True)
 
+@common.profiled
 def main():
     """Main application function"""
     # Load CSS and initialize
@@ -367,13 +428,10 @@ def main():
     render_sidebar()
     
     # Main content with tabs
-    tab1, tab2 = st.tabs(["📤 Producer", "📥 Consumer"])
-    
-    with tab1:
-        render_producer_tab()
-    
-    with tab2:
-        render_consumer_tab()
+    common.tab_router({
+        "📤 Producer": render_producer_tab,
+        "📥 Consumer": render_consumer_tab,
+    })
     
     # Render footer
     render_footer()
@@ -6,13 +6,15 @@ import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Any
 import streamlit as st
-import pandas as pd
 import utils.common as common
 import utils.authenticate as authenticate
 import logging
 from utils.sns.config import AWSConfig, AppConfig, SAMPLE_MESSAGES, CUSTOM_CSS
 from utils.sns.aws_services import AWSResourceManager, AWSServiceError
 
+# Heavy libraries are imported when a tab first uses them
+pd = common.lazy_import("pandas")
+
 
 # Configure logging for debugging
 logging.basicConfig(
@@ -21,6 +23,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Messages and log lines kept in the session, per subscriber; the oldest are dropped first
+MAX_RECEIVED_MESSAGES = 200
+common.declare_session_key("received_messages", max_items=MAX_RECEIVED_MESSAGES)
+common.declare_session_key("debug_logs", max_items=MAX_RECEIVED_MESSAGES)
+
 common.initialize_session_state()
 
 # Configure Streamlit page
@@ -128,6 +135,7 @@ def render_sidebar(aws_manager: AWSResourceManager):
             total_received = sum(st.session_state.messages_received.values())
             st.metric("Total Received", total_received)
 
+@common.profiled
 def render_publisher_tab(aws_manager: AWSResourceManager):
     """Render publisher tab interface."""
     st.header("📤 Message Publisher")
@@ -253,6 +261,7 @@ def render_publisher_tab(aws_manager: AWSResourceManager):
             st.write(f"**Published At:** {result['published_at']}")
             st.write(f"**Topic:** {result['topic_arn'].split(':')[-1]}")
 
+@common.profiled
 def render_subscriber_tab(subscriber_name: str, aws_manager: AWSResourceManager):
     """Render subscriber tab interface."""
     subscriber_key = f"subscriber_{subscriber_name}"
@@ -290,6 +299,12 @@ def render_subscriber_tab(subscriber_name: str, aws_manager: AWSResourceManager)
         with col4:
             local_msgs = len(st.session_state.received_messages[subscriber_key])
             st.metric("Local Cache", local_msgs)
+        
+        # Messages received by the background poller count as in flight until consumed
+        poller = consumer.background_consumer().metrics()
+        st.caption(f"📡 Background long polling: {poller['depth']} / {poller['capacity']} buffered, "
+                   f"{poller['receive_rate']:.2f} msg/s, {poller['empty_ratio']:.0%} empty receives, "
+                   f"{poller['released']} unread released to the queue")
     except Exception as e:
         st.error(f"Error getting queue stats: {e}")
     
@@ -314,8 +329,8 @@ def render_subscriber_tab(subscriber_name: str, aws_manager: AWSResourceManager)
                 
                 status_placeholder.info("🔄 Fetching messages from queue...")
                 
-                # Receive messages
-                messages = consumer.receive_messages(max_messages=10, wait_time=0)
+                # Take what the background poller has received; it keeps the next 10 buffered
+                messages = consumer.take_buffered_messages(max_messages=10)
                 
                 status_placeholder.info(f"🔄 Processing {len(messages)} messages...")
                 
@@ -324,11 +339,11 @@ def render_subscriber_tab(subscriber_name: str, aws_manager: AWSResourceManager)
                     st.session_state.received_messages[subscriber_key].extend(messages)
                     st.session_state.messages_received[subscriber_key] += len(messages)
                     
-                    # Delete messages from queue (acknowledge)
-                    deleted_count = 0
+                    # Delete messages from queue (acknowledge), 10 per DeleteMessageBatch call
                     for msg in messages:
-                        if consumer.delete_message(msg['receipt_handle']):
-                            deleted_count += 1
+                        consumer.acknowledge(msg['receipt_handle'])
+                    deleted = set(consumer.flush_acknowledgements()['deleted_handles'])
+                    deleted_count = sum(1 for msg in messages if msg['receipt_handle'] in deleted)
                     
                     status_placeholder.success(f"✅ Received {len(messages)} messages, deleted {deleted_count}")
                     
@@ -340,7 +355,8 @@ def render_subscriber_tab(subscriber_name: str, aws_manager: AWSResourceManager)
                     })
                     
                 else:
-                    status_placeholder.info("📭 No messages available in queue")
+                    status_placeholder.info("📭 No messages buffered; the background poller "
+                                            "checks the queue with 20 second long polls")
                     
                     # Show queue status
                     attrs = consumer.get_queue_attributes()
@@ -374,8 +390,7 @@ def render_subscriber_tab(subscriber_name: str, aws_manager: AWSResourceManager)
         if st.button(f"🧪 Test Direct SQS Send", key=f"test_{subscriber_name}", use_container_width=True):
             try:
                 # Send a test message directly to SQS (bypassing SNS)
-                import boto3
-                sqs_client = boto3.client('sqs', region_name=consumer.region)
+                sqs_client = consumer.client
                 
                 test_message = {
                     "type": "test",
@@ -458,6 +473,7 @@ def render_subscriber_tab(subscriber_name: str, aws_manager: AWSResourceManager)
             """)
             
             
+@common.profiled
 def render_debug_tab(aws_manager: AWSResourceManager):
     """Render debug information tab."""
     st.header("🔍 Debug Information")
@@ -518,6 +534,7 @@ def render_footer():
         </div>
     """, unsafe_allow_html=True)
 
+@common.profiled
 def main():
     """Main application function."""
     # Configure page
@@ -528,8 +545,7 @@ def main():
     
     # Load AWS configuration
     try:
-        aws_config = AWSConfig.from_env()
-        aws_manager = AWSResourceManager(aws_config)
+        aws_manager = common.session_resource("sns_aws_manager", lambda: AWSResourceManager(AWSConfig.from_env()))
     except Exception as e:
         st.error(f"❌ Failed to initialize AWS services: {e}")
         st.stop()
@@ -538,29 +554,15 @@ def main():
     render_header()
     render_sidebar(aws_manager)
     
-    # Main content area with tabs
-    tab1, tab2, tab3, tab4, tab5 = st.tabs([
-        "📤 Publisher", 
-        "📥 Subscriber 1", 
-        "📥 Subscriber 2", 
-        "📥 Subscriber 3",
-        "🔍 Debug"
-    ])
-    
-    with tab1:
-        render_publisher_tab(aws_manager)
-    
-    with tab2:
-        render_subscriber_tab("1", aws_manager)
-    
-    with tab3:
-        render_subscriber_tab("2", aws_manager)
-    
-    with tab4:
-        render_subscriber_tab("3", aws_manager)
-    
-    with tab5:
-        render_debug_tab(aws_manager)
+    # Main content area; only the selected section runs, so its AWS calls
+    # are the only ones made on a rerun
+    common.tab_router({
+        "📤 Publisher": lambda: render_publisher_tab(aws_manager),
+        "📥 Subscriber 1": lambda: render_subscriber_tab("1", aws_manager),
+        "📥 Subscriber 2": lambda: render_subscriber_tab("2", aws_manager),
+        "📥 Subscriber 3": lambda: render_subscriber_tab("3", aws_manager),
+        "🔍 Debug": lambda: render_debug_tab(aws_manager),
+    })
     
     # Auto-refresh mechanism
     if st.session_state.auto_refresh:
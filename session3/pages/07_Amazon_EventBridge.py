@@ -1,5 +1,4 @@
 import streamlit as st
-import boto3
 import json
 import uuid
 from datetime import datetime
@@ -39,9 +38,8 @@ class EventBridgeOrderDemo:
     def initialize_aws_clients(self):
         """Initialize AWS clients with error handling."""
         try:
-            session = boto3.Session(region_name='ap-southeast-1')
-            self.eventbridge_client = session.client('events')
-            self.logs_client = session.client('logs')
+            self.eventbridge_client = common.aws_client('events', region_name='ap-southeast-1')
+            self.logs_client = common.aws_client('logs', region_name='ap-southeast-1')
         except Exception as e:
             logger.error(f"Failed to initialize AWS clients: {str(e)}")
             st.error("Failed to initialize AWS clients. Please check your AWS credentials.")
@@ -247,6 +245,7 @@ def render_order_form(demo: EventBridgeOrderDemo):
                 "Total": f"${order['total_amount']:.2f}"
             })
 
+@common.profiled
 def render_service_tab(demo: EventBridgeOrderDemo, service_name: str, function_name: str, 
                       icon: str, description: str, features: list):
     """Render a service processing tab."""
@@ -306,6 +305,7 @@ def render_service_tab(demo: EventBridgeOrderDemo, service_name: str, function_n
     with metric_col3:
         st.metric("Events Processed", "1,247", "+23")
 
+@common.profiled
 def main():
     """Main function to run the Streamlit application."""
     # Apply custom CSS
@@ -322,14 +322,10 @@ def main():
     # Initialize demo
     demo = EventBridgeOrderDemo()
     
-    # Create tabs
-    tabs = st.tabs(["🛒 Place Order", "📦 Inventory Service", "📧 Email Service", "💳 Payment Service"])
-    
-    with tabs[0]:
-        render_order_form(demo)
-    
-    with tabs[1]:
-        render_service_tab(
+    # Only the selected section runs on each rerun
+    common.tab_router({
+        "🛒 Place Order": lambda: render_order_form(demo),
+        "📦 Inventory Service": lambda: render_service_tab(
             demo=demo,
             service_name="Inventory Management Service",
             function_name="InventoryProcessorFunction",
@@ -342,10 +338,8 @@ def main():
                 "Product availability tracking",
                 "Automatic reorder triggers"
             ]
-        )
-    
-    with tabs[2]:
-        render_service_tab(
+        ),
+        "📧 Email Service": lambda: render_service_tab(
             demo=demo,
             service_name="Email Notification Service",
             function_name="EmailProcessorFunction",
@@ -358,10 +352,8 @@ def main():
                 "Promotional campaigns",
                 "Customer communication logs"
             ]
-        )
-    
-    with tabs[3]:
-        render_service_tab(
+        ),
+        "💳 Payment Service": lambda: render_service_tab(
             demo=demo,
             service_name="Payment Processing Service",
             function_name="PaymentProcessorFunction",
@@ -374,7 +366,8 @@ def main():
                 "Payment method validation",
                 "Financial reporting"
             ]
-        )
+        ),
+    })
     
     # Sidebar with additional information
     with st.sidebar:
@@ -2,83 +2,26 @@
 # Streamlit Chat with ElastiCache Redis Memory - Amazon Bedrock and LangChain
 # ------------------------------------------------------------------------
 import streamlit as st
-import boto3
 import botocore
 import uuid
-import redis
-import json
 import os
-from typing import Optional, List
-from langchain_core.output_parsers import StrOutputParser
-from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain_core.runnables.history import RunnableWithMessageHistory
-from langchain_aws import ChatBedrock
-from langchain_core.chat_history import BaseChatMessageHistory
-from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
+from typing import Optional
 import utils.common as common
 import utils.authenticate as authenticate
 
+# LangChain and the Redis client are imported once the chat is first built, after login
+redis = common.lazy_import("redis")
+StrOutputParser = common.lazy_import("langchain_core.output_parsers", "StrOutputParser")
+ChatPromptTemplate = common.lazy_import("langchain_core.prompts", "ChatPromptTemplate")
+MessagesPlaceholder = common.lazy_import("langchain_core.prompts", "MessagesPlaceholder")
+RunnableWithMessageHistory = common.lazy_import("langchain_core.runnables.history", "RunnableWithMessageHistory")
+ChatBedrock = common.lazy_import("langchain_aws", "ChatBedrock")
+# Subclasses LangChain's BaseChatMessageHistory, so it lives in its own module
+RedisChatMessageHistory = common.lazy_import("utils.redis_chat_history", "RedisChatMessageHistory")
 
-class RedisChatMessageHistory(BaseChatMessageHistory):
-    """Custom Redis chat message history implementation for LangChain."""
-    
-    def __init__(self, session_id: str, redis_client: redis.Redis, ttl: int = 3600):
-        self.session_id = session_id
-        self.redis_client = redis_client
-        self.ttl = ttl
-        self.key = f"chat_history:{session_id}"
-    
-    @property
-    def messages(self) -> List[BaseMessage]:
-        """Retrieve messages from Redis."""
-        try:
-            messages_data = self.redis_client.get(self.key)
-            if not messages_data:
-                return []
-            
-            messages_list = json.loads(messages_data)
-            messages = []
-            
-            for msg_data in messages_list:
-                if msg_data["type"] == "human":
-                    messages.append(HumanMessage(content=msg_data["content"]))
-                elif msg_data["type"] == "ai":
-                    messages.append(AIMessage(content=msg_data["content"]))
-            
-            return messages
-        except Exception as e:
-            st.error(f"Error retrieving messages from Redis: {e}")
-            return []
-    
-    def add_message(self, message: BaseMessage) -> None:
-        """Add a message to Redis."""
-        try:
-            current_messages = self.messages
-            current_messages.append(message)
-            
-            # Convert messages to serializable format
-            messages_data = []
-            for msg in current_messages:
-                if isinstance(msg, HumanMessage):
-                    messages_data.append({"type": "human", "content": msg.content})
-                elif isinstance(msg, AIMessage):
-                    messages_data.append({"type": "ai", "content": msg.content})
-            
-            # Store in Redis with TTL
-            self.redis_client.setex(
-                self.key, 
-                self.ttl, 
-                json.dumps(messages_data)
-            )
-        except Exception as e:
-            st.error(f"Error adding message to Redis: {e}")
-    
-    def clear(self) -> None:
-        """Clear the chat history."""
-        try:
-            self.redis_client.delete(self.key)
-        except Exception as e:
-            st.error(f"Error clearing messages from Redis: {e}")
+# Chat messages shown in the session; the full history stays in Redis
+MAX_CHAT_MESSAGES = 100
+common.declare_session_key("messages", max_items=MAX_CHAT_MESSAGES)
 
 
 class RedisConnectionManager:
@@ -89,7 +32,7 @@ class RedisConnectionManager:
         self._connection_pool: Optional[redis.ConnectionPool] = None
     
     def get_redis_client(self, host: str, port: int = 6379, 
-                        ssl: bool = True, decode_responses: bool = True) -> Optional[redis.Redis]:
+                        ssl: bool = True, decode_responses: bool = True) -> "Optional[redis.Redis]":
         """Get Redis client with connection pooling."""
         try:
             if not self._connection_pool:
@@ -119,7 +62,7 @@ class RedisConnectionManager:
             st.error(f"Unexpected Redis error: {e}")
             return None
     
-    def test_connection(self, redis_client: redis.Redis) -> bool:
+    def test_connection(self, redis_client: "redis.Redis") -> bool:
         """Test Redis connection."""
         try:
             return redis_client.ping()
@@ -160,20 +103,17 @@ def get_model_kwargs(model: str, temperature: float, top_p: float, max_tokens: i
     return model_configs.get(provider, {})
 
 
-def initialize_bedrock_client(region: str = "us-east-1") -> boto3.client:
+def initialize_bedrock_client(region: str = "us-east-1"):
     """Initialize Amazon Bedrock client."""
     try:
-        return boto3.client(
-            service_name="bedrock-runtime",
-            region_name=region,
-        )
+        return common.aws_client("bedrock-runtime", region_name=region)
     except Exception as e:
         st.error(f"Error initializing Bedrock client: {e}")
         return None
 
 
 def create_chat_chain(bedrock_client, model_id: str, model_kwargs: dict, 
-                     redis_client: redis.Redis, session_id: str):
+                     redis_client: "redis.Redis", session_id: str):
     """Create the chat chain with Redis message history."""
     
     template = [
@@ -206,7 +146,7 @@ def create_chat_chain(bedrock_client, model_id: str, model_kwargs: dict,
     return chain_with_history
 
 
-def render_sidebar_controls(redis_client: Optional[redis.Redis]) -> tuple:
+def render_sidebar_controls(redis_client: "Optional[redis.Redis]") -> tuple:
     """Render sidebar controls and return configuration values."""
     with st.sidebar:
         common.render_sidebar()
@@ -290,6 +230,7 @@ def process_chat_message(chain_with_history, user_prompt: str, session_id: str,
                     st.error(f"Error getting response: {e}")
 
 
+@common.profiled
 def main():
     """Main application function."""
     # Page configuration
@@ -307,16 +248,20 @@ def main():
     st.subheader("Chatbot with ElastiCache Redis Memory")
     st.write("Amazon ElastiCache for Redis provides persistent memory for your conversational AI application")
 
-    # Get Redis endpoint from environment or Streamlit secrets
-    redis_endpoint = os.getenv('REDIS_ENDPOINT') or st.secrets.get("REDIS_ENDPOINT")
-    
-    if not redis_endpoint:
-        st.error("Redis endpoint not configured. Please set REDIS_ENDPOINT environment variable or add it to Streamlit secrets.")
-        st.stop()
+    if common.local_backend.enabled():
+        # Offline: local Redis stand-in (DVA_AWS_BACKEND=local)
+        redis_client = common.local_backend.redis_client()
+    else:
+        # Get Redis endpoint from environment or Streamlit secrets
+        redis_endpoint = os.getenv('REDIS_ENDPOINT') or st.secrets.get("REDIS_ENDPOINT")
+
+        if not redis_endpoint:
+            st.error("Redis endpoint not configured. Please set REDIS_ENDPOINT environment variable or add it to Streamlit secrets.")
+            st.stop()
 
-    # Initialize Redis connection
-    redis_manager = RedisConnectionManager()
-    redis_client = redis_manager.get_redis_client(host=redis_endpoint, port=6379)
+        # Initialize Redis connection
+        redis_manager = RedisConnectionManager()
+        redis_client = redis_manager.get_redis_client(host=redis_endpoint, port=6379)
 
     if not redis_client:
         st.error("Failed to connect to Redis. Please check your configuration.")
@@ -0,0 +1,37 @@
+"""Shared fixtures for the session 3 SQS tests.
+
+Run from the session3 directory with ``python -m pytest tests``.
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+# The pages import the app's modules as ``utils.*``, relative to the app directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def sqs_queue(monkeypatch):
+    """A moto SQS queue with a dead-letter queue after 3 receives.
+
+    Yields:
+        (client, queue URL, dead-letter queue URL)
+    """
+    moto = pytest.importorskip("moto")
+    boto3 = pytest.importorskip("boto3")
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    with moto.mock_aws():
+        client = boto3.client("sqs", region_name="us-east-1")
+        dlq_url = client.create_queue(QueueName="test-dlq")["QueueUrl"]
+        dlq_arn = client.get_queue_attributes(
+            QueueUrl=dlq_url, AttributeNames=["QueueArn"])["Attributes"]["QueueArn"]
+        queue_url = client.create_queue(QueueName="test-main-queue", Attributes={
+            "VisibilityTimeout": "7",
+            "RedrivePolicy": json.dumps({"deadLetterTargetArn": dlq_arn, "maxReceiveCount": "3"}),
+        })["QueueUrl"]
+        yield client, queue_url, dlq_url
+
@@ -0,0 +1,157 @@
+"""AckBuffer: size and time triggered deletes, partial failures and reporting."""
+
+import threading
+import time
+
+import pytest
+from botocore.exceptions import EndpointConnectionError
+
+from utils.sqs import acknowledgements
+from utils.sqs.acknowledgements import AckBuffer
+from utils.sqs.config import AWSConfig
+from utils.sqs.sqs_service import SQSService
+
+QUEUE_URL = "https://sqs.us-east-1.amazonaws.com/123456789012/test-main-queue"
+
+
+class DeleteClient:
+    """Records DeleteMessageBatch calls; handles named in ``failures`` fail with that outcome.
+
+    "retry" is a server-side failure, "invalid" a sender fault and "error"
+    makes the whole call raise. ``delay`` holds each call for that long.
+    """
+
+    def __init__(self, failures=None, delay=0.0):
+        self.failures = failures or {}
+        self.delay = delay
+        self.calls = []
+
+    def delete_message_batch(self, QueueUrl, Entries):
+        handles = [entry["ReceiptHandle"] for entry in Entries]
+        self.calls.append(handles)
+        time.sleep(self.delay)
+        if any(self.failures.get(handle) == "error" for handle in handles):
+            raise EndpointConnectionError(endpoint_url=QueueUrl)
+        response = {"Successful": [], "Failed": []}
+        for entry in Entries:
+            outcome = self.failures.get(entry["ReceiptHandle"])
+            if outcome is None:
+                response["Successful"].append({"Id": entry["Id"]})
+            else:
+                response["Failed"].append({"Id": entry["Id"], "Code": outcome, "SenderFault": outcome == "invalid"})
+        return response
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(acknowledgements, "ACK_BACKOFF_SECONDS", 0)
+
+
+def test_full_buffer_is_deleted_at_once_and_reported_by_flush():
+    client = DeleteClient()
+    buffer = AckBuffer(lambda: client, QUEUE_URL, flush_delay=60)
+
+    for n in range(12):
+        buffer.add(f"h{n}")
+
+    assert client.calls == [[f"h{n}" for n in range(10)]]
+    result = buffer.flush()
+    assert client.calls[1] == ["h10", "h11"]
+    assert result["deleted"] == 12
+    assert result["deleted_handles"] == [f"h{n}" for n in range(12)]
+    assert buffer.flush() == {"deleted": 0, "failed": 0, "deleted_handles": [], "failed_handles": []}
+
+
+def test_buffer_is_deleted_after_the_flush_delay():
+    client = DeleteClient()
+    buffer = AckBuffer(lambda: client, QUEUE_URL, flush_delay=0.1)
+
+    for n in range(3):
+        buffer.add(f"h{n}")
+    assert client.calls == []
+    time.sleep(0.4)
+
+    assert client.calls == [["h0", "h1", "h2"]]
+    assert buffer.stats() == {"acknowledged": 3, "failed": 0, "calls": 1, "pending": 0}
+    assert buffer.flush()["deleted_handles"] == ["h0", "h1", "h2"]
+
+
+def test_partial_failures_are_reported_per_handle():
+    client = DeleteClient(failures={"h1": "invalid", "h2": "retry"})
+    buffer = AckBuffer(lambda: client, QUEUE_URL, flush_delay=60)
+
+    for n in range(4):
+        buffer.add(f"h{n}")
+    result = buffer.flush()
+
+    # The sender fault is not retried; the server-side failure is, ACK_RETRIES times
+    assert client.calls == [["h0", "h1", "h2", "h3"]] + [["h2"]] * acknowledgements.ACK_RETRIES
+    assert result == {"deleted": 2, "failed": 2, "deleted_handles": ["h0", "h3"], "failed_handles": ["h1", "h2"]}
+
+
+def test_failed_call_fails_only_its_batch():
+    client = DeleteClient(failures={"h12": "error"})
+    buffer = AckBuffer(lambda: client, QUEUE_URL, flush_delay=60)
+
+    for n in range(15):
+        buffer.add(f"h{n}")
+    result = buffer.flush()
+
+    assert result["deleted_handles"] == [f"h{n}" for n in range(10)]
+    assert result["failed_handles"] == [f"h{n}" for n in range(10, 15)]
+    assert buffer.stats()["failed"] == 5
+
+
+def test_flush_waits_for_a_timed_delete_in_flight():
+    client = DeleteClient(delay=0.3)
+    buffer = AckBuffer(lambda: client, QUEUE_URL, flush_delay=0.05)
+
+    buffer.add("h0")
+    time.sleep(0.15)
+    assert client.calls == [["h0"]]
+    result = buffer.flush()
+
+    assert result["deleted_handles"] == ["h0"]
+
+
+def test_concurrent_acknowledgements_are_all_reported():
+    client = DeleteClient()
+    buffer = AckBuffer(lambda: client, QUEUE_URL, flush_delay=0.01)
+
+    def acknowledge(prefix):
+        for n in range(50):
+            buffer.add(f"{prefix}{n}")
+
+    threads = [threading.Thread(target=acknowledge, args=(prefix,)) for prefix in "abcd"]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    result = buffer.flush()
+
+    assert sorted(result["deleted_handles"]) == sorted(f"{prefix}{n}" for prefix in "abcd" for n in range(50))
+    assert all(len(call) <= acknowledgements.MAX_ACK_BATCH for call in client.calls)
+
+
+def test_service_deletes_acknowledged_messages(sqs_queue):
+    client, queue_url, _ = sqs_queue
+    service = SQSService(AWSConfig(region="us-east-1", queue_url=queue_url))
+    service._client = client
+    for n in range(12):
+        client.send_message(QueueUrl=queue_url, MessageBody=f'{{"n": {n}}}')
+    handles = []
+    while len(handles) < 12:
+        messages = client.receive_message(QueueUrl=queue_url, MaxNumberOfMessages=10)["Messages"]
+        handles += [message["ReceiptHandle"] for message in messages]
+
+    for handle in handles:
+        service.acknowledge(handle)
+    result = service.flush_acknowledgements()
+
+    assert result["deleted"] == 12
+    assert sorted(result["deleted_handles"]) == sorted(handles)
+    attributes = client.get_queue_attributes(
+        QueueUrl=queue_url,
+        AttributeNames=["ApproximateNumberOfMessages", "ApproximateNumberOfMessagesNotVisible"],
+    )["Attributes"]
+    assert attributes == {"ApproximateNumberOfMessages": "0", "ApproximateNumberOfMessagesNotVisible": "0"}
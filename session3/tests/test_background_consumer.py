@@ -0,0 +1,253 @@
+"""BackgroundConsumer: buffered reads, prefetch limits, release and idle shutdown."""
+
+import threading
+import time
+
+import pytest
+
+from utils.sqs import background_consumer
+from utils.sqs.background_consumer import BackgroundConsumer
+
+QUEUE_URL = "https://sqs.us-east-1.amazonaws.com/123456789012/test-main-queue"
+
+
+class PollClient:
+    """An in-memory queue answering ReceiveMessage like a long poll.
+
+    A receive waits up to WaitTimeSeconds for messages, after ``delay``
+    seconds of latency. Released messages go back to the queue.
+    """
+
+    def __init__(self, messages=0, visibility_timeout=30, delay=0.0):
+        self.visibility_timeout = visibility_timeout
+        self.delay = delay
+        self.receives = []
+        self.releases = []
+        self._queue = []
+        self._sent = 0
+        self._condition = threading.Condition()
+        self.send(messages)
+
+    def send(self, count):
+        with self._condition:
+            self._queue += [{"MessageId": f"m{n}", "ReceiptHandle": f"r{n}", "Body": "{}"}
+                            for n in range(self._sent, self._sent + count)]
+            self._sent += count
+            self._condition.notify_all()
+
+    def depth(self):
+        with self._condition:
+            return len(self._queue)
+
+    def get_queue_attributes(self, QueueUrl, AttributeNames):
+        return {"Attributes": {"VisibilityTimeout": str(self.visibility_timeout)}}
+
+    def receive_message(self, QueueUrl, MaxNumberOfMessages, WaitTimeSeconds, **kwargs):
+        self.receives.append((MaxNumberOfMessages, WaitTimeSeconds))
+        time.sleep(self.delay)
+        with self._condition:
+            self._condition.wait_for(lambda: self._queue, timeout=WaitTimeSeconds)
+            messages, self._queue = self._queue[:MaxNumberOfMessages], self._queue[MaxNumberOfMessages:]
+        return {"Messages": messages}
+
+    def change_message_visibility_batch(self, QueueUrl, Entries):
+        assert all(entry["VisibilityTimeout"] == 0 for entry in Entries)
+        self.releases.append([entry["ReceiptHandle"] for entry in Entries])
+        with self._condition:
+            self._queue += [{"MessageId": entry["ReceiptHandle"], "ReceiptHandle": entry["ReceiptHandle"],
+                             "Body": "{}"} for entry in Entries]
+            self._condition.notify_all()
+        return {"Successful": [{"Id": entry["Id"]} for entry in Entries]}
+
+
+@pytest.fixture(autouse=True)
+def no_error_backoff(monkeypatch):
+    monkeypatch.setattr(background_consumer, "ERROR_BACKOFF_SECONDS", 0.05)
+
+
+def wait_until(condition, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_metrics_do_not_start_polling():
+    client = PollClient(messages=5)
+    consumer = BackgroundConsumer(lambda: client, QUEUE_URL)
+
+    for _ in range(20):
+        consumer.metrics()
+        time.sleep(0.01)
+
+    assert not consumer.metrics()["running"]
+    assert client.receives == []
+
+
+def test_take_returns_at_once_and_the_buffer_fills_behind_it():
+    client = PollClient(messages=50)
+    consumer = BackgroundConsumer(lambda: client, QUEUE_URL)
+
+    started = time.monotonic()
+    assert consumer.take(3) == []
+    assert time.monotonic() - started < 0.1
+    wait_until(lambda: consumer.metrics()["depth"] == 3)
+
+    started = time.monotonic()
+    assert [message["ReceiptHandle"] for message in consumer.take(3)] == ["r0", "r1", "r2"]
+    assert time.monotonic() - started < 0.1
+    assert client.receives[0] == (3, background_consumer.LONG_POLL_SECONDS)
+
+
+def test_prefetch_is_limited_to_the_last_read():
+    client = PollClient(messages=50)
+    consumer = BackgroundConsumer(lambda: client, QUEUE_URL)
+
+    consumer.take(3)
+    wait_until(lambda: consumer.metrics()["depth"] == 3)
+    time.sleep(0.2)
+
+    # Backpressure: a full buffer stops receiving until a read makes room
+    assert len(client.receives) == 1
+    assert client.depth() == 47
+    assert len(consumer.take(3)) == 3
+    wait_until(lambda: consumer.metrics()["depth"] == 3)
+    assert [count for count, _ in client.receives] == [3, 3]
+
+
+def test_prefetch_is_capped_by_the_buffer_capacity():
+    client = PollClient(messages=50)
+    consumer = BackgroundConsumer(lambda: client, QUEUE_URL, capacity=2)
+
+    consumer.take(10)
+    wait_until(lambda: consumer.metrics()["depth"] == 2)
+
+    assert client.receives[0][0] == 2
+    assert consumer.metrics()["prefetch"] == 2
+
+
+def test_long_poll_ends_before_a_held_message_falls_due():
+    # Held messages fall due 5 seconds after they arrive
+    client = PollClient(messages=2, visibility_timeout=10)
+    consumer = BackgroundConsumer(lambda: client, QUEUE_URL)
+
+    consumer.take(5)
+    wait_until(lambda: len(client.receives) == 2)
+
+    assert client.receives[0] == (5, background_consumer.LONG_POLL_SECONDS)
+    assert client.receives[1][0] == 3
+    assert 1 <= client.receives[1][1] <= 5
+
+
+def test_unread_messages_are_released_and_polling_pauses(monkeypatch):
+    monkeypatch.setattr(background_consumer, "VISIBILITY_MARGIN_SECONDS", 0.5)
+    client = PollClient(messages=3, visibility_timeout=1)
+    consumer = BackgroundConsumer(lambda: client, QUEUE_URL)
+
+    consumer.take(3)
+    wait_until(lambda: consumer.metrics()["depth"] == 3)
+    received_at = time.monotonic()
+    wait_until(lambda: consumer.metrics()["released"] == 3)
+
+    assert time.monotonic() - received_at < 1
+    assert client.releases == [["r0", "r1", "r2"]]
+    assert client.depth() == 3
+    # Nobody read them, so they are not received again until the next read
+    time.sleep(0.3)
+    assert len(client.receives) == 1
+    assert consumer.metrics()["paused"]
+
+    assert consumer.take(3) == []
+    wait_until(lambda: consumer.metrics()["depth"] == 3)
+    assert len(consumer.take(3)) == 3
+    assert len(client.receives) >= 2
+
+
+def test_releases_are_batched_by_ten():
+    client = PollClient()
+    consumer = BackgroundConsumer(lambda: client, QUEUE_URL)
+
+    consumer._release([{"ReceiptHandle": f"r{n}"} for n in range(15)])
+
+    assert client.releases == [[f"r{n}" for n in range(10)], [f"r{n}" for n in range(10, 15)]]
+    assert consumer.metrics()["released"] == 15
+
+
+def test_messages_are_not_held_within_the_visibility_margin(monkeypatch):
+    monkeypatch.setattr(background_consumer, "VISIBILITY_MARGIN_SECONDS", 1)
+    client = PollClient(messages=3, visibility_timeout=1)
+    consumer = BackgroundConsumer(lambda: client, QUEUE_URL)
+
+    consumer.take(3)
+    wait_until(lambda: consumer.metrics()["released"] == 3)
+
+    assert client.releases == [["r0", "r1", "r2"]]
+    assert consumer.take(3) == []
+
+
+def test_idle_consumer_stops_and_restarts():
+    # A receive in progress delays the shutdown, so keep the long polls short
+    client = PollClient(messages=1)
+    consumer = BackgroundConsumer(lambda: client, QUEUE_URL, wait_time=1, idle_seconds=0.3)
+
+    consumer.take(1)
+    wait_until(lambda: consumer.metrics()["depth"] == 1)
+    assert len(consumer.take(1)) == 1
+    assert consumer.metrics()["running"]
+    wait_until(lambda: not consumer.metrics()["running"])
+
+    client.send(1)
+    consumer.take(1)
+    assert consumer.metrics()["running"]
+    wait_until(lambda: consumer.metrics()["depth"] == 1)
+
+
+def test_idle_shutdown_releases_held_messages():
+    client = PollClient(messages=2)
+    consumer = BackgroundConsumer(lambda: client, QUEUE_URL, idle_seconds=0.5)
+
+    consumer.take(2)
+    wait_until(lambda: not consumer.metrics()["running"])
+
+    assert client.releases == [["r0", "r1"]]
+    assert consumer.metrics()["depth"] == 0
+
+
+def queue_depth(client, queue_url):
+    attributes = client.get_queue_attributes(
+        QueueUrl=queue_url,
+        AttributeNames=["ApproximateNumberOfMessages", "ApproximateNumberOfMessagesNotVisible"],
+    )["Attributes"]
+    return (int(attributes["ApproximateNumberOfMessages"]),
+            int(attributes["ApproximateNumberOfMessagesNotVisible"]))
+
+
+def test_unread_messages_never_reach_the_dead_letter_queue(sqs_queue, monkeypatch):
+    # The queue has a 7 second visibility timeout and a DLQ after 3 receives;
+    # held messages are released 1 second after they arrive
+    monkeypatch.setattr(background_consumer, "VISIBILITY_MARGIN_SECONDS", 6)
+    client, queue_url, dlq_url = sqs_queue
+    for n in range(5):
+        client.send_message(QueueUrl=queue_url, MessageBody=f'{{"n": {n}}}')
+    consumer = BackgroundConsumer(lambda: client, queue_url, idle_seconds=1)
+
+    # A page showing the consumer metrics receives nothing
+    for _ in range(10):
+        consumer.metrics()
+        time.sleep(0.05)
+    assert consumer.metrics()["receives"] == 0
+
+    # One read, then nobody reads again: the prefetched messages go back once
+    assert consumer.take(2) == []
+    wait_until(lambda: consumer.metrics()["released"] == 2)
+    time.sleep(3)
+    assert consumer.metrics()["receives"] == 1
+    assert queue_depth(client, queue_url) == (5, 0)
+
+    # The next reads find the buffer filled again
+    consumer.take(2)
+    wait_until(lambda: consumer.metrics()["depth"] == 2)
+    assert len(consumer.take(2)) == 2
+    wait_until(lambda: not consumer.metrics()["running"])
+    assert queue_depth(client, queue_url) == (3, 2)
+    assert queue_depth(client, dlq_url) == (0, 0)
@@ -0,0 +1,152 @@
+"""SQSService.send_messages: batching limits, retries and per-batch failures."""
+
+import json
+
+import pytest
+from botocore.exceptions import ClientError, EndpointConnectionError
+
+from utils.sqs import sqs_service
+from utils.sqs.config import AWSConfig
+from utils.sqs.sqs_service import MAX_BATCH_BYTES, MAX_BATCH_ENTRIES, SQSService
+
+QUEUE_URL = "https://sqs.us-east-1.amazonaws.com/123456789012/test-main-queue"
+
+
+class BatchClient:
+    """Records SendMessageBatch calls and answers them from a script.
+
+    ``outcomes`` maps a message index to what each call should do with it:
+    "ok", "retry" (a server-side failure) or "invalid" (a sender fault).
+    A callable in ``errors`` is given the call number, from 0, and may raise.
+    """
+
+    def __init__(self, outcomes=None, errors=None):
+        self.outcomes = outcomes or {}
+        self.errors = errors or (lambda call: None)
+        self.calls = []
+
+    def send_message_batch(self, QueueUrl, Entries):
+        self.calls.append([entry["Id"] for entry in Entries])
+        self.errors(len(self.calls) - 1)
+        response = {"Successful": [], "Failed": []}
+        for entry in Entries:
+            outcome = self.outcomes.get(int(entry["Id"]), ["ok"])
+            action = outcome.pop(0) if len(outcome) > 1 else outcome[0]
+            if action == "ok":
+                response["Successful"].append({"Id": entry["Id"], "MessageId": f"msg-{entry['Id']}",
+                                               "MD5OfMessageBody": "md5"})
+            else:
+                response["Failed"].append({"Id": entry["Id"], "Code": action, "Message": action,
+                                           "SenderFault": action == "invalid"})
+        return response
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(sqs_service, "BATCH_BACKOFF_SECONDS", 0)
+    return SQSService(AWSConfig(region="us-east-1", queue_url=QUEUE_URL))
+
+
+def test_batches_hold_at_most_ten_entries(service):
+    service._client = client = BatchClient()
+
+    results = service.send_messages([{"type": "order", "n": n} for n in range(25)])
+
+    assert [len(call) for call in client.calls] == [10, 10, 5]
+    assert all(result["success"] for result in results)
+    assert [result["message_id"] for result in results] == [f"msg-{n}" for n in range(25)]
+
+
+def test_batches_stay_within_256_kb(service):
+    service._client = client = BatchClient()
+    messages = [{"type": "blob", "data": "x" * 100_000} for _ in range(5)]
+
+    results = service.send_messages(messages)
+
+    assert [len(call) for call in client.calls] == [2, 2, 1]
+    assert all(result["success"] for result in results)
+    entry = dict(service._build_entry(messages[0]), Id="0")
+    assert 2 * service._entry_size(entry) <= MAX_BATCH_BYTES < 3 * service._entry_size(entry)
+
+
+def test_chunking_splits_on_whichever_limit_comes_first(service):
+    small = dict(service._build_entry({"type": "order"}), Id="0")
+    large = dict(service._build_entry({"type": "blob", "data": "x" * 200_000}), Id="1")
+
+    batches = service._chunk_entries([small] * 12 + [large, large])
+
+    assert [len(batch) for batch in batches] == [MAX_BATCH_ENTRIES, 3, 1]
+    for batch in batches:
+        assert sum(service._entry_size(entry) for entry in batch) <= MAX_BATCH_BYTES
+
+
+def test_oversized_message_fails_without_a_call(service):
+    service._client = client = BatchClient()
+
+    results = service.send_messages([{"type": "blob", "data": "x" * MAX_BATCH_BYTES}, {"type": "order"}])
+
+    assert not results[0]["success"]
+    assert "256 KB" in results[0]["error"]
+    assert results[1]["success"]
+    assert client.calls == [["1"]]
+
+
+def test_only_failed_entries_are_retried(service):
+    service._client = client = BatchClient(outcomes={2: ["retry", "ok"], 7: ["retry", "retry", "ok"]})
+
+    results = service.send_messages([{"type": "order", "n": n} for n in range(10)])
+
+    assert client.calls == [[str(n) for n in range(10)], ["2", "7"], ["7"]]
+    assert all(result["success"] for result in results)
+
+
+def test_sender_faults_are_not_retried(service):
+    service._client = client = BatchClient(outcomes={3: ["invalid"], 4: ["retry"]})
+
+    results = service.send_messages([{"type": "order", "n": n} for n in range(5)])
+
+    assert client.calls[1:] == [["4"]] * (sqs_service.BATCH_MAX_ATTEMPTS - 1)
+    assert [result["success"] for result in results] == [True, True, True, False, False]
+    assert results[3]["error"].startswith("invalid")
+
+
+def test_botocore_error_fails_only_its_batch(service):
+    def drop_second_call(call):
+        if call == 1:
+            raise EndpointConnectionError(endpoint_url=QUEUE_URL)
+
+    service._client = BatchClient(errors=drop_second_call)
+
+    results = service.send_messages([{"type": "order", "n": n} for n in range(25)])
+
+    assert [result["success"] for result in results] == [True] * 10 + [False] * 10 + [True] * 5
+    assert "Could not connect" in results[10]["error"]
+
+
+def test_client_error_fails_only_its_batch(service):
+    def deny_first_call(call):
+        if call == 0:
+            raise ClientError({"Error": {"Code": "AccessDenied", "Message": "denied"}}, "SendMessageBatch")
+
+    service._client = BatchClient(errors=deny_first_call)
+
+    results = service.send_messages([{"type": "order", "n": n} for n in range(12)])
+
+    assert [result["success"] for result in results] == [False] * 10 + [True] * 2
+    assert results[0]["error"] == "AccessDenied: denied"
+
+
+def test_batches_reach_the_queue(service, sqs_queue):
+    client, queue_url, _ = sqs_queue
+    service._client = client
+
+    results = service.send_messages([{"type": "order", "n": n} for n in range(15)], queue_url=queue_url)
+
+    assert all(result["success"] for result in results)
+    received = []
+    while True:
+        messages = client.receive_message(QueueUrl=queue_url, MaxNumberOfMessages=10).get("Messages", [])
+        if not messages:
+            break
+        received += [json.loads(message["Body"])["body"]["n"] for message in messages]
+    assert sorted(received) == list(range(15))
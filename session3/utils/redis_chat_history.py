@@ -0,0 +1,75 @@
+"""LangChain chat message history stored in ElastiCache for Redis.
+
+Kept out of the page so that LangChain and the Redis client are imported
+only once the chat is built; the page loads this module through
+common.lazy_import.
+"""
+import json
+from typing import List
+
+import redis
+import streamlit as st
+from langchain_core.chat_history import BaseChatMessageHistory
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+
+
+class RedisChatMessageHistory(BaseChatMessageHistory):
+    """Custom Redis chat message history implementation for LangChain."""
+    
+    def __init__(self, session_id: str, redis_client: redis.Redis, ttl: int = 3600):
+        self.session_id = session_id
+        self.redis_client = redis_client
+        self.ttl = ttl
+        self.key = f"chat_history:{session_id}"
+    
+    @property
+    def messages(self) -> List[BaseMessage]:
+        """Retrieve messages from Redis."""
+        try:
+            messages_data = self.redis_client.get(self.key)
+            if not messages_data:
+                return []
+            
+            messages_list = json.loads(messages_data)
+            messages = []
+            
+            for msg_data in messages_list:
+                if msg_data["type"] == "human":
+                    messages.append(HumanMessage(content=msg_data["content"]))
+                elif msg_data["type"] == "ai":
+                    messages.append(AIMessage(content=msg_data["content"]))
+            
+            return messages
+        except Exception as e:
+            st.error(f"Error retrieving messages from Redis: {e}")
+            return []
+    
+    def add_message(self, message: BaseMessage) -> None:
+        """Add a message to Redis."""
+        try:
+            current_messages = self.messages
+            current_messages.append(message)
+            
+            # Convert messages to serializable format
+            messages_data = []
+            for msg in current_messages:
+                if isinstance(msg, HumanMessage):
+                    messages_data.append({"type": "human", "content": msg.content})
+                elif isinstance(msg, AIMessage):
+                    messages_data.append({"type": "ai", "content": msg.content})
+            
+            # Store in Redis with TTL
+            self.redis_client.setex(
+                self.key, 
+                self.ttl, 
+                json.dumps(messages_data)
+            )
+        except Exception as e:
+            st.error(f"Error adding message to Redis: {e}")
+    
+    def clear(self) -> None:
+        """Clear the chat history."""
+        try:
+            self.redis_client.delete(self.key)
+        except Exception as e:
+            st.error(f"Error clearing messages from Redis: {e}")
@@ -4,9 +4,11 @@ import json
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Any
-import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 import streamlit as st
+from dva_shared.aws_clients import aws_client
+from utils.sqs.acknowledgements import AckBuffer
+from utils.sqs.background_consumer import BackgroundConsumer, background_consumer
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -28,7 +30,7 @@ class SNSPublisher:
     def client(self):
         if self._client is None:
             try:
-                self._client = boto3.client('sns', region_name=self.region)
+                self._client = aws_client('sns', region_name=self.region)
             except NoCredentialsError:
                 raise AWSServiceError("AWS credentials not configured")
         return self._client
@@ -95,12 +97,13 @@ class SQSConsumer:
         self.queue_url = queue_url
         self.region = region
         self._client = None
+        self._ack_buffer = AckBuffer(lambda: self.client, queue_url)
     
     @property
     def client(self):
         if self._client is None:
             try:
-                self._client = boto3.client('sqs', region_name=self.region)
+                self._client = aws_client('sqs', region_name=self.region)
             except NoCredentialsError:
                 raise AWSServiceError("AWS credentials not configured")
         return self._client
@@ -128,74 +131,7 @@ class SQSConsumer:
                 logger.info("No messages available in queue")
                 return []
             
-            processed_messages = []
-            
-            for idx, message in enumerate(messages):
-                logger.info(f"Processing message {idx + 1}/{len(messages)}")
-                
-                try:
-                    # Get basic message info
-                    receipt_handle = message.get('ReceiptHandle')
-                    message_id = message.get('MessageId')
-                    body = message.get('Body', '{}')
-                    
-                    logger.info(f"Message ID: {message_id}")
-                    logger.info(f"Message body length: {len(body)}")
-                    
-                    # Parse message body
-                    parsed_body = json.loads(body)
-                    
-                    # Check if this is an SNS message
-                    if 'Message' in parsed_body and 'TopicArn' in parsed_body:
-                        logger.info("Detected SNS message format")
-                        try:
-                            actual_message = json.loads(parsed_body['Message'])
-                            message_source = 'SNS'
-                        except json.JSONDecodeError:
-                            logger.warning("Failed to parse SNS message content")
-                            actual_message = parsed_body['Message']
-                            message_source = 'SNS_RAW'
-                    else:
-                        logger.info("Detected direct SQS message format")
-                        actual_message = parsed_body
-                        message_source = 'SQS'
-                    
-                    processed_message = {
-                        'receipt_handle': receipt_handle,
-                        'message_id': message_id,
-                        'content': actual_message,
-                        'received_at': datetime.utcnow().isoformat(),
-                        'source': message_source,
-                        'raw_body': parsed_body,
-                        'attributes': message.get('Attributes', {}),
-                        'message_attributes': message.get('MessageAttributes', {})
-                    }
-                    
-                    processed_messages.append(processed_message)
-                    logger.info(f"Successfully processed message {idx + 1}")
-                    
-                except json.JSONDecodeError as e:
-                    logger.error(f"JSON decode error for message {idx + 1}: {e}")
-                    
-                    # Create error message entry
-                    error_message = {
-                        'receipt_handle': message.get('ReceiptHandle'),
-                        'message_id': message.get('MessageId'),
-                        'content': {
-                            'error': 'Failed to parse message',
-                            'raw_body': body,
-                            'parse_error': str(e)
-                        },
-                        'received_at': datetime.utcnow().isoformat(),
-                        'source': 'ERROR',
-                        'parse_error': str(e)
-                    }
-                    
-                    processed_messages.append(error_message)
-                    
-                except Exception as e:
-                    logger.error(f"Unexpected error processing message {idx + 1}: {e}")
-                    continue
+            processed_messages = self._process_messages(messages)
             
             logger.info(f"Successfully processed {len(processed_messages)} messages")
             return processed_messages
@@ -210,6 +146,87 @@ class SQSConsumer:
             logger.error(f"Unexpected error in receive_messages: {e}")
             raise AWSServiceError(f"Unexpected error: {str(e)}")
     
+    def _process_messages(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Unwrap SNS envelopes and parse raw SQS messages."""
+        processed_messages = []
+
+        for idx, message in enumerate(messages):
+            logger.info(f"Processing message {idx + 1}/{len(messages)}")
+
+            try:
+                # Get basic message info
+                receipt_handle = message.get('ReceiptHandle')
+                message_id = message.get('MessageId')
+                body = message.get('Body', '{}')
+
+                logger.info(f"Message ID: {message_id}")
+                logger.info(f"Message body length: {len(body)}")
+
+                # Parse message body
+                parsed_body = json.loads(body)
+
+                # Check if this is an SNS message
+                if 'Message' in parsed_body and 'TopicArn' in parsed_body:
+                    logger.info("Detected SNS message format")
+                    try:
+                        actual_message = json.loads(parsed_body['Message'])
+                        message_source = 'SNS'
+                    except json.JSONDecodeError:
+                        logger.warning("Failed to parse SNS message content")
+                        actual_message = parsed_body['Message']
+                        message_source = 'SNS_RAW'
+                else:
+                    logger.info("Detected direct SQS message format")
+                    actual_message = parsed_body
+                    message_source = 'SQS'
+
+                processed_message = {
+                    'receipt_handle': receipt_handle,
+                    'message_id': message_id,
+                    'content': actual_message,
+                    'received_at': datetime.utcnow().isoformat(),
+                    'source': message_source,
+                    'raw_body': parsed_body,
+                    'attributes': message.get('Attributes', {}),
+                    'message_attributes': message.get('MessageAttributes', {})
+                }
+
+                processed_messages.append(processed_message)
+                logger.info(f"Successfully processed message {idx + 1}")
+
+            except json.JSONDecodeError as e:
+                logger.error(f"JSON decode error for message {idx + 1}: {e}")
+
+                # Create error message entry
+                error_message = {
+                    'receipt_handle': message.get('ReceiptHandle'),
+                    'message_id': message.get('MessageId'),
+                    'content': {
+                        'error': 'Failed to parse message',
+                        'raw_body': body,
+                        'parse_error': str(e)
+                    },
+                    'received_at': datetime.utcnow().isoformat(),
+                    'source': 'ERROR',
+                    'parse_error': str(e)
+                }
+
+                processed_messages.append(error_message)
+
+            except Exception as e:
+                logger.error(f"Unexpected error processing message {idx + 1}: {e}")
+                continue
+        
+        return processed_messages
+    
+    def background_consumer(self) -> BackgroundConsumer:
+        """Background long-polling consumer of the queue, shared by every session; getting it does not poll."""
+        return background_consumer(lambda: self.client, self.queue_url)
+    
+    def take_buffered_messages(self, max_messages: int = 10) -> List[Dict[str, Any]]:
+        """Take messages the background consumer has already received, without calling SQS."""
+        return self._process_messages(self.background_consumer().take(max_messages))
+    
     def delete_message(self, receipt_handle: str) -> bool:
         """Delete message from queue."""
         try:
@@ -223,6 +240,14 @@ class SQSConsumer:
             logger.error(f"Failed to delete message: {e}")
             return False
     
+    def acknowledge(self, receipt_handle: str) -> None:
+        """Queue a processed message for deletion in a DeleteMessageBatch call."""
+        self._ack_buffer.add(receipt_handle)
+    
+    def flush_acknowledgements(self) -> Dict[str, Any]:
+        """Delete every message queued by acknowledge() now; returns deleted and failed handles and counts."""
+        return self._ack_buffer.flush()
+    
     def get_queue_attributes(self) -> Dict[str, Any]:
         """Get queue attributes including message counts."""
         try:
@@ -255,13 +280,13 @@ class SNSSubscriptionManager:
     @property
     def sns_client(self):
         if self._sns_client is None:
-            self._sns_client = boto3.client('sns', region_name=self.region)
+            self._sns_client = aws_client('sns', region_name=self.region)
         return self._sns_client
     
     @property
     def sqs_client(self):
         if self._sqs_client is None:
-            self._sqs_client = boto3.client('sqs', region_name=self.region)
+            self._sqs_client = aws_client('sqs', region_name=self.region)
         return self._sqs_client
     
     def setup_sqs_subscription(self, topic_arn: str, queue_url: str) -> bool:
@@ -0,0 +1,133 @@
+"""Batched acknowledgement (delete) of received SQS messages."""
+
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+logger = logging.getLogger(__name__)
+
+# DeleteMessageBatch takes at most 10 receipt handles per call
+MAX_ACK_BATCH = 10
+# Seconds a receipt handle may wait in the buffer before it is flushed
+ACK_FLUSH_DELAY = 1.0
+# Extra attempts for deletes that failed on the SQS side
+ACK_RETRIES = 1
+ACK_BACKOFF_SECONDS = 0.1
+
+
+class AckBuffer:
+    """Coalesces message deletes for one queue into DeleteMessageBatch calls.
+
+    Receipt handles are buffered and deleted 10 per call, as soon as 10 are
+    waiting or ACK_FLUSH_DELAY seconds after the first one arrived,
+    whichever comes first. flush() deletes what is waiting right away and
+    reports every delete settled since the previous flush(), including the
+    ones the size and time triggers sent in between.
+
+    Deletes SQS rejects are not raised: the message stays in the queue and
+    is delivered again once its visibility timeout expires, so a lost
+    acknowledgement means a repeated message, never a lost one.
+    """
+
+    def __init__(self, client_factory: Callable[[], Any], queue_url: str,
+                 max_batch: int = MAX_ACK_BATCH, flush_delay: float = ACK_FLUSH_DELAY):
+        self._client_factory = client_factory
+        self.queue_url = queue_url
+        self.max_batch = min(max_batch, MAX_ACK_BATCH)
+        self.flush_delay = flush_delay
+        self._pending: List[str] = []
+        self._deleted: List[str] = []
+        self._failed: List[str] = []
+        self._timer = None
+        self._lock = threading.Lock()
+        # Held for a whole flush, so flush() waits for one already under way
+        self._flush_lock = threading.Lock()
+        self._stats = {"acknowledged": 0, "failed": 0, "calls": 0}
+
+    def add(self, receipt_handle: str) -> None:
+        """Queue a received message for deletion."""
+        with self._lock:
+            self._pending.append(receipt_handle)
+            full = len(self._pending) >= self.max_batch
+            if not full and self._timer is None and self.flush_delay > 0:
+                self._timer = threading.Timer(self.flush_delay, self._send)
+                self._timer.daemon = True
+                self._timer.start()
+        if full:
+            self._send()
+
+    def flush(self) -> Dict[str, Any]:
+        """Delete every buffered message now.
+
+        Returns:
+            Counts and receipt handles of the messages deleted and of the
+            deletes that failed since the previous flush()
+        """
+        with self._flush_lock:
+            self._send_pending()
+            with self._lock:
+                deleted, self._deleted = self._deleted, []
+                failed, self._failed = self._failed, []
+        return {"deleted": len(deleted), "failed": len(failed),
+                "deleted_handles": deleted, "failed_handles": failed}
+
+    def _send(self) -> None:
+        """Delete the buffered messages, keeping the outcome for flush()."""
+        with self._flush_lock:
+            self._send_pending()
+
+    def _send_pending(self) -> None:
+        """Delete the buffered messages; the caller holds the flush lock."""
+        with self._lock:
+            handles, self._pending = self._pending, []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        for start in range(0, len(handles), self.max_batch):
+            deleted, failed = self._delete_batch(handles[start:start + self.max_batch])
+            with self._lock:
+                self._deleted.extend(deleted)
+                self._failed.extend(failed)
+                self._stats["acknowledged"] += len(deleted)
+                self._stats["failed"] += len(failed)
+
+    def _delete_batch(self, handles: List[str]) -> Tuple[List[str], List[str]]:
+        """Delete up to 10 messages, retrying the ones that failed on the SQS side.
+
+        Returns:
+            Receipt handles deleted and receipt handles whose delete failed
+        """
+        entries = [{"Id": str(index), "ReceiptHandle": handle} for index, handle in enumerate(handles)]
+        deleted: List[str] = []
+        failed: List[str] = []
+        for attempt in range(ACK_RETRIES + 1):
+            if attempt:
+                time.sleep(ACK_BACKOFF_SECONDS * 2 ** (attempt - 1) * random.uniform(0.5, 1.5))
+            try:
+                with self._lock:
+                    self._stats["calls"] += 1
+                response = self._client_factory().delete_message_batch(QueueUrl=self.queue_url, Entries=entries)
+            except (BotoCoreError, ClientError) as e:
+                logger.warning(f"Failed to delete {len(entries)} messages, they return after their "
+                               f"visibility timeout: {e}")
+                return deleted, failed + [entry["ReceiptHandle"] for entry in entries]
+            by_id = {entry["Id"]: entry["ReceiptHandle"] for entry in entries}
+            deleted.extend(by_id[sent["Id"]] for sent in response.get("Successful", []))
+            failures = response.get("Failed", [])
+            for failure in failures:
+                logger.warning(f"Failed to delete message: {failure.get('Code')} {failure.get('Message', '')}")
+            retry_ids = {failure["Id"] for failure in failures if not failure.get("SenderFault")}
+            failed.extend(by_id[failure["Id"]] for failure in failures if failure["Id"] not in retry_ids)
+            entries = [entry for entry in entries if entry["Id"] in retry_ids]
+            if not entries:
+                break
+        return deleted, failed + [entry["ReceiptHandle"] for entry in entries]
+
+    def stats(self) -> Dict[str, int]:
+        """Messages acknowledged, deletes failed and DeleteMessageBatch calls so far."""
+        with self._lock:
+            return dict(self._stats, pending=len(self._pending))
@@ -0,0 +1,263 @@
+"""Background long-polling of SQS queues into bounded in-memory buffers."""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Tuple
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+logger = logging.getLogger(__name__)
+
+# Long-poll wait per ReceiveMessage call; 20 seconds is the SQS maximum
+LONG_POLL_SECONDS = 20
+# Messages held per queue, however many a read takes
+BUFFER_CAPACITY = 100
+# Polling stops when nobody has read the buffer for this long, and resumes on the next read
+CONSUMER_IDLE_SECONDS = 300
+# Window over which the receive rate is reported
+RATE_WINDOW_SECONDS = 60
+# Pause after a failed receive before polling again
+ERROR_BACKOFF_SECONDS = 5
+# Unread messages are handed back to the queue this long before their
+# visibility timeout runs out, so SQS never counts the timeout as a failed delivery
+VISIBILITY_MARGIN_SECONDS = 5
+DEFAULT_VISIBILITY_TIMEOUT = 30
+# ChangeMessageVisibilityBatch takes at most 10 entries per call
+MAX_RELEASE_BATCH = 10
+
+
+class BackgroundConsumer:
+    """Long-polls one queue on a daemon thread into a bounded buffer.
+
+    Readers take messages from the buffer without waiting on SQS; the
+    thread keeps it filled with 20 second long polls, so an empty queue
+    costs three receives a minute instead of one per click. The buffer is
+    filled up to the number of messages the last read took, capped at
+    ``capacity``, so the thread prefetches about one read ahead and leaves
+    the rest of the messages in the queue.
+
+    Buffered messages are in flight. Those still unread
+    VISIBILITY_MARGIN_SECONDS before their visibility timeout runs out are
+    handed back to the queue with ChangeMessageVisibilityBatch
+    (VisibilityTimeout=0), and the thread then stops receiving until the
+    next read: messages nobody reads are received at most once per read,
+    not over and over until they reach the queue's maxReceiveCount. Long
+    polls are cut short so that a release is never late.
+
+    The thread starts on the first read and stops after
+    CONSUMER_IDLE_SECONDS without one, releasing what it still holds.
+    """
+
+    def __init__(self, client_factory: Callable[[], Any], queue_url: str, capacity: int = BUFFER_CAPACITY,
+                 wait_time: int = LONG_POLL_SECONDS, idle_seconds: float = CONSUMER_IDLE_SECONDS):
+        self._client_factory = client_factory
+        self.queue_url = queue_url
+        self.capacity = capacity
+        self.wait_time = wait_time
+        self.idle_seconds = idle_seconds
+        # (monotonic time to hand the message back, raw message), oldest first
+        self._buffer: Deque[Tuple[float, Dict[str, Any]]] = deque()
+        self._condition = threading.Condition()
+        self._running = False
+        self._last_read = 0.0
+        # Messages the buffer is filled up to: the size of the last read
+        self._prefetch = 0
+        # Set when unread messages were released; cleared by the next read
+        self._paused = False
+        self._visibility_timeout = DEFAULT_VISIBILITY_TIMEOUT
+        self._receives: Deque[Tuple[float, int]] = deque()
+        self._stats = {"receives": 0, "empty_receives": 0, "messages": 0, "taken": 0, "released": 0,
+                       "errors": 0}
+        self._last_error = ""
+        self._started_at = 0.0
+
+    def start(self) -> None:
+        """Mark the buffer as read and start polling if it is not running."""
+        with self._condition:
+            self._last_read = time.monotonic()
+            self._paused = False
+            if not self._running:
+                self._running = True
+                self._started_at = time.monotonic()
+                name = f"sqs-poller-{self.queue_url.rsplit('/', 1)[-1]}"
+                threading.Thread(target=self._run, name=name, daemon=True).start()
+            self._condition.notify_all()
+
+    def take(self, max_messages: int = 10) -> List[Dict[str, Any]]:
+        """Remove up to ``max_messages`` messages from the buffer, without waiting.
+
+        Also sets how many messages the thread keeps buffered for the next
+        read, so the first read after a quiet spell may return nothing.
+
+        Returns:
+            Raw SQS messages, oldest first
+        """
+        with self._condition:
+            self._prefetch = max_messages
+            due = self._pop_due()
+            messages = [self._buffer.popleft()[1] for _ in range(min(max_messages, len(self._buffer)))]
+            self._stats["taken"] += len(messages)
+        self._release(due)
+        self.start()
+        return messages
+
+    def _pop_due(self) -> List[Dict[str, Any]]:
+        # Caller must hold self._condition
+        now = time.monotonic()
+        due = []
+        while self._buffer and self._buffer[0][0] <= now:
+            due.append(self._buffer.popleft()[1])
+        return due
+
+    def _release(self, messages: List[Dict[str, Any]]) -> None:
+        """Make unread messages visible in the queue again right away."""
+        for start in range(0, len(messages), MAX_RELEASE_BATCH):
+            batch = messages[start:start + MAX_RELEASE_BATCH]
+            entries = [{"Id": str(index), "ReceiptHandle": message["ReceiptHandle"], "VisibilityTimeout": 0}
+                       for index, message in enumerate(batch)]
+            try:
+                response = self._client_factory().change_message_visibility_batch(
+                    QueueUrl=self.queue_url, Entries=entries)
+            except (BotoCoreError, ClientError) as e:
+                logger.warning(f"Could not release {len(entries)} messages to {self.queue_url}, they return "
+                               f"after their visibility timeout: {e}")
+                with self._condition:
+                    self._stats["errors"] += 1
+                    self._last_error = str(e)
+                continue
+            with self._condition:
+                self._stats["released"] += len(response.get("Successful", []))
+                if response.get("Failed"):
+                    self._stats["errors"] += 1
+                    self._last_error = f"{len(response['Failed'])} messages could not be released"
+
+    def _read_visibility_timeout(self) -> None:
+        try:
+            attributes = self._client_factory().get_queue_attributes(
+                QueueUrl=self.queue_url, AttributeNames=["VisibilityTimeout"])["Attributes"]
+            self._visibility_timeout = int(attributes.get("VisibilityTimeout", DEFAULT_VISIBILITY_TIMEOUT))
+        except (BotoCoreError, ClientError, KeyError, ValueError) as e:
+            logger.warning(f"Could not read the visibility timeout of {self.queue_url}: {e}")
+
+    def _run(self) -> None:
+        try:
+            self._poll()
+        except Exception:
+            # Let the next read start a new thread
+            with self._condition:
+                self._running = False
+            raise
+
+    def _poll(self) -> None:
+        self._read_visibility_timeout()
+        while True:
+            stopping = False
+            with self._condition:
+                while True:
+                    due = self._pop_due()
+                    if due:
+                        # Nobody read them in time; wait for a read before receiving more
+                        self._paused = True
+                        break
+                    now = time.monotonic()
+                    if now - self._last_read > self.idle_seconds:
+                        # Decided under the lock, so a concurrent start() sees it and starts a new thread
+                        self._running = False
+                        stopping = True
+                        due = [message for _, message in self._buffer]
+                        self._buffer.clear()
+                        break
+                    room = min(self._prefetch, self.capacity) - len(self._buffer)
+                    # Whole seconds the long poll may last before the oldest held message falls due
+                    wait = self.wait_time
+                    if self._buffer:
+                        wait = min(wait, int(self._buffer[0][0] - now))
+                    if room > 0 and not self._paused and wait >= 1:
+                        break
+                    # Sleep until a read makes room, a held message falls due or the thread goes idle
+                    timeout = self._last_read + self.idle_seconds - now
+                    if self._buffer:
+                        timeout = min(timeout, self._buffer[0][0] - now)
+                    self._condition.wait(timeout=max(timeout, 0.01))
+
+            if due:
+                self._release(due)
+            if stopping:
+                logger.info(f"Stopped polling {self.queue_url}: no reads for {self.idle_seconds}s")
+                return
+            if due:
+                continue
+
+            try:
+                response = self._client_factory().receive_message(
+                    QueueUrl=self.queue_url,
+                    MaxNumberOfMessages=min(room, 10),
+                    WaitTimeSeconds=wait,
+                    MessageAttributeNames=["All"],
+                    AttributeNames=["All"],
+                )
+            except (BotoCoreError, ClientError) as e:
+                logger.warning(f"Background receive from {self.queue_url} failed: {e}")
+                with self._condition:
+                    self._stats["errors"] += 1
+                    self._last_error = str(e)
+                time.sleep(ERROR_BACKOFF_SECONDS)
+                continue
+
+            messages = response.get("Messages", [])
+            now = time.monotonic()
+            release_at = now + max(self._visibility_timeout - VISIBILITY_MARGIN_SECONDS, 0)
+            with self._condition:
+                self._stats["receives"] += 1
+                self._stats["empty_receives"] += not messages
+                self._stats["messages"] += len(messages)
+                self._receives.append((now, len(messages)))
+                while self._receives and self._receives[0][0] < now - RATE_WINDOW_SECONDS:
+                    self._receives.popleft()
+                self._buffer.extend((release_at, message) for message in messages)
+                self._condition.notify_all()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Receive rate, empty-receive ratio, buffer depth and counters."""
+        with self._condition:
+            now = time.monotonic()
+            # Until the consumer has run for a full window, the rate is over the time it has run
+            window = min(RATE_WINDOW_SECONDS, max(now - self._started_at, 1))
+            received = sum(count for at, count in self._receives if at >= now - RATE_WINDOW_SECONDS)
+            receives = self._stats["receives"]
+            return dict(
+                self._stats,
+                running=self._running,
+                paused=self._paused,
+                depth=len(self._buffer),
+                capacity=self.capacity,
+                prefetch=min(self._prefetch, self.capacity),
+                receive_rate=received / window,
+                empty_ratio=self._stats["empty_receives"] / receives if receives else 0.0,
+                last_error=self._last_error,
+            )
+
+
+_consumers: Dict[str, BackgroundConsumer] = {}
+_consumers_lock = threading.Lock()
+
+
+def background_consumer(client_factory: Callable[[], Any], queue_url: str) -> BackgroundConsumer:
+    """The process-wide background consumer of a queue, shared by every session.
+
+    Getting it does not start polling; the first take() does.
+
+    Args:
+        client_factory: Returns the SQS client to poll with
+        queue_url: Queue to poll
+
+    Returns:
+        The queue's consumer
+    """
+    with _consumers_lock:
+        consumer = _consumers.get(queue_url)
+        if consumer is None:
+            consumer = _consumers[queue_url] = BackgroundConsumer(client_factory, queue_url)
+    return consumer
@@ -1,29 +1,41 @@
-import boto3
 import json
+import random
+import time
 import uuid
 import logging
 from datetime import datetime
 from typing import List, Dict, Any, Optional
-from botocore.exceptions import ClientError, NoCredentialsError
+from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
+from dva_shared.aws_clients import aws_client
+from utils.sqs.acknowledgements import AckBuffer
+from utils.sqs.background_consumer import BackgroundConsumer, background_consumer
 from utils.sqs.config import AWSConfig
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# SendMessageBatch limits: entries per call and total payload per call
+MAX_BATCH_ENTRIES = 10
+MAX_BATCH_BYTES = 256 * 1024
+# Attempts for entries that failed on the SQS side, with exponential backoff
+BATCH_MAX_ATTEMPTS = 4
+BATCH_BACKOFF_SECONDS = 0.1
+
 class SQSService:
     """Service class for AWS SQS operations"""
     
     def __init__(self, config: AWSConfig):
         self.config = config
         self._client = None
+        self._ack_buffers: Dict[str, AckBuffer] = {}
         
     @property
     def client(self):
         """Lazy initialization of SQS client"""
         if self._client is None:
             try:
-                self._client = boto3.client(
+                self._client = aws_client(
                     'sqs',
                     region_name=self.config.region,
                     aws_access_key_id=self.config.access_key_id,
@@ -51,29 +63,7 @@ class SQSService:
             if not url:
                 raise ValueError("Queue URL not provided")
             
-            # Add metadata to message
-            enhanced_message = {
-                "id": str(uuid.uuid4()),
-                "timestamp": datetime.utcnow().isoformat(),
-                "body": message_body
-            }
-            
-            message_body_str = json.dumps(enhanced_message, default=str)
-            
-            response = self.client.send_message(
-                QueueUrl=url,
-                MessageBody=message_body_str,
-                MessageAttributes={
-                    'MessageType': {
-                        'StringValue': message_body.get('type', 'unknown'),
-                        'DataType': 'String'
-                    },
-                    'Source': {
-                        'StringValue': 'StreamlitApp',
-                        'DataType': 'String'
-                    }
-                }
-            )
+            response = self.client.send_message(QueueUrl=url, **self._build_entry(message_body))
             
             logger.info(f"Message sent successfully: {response.get('MessageId', 'Unknown')}")
             return {
@@ -97,6 +87,131 @@ class SQSService:
             logger.error(f"Unexpected error: {e}")
             return {"success": False, "error": str(e)}
     
+    @staticmethod
+    def _build_entry(message_body: Dict[str, Any]) -> Dict[str, Any]:
+        """Wrap a message with its metadata and attributes, as SendMessage parameters"""
+        # Add metadata to message
+        enhanced_message = {
+            "id": str(uuid.uuid4()),
+            "timestamp": datetime.utcnow().isoformat(),
+            "body": message_body
+        }
+        
+        return {
+            "MessageBody": json.dumps(enhanced_message, default=str),
+            "MessageAttributes": {
+                'MessageType': {
+                    'StringValue': message_body.get('type', 'unknown'),
+                    'DataType': 'String'
+                },
+                'Source': {
+                    'StringValue': 'StreamlitApp',
+                    'DataType': 'String'
+                }
+            }
+        }
+    
+    @staticmethod
+    def _entry_size(entry: Dict[str, Any]) -> int:
+        """Payload size of an entry as SQS counts it: body plus attribute names, types and values"""
+        size = len(entry["MessageBody"].encode("utf-8"))
+        for name, attribute in entry.get("MessageAttributes", {}).items():
+            size += len(name.encode("utf-8")) + len(attribute["DataType"].encode("utf-8"))
+            size += len(attribute.get("StringValue", "").encode("utf-8"))
+        return size
+    
+    def _chunk_entries(self, entries: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Split entries into batches within the entry count and payload limits"""
+        batches, batch, batch_bytes = [], [], 0
+        for entry in entries:
+            size = self._entry_size(entry)
+            if batch and (len(batch) == MAX_BATCH_ENTRIES or batch_bytes + size > MAX_BATCH_BYTES):
+                batches.append(batch)
+                batch, batch_bytes = [], 0
+            batch.append(entry)
+            batch_bytes += size
+        if batch:
+            batches.append(batch)
+        return batches
+    
+    def send_messages(self, messages: List[Dict[str, Any]],
+                      queue_url: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Send messages to SQS queue in batches
+        
+        Messages go out with SendMessageBatch, up to 10 per call and 256 KB
+        per call. Entries that fail on the SQS side are retried with
+        exponential backoff; entries rejected as invalid are not. A call
+        that fails outright marks only its own batch as failed.
+        
+        Args:
+            messages: Message contents as dictionaries
+            queue_url: SQS queue URL (optional, uses config default)
+            
+        Returns:
+            One result per message, in the same order, shaped like the
+            result of send_message()
+        """
+        url = queue_url or self.config.queue_url
+        if not url:
+            return [{"success": False, "error": "Queue URL not provided"} for _ in messages]
+        
+        results: List[Dict[str, Any]] = [{} for _ in messages]
+        pending = []
+        for index, message_body in enumerate(messages):
+            entry = dict(self._build_entry(message_body), Id=str(index))
+            if self._entry_size(entry) > MAX_BATCH_BYTES:
+                results[index] = {"success": False, "error": "Message exceeds the 256 KB SQS limit"}
+            else:
+                pending.append(entry)
+        
+        for attempt in range(BATCH_MAX_ATTEMPTS):
+            if attempt:
+                time.sleep(BATCH_BACKOFF_SECONDS * 2 ** (attempt - 1) * random.uniform(0.5, 1.5))
+            retry = []
+            for batch in self._chunk_entries(pending):
+                try:
+                    response = self.client.send_message_batch(QueueUrl=url, Entries=batch)
+                except ClientError as e:
+                    error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+                    error_msg = e.response.get('Error', {}).get('Message', str(e))
+                    logger.error(f"AWS Client Error [{error_code}]: {error_msg}")
+                    for entry in batch:
+                        results[int(entry["Id"])] = {"success": False, "error": f"{error_code}: {error_msg}"}
+                    continue
+                except NoCredentialsError:
+                    logger.error("AWS credentials not found")
+                    for entry in batch:
+                        results[int(entry["Id"])] = {"success": False, "error": "AWS credentials not configured"}
+                    continue
+                except BotoCoreError as e:
+                    logger.error(f"Error sending message batch: {e}")
+                    for entry in batch:
+                        results[int(entry["Id"])] = {"success": False, "error": str(e)}
+                    continue
+                
+                for sent in response.get('Successful', []):
+                    results[int(sent['Id'])] = {
+                        "success": True,
+                        "message_id": sent.get('MessageId', 'Unknown'),
+                        "md5": sent.get('MD5OfMessageBody', 'N/A')
+                    }
+                entries = {entry["Id"]: entry for entry in batch}
+                for failed in response.get('Failed', []):
+                    results[int(failed['Id'])] = {
+                        "success": False,
+                        "error": f"{failed.get('Code', 'Unknown')}: {failed.get('Message', '')}"
+                    }
+                    if not failed.get('SenderFault'):
+                        retry.append(entries[failed['Id']])
+            pending = retry
+            if not pending:
+                break
+        
+        sent_count = sum(1 for result in results if result.get("success"))
+        logger.info(f"Sent {sent_count} of {len(messages)} messages in batches")
+        return results
+    
     def receive_messages(self, max_messages: int = 10, 
                         queue_url: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -121,22 +236,7 @@ class SQSService:
                 MessageAttributeNames=['All']
             )
             
-            messages = response.get('Messages', [])
-            processed_messages = []
-            
-            for message in messages:
-                try:
-                    body = json.loads(message['Body'])
-                    processed_messages.append({
-                        "message_id": message['MessageId'],
-                        "receipt_handle": message['ReceiptHandle'],
-                        "body": body,
-                        "attributes": message.get('MessageAttributes', {}),
-                        "md5": message['MD5OfBody']
-                    })
-                except json.JSONDecodeError as e:
-                    logger.warning(f"Failed to parse message body: {e}")
-                    continue
+            processed_messages = self._process_messages(response.get('Messages', []))
             
             logger.info(f"Received {len(processed_messages)} messages")
             return processed_messages
@@ -148,6 +248,59 @@ class SQSService:
             logger.error(f"Unexpected error: {e}")
             return []
     
+    @staticmethod
+    def _process_messages(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Turn raw SQS messages into message dictionaries, skipping unparsable bodies"""
+        processed_messages = []
+        
+        for message in messages:
+            try:
+                body = json.loads(message['Body'])
+                processed_messages.append({
+                    "message_id": message['MessageId'],
+                    "receipt_handle": message['ReceiptHandle'],
+                    "body": body,
+                    "attributes": message.get('MessageAttributes', {}),
+                    "md5": message['MD5OfBody']
+                })
+            except json.JSONDecodeError as e:
+                logger.warning(f"Failed to parse message body: {e}")
+                continue
+        
+        return processed_messages
+    
+    def background_consumer(self, queue_url: Optional[str] = None) -> BackgroundConsumer:
+        """
+        Background long-polling consumer of the queue, shared by every session
+        
+        Getting it does not start polling, so it is safe to read its metrics.
+        
+        Args:
+            queue_url: SQS queue URL (optional, uses config default)
+            
+        Returns:
+            The queue's background consumer
+        """
+        return background_consumer(lambda: self.client, queue_url or self.config.queue_url)
+    
+    def take_buffered_messages(self, max_messages: int = 10,
+                               queue_url: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Take messages the background consumer has already received
+        
+        Returns at once with what is buffered, possibly nothing, instead of
+        calling SQS. The consumer then keeps up to max_messages buffered
+        for the next call.
+        
+        Args:
+            max_messages: Maximum number of messages to take
+            queue_url: SQS queue URL (optional, uses config default)
+            
+        Returns:
+            List of message dictionaries, as from receive_messages()
+        """
+        return self._process_messages(self.background_consumer(queue_url).take(max_messages))
+    
     def delete_message(self, receipt_handle: str, 
                       queue_url: Optional[str] = None) -> bool:
         """
@@ -180,6 +333,38 @@ class SQSService:
             logger.error(f"Unexpected error: {e}")
             return False
     
+    def acknowledge(self, receipt_handle: str, queue_url: Optional[str] = None) -> None:
+        """
+        Queue a processed message for deletion
+        
+        Deletes are coalesced into DeleteMessageBatch calls of up to 10
+        messages, sent when 10 are waiting, a second after the first one,
+        or on flush_acknowledgements(). A delete that fails leaves the
+        message to reappear after its visibility timeout.
+        
+        Args:
+            receipt_handle: Message receipt handle
+            queue_url: SQS queue URL (optional, uses config default)
+        """
+        url = queue_url or self.config.queue_url
+        if url not in self._ack_buffers:
+            self._ack_buffers[url] = AckBuffer(lambda: self.client, url)
+        self._ack_buffers[url].add(receipt_handle)
+    
+    def flush_acknowledgements(self) -> Dict[str, Any]:
+        """
+        Delete every message queued by acknowledge() now
+        
+        Returns:
+            Counts and receipt handles of the messages deleted and of the
+            deletes that failed since the previous flush
+        """
+        totals: Dict[str, Any] = {"deleted": 0, "failed": 0, "deleted_handles": [], "failed_handles": []}
+        for buffer in list(self._ack_buffers.values()):
+            for key, value in buffer.flush().items():
+                totals[key] += value
+        return totals
+    
     def get_queue_attributes(self, queue_url: Optional[str] = None) -> Dict[str, Any]:
         """
         Get queue attributes
@@ -1,11 +1,13 @@
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime, timedelta
 import utils.common as common
+import utils.catalog as catalog
 import utils.authenticate as authenticate
 
+# Heavy libraries are imported when a tab first uses them
+go = common.lazy_import("plotly.graph_objects")
+px = common.lazy_import("plotly.express")
+
 # Page configuration
 st.set_page_config(
     page_title="AWS Developer Associate - Session 4",
@@ -13,10 +15,10 @@ st.set_page_config(
     layout="wide"
 )
 
+@common.profiled
 def main():
     # Custom CSS for AWS styling
-    st.markdown("""
-    <style>
+    common.stylesheet("""
     /* AWS Color Scheme */
     :root {
         --aws-orange: #FF9900;
@@ -127,8 +129,7 @@ def main():
         border-left: 4px solid #4caf50;
         margin: 1rem 0;
     }
-    </style>
-    """, unsafe_allow_html=True)
+    """)
 
 common.initialize_session_state()
 
@@ -541,28 +542,7 @@ def render_deployment_strategies():
     # Deployment Configuration Examples
     st.markdown("### ⚙️ AWS CodeDeploy Configuration Examples")
     
-    deployment_configs = [
-        {
-            "strategy": "All at Once",
-            "ecs_config": "CodeDeployDefault.ECSAllAtOnce",
-            "lambda_config": "CodeDeployDefault.LambdaAllAtOnce",
-            "description": "Shifts all traffic immediately"
-        },
-        {
-            "strategy": "Linear",
-            "ecs_config": "CodeDeployDefault.ECSLinear10PercentEvery1Minutes",
-            "lambda_config": "CodeDeployDefault.LambdaLinear10PercentEvery3Minutes",
-            "description": "Gradual traffic shift at regular intervals"
-        },
-        {
-            "strategy": "Canary",
-            "ecs_config": "CodeDeployDefault.ECSCanary10Percent15Minutes",
-            "lambda_config": "CodeDeployDefault.LambdaCanary10Percent5Minutes",
-            "description": "Small initial deployment, then full rollout"
-        }
-    ]
-
-    config_df = pd.DataFrame(deployment_configs)
+    config_df = catalog.table("render_deployment_strategies.deployment_configs")
     
     st.markdown("""
     <div class="comparison-table">
@@ -1,14 +1,17 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import utils.common as common
+import utils.catalog as catalog
 import utils.authenticate as authenticate
 import json
 from datetime import datetime, timedelta
 
+# Heavy libraries are imported when a tab first uses them
+pd = common.lazy_import("pandas")
+np = common.lazy_import("numpy")
+px = common.lazy_import("plotly.express")
+go = common.lazy_import("plotly.graph_objects")
+make_subplots = common.lazy_import("plotly.subplots", "make_subplots")
+
 # Page configuration
 st.set_page_config(
     page_title="AWS CI/CD",
@@ -30,8 +33,7 @@ AWS_COLORS = {
 
 def apply_custom_styles():
     """Apply custom CSS styling with AWS color scheme"""
-    st.markdown(f"""
-    <style>
+    common.stylesheet(f"""
         .main {{
             background-color: {AWS_COLORS['light_gray']};
         }}
@@ -132,8 +134,7 @@ def apply_custom_styles():
             margin: 10px 0;
             text-align: center;
         }}
-    </style>
-    """, unsafe_allow_html=True)
+    """)
 
 def create_sidebar():
     """Create sidebar with app information and controls"""
@@ -338,6 +339,7 @@ def create_configuration_management_mermaid():
         style E fill:#232F3E,stroke:#FF9900,color:#fff
     """
 
+@common.profiled
 def release_process_stages_tab():
     """Content for Release Process Stages tab"""
     st.markdown("## 🔄 Release Process Stages")
@@ -795,6 +797,7 @@ if result:
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def cicd_tab():
     """Content for CI/CD tab"""
     st.markdown("## 🚀 Continuous Integration and Continuous Delivery (CI/CD)")
@@ -1001,14 +1004,7 @@ def cicd_tab():
     # Benefits Comparison
     st.markdown("### ✨ CI/CD Benefits Analysis")
     
-    benefits_data = {
-        'Metric': ['Deployment Frequency', 'Lead Time', 'Change Failure Rate', 'Recovery Time', 'Developer Productivity'],
-        'Without CI/CD': ['Monthly', '2-4 weeks', '20-30%', '2-7 days', 'Low'],
-        'With CI/CD': ['Daily/Weekly', '1-3 days', '5-15%', '1-4 hours', 'High'],
-        'Improvement': ['10-30x faster', '5-10x faster', '2-3x lower', '10-50x faster', '2-3x higher']
-    }
-    
-    df_benefits = pd.DataFrame(benefits_data)
+    df_benefits = catalog.table("cicd.benefits")
     st.dataframe(df_benefits, use_container_width=True)
     
     # Code Example
@@ -1376,6 +1372,7 @@ if result:
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def codepipeline_tab():
     """Content for AWS CodePipeline tab"""
     st.markdown("## 🔗 AWS CodePipeline")
@@ -1522,28 +1519,7 @@ def codepipeline_tab():
     # CodePipeline Action Details
     st.markdown("### 📋 CodePipeline Action Types Detailed")
     
-    action_details = {
-        'Action Type': ['Source', 'Build', 'Test', 'Deploy', 'Approval', 'Invoke'],
-        'Purpose': [
-            'Retrieve source code from repository',
-            'Compile and package application',
-            'Run automated tests',
-            'Deploy to target environment',
-            'Human approval checkpoint',
-            'Execute custom functions'
-        ],
-        'Common Providers': [
-            'CodeCommit, GitHub, S3',
-            'CodeBuild, Jenkins',
-            'CodeBuild, Device Farm',
-            'CodeDeploy, ECS, Beanstalk',
-            'Manual, SNS notification',
-            'Lambda, Step Functions'
-        ],
-        'Typical Duration': ['1-2 min', '5-15 min', '10-30 min', '5-20 min', 'Variable', '1-5 min']
-    }
-    
-    df_actions = pd.DataFrame(action_details)
+    df_actions = catalog.table("codepipeline.action_details")
     st.dataframe(df_actions, use_container_width=True)
     
     # Pipeline Execution Monitoring
@@ -1982,6 +1958,7 @@ if pipeline:
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def application_configuration_tab():
     """Content for Application Configuration tab"""
     st.markdown("## ⚙️ Application Configuration")
@@ -2103,25 +2080,29 @@ def application_configuration_tab():
                 st.error("Parameter name must start with '/' for hierarchical organization")
         
         # Parameter Store Pricing Calculator
-        st.markdown("### 💰 Parameter Store Cost Calculator")
+        @common.fragment
+        def parameter_store_cost_calculator():
+            st.markdown("### 💰 Parameter Store Cost Calculator")
         
-        col3, col4 = st.columns(2)
+            col3, col4 = st.columns(2)
         
-        with col3:
-            num_standard_params = st.number_input("Standard Parameters:", 0, 10000, 100)
-            num_advanced_params = st.number_input("Advanced Parameters:", 0, 100000, 50)
+            with col3:
+                num_standard_params = st.number_input("Standard Parameters:", 0, 10000, 100)
+                num_advanced_params = st.number_input("Advanced Parameters:", 0, 100000, 50)
         
-        with col4:
-            api_calls_per_month = st.number_input("API Calls/Month:", 0, 10000000, 50000)
+            with col4:
+                api_calls_per_month = st.number_input("API Calls/Month:", 0, 10000000, 50000)
             
-        # Calculate costs
-        standard_cost = 0  # First 10,000 are free
-        advanced_cost = num_advanced_params * 0.05  # $0.05 per parameter per month
-        api_cost = max(0, (api_calls_per_month - 10000)) * 0.00005  # First 10,000 free, then $0.05 per 1000
+            # Calculate costs
+            standard_cost = 0  # First 10,000 are free
+            advanced_cost = num_advanced_params * 0.05  # $0.05 per parameter per month
+            api_cost = max(0, (api_calls_per_month - 10000)) * 0.00005  # First 10,000 free, then $0.05 per 1000
         
-        total_cost = standard_cost + advanced_cost + api_cost
+            total_cost = standard_cost + advanced_cost + api_cost
         
-        st.metric("Estimated Monthly Cost", f"${total_cost:.2f}")
+            st.metric("Estimated Monthly Cost", f"${total_cost:.2f}")
+
+        parameter_store_cost_calculator()
     
     with tab2:
         st.markdown("### 🔐 Secrets Manager Configuration")
@@ -2193,25 +2174,29 @@ def application_configuration_tab():
             st.markdown('</div>', unsafe_allow_html=True)
         
         # Secrets Manager Cost Calculator
-        st.markdown("### 💰 Secrets Manager Cost Calculator")
+        @common.fragment
+        def secrets_manager_cost_calculator():
+            st.markdown("### 💰 Secrets Manager Cost Calculator")
         
-        col3, col4 = st.columns(2)
+            col3, col4 = st.columns(2)
         
-        with col3:
-            num_secrets = st.number_input("Number of Secrets:", 1, 10000, 10)
-            api_calls_per_month_secrets = st.number_input("API Calls/Month (Secrets):", 0, 1000000, 10000)
+            with col3:
+                num_secrets = st.number_input("Number of Secrets:", 1, 10000, 10)
+                api_calls_per_month_secrets = st.number_input("API Calls/Month (Secrets):", 0, 1000000, 10000)
         
-        with col4:
-            replica_count = st.number_input("Replica Regions per Secret:", 0, 10, 0)
+            with col4:
+                replica_count = st.number_input("Replica Regions per Secret:", 0, 10, 0)
         
-        # Calculate Secrets Manager costs
-        base_secret_cost = num_secrets * 0.40  # $0.40 per secret per month
-        replica_cost = num_secrets * replica_count * 0.05  # $0.05 per replica per month
-        api_cost_secrets = api_calls_per_month_secrets * 0.00005  # $0.05 per 10,000 API calls
+            # Calculate Secrets Manager costs
+            base_secret_cost = num_secrets * 0.40  # $0.40 per secret per month
+            replica_cost = num_secrets * replica_count * 0.05  # $0.05 per replica per month
+            api_cost_secrets = api_calls_per_month_secrets * 0.00005  # $0.05 per 10,000 API calls
         
-        total_secrets_cost = base_secret_cost + replica_cost + api_cost_secrets
+            total_secrets_cost = base_secret_cost + replica_cost + api_cost_secrets
         
-        st.metric("Estimated Monthly Cost", f"${total_secrets_cost:.2f}")
+            st.metric("Estimated Monthly Cost", f"${total_secrets_cost:.2f}")
+
+        secrets_manager_cost_calculator()
     
     # Configuration Best Practices
     st.markdown("### 💡 Configuration Management Best Practices")
@@ -2260,42 +2245,7 @@ def application_configuration_tab():
     # Integration Patterns
     st.markdown("### 🔗 Integration Patterns & Use Cases")
     
-    integration_data = {
-        'Use Case': [
-            'Database Connection',
-            'API Configuration', 
-            'Feature Flags',
-            'Third-party Keys',
-            'Environment Settings',
-            'Application Secrets'
-        ],
-        'Parameter Store': [
-            'Host, Port, DB Name',
-            'Endpoints, Timeouts',
-            'Boolean flags',
-            'Non-sensitive keys',
-            'Log levels, Debug mode',
-            'N/A'
-        ],
-        'Secrets Manager': [
-            'Username, Password',
-            'API tokens',
-            'N/A',
-            'Sensitive API keys',
-            'N/A',
-            'Encryption keys'
-        ],
-        'Best Practice': [
-            'Combine both services',
-            'Separate config from secrets',
-            'Use Parameter Store',
-            'Use Secrets Manager',
-            'Use Parameter Store',
-            'Use Secrets Manager'
-        ]
-    }
-    
-    df_integration = pd.DataFrame(integration_data)
+    df_integration = catalog.table("application_configuration.integration")
     st.dataframe(df_integration, use_container_width=True)
     
     # Code Example
@@ -2602,6 +2552,7 @@ class ConfigurationManager:
         print("🗑️  Configuration cache cleared")
 
 # Example usage
+@common.profiled
 def main():
     # Initialize configuration manager
     config_manager = ConfigurationManager(
@@ -2645,6 +2596,7 @@ if __name__ == '__main__':
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def main():
     """Main application function"""
     # Apply styling
@@ -2667,24 +2619,12 @@ def main():
                 </div>""", unsafe_allow_html=True)
     
     # Create tabs
-    tab1, tab2, tab3, tab4 = st.tabs([
-        "🔄 Release Process Stages", 
-        "🚀 CI/CD", 
-        "🔗 AWS CodePipeline",
-        "⚙️ Application Configuration"
-    ])
-    
-    with tab1:
-        release_process_stages_tab()
-    
-    with tab2:
-        cicd_tab()
-    
-    with tab3:
-        codepipeline_tab()
-    
-    with tab4:
-        application_configuration_tab()
+    common.tab_router({
+        "🔄 Release Process Stages": release_process_stages_tab,
+        "🚀 CI/CD": cicd_tab,
+        "🔗 AWS CodePipeline": codepipeline_tab,
+        "⚙️ Application Configuration": application_configuration_tab,
+    })
     
     # Footer
     st.markdown("""
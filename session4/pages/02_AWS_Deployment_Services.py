@@ -1,15 +1,17 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import utils.common as common
+import utils.catalog as catalog
 import utils.authenticate as authenticate
 import json
 import random
 from datetime import datetime, timedelta
 
+# Heavy libraries are imported when a tab first uses them
+np = common.lazy_import("numpy")
+px = common.lazy_import("plotly.express")
+go = common.lazy_import("plotly.graph_objects")
+make_subplots = common.lazy_import("plotly.subplots", "make_subplots")
+
 # Page configuration
 st.set_page_config(
     page_title="AWS Deployment Services Hub",
@@ -31,8 +33,7 @@ AWS_COLORS = {
 
 def apply_custom_styles():
     """Apply custom CSS styling with AWS color scheme"""
-    st.markdown(f"""
-    <style>
+    common.stylesheet(f"""
         .main {{
             background-color: {AWS_COLORS['light_gray']};
         }}
@@ -132,8 +133,7 @@ def apply_custom_styles():
             border: 2px solid {AWS_COLORS['light_blue']};
             margin: 15px 0;
         }}
-    </style>
-    """, unsafe_allow_html=True)
+    """)
 
 def create_sidebar():
     """Create sidebar with app information and controls"""
@@ -322,6 +322,7 @@ def create_cloudformation_workflow():
         style L fill:#232F3E,stroke:#FF9900,color:#fff
     """
 
+@common.profiled
 def elastic_beanstalk_tab():
     """Content for AWS Elastic Beanstalk tab"""
     st.markdown("## 🌱 AWS Elastic Beanstalk")
@@ -510,16 +511,7 @@ def elastic_beanstalk_tab():
     # Deployment Policies Comparison
     st.markdown("### 📊 Deployment Policies Comparison")
     
-    policies_data = {
-        'Policy': ['All at once', 'Rolling', 'Rolling with additional batch', 'Immutable'],
-        'Downtime': ['Yes', 'No', 'No', 'No'],
-        'Deployment Speed': ['Fastest', 'Slow', 'Medium', 'Slowest'],
-        'Rollback Time': ['Manual', 'Manual', 'Manual', 'Fast'],
-        'Cost': ['Lowest', 'Low', 'Medium', 'Highest'],
-        'Best For': ['Dev/Test', 'Production', 'Critical Production', 'High-risk deployments']
-    }
-    
-    df_policies = pd.DataFrame(policies_data)
+    df_policies = catalog.table("elastic_beanstalk.policies")
     st.dataframe(df_policies, use_container_width=True)
     
     # Code Example
@@ -667,6 +659,7 @@ eb terminate production-env
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def codedeploy_tab():
     """Content for AWS CodeDeploy tab"""
     st.markdown("## 🚀 AWS CodeDeploy")
@@ -861,24 +854,7 @@ def codedeploy_tab():
     # Deployment Configurations Comparison
     st.markdown("### 📊 Deployment Configurations Comparison")
     
-    config_data = {
-        'Configuration': [
-            'AllAtOnce', 'HalfAtATime', 'OneAtATime', 
-            'Linear10PercentEvery3Minutes', 'Canary10Percent5Minutes'
-        ],
-        'Speed': ['Fastest', 'Medium', 'Slowest', 'Slow', 'Medium'],
-        'Risk': ['Highest', 'Medium', 'Lowest', 'Low', 'Low'],
-        'Rollback Impact': ['High', 'Medium', 'Low', 'Low', 'Low'],
-        'Best Use Case': [
-            'Dev/Test environments',
-            'Balanced production deployments',
-            'Critical production systems',
-            'Gradual feature rollouts',
-            'High-risk deployments with quick validation'
-        ]
-    }
-    
-    df_configs = pd.DataFrame(config_data)
+    df_configs = catalog.table("codedeploy.config")
     st.dataframe(df_configs, use_container_width=True)
     
     # Code Example
@@ -1100,6 +1076,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def ecs_tab():
     """Content for Amazon ECS tab"""
     st.markdown("## 🐳 Amazon Elastic Container Service (ECS)")
@@ -1314,21 +1291,7 @@ def ecs_tab():
     # ECS vs EKS Comparison
     st.markdown("### ⚖️ ECS vs EKS Comparison")
     
-    comparison_data = {
-        'Feature': ['Learning Curve', 'AWS Integration', 'Kubernetes Compatibility', 'Cost', 'Ecosystem', 'Flexibility'],
-        'Amazon ECS': ['Easy', 'Native', 'No', 'Lower', 'AWS-focused', 'Good'],
-        'Amazon EKS': ['Steep', 'Good', 'Full', 'Higher', 'CNCF/K8s', 'Excellent'],
-        'Best Choice': [
-            'ECS for AWS-first teams',
-            'ECS for tight AWS integration', 
-            'EKS for K8s workloads',
-            'ECS for cost optimization',
-            'EKS for open-source tools',
-            'EKS for complex orchestration'
-        ]
-    }
-    
-    df_comparison = pd.DataFrame(comparison_data)
+    df_comparison = catalog.table("ecs.comparison")
     st.dataframe(df_comparison, use_container_width=True)
     
     # Code Example
@@ -1662,6 +1625,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def eks_tab():
     """Content for Amazon EKS tab"""
     st.markdown("## ☸️ Amazon Elastic Kubernetes Service (EKS)")
@@ -1907,40 +1871,7 @@ def eks_tab():
     # EKS vs ECS Decision Matrix
     st.markdown("### 🤔 When to Choose EKS vs ECS")
     
-    decision_data = {
-        'Criteria': [
-            'Kubernetes Experience',
-            'Ecosystem Requirements', 
-            'Multi-Cloud Strategy',
-            'Complex Orchestration',
-            'AWS-Native Integration',
-            'Learning Curve',
-            'Operational Overhead',
-            'Cost Sensitivity'
-        ],
-        'Choose EKS If': [
-            'Team has K8s expertise',
-            'Need CNCF ecosystem tools',
-            'Planning multi-cloud deployment',
-            'Complex scheduling requirements',
-            'Moderate AWS integration needs',
-            'Can invest in K8s learning',
-            'Have dedicated DevOps team',
-            'Cost is secondary to features'
-        ],
-        'Choose ECS If': [
-            'New to container orchestration',
-            'AWS-first approach',
-            'Single cloud deployment',
-            'Simple container orchestration',
-            'Deep AWS service integration',
-            'Want quick start',
-            'Prefer managed services',
-            'Cost optimization is priority'
-        ]
-    }
-    
-    df_decision = pd.DataFrame(decision_data)
+    df_decision = catalog.table("eks.decision")
     st.dataframe(df_decision, use_container_width=True)
     
     # Code Example
@@ -2302,6 +2233,7 @@ terraform destroy
     ''', language='hcl')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def cloudformation_tab():
     """Content for AWS CloudFormation tab"""
     st.markdown("## 📋 AWS CloudFormation")
@@ -2496,39 +2428,13 @@ def cloudformation_tab():
     # Stack Lifecycle
     st.markdown("### 🔄 CloudFormation Stack Lifecycle")
     
-    lifecycle_data = {
-        'Operation': ['Create', 'Update', 'Delete', 'Rollback'],
-        'Description': [
-            'Create new stack from template',
-            'Modify existing stack resources',
-            'Remove stack and all resources',
-            'Revert to previous stable state'
-        ],
-        'Typical Duration': ['5-30 minutes', '5-30 minutes', '5-15 minutes', '5-20 minutes'],
-        'Risk Level': ['Medium', 'High', 'Low', 'Low'],
-        'Best Practice': [
-            'Use parameters for flexibility',
-            'Use change sets to preview',
-            'Ensure no dependencies exist',
-            'Enable automatic rollback'
-        ]
-    }
-    
-    df_lifecycle = pd.DataFrame(lifecycle_data)
+    df_lifecycle = catalog.table("cloudformation.lifecycle")
     st.dataframe(df_lifecycle, use_container_width=True)
     
     # CloudFormation vs Other IaC Tools
     st.markdown("### ⚖️ CloudFormation vs Other IaC Tools")
     
-    comparison_data = {
-        'Feature': ['Cloud Support', 'Learning Curve', 'State Management', 'Cost', 'AWS Integration', 'Community'],
-        'CloudFormation': ['AWS Only', 'Medium', 'AWS Managed', 'Free', 'Native', 'Large'],
-        'Terraform': ['Multi-Cloud', 'Steep', 'Self-Managed', 'Free/Paid', 'Good', 'Very Large'],
-        'AWS CDK': ['AWS Focus', 'Medium', 'CF Backend', 'Free', 'Native', 'Growing'],
-        'Pulumi': ['Multi-Cloud', 'Medium', 'Cloud Backend', 'Free/Paid', 'Good', 'Medium']
-    }
-    
-    df_comparison = pd.DataFrame(comparison_data)
+    df_comparison = catalog.table("cloudformation.comparison")
     st.dataframe(df_comparison, use_container_width=True)
     
     # Code Example
@@ -3054,6 +2960,7 @@ Outputs:
     ''', language='yaml')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def main():
     """Main application function"""
     # Apply styling
@@ -3076,28 +2983,13 @@ def main():
     """, unsafe_allow_html=True)
     
     # Create tabs
-    tab1, tab2, tab3, tab4, tab5 = st.tabs([
-        "🌱 AWS Elastic Beanstalk",
-        "🚀 AWS CodeDeploy", 
-        "🐳 Amazon ECS",
-        "☸️ Amazon EKS",
-        "📋 AWS CloudFormation"
-    ])
-    
-    with tab1:
-        elastic_beanstalk_tab()
-    
-    with tab2:
-        codedeploy_tab()
-    
-    with tab3:
-        ecs_tab()
-        
-    with tab4:
-        eks_tab()
-        
-    with tab5:
-        cloudformation_tab()
+    common.tab_router({
+        "🌱 AWS Elastic Beanstalk": elastic_beanstalk_tab,
+        "🚀 AWS CodeDeploy": codedeploy_tab,
+        "🐳 Amazon ECS": ecs_tab,
+        "☸️ Amazon EKS": eks_tab,
+        "📋 AWS CloudFormation": cloudformation_tab,
+    })
     
     # Footer
     st.markdown("""
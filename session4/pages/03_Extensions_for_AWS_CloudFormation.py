@@ -1,14 +1,16 @@
 
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import utils.common as common
+import utils.catalog as catalog
 import utils.authenticate as authenticate
 import json
 
+# Heavy libraries are imported when a tab first uses them
+np = common.lazy_import("numpy")
+px = common.lazy_import("plotly.express")
+go = common.lazy_import("plotly.graph_objects")
+make_subplots = common.lazy_import("plotly.subplots", "make_subplots")
+
 # Page configuration
 st.set_page_config(
     page_title="AWS Infrastructure as Code Hub",
@@ -30,8 +32,7 @@ AWS_COLORS = {
 
 def apply_custom_styles():
     """Apply custom CSS styling with AWS color scheme"""
-    st.markdown(f"""
-    <style>
+    common.stylesheet(f"""
         .main {{
             background-color: {AWS_COLORS['light_gray']};
         }}
@@ -139,8 +140,7 @@ def apply_custom_styles():
             color: white;
             margin: 15px 0;
         }}
-    </style>
-    """, unsafe_allow_html=True)
+    """)
 
 def create_sidebar():
     """Create sidebar with app information and controls"""
@@ -266,6 +266,7 @@ def create_sam_architecture_mermaid():
         style F fill:#9D5AAE,stroke:#232F3E,color:#fff
     """
 
+@common.profiled
 def cdk_tab():
     """Content for AWS CDK tab"""
     st.markdown("## 🏗️ AWS Cloud Development Kit (CDK)")
@@ -494,14 +495,7 @@ app.synth()
     # CDK vs CloudFormation Comparison
     st.markdown("### ⚖️ CDK vs Traditional CloudFormation")
     
-    comparison_data = {
-        'Aspect': ['Language', 'Learning Curve', 'IDE Support', 'Reusability', 'Testing', 'Community'],
-        'CloudFormation': ['JSON/YAML', 'Moderate', 'Limited', 'Templates', 'Limited', 'AWS Official'],
-        'CDK': ['Programming Languages', 'Steep initially', 'Excellent', 'Classes/Libraries', 'Unit Testing', 'Growing Rapidly'],
-        'CDK Advantage': ['✅ Familiar syntax', '⚠️ Requires coding skills', '✅ IntelliSense/Debugging', '✅ OOP patterns', '✅ Jest/PyTest', '✅ Open source']
-    }
-    
-    df_comparison = pd.DataFrame(comparison_data)
+    df_comparison = catalog.table("cdk.comparison")
     st.dataframe(df_comparison, use_container_width=True)
     
     # Advanced CDK Features
@@ -702,6 +696,7 @@ app.synth()
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def sam_tab():
     """Content for AWS SAM tab"""
     st.markdown("## 🚀 AWS Serverless Application Model (SAM)")
@@ -970,15 +965,7 @@ Outputs:
     # SAM vs Other Frameworks
     st.markdown("### ⚖️ SAM vs Other Serverless Frameworks")
     
-    framework_comparison = {
-        'Feature': ['Learning Curve', 'AWS Integration', 'Local Testing', 'Multi-Cloud', 'Community', 'Cost'],
-        'AWS SAM': ['Low', 'Excellent', 'Excellent', 'AWS Only', 'Growing', 'Free'],
-        'Serverless Framework': ['Medium', 'Good', 'Good', 'Yes', 'Large', 'Free/Paid'],
-        'CDK': ['High', 'Excellent', 'Limited', 'AWS Only', 'Growing', 'Free'],
-        'Terraform': ['High', 'Good', 'Limited', 'Yes', 'Very Large', 'Free/Paid']
-    }
-    
-    df_frameworks = pd.DataFrame(framework_comparison)
+    df_frameworks = catalog.table("sam.framework_comparison")
     st.dataframe(df_frameworks, use_container_width=True)
     
     # Real-world SAM Example
@@ -1233,33 +1220,10 @@ Outputs:
     # Advanced SAM Features
     st.markdown("### 🚀 Advanced SAM Features")
     
-    features_data = {
-        'Feature': [
-            'SAM Pipeline', 'Step Functions Integration', 'Event Source Mapping', 
-            'Layer Management', 'Custom Resources', 'Policy Templates'
-        ],
-        'Description': [
-            'CI/CD pipeline generation',
-            'Serverless workflows with Step Functions',
-            'Connect Lambda to event sources',
-            'Shared code and dependencies',
-            'CloudFormation custom resources',
-            'Pre-built IAM policy templates'
-        ],
-        'Use Case': [
-            'Automated deployments',
-            'Complex business workflows',
-            'Event-driven processing',
-            'Code reuse across functions',
-            'Custom AWS integrations',
-            'Secure function permissions'
-        ],
-        'Complexity': ['Medium', 'High', 'Low', 'Low', 'High', 'Low']
-    }
-    
-    df_features = pd.DataFrame(features_data)
+    df_features = catalog.table("sam.features")
     st.dataframe(df_features, use_container_width=True)
 
+@common.profiled
 def main():
     """Main application function"""
     # Apply styling
@@ -1282,16 +1246,10 @@ def main():
                 </div>""", unsafe_allow_html=True)
     
     # Create tabs
-    tab1, tab2 = st.tabs([
-        "🏗️ AWS CDK", 
-        "🚀 AWS SAM"
-    ])
-    
-    with tab1:
-        cdk_tab()
-    
-    with tab2:
-        sam_tab()
+    common.tab_router({
+        "🏗️ AWS CDK": cdk_tab,
+        "🚀 AWS SAM": sam_tab,
+    })
     
     # Footer
     st.markdown("""
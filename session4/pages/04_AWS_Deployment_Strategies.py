@@ -1,12 +1,14 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import utils.common as common
+import utils.catalog as catalog
 import utils.authenticate as authenticate
 
+# Heavy libraries are imported when a tab first uses them
+np = common.lazy_import("numpy")
+px = common.lazy_import("plotly.express")
+go = common.lazy_import("plotly.graph_objects")
+make_subplots = common.lazy_import("plotly.subplots", "make_subplots")
+
 # Page configuration
 st.set_page_config(
     page_title="AWS Deployment Strategies Hub",
@@ -28,8 +30,7 @@ AWS_COLORS = {
 
 def apply_custom_styles():
     """Apply custom CSS styling with AWS color scheme"""
-    st.markdown(f"""
-    <style>
+    common.stylesheet(f"""
         .main {{
             background-color: {AWS_COLORS['light_gray']};
         }}
@@ -137,8 +138,7 @@ def apply_custom_styles():
             gap: 20px;
             margin: 20px 0;
         }}
-    </style>
-    """, unsafe_allow_html=True)
+    """)
 
 def create_sidebar():
     """Create sidebar with app information and controls"""
@@ -260,6 +260,43 @@ def create_canary_deployment_mermaid():
         style J fill:#FF6B35,stroke:#232F3E,color:#fff
     """
 
+@common.cached_figure
+def create_strategy_comparison_chart():
+    """Bar charts comparing deployment time, risk and cost of each strategy."""
+    # Create comparison metrics
+    strategies = ['All at Once', 'Linear', 'Blue/Green', 'Canary']
+    deployment_time = [2, 15, 5, 30]  # minutes
+    risk_level = [9, 5, 3, 1]  # 1-10 scale
+    infrastructure_cost = [1, 3, 8, 4]  # relative cost
+    
+    fig = make_subplots(
+        rows=1, cols=3,
+        subplot_titles=('Deployment Time (min)', 'Risk Level (1-10)', 'Infrastructure Cost (relative)'),
+        specs=[[{"secondary_y": False}, {"secondary_y": False}, {"secondary_y": False}]]
+    )
+    
+    fig.add_trace(
+        go.Bar(x=strategies, y=deployment_time, name='Deployment Time', 
+               marker_color=AWS_COLORS['primary']),
+        row=1, col=1
+    )
+    
+    fig.add_trace(
+        go.Bar(x=strategies, y=risk_level, name='Risk Level',
+               marker_color=AWS_COLORS['warning']),
+        row=1, col=2
+    )
+    
+    fig.add_trace(
+        go.Bar(x=strategies, y=infrastructure_cost, name='Infrastructure Cost',
+               marker_color=AWS_COLORS['light_blue']),
+        row=1, col=3
+    )
+    
+    fig.update_layout(height=400, showlegend=False)
+    return fig
+
+@common.profiled
 def deployment_strategies_tab():
     """Content for Deployment Strategies Overview tab"""
     st.markdown("## 🚀 AWS Deployment Strategies")
@@ -387,22 +424,7 @@ def deployment_strategies_tab():
     # Comparison Table
     st.markdown("### 📊 Deployment Strategy Comparison")
     
-    comparison_data = {
-        'Strategy': ['All at Once', 'Linear', 'Blue/Green', 'Canary'],
-        'Downtime': ['Yes', 'No', 'No', 'No'],
-        'Rollback Speed': ['Slow', 'Fast', 'Instant', 'Fast'],
-        'Infrastructure Cost': ['Low', 'Medium', 'High', 'Medium'],
-        'Deployment Speed': ['Fast', 'Medium', 'Fast', 'Slow'],
-        'Risk Level': ['High', 'Medium', 'Low', 'Very Low'],
-        'Best For': [
-            'Dev/Test environments',
-            'Production with health checks',
-            'Critical applications',
-            'High-risk deployments'
-        ]
-    }
-    
-    df_comparison = pd.DataFrame(comparison_data)
+    df_comparison = catalog.table("deployment_strategies.comparison")
     st.dataframe(df_comparison, use_container_width=True)
     
     # AWS Services Supporting Each Strategy
@@ -474,38 +496,7 @@ def deployment_strategies_tab():
     # Performance Impact Visualization
     st.markdown("### 📊 Strategy Performance Comparison")
     
-    # Create comparison metrics
-    strategies = ['All at Once', 'Linear', 'Blue/Green', 'Canary']
-    deployment_time = [2, 15, 5, 30]  # minutes
-    risk_level = [9, 5, 3, 1]  # 1-10 scale
-    infrastructure_cost = [1, 3, 8, 4]  # relative cost
-    
-    fig = make_subplots(
-        rows=1, cols=3,
-        subplot_titles=('Deployment Time (min)', 'Risk Level (1-10)', 'Infrastructure Cost (relative)'),
-        specs=[[{"secondary_y": False}, {"secondary_y": False}, {"secondary_y": False}]]
-    )
-    
-    fig.add_trace(
-        go.Bar(x=strategies, y=deployment_time, name='Deployment Time', 
-               marker_color=AWS_COLORS['primary']),
-        row=1, col=1
-    )
-    
-    fig.add_trace(
-        go.Bar(x=strategies, y=risk_level, name='Risk Level',
-               marker_color=AWS_COLORS['warning']),
-        row=1, col=2
-    )
-    
-    fig.add_trace(
-        go.Bar(x=strategies, y=infrastructure_cost, name='Infrastructure Cost',
-               marker_color=AWS_COLORS['light_blue']),
-        row=1, col=3
-    )
-    
-    fig.update_layout(height=400, showlegend=False)
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(create_strategy_comparison_chart(), use_container_width=True)
     
     # Code Example
     st.markdown("### 💻 Code Example: Deployment Strategy Selection")
@@ -660,6 +651,7 @@ for strategy in strategies:
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def blue_green_tab():
     """Content for Blue/Green Deployment tab"""
     st.markdown("## 🔵 Blue/Green Deployment")
@@ -680,63 +672,67 @@ def blue_green_tab():
     common.mermaid(create_blue_green_mermaid(), height=450)
     
     # Interactive Blue/Green Simulator
-    st.markdown("### 🎮 Interactive Blue/Green Deployment Simulator")
+    @common.fragment
+    def interactive_blue_green_deployment_simulator():
+        st.markdown("### 🎮 Interactive Blue/Green Deployment Simulator")
     
-    col1, col2 = st.columns(2)
+        col1, col2 = st.columns(2)
     
-    with col1:
-        st.markdown("### 🔵 Blue Environment (Current)")
-        blue_version = st.text_input("Current Version:", "v1.2.0")
-        blue_instances = st.slider("Blue Instances:", 1, 10, 3)
-        blue_health = st.selectbox("Blue Health Status:", ["Healthy", "Degraded", "Unhealthy"])
-        blue_traffic = st.slider("Blue Traffic %:", 0, 100, 100)
+        with col1:
+            st.markdown("### 🔵 Blue Environment (Current)")
+            blue_version = st.text_input("Current Version:", "v1.2.0")
+            blue_instances = st.slider("Blue Instances:", 1, 10, 3)
+            blue_health = st.selectbox("Blue Health Status:", ["Healthy", "Degraded", "Unhealthy"])
+            blue_traffic = st.slider("Blue Traffic %:", 0, 100, 100)
     
-    with col2:
-        st.markdown("### 🟢 Green Environment (New)")
-        green_version = st.text_input("New Version:", "v1.3.0")
-        green_instances = st.slider("Green Instances:", 0, 10, 3)
-        green_health = st.selectbox("Green Health Status:", ["Healthy", "Degraded", "Unhealthy", "Not Deployed"])
-        green_traffic = st.slider("Green Traffic %:", 0, 100, 0)
+        with col2:
+            st.markdown("### 🟢 Green Environment (New)")
+            green_version = st.text_input("New Version:", "v1.3.0")
+            green_instances = st.slider("Green Instances:", 0, 10, 3)
+            green_health = st.selectbox("Green Health Status:", ["Healthy", "Degraded", "Unhealthy", "Not Deployed"])
+            green_traffic = st.slider("Green Traffic %:", 0, 100, 0)
     
-    # Deployment Actions
-    st.markdown("### 🎛️ Deployment Control Panel")
+        # Deployment Actions
+        st.markdown("### 🎛️ Deployment Control Panel")
     
-    col1, col2, col3, col4 = st.columns(4)
+        col1, col2, col3, col4 = st.columns(4)
     
-    with col1:
-        if st.button("🚀 Deploy to Green", use_container_width=True):
-            st.session_state.deployment_status = "Deploying to Green environment..."
-            st.session_state.green_deployed = True
+        with col1:
+            if st.button("🚀 Deploy to Green", use_container_width=True):
+                st.session_state.deployment_status = "Deploying to Green environment..."
+                st.session_state.green_deployed = True
     
-    with col2:
-        if st.button("🧪 Test Green Environment", use_container_width=True):
-            if st.session_state.get('green_deployed', False):
-                st.session_state.deployment_status = "Testing Green environment..."
-                st.session_state.green_tested = True
-            else:
-                st.session_state.deployment_status = "❌ Deploy to Green first!"
+        with col2:
+            if st.button("🧪 Test Green Environment", use_container_width=True):
+                if st.session_state.get('green_deployed', False):
+                    st.session_state.deployment_status = "Testing Green environment..."
+                    st.session_state.green_tested = True
+                else:
+                    st.session_state.deployment_status = "❌ Deploy to Green first!"
     
-    with col3:
-        if st.button("🔄 Switch Traffic to Green", use_container_width=True):
-            if st.session_state.get('green_tested', False):
-                st.session_state.deployment_status = "✅ Traffic switched to Green!"
-                st.session_state.traffic_switched = True
-            else:
-                st.session_state.deployment_status = "❌ Test Green environment first!"
+        with col3:
+            if st.button("🔄 Switch Traffic to Green", use_container_width=True):
+                if st.session_state.get('green_tested', False):
+                    st.session_state.deployment_status = "✅ Traffic switched to Green!"
+                    st.session_state.traffic_switched = True
+                else:
+                    st.session_state.deployment_status = "❌ Test Green environment first!"
     
-    with col4:
-        if st.button("⏪ Rollback to Blue", use_container_width=True):
-            st.session_state.deployment_status = "⏪ Rolled back to Blue environment"
-            st.session_state.traffic_switched = False
-    
-    # Show deployment status
-    if 'deployment_status' in st.session_state:
-        if "✅" in st.session_state.deployment_status:
-            st.success(st.session_state.deployment_status)
-        elif "❌" in st.session_state.deployment_status:
-            st.error(st.session_state.deployment_status)
-        else:
-            st.info(st.session_state.deployment_status)
+        with col4:
+            if st.button("⏪ Rollback to Blue", use_container_width=True):
+                st.session_state.deployment_status = "⏪ Rolled back to Blue environment"
+                st.session_state.traffic_switched = False
+    
+        # Show deployment status
+        if 'deployment_status' in st.session_state:
+            if "✅" in st.session_state.deployment_status:
+                st.success(st.session_state.deployment_status)
+            elif "❌" in st.session_state.deployment_status:
+                st.error(st.session_state.deployment_status)
+            else:
+                st.info(st.session_state.deployment_status)
+
+    interactive_blue_green_deployment_simulator()
     
     # Benefits and Challenges
     st.markdown("### ✨ Blue/Green Benefits & Challenges")
@@ -770,34 +766,7 @@ def blue_green_tab():
     # Use Cases
     st.markdown("### 🌟 Ideal Use Cases for Blue/Green")
     
-    use_cases_data = {
-        'Application Type': [
-            'E-commerce Platforms',
-            'Financial Services',
-            'Healthcare Systems', 
-            'Media Streaming',
-            'SaaS Applications',
-            'Mobile App Backends'
-        ],
-        'Why Blue/Green?': [
-            'Zero tolerance for downtime during sales',
-            'Regulatory compliance requirements',
-            'Patient safety and data integrity',
-            'Uninterrupted service for global users',
-            'Customer retention and SLA requirements',
-            'Mobile apps cannot handle service interruptions'
-        ],
-        'Key Benefit': [
-            'Revenue protection',
-            'Compliance assurance',
-            'Safety guarantee',
-            'User experience',
-            'SLA compliance',
-            'App store ratings'
-        ]
-    }
-    
-    df_use_cases = pd.DataFrame(use_cases_data)
+    df_use_cases = catalog.table("blue_green.use_cases")
     st.dataframe(df_use_cases, use_container_width=True)
     
     # AWS Services for Blue/Green
@@ -842,50 +811,54 @@ def blue_green_tab():
     st.markdown("### 💰 Blue/Green Cost Analysis")
     
     # Interactive cost calculator
-    st.markdown("### 🧮 Blue/Green Cost Calculator")
+    @common.fragment
+    def blue_green_cost_calculator():
+        st.markdown("### 🧮 Blue/Green Cost Calculator")
     
-    col1, col2 = st.columns(2)
+        col1, col2 = st.columns(2)
     
-    with col1:
-        ec2_instances = st.slider("EC2 Instances per Environment:", 1, 20, 5)
-        instance_type = st.selectbox("Instance Type:", [
-            "t3.micro ($0.0104/hr)", "t3.small ($0.0208/hr)", 
-            "t3.medium ($0.0416/hr)", "m5.large ($0.096/hr)"
-        ])
-        hours_per_deployment = st.slider("Hours per Deployment:", 1, 24, 4)
+        with col1:
+            ec2_instances = st.slider("EC2 Instances per Environment:", 1, 20, 5)
+            instance_type = st.selectbox("Instance Type:", [
+                "t3.micro ($0.0104/hr)", "t3.small ($0.0208/hr)", 
+                "t3.medium ($0.0416/hr)", "m5.large ($0.096/hr)"
+            ])
+            hours_per_deployment = st.slider("Hours per Deployment:", 1, 24, 4)
     
-    with col2:
-        deployments_per_month = st.slider("Deployments per Month:", 1, 100, 10)
-        rds_cost = st.slider("RDS Instance Cost ($/hr):", 0.0, 5.0, 0.5)
-        load_balancer_hours = st.slider("Load Balancer Hours:", 0, 744, 744)  # Full month
+        with col2:
+            deployments_per_month = st.slider("Deployments per Month:", 1, 100, 10)
+            rds_cost = st.slider("RDS Instance Cost ($/hr):", 0.0, 5.0, 0.5)
+            load_balancer_hours = st.slider("Load Balancer Hours:", 0, 744, 744)  # Full month
     
-    if st.button("💰 Calculate Blue/Green Costs"):
-        # Extract hourly cost from instance type
-        hourly_cost = float(instance_type.split('$')[1].split('/')[0])
+        if st.button("💰 Calculate Blue/Green Costs"):
+            # Extract hourly cost from instance type
+            hourly_cost = float(instance_type.split('$')[1].split('/')[0])
         
-        # Calculate costs
-        monthly_base_cost = ec2_instances * hourly_cost * 744  # One environment running full time
-        deployment_cost = ec2_instances * hourly_cost * hours_per_deployment * deployments_per_month  # Second environment during deployments
-        rds_additional_cost = rds_cost * hours_per_deployment * deployments_per_month  # Additional RDS if needed
-        alb_cost = 0.0225 * load_balancer_hours  # ALB cost per hour
+            # Calculate costs
+            monthly_base_cost = ec2_instances * hourly_cost * 744  # One environment running full time
+            deployment_cost = ec2_instances * hourly_cost * hours_per_deployment * deployments_per_month  # Second environment during deployments
+            rds_additional_cost = rds_cost * hours_per_deployment * deployments_per_month  # Additional RDS if needed
+            alb_cost = 0.0225 * load_balancer_hours  # ALB cost per hour
         
-        total_monthly_cost = monthly_base_cost + deployment_cost + rds_additional_cost + alb_cost
+            total_monthly_cost = monthly_base_cost + deployment_cost + rds_additional_cost + alb_cost
         
-        # Compare with single environment
-        single_env_cost = ec2_instances * hourly_cost * 744 + rds_cost * 744 + alb_cost
-        additional_cost = total_monthly_cost - single_env_cost
+            # Compare with single environment
+            single_env_cost = ec2_instances * hourly_cost * 744 + rds_cost * 744 + alb_cost
+            additional_cost = total_monthly_cost - single_env_cost
         
-        col1, col2, col3, col4 = st.columns(4)
+            col1, col2, col3, col4 = st.columns(4)
         
-        with col1:
-            st.metric("Base Environment", f"${monthly_base_cost:.2f}/mo")
-        with col2:
-            st.metric("Deployment Overhead", f"${deployment_cost:.2f}/mo")
-        with col3:
-            st.metric("Total Blue/Green Cost", f"${total_monthly_cost:.2f}/mo")
-        with col4:
-            st.metric("Additional Cost", f"${additional_cost:.2f}/mo", 
-                     f"{(additional_cost/single_env_cost*100):.1f}% more")
+            with col1:
+                st.metric("Base Environment", f"${monthly_base_cost:.2f}/mo")
+            with col2:
+                st.metric("Deployment Overhead", f"${deployment_cost:.2f}/mo")
+            with col3:
+                st.metric("Total Blue/Green Cost", f"${total_monthly_cost:.2f}/mo")
+            with col4:
+                st.metric("Additional Cost", f"${additional_cost:.2f}/mo", 
+                         f"{(additional_cost/single_env_cost*100):.1f}% more")
+
+    blue_green_cost_calculator()
     
     # Code Example
     st.markdown("### 💻 Code Example: Blue/Green Deployment with AWS CodeDeploy")
@@ -1095,6 +1068,7 @@ deploy_application_blue_green()
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def all_at_once_tab():
     """Content for All at Once Deployment tab"""
     st.markdown("## 🔄 All at Once Deployment")
@@ -1134,88 +1108,92 @@ def all_at_once_tab():
         st.markdown('</div>', unsafe_allow_html=True)
     
     # Interactive All at Once Simulator
-    st.markdown("### 🎮 Interactive All at Once Deployment Simulator")
+    @common.fragment
+    def interactive_all_at_once_deployment_simulator():
+        st.markdown("### 🎮 Interactive All at Once Deployment Simulator")
     
-    col1, col2 = st.columns(2)
+        col1, col2 = st.columns(2)
     
-    with col1:
-        st.markdown("### ⚙️ Deployment Configuration")
-        instance_count = st.slider("Number of Instances:", 1, 20, 6)
-        deployment_time = st.slider("Deployment Time per Instance (seconds):", 30, 300, 90)
-        failure_probability = st.slider("Failure Probability (%):", 0, 50, 5)
-        rollback_time = st.slider("Rollback Time (seconds):", 60, 600, 180)
+        with col1:
+            st.markdown("### ⚙️ Deployment Configuration")
+            instance_count = st.slider("Number of Instances:", 1, 20, 6)
+            deployment_time = st.slider("Deployment Time per Instance (seconds):", 30, 300, 90)
+            failure_probability = st.slider("Failure Probability (%):", 0, 50, 5)
+            rollback_time = st.slider("Rollback Time (seconds):", 60, 600, 180)
     
-    with col2:
-        st.markdown("### 📊 Current Status")
-        current_version = st.text_input("Current Version:", "v1.4.2")
-        new_version = st.text_input("New Version:", "v1.5.0")
-        environment = st.selectbox("Environment:", ["Development", "Staging", "Production"])
-    
-    # Deployment simulation
-    if st.button("🚀 Start All at Once Deployment", use_container_width=True):
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        
-        # Simulate deployment
-        total_time = deployment_time * instance_count
-        
-        for i in range(instance_count):
-            # Simulate deployment to each instance
-            progress = (i + 1) / instance_count
-            progress_bar.progress(progress)
-            status_text.text(f"Deploying to instance {i+1}/{instance_count}...")
+        with col2:
+            st.markdown("### 📊 Current Status")
+            current_version = st.text_input("Current Version:", "v1.4.2")
+            new_version = st.text_input("New Version:", "v1.5.0")
+            environment = st.selectbox("Environment:", ["Development", "Staging", "Production"])
+    
+        # Deployment simulation
+        if st.button("🚀 Start All at Once Deployment", use_container_width=True):
+            progress_bar = st.progress(0)
+            status_text = st.empty()
+        
+            # Simulate deployment
+            total_time = deployment_time * instance_count
+        
+            for i in range(instance_count):
+                # Simulate deployment to each instance
+                progress = (i + 1) / instance_count
+                progress_bar.progress(progress)
+                status_text.text(f"Deploying to instance {i+1}/{instance_count}...")
             
-            # Simulate failure
-            if np.random.randint(0, 100) < failure_probability:
-                st.error(f"❌ Deployment failed on instance {i+1}!")
-                st.warning(f"⏪ Rolling back... (estimated {rollback_time} seconds)")
-                time.sleep(1)  # Brief pause for effect
-                st.info("🔄 All instances rolled back to previous version")
-                st.session_state.deployment_failed = True
-                break
+                # Simulate failure
+                if np.random.randint(0, 100) < failure_probability:
+                    st.error(f"❌ Deployment failed on instance {i+1}!")
+                    st.warning(f"⏪ Rolling back... (estimated {rollback_time} seconds)")
+                    time.sleep(1)  # Brief pause for effect
+                    st.info("🔄 All instances rolled back to previous version")
+                    st.session_state.deployment_failed = True
+                    break
             
-            time.sleep(0.5)  # Brief pause for visual effect
-        else:
-            st.success("✅ All at Once deployment completed successfully!")
-            st.info(f"🎉 All {instance_count} instances updated from {current_version} to {new_version}")
-            st.session_state.deployment_failed = False
+                time.sleep(0.5)  # Brief pause for visual effect
+            else:
+                st.success("✅ All at Once deployment completed successfully!")
+                st.info(f"🎉 All {instance_count} instances updated from {current_version} to {new_version}")
+                st.session_state.deployment_failed = False
         
-        progress_bar.empty()
-        status_text.empty()
+            progress_bar.empty()
+            status_text.empty()
     
-    # Deployment Analysis
-    if st.session_state.get('deployment_failed'):
-        st.markdown('<div class="warning-box">', unsafe_allow_html=True)
-        st.markdown("""
-        ### ⚠️ Deployment Analysis: Failed
+        # Deployment Analysis
+        if st.session_state.get('deployment_failed'):
+            st.markdown('<div class="warning-box">', unsafe_allow_html=True)
+            st.markdown("""
+            ### ⚠️ Deployment Analysis: Failed
         
-        **What Happened:**
-        - Deployment failed on one or more instances
-        - All instances were rolled back to prevent inconsistent state
-        - Service experienced brief downtime during rollback
+            **What Happened:**
+            - Deployment failed on one or more instances
+            - All instances were rolled back to prevent inconsistent state
+            - Service experienced brief downtime during rollback
         
-        **Mitigation Strategies:**
-        - Use staging environment for thorough testing
-        - Implement health checks before deployment
-        - Consider blue/green or rolling deployment for production
-        """)
-        st.markdown('</div>', unsafe_allow_html=True)
-    elif 'deployment_failed' in st.session_state and not st.session_state.deployment_failed:
-        st.markdown('<div class="highlight-box">', unsafe_allow_html=True)
-        st.markdown("""
-        ### ✅ Deployment Analysis: Successful
+            **Mitigation Strategies:**
+            - Use staging environment for thorough testing
+            - Implement health checks before deployment
+            - Consider blue/green or rolling deployment for production
+            """)
+            st.markdown('</div>', unsafe_allow_html=True)
+        elif 'deployment_failed' in st.session_state and not st.session_state.deployment_failed:
+            st.markdown('<div class="highlight-box">', unsafe_allow_html=True)
+            st.markdown("""
+            ### ✅ Deployment Analysis: Successful
         
-        **What Happened:**
-        - All instances successfully updated simultaneously
-        - Minimal downtime during the deployment process
-        - Fast completion due to parallel execution
+            **What Happened:**
+            - All instances successfully updated simultaneously
+            - Minimal downtime during the deployment process
+            - Fast completion due to parallel execution
         
-        **Benefits Realized:**
-        - Quick deployment completion
-        - No additional infrastructure costs
-        - Simple rollback if needed
-        """)
-        st.markdown('</div>', unsafe_allow_html=True)
+            **Benefits Realized:**
+            - Quick deployment completion
+            - No additional infrastructure costs
+            - Simple rollback if needed
+            """)
+            st.markdown('</div>', unsafe_allow_html=True)
+
+    interactive_all_at_once_deployment_simulator()
     
     # When to Use All at Once
     st.markdown("### 🎯 When to Use All at Once Deployment")
@@ -1290,50 +1268,54 @@ def all_at_once_tab():
     st.markdown("### ⏱️ Downtime Analysis")
     
     # Interactive downtime calculator
-    st.markdown("### 🧮 Downtime Impact Calculator")
+    @common.fragment
+    def downtime_impact_calculator():
+        st.markdown("### 🧮 Downtime Impact Calculator")
     
-    col1, col2 = st.columns(2)
+        col1, col2 = st.columns(2)
     
-    with col1:
-        avg_deployment_time = st.slider("Average Deployment Time (minutes):", 1, 30, 5)
-        deployments_per_month = st.slider("Deployments per Month:", 1, 50, 8)
-        revenue_per_minute = st.slider("Revenue per Minute ($):", 0, 10000, 100)
+        with col1:
+            avg_deployment_time = st.slider("Average Deployment Time (minutes):", 1, 30, 5)
+            deployments_per_month = st.slider("Deployments per Month:", 1, 50, 8)
+            revenue_per_minute = st.slider("Revenue per Minute ($):", 0, 10000, 100)
     
-    with col2:
-        users_affected = st.slider("Users Affected per Deployment:", 1, 1000000, 10000)
-        customer_satisfaction_impact = st.slider("Customer Satisfaction Impact (1-10):", 1, 10, 3)
-        rollback_success_rate = st.slider("Rollback Success Rate (%):", 50, 100, 90)
+        with col2:
+            users_affected = st.slider("Users Affected per Deployment:", 1, 1000000, 10000)
+            customer_satisfaction_impact = st.slider("Customer Satisfaction Impact (1-10):", 1, 10, 3)
+            rollback_success_rate = st.slider("Rollback Success Rate (%):", 50, 100, 90)
     
-    if st.button("📊 Calculate Downtime Impact"):
-        # Calculate monthly downtime
-        monthly_downtime = avg_deployment_time * deployments_per_month
-        annual_downtime = monthly_downtime * 12
+        if st.button("📊 Calculate Downtime Impact"):
+            # Calculate monthly downtime
+            monthly_downtime = avg_deployment_time * deployments_per_month
+            annual_downtime = monthly_downtime * 12
         
-        # Calculate business impact
-        monthly_revenue_loss = monthly_downtime * revenue_per_minute
-        annual_revenue_loss = monthly_revenue_loss * 12
+            # Calculate business impact
+            monthly_revenue_loss = monthly_downtime * revenue_per_minute
+            annual_revenue_loss = monthly_revenue_loss * 12
         
-        # User impact
-        total_user_minutes_lost = users_affected * monthly_downtime
+            # User impact
+            total_user_minutes_lost = users_affected * monthly_downtime
         
-        col1, col2, col3, col4 = st.columns(4)
+            col1, col2, col3, col4 = st.columns(4)
         
-        with col1:
-            st.metric("Monthly Downtime", f"{monthly_downtime} min")
-        with col2:
-            st.metric("Annual Downtime", f"{annual_downtime} min", f"{annual_downtime/60:.1f} hours")
-        with col3:
-            st.metric("Monthly Revenue Impact", f"${monthly_revenue_loss:,.0f}")
-        with col4:
-            st.metric("User Minutes Lost/Month", f"{total_user_minutes_lost:,.0f}")
+            with col1:
+                st.metric("Monthly Downtime", f"{monthly_downtime} min")
+            with col2:
+                st.metric("Annual Downtime", f"{annual_downtime} min", f"{annual_downtime/60:.1f} hours")
+            with col3:
+                st.metric("Monthly Revenue Impact", f"${monthly_revenue_loss:,.0f}")
+            with col4:
+                st.metric("User Minutes Lost/Month", f"{total_user_minutes_lost:,.0f}")
         
-        # Recommendations based on impact
-        if monthly_revenue_loss > 10000:
-            st.error("💸 High revenue impact detected! Consider Blue/Green or Canary deployment.")
-        elif monthly_revenue_loss > 1000:
-            st.warning("⚠️ Moderate revenue impact. Consider Linear deployment for production.")
-        else:
-            st.success("✅ Low revenue impact. All at Once may be acceptable for your use case.")
+            # Recommendations based on impact
+            if monthly_revenue_loss > 10000:
+                st.error("💸 High revenue impact detected! Consider Blue/Green or Canary deployment.")
+            elif monthly_revenue_loss > 1000:
+                st.warning("⚠️ Moderate revenue impact. Consider Linear deployment for production.")
+            else:
+                st.success("✅ Low revenue impact. All at Once may be acceptable for your use case.")
+
+    downtime_impact_calculator()
     
     # Best Practices
     st.markdown("### 💡 All at Once Best Practices")
@@ -1612,6 +1594,7 @@ print(f"\n🏁 Final Result: {'Success' if success else 'Failed'}")
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def linear_tab():
     """Content for Linear Deployment tab"""
     st.markdown("## 📈 Linear Deployment")
@@ -1632,99 +1615,103 @@ def linear_tab():
     common.mermaid(create_linear_deployment_mermaid(), height=1000)
     
     # Interactive Linear Deployment Simulator
-    st.markdown("### 🎮 Interactive Linear Deployment Simulator")
+    @common.fragment
+    def interactive_linear_deployment_simulator():
+        st.markdown("### 🎮 Interactive Linear Deployment Simulator")
     
-    col1, col2 = st.columns(2)
+        col1, col2 = st.columns(2)
     
-    with col1:
-        st.markdown("### ⚙️ Linear Configuration")
-        linear_percentage = st.slider("Linear Percentage per Step:", 5, 50, 10)
-        linear_interval = st.slider("Linear Interval (minutes):", 1, 10, 3)
-        total_instances = st.slider("Total Instances:", 5, 50, 20)
-        failure_threshold = st.slider("Failure Threshold (%):", 5, 30, 10)
+        with col1:
+            st.markdown("### ⚙️ Linear Configuration")
+            linear_percentage = st.slider("Linear Percentage per Step:", 5, 50, 10)
+            linear_interval = st.slider("Linear Interval (minutes):", 1, 10, 3)
+            total_instances = st.slider("Total Instances:", 5, 50, 20)
+            failure_threshold = st.slider("Failure Threshold (%):", 5, 30, 10)
     
-    with col2:
-        st.markdown("### 📊 Deployment Preview")
-        steps = 100 // linear_percentage
-        total_time = steps * linear_interval
-        instances_per_step = max(1, (total_instances * linear_percentage) // 100)
-        
-        st.info(f"""
-        **Deployment Plan:**
-        - **Steps**: {steps} increments
-        - **Instances per step**: {instances_per_step}
-        - **Total time**: {total_time} minutes
-        - **Risk window**: {linear_percentage}% at a time
-        """)
+        with col2:
+            st.markdown("### 📊 Deployment Preview")
+            steps = 100 // linear_percentage
+            total_time = steps * linear_interval
+            instances_per_step = max(1, (total_instances * linear_percentage) // 100)
+        
+            st.info(f"""
+            **Deployment Plan:**
+            - **Steps**: {steps} increments
+            - **Instances per step**: {instances_per_step}
+            - **Total time**: {total_time} minutes
+            - **Risk window**: {linear_percentage}% at a time
+            """)
     
-    # Deployment execution simulator
-    if st.button("🚀 Start Linear Deployment", use_container_width=True):
-        st.markdown("### 📊 Live Deployment Progress")
+        # Deployment execution simulator
+        if st.button("🚀 Start Linear Deployment", use_container_width=True):
+            st.markdown("### 📊 Live Deployment Progress")
         
-        progress_bar = st.progress(0)
-        metrics_container = st.container()
-        status_container = st.container()
+            progress_bar = st.progress(0)
+            metrics_container = st.container()
+            status_container = st.container()
         
-        deployment_successful = True
-        current_step = 0
+            deployment_successful = True
+            current_step = 0
         
-        for step in range(1, steps + 1):
-            current_percentage = step * linear_percentage
-            progress_bar.progress(current_percentage / 100)
+            for step in range(1, steps + 1):
+                current_percentage = step * linear_percentage
+                progress_bar.progress(current_percentage / 100)
             
-            # Simulate deployment step
-            with status_container:
-                st.info(f"⏳ Step {step}/{steps}: Deploying to {current_percentage}% of instances...")
+                # Simulate deployment step
+                with status_container:
+                    st.info(f"⏳ Step {step}/{steps}: Deploying to {current_percentage}% of instances...")
             
-            # Simulate health checks
-            time.sleep(1)  # Brief pause for visual effect
+                # Simulate health checks
+                time.sleep(1)  # Brief pause for visual effect
             
-            # Random failure simulation
-            if np.random.randint(0, 100) < (failure_threshold * step / steps):  # Increasing failure chance
-                deployment_successful = False
-                with status_container:
-                    st.error(f"❌ Deployment failed at step {step} ({current_percentage}%)!")
-                    st.warning("🔄 Initiating automatic rollback...")
-                    st.info("⏪ Rolling back all deployed instances to previous version")
-                break
+                # Random failure simulation
+                if np.random.randint(0, 100) < (failure_threshold * step / steps):  # Increasing failure chance
+                    deployment_successful = False
+                    with status_container:
+                        st.error(f"❌ Deployment failed at step {step} ({current_percentage}%)!")
+                        st.warning("🔄 Initiating automatic rollback...")
+                        st.info("⏪ Rolling back all deployed instances to previous version")
+                    break
             
-            # Show metrics
-            with metrics_container:
-                col1, col2, col3, col4 = st.columns(4)
-                with col1:
-                    st.metric("Current Step", f"{step}/{steps}")
-                with col2:
-                    st.metric("Traffic Shifted", f"{current_percentage}%")
-                with col3:
-                    st.metric("Instances Updated", f"{step * instances_per_step}")
-                with col4:
-                    st.metric("Time Elapsed", f"{step * linear_interval} min")
+                # Show metrics
+                with metrics_container:
+                    col1, col2, col3, col4 = st.columns(4)
+                    with col1:
+                        st.metric("Current Step", f"{step}/{steps}")
+                    with col2:
+                        st.metric("Traffic Shifted", f"{current_percentage}%")
+                    with col3:
+                        st.metric("Instances Updated", f"{step * instances_per_step}")
+                    with col4:
+                        st.metric("Time Elapsed", f"{step * linear_interval} min")
             
-            current_step = step
+                current_step = step
         
-        if deployment_successful:
-            with status_container:
-                st.success("✅ Linear deployment completed successfully!")
-                st.balloons()
+            if deployment_successful:
+                with status_container:
+                    st.success("✅ Linear deployment completed successfully!")
+                    st.balloons()
                 
-            st.markdown('<div class="highlight-box">', unsafe_allow_html=True)
-            st.markdown(f"""
-            ### 🎉 Deployment Summary
+                st.markdown('<div class="highlight-box">', unsafe_allow_html=True)
+                st.markdown(f"""
+                ### 🎉 Deployment Summary
             
-            **Deployment Details:**
-            - **Total Steps**: {steps}
-            - **Final Traffic**: 100% on new version
-            - **Total Time**: {total_time} minutes
-            - **Instances Updated**: {total_instances}
-            - **Risk Mitigation**: Gradual rollout minimized impact
+                **Deployment Details:**
+                - **Total Steps**: {steps}
+                - **Final Traffic**: 100% on new version
+                - **Total Time**: {total_time} minutes
+                - **Instances Updated**: {total_instances}
+                - **Risk Mitigation**: Gradual rollout minimized impact
             
-            **Key Benefits Achieved:**
-            - ✅ Zero downtime during deployment
-            - ✅ Gradual risk exposure
-            - ✅ Early detection capability
-            - ✅ Controlled rollout pace
-            """)
-            st.markdown('</div>', unsafe_allow_html=True)
+                **Key Benefits Achieved:**
+                - ✅ Zero downtime during deployment
+                - ✅ Gradual risk exposure
+                - ✅ Early detection capability
+                - ✅ Controlled rollout pace
+                """)
+                st.markdown('</div>', unsafe_allow_html=True)
+
+    interactive_linear_deployment_simulator()
     
     # Linear Configuration Options
     st.markdown("### 🛠️ AWS Linear Configuration Options")
@@ -1781,15 +1768,7 @@ def linear_tab():
     # Linear vs Other Strategies
     st.markdown("### ⚖️ Linear vs Other Deployment Strategies")
     
-    comparison_metrics = {
-        'Metric': ['Deployment Speed', 'Risk Level', 'Downtime', 'Rollback Speed', 'Infrastructure Cost', 'Complexity'],
-        'All at Once': ['Fast', 'High', 'Yes', 'Slow', 'Low', 'Low'],  
-        'Linear': ['Medium', 'Medium', 'No', 'Fast', 'Medium', 'Medium'],
-        'Blue/Green': ['Fast', 'Low', 'No', 'Instant', 'High', 'Medium'],
-        'Canary': ['Slow', 'Very Low', 'No', 'Fast', 'Medium', 'High']
-    }
-    
-    df_comparison = pd.DataFrame(comparison_metrics)
+    df_comparison = catalog.table("linear.comparison_metrics")
     st.dataframe(df_comparison, use_container_width=True)
     
     # Linear Deployment Benefits
@@ -2168,6 +2147,7 @@ print(f"\n🏁 Deployment Result: {'Success' if success else 'Failed'}")
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def canary_tab():
     """Content for Canary Deployment tab"""
     st.markdown("## 🎯 Canary Deployment")
@@ -2188,118 +2168,122 @@ def canary_tab():
     common.mermaid(create_canary_deployment_mermaid(), height=1100)
     
     # Interactive Canary Simulator  
-    st.markdown("### 🎮 Interactive Canary Deployment Simulator")
+    @common.fragment
+    def interactive_canary_deployment_simulator():
+        st.markdown("### 🎮 Interactive Canary Deployment Simulator")
     
-    col1, col2 = st.columns(2)
+        col1, col2 = st.columns(2)
     
-    with col1:
-        st.markdown("### 🐦 Canary Configuration")
-        canary_percentage = st.slider("Canary Traffic Percentage:", 1, 25, 10)
-        canary_duration = st.slider("Canary Duration (minutes):", 5, 60, 15)
-        success_threshold = st.slider("Success Threshold (%):", 90, 100, 95)
-        max_error_rate = st.slider("Max Error Rate (%):", 0.1, 5.0, 1.0)
+        with col1:
+            st.markdown("### 🐦 Canary Configuration")
+            canary_percentage = st.slider("Canary Traffic Percentage:", 1, 25, 10)
+            canary_duration = st.slider("Canary Duration (minutes):", 5, 60, 15)
+            success_threshold = st.slider("Success Threshold (%):", 90, 100, 95)
+            max_error_rate = st.slider("Max Error Rate (%):", 0.1, 5.0, 1.0)
     
-    with col2:
-        st.markdown("### 📊 Monitoring Metrics")
-        monitor_response_time = st.checkbox("Monitor Response Time", True)
-        monitor_error_rate = st.checkbox("Monitor Error Rate", True)
-        monitor_cpu_usage = st.checkbox("Monitor CPU Usage", True)
-        monitor_memory_usage = st.checkbox("Monitor Memory Usage", True)
-    
-    # Canary deployment execution
-    if st.button("🚀 Start Canary Deployment", use_container_width=True):
-        st.markdown("### 📊 Canary Deployment Progress")
-        
-        # Phase 1: Canary deployment
-        st.info(f"🐦 Phase 1: Deploying to {canary_percentage}% of traffic...")
-        progress_bar = st.progress(0)
-        
-        canary_metrics = {
-            'response_time': [],
-            'error_rate': [],
-            'cpu_usage': [],
-            'memory_usage': []
-        }
+        with col2:
+            st.markdown("### 📊 Monitoring Metrics")
+            monitor_response_time = st.checkbox("Monitor Response Time", True)
+            monitor_error_rate = st.checkbox("Monitor Error Rate", True)
+            monitor_cpu_usage = st.checkbox("Monitor CPU Usage", True)
+            monitor_memory_usage = st.checkbox("Monitor Memory Usage", True)
+    
+        # Canary deployment execution
+        if st.button("🚀 Start Canary Deployment", use_container_width=True):
+            st.markdown("### 📊 Canary Deployment Progress")
+        
+            # Phase 1: Canary deployment
+            st.info(f"🐦 Phase 1: Deploying to {canary_percentage}% of traffic...")
+            progress_bar = st.progress(0)
+        
+            canary_metrics = {
+                'response_time': [],
+                'error_rate': [],
+                'cpu_usage': [],
+                'memory_usage': []
+            }
         
-        # Simulate canary monitoring
-        canary_healthy = True
+            # Simulate canary monitoring
+            canary_healthy = True
         
-        for minute in range(canary_duration):
-            progress_bar.progress((minute + 1) / canary_duration)
+            for minute in range(canary_duration):
+                progress_bar.progress((minute + 1) / canary_duration)
             
-            # Simulate metrics
-            response_time = np.random.uniform(100, 200)  # ms
-            error_rate = np.random.uniform(0.1, 2.0)  # %
-            cpu_usage = np.random.uniform(30, 70)  # %
-            memory_usage = np.random.uniform(40, 80)  # %
+                # Simulate metrics
+                response_time = np.random.uniform(100, 200)  # ms
+                error_rate = np.random.uniform(0.1, 2.0)  # %
+                cpu_usage = np.random.uniform(30, 70)  # %
+                memory_usage = np.random.uniform(40, 80)  # %
             
-            canary_metrics['response_time'].append(response_time)
-            canary_metrics['error_rate'].append(error_rate)
-            canary_metrics['cpu_usage'].append(cpu_usage)
-            canary_metrics['memory_usage'].append(memory_usage)
+                canary_metrics['response_time'].append(response_time)
+                canary_metrics['error_rate'].append(error_rate)
+                canary_metrics['cpu_usage'].append(cpu_usage)
+                canary_metrics['memory_usage'].append(memory_usage)
             
-            # Check for failures
-            if error_rate > max_error_rate:
-                canary_healthy = False
-                st.error(f"❌ Canary failed at minute {minute + 1}: Error rate {error_rate:.2f}% exceeds threshold {max_error_rate}%")
-                break
+                # Check for failures
+                if error_rate > max_error_rate:
+                    canary_healthy = False
+                    st.error(f"❌ Canary failed at minute {minute + 1}: Error rate {error_rate:.2f}% exceeds threshold {max_error_rate}%")
+                    break
             
-            time.sleep(0.1)  # Brief pause for visual effect
+                time.sleep(0.1)  # Brief pause for visual effect
         
-        progress_bar.empty()
+            progress_bar.empty()
         
-        # Show canary results
-        if canary_healthy:
-            avg_response_time = np.mean(canary_metrics['response_time'])
-            avg_error_rate = np.mean(canary_metrics['error_rate'])
+            # Show canary results
+            if canary_healthy:
+                avg_response_time = np.mean(canary_metrics['response_time'])
+                avg_error_rate = np.mean(canary_metrics['error_rate'])
             
-            st.success(f"✅ Canary deployment successful!")
+                st.success(f"✅ Canary deployment successful!")
             
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric("Avg Response Time", f"{avg_response_time:.0f}ms")
-            with col2:
-                st.metric("Avg Error Rate", f"{avg_error_rate:.2f}%")
-            with col3:
-                st.metric("Canary Traffic", f"{canary_percentage}%")
-            with col4:
-                st.metric("Duration", f"{canary_duration} min")
+                col1, col2, col3, col4 = st.columns(4)
+                with col1:
+                    st.metric("Avg Response Time", f"{avg_response_time:.0f}ms")
+                with col2:
+                    st.metric("Avg Error Rate", f"{avg_error_rate:.2f}%")
+                with col3:
+                    st.metric("Canary Traffic", f"{canary_percentage}%")
+                with col4:
+                    st.metric("Duration", f"{canary_duration} min")
             
-            # Phase 2: Full deployment
-            if st.button("🚀 Proceed with Full Deployment"):
-                st.info("📈 Phase 2: Deploying to remaining 90% of traffic...")
-                full_progress = st.progress(0)
+                # Phase 2: Full deployment
+                if st.button("🚀 Proceed with Full Deployment"):
+                    st.info("📈 Phase 2: Deploying to remaining 90% of traffic...")
+                    full_progress = st.progress(0)
                 
-                for i in range(10):
-                    full_progress.progress((i + 1) / 10)
-                    time.sleep(0.2)
+                    for i in range(10):
+                        full_progress.progress((i + 1) / 10)
+                        time.sleep(0.2)
                 
-                full_progress.empty()
-                st.success("🎉 Full canary deployment completed successfully!")
-                st.balloons()
+                    full_progress.empty()
+                    st.success("🎉 Full canary deployment completed successfully!")
+                    st.balloons()
                 
-                st.markdown('<div class="highlight-box">', unsafe_allow_html=True)
-                st.markdown(f"""
-                ### 🎯 Canary Deployment Summary
+                    st.markdown('<div class="highlight-box">', unsafe_allow_html=True)
+                    st.markdown(f"""
+                    ### 🎯 Canary Deployment Summary
                 
-                **Phase 1 - Canary:**
-                - Traffic: {canary_percentage}%
-                - Duration: {canary_duration} minutes
-                - Result: ✅ Passed all health checks
+                    **Phase 1 - Canary:**
+                    - Traffic: {canary_percentage}%
+                    - Duration: {canary_duration} minutes
+                    - Result: ✅ Passed all health checks
                 
-                **Phase 2 - Full Deployment:**
-                - Traffic: 100%
-                - Result: ✅ Successfully completed
+                    **Phase 2 - Full Deployment:**
+                    - Traffic: 100%
+                    - Result: ✅ Successfully completed
                 
-                **Risk Mitigation Achieved:**
-                - Limited initial exposure to {canary_percentage}% of users
-                - Real production testing with actual traffic
-                - Automated health monitoring and failure detection
-                """)
-                st.markdown('</div>', unsafe_allow_html=True)
-        else:
-            st.warning("⏪ Canary failed - initiating automatic rollback...")
-            st.info("🔄 All canary traffic has been redirected back to stable version")
+                    **Risk Mitigation Achieved:**
+                    - Limited initial exposure to {canary_percentage}% of users
+                    - Real production testing with actual traffic
+                    - Automated health monitoring and failure detection
+                    """)
+                    st.markdown('</div>', unsafe_allow_html=True)
+            else:
+                st.warning("⏪ Canary failed - initiating automatic rollback...")
+                st.info("🔄 All canary traffic has been redirected back to stable version")
+
+    interactive_canary_deployment_simulator()
     
     # Canary Configuration Options
     st.markdown("### 🛠️ AWS Canary Configuration Options")
@@ -2385,26 +2369,7 @@ def canary_tab():
     # Canary Success Criteria
     st.markdown("### ✅ Canary Success Criteria")
     
-    success_criteria_data = {
-        'Metric Category': ['Performance', 'Reliability', 'Business', 'Infrastructure', 'Security'],
-        'Key Indicators': [
-            'Response time within 10% of baseline',
-            'Error rate < 1% for 4xx, < 0.1% for 5xx',
-            'Conversion rate maintains baseline',
-            'CPU/Memory usage within normal ranges',
-            'No security alerts or anomalies'
-        ],
-        'Failure Actions': [
-            'Immediate rollback if >20% slower',
-            'Rollback if error threshold exceeded',
-            'Alert stakeholders, consider rollback',
-            'Scale resources or rollback',
-            'Immediate security team notification'
-        ],
-        'Monitoring Duration': ['Continuous', 'Continuous', 'Full canary period', 'Continuous', 'Continuous']
-    }
-    
-    df_success_criteria = pd.DataFrame(success_criteria_data)
+    df_success_criteria = catalog.table("canary.success_criteria")
     st.dataframe(df_success_criteria, use_container_width=True)
     
     # Canary vs A/B Testing
@@ -2453,31 +2418,7 @@ def canary_tab():
     # Advanced Canary Strategies
     st.markdown("### 🚀 Advanced Canary Strategies")
     
-    advanced_strategies = {
-        'Strategy': [
-            'Geographic Canary',
-            'User Segment Canary', 
-            'Feature Flag Canary',
-            'Multi-Stage Canary',
-            'Automated Canary'
-        ],
-        'Description': [
-            'Deploy to specific regions first',
-            'Target specific user groups (beta users, employees)',
-            'Use feature flags to control canary exposure',
-            'Multiple canary phases (1%, 5%, 25%, 100%)',
-            'AI/ML-driven canary decisions based on metrics'
-        ],
-        'Best For': [
-            'Global applications with regional variations',
-            'B2B applications with diverse user types',
-            'Complex features requiring granular control',
-            'High-risk deployments requiring gradual validation',
-            'High-frequency deployments with consistent patterns'
-        ]
-    }
-    
-    df_advanced = pd.DataFrame(advanced_strategies)
+    df_advanced = catalog.table("canary.advanced_strategies")
     st.dataframe(df_advanced, use_container_width=True)
     
     # Code Example
@@ -2862,6 +2803,7 @@ print(f"\n🏁 Canary Deployment Result: {'Success' if success else 'Failed'}")
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def main():
     """Main application function"""
     # Apply styling
@@ -2884,28 +2826,13 @@ def main():
                 </div>""", unsafe_allow_html=True)
     
     # Create tabs
-    tab1, tab2, tab3, tab4, tab5 = st.tabs([
-        "🚀 Deployment Strategies", 
-        "🔵 Blue/Green", 
-        "🔄 All at Once",
-        "📈 Linear",
-        "🎯 Canary"
-    ])
-    
-    with tab1:
-        deployment_strategies_tab()
-    
-    with tab2:
-        blue_green_tab()
-    
-    with tab3:
-        all_at_once_tab()
-    
-    with tab4:
-        linear_tab()
-        
-    with tab5:
-        canary_tab()
+    common.tab_router({
+        "🚀 Deployment Strategies": deployment_strategies_tab,
+        "🔵 Blue/Green": blue_green_tab,
+        "🔄 All at Once": all_at_once_tab,
+        "📈 Linear": linear_tab,
+        "🎯 Canary": canary_tab,
+    })
     
     # Footer
     st.markdown("""
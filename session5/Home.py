@@ -1,12 +1,14 @@
 
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime, timedelta
 import utils.common as common
 import utils.authenticate as authenticate
 
+# Heavy libraries are imported when a tab first uses them
+pd = common.lazy_import("pandas")
+go = common.lazy_import("plotly.graph_objects")
+px = common.lazy_import("plotly.express")
+
 # Page configuration
 st.set_page_config(
     page_title="AWS Developer Associate - Session 5",
@@ -16,10 +18,10 @@ st.set_page_config(
 
 common.initialize_session_state()
 
+@common.profiled
 def main():
     # Custom CSS for AWS styling
-    st.markdown("""
-    <style>
+    common.stylesheet("""
     /* AWS Color Scheme */
     :root {
         --aws-orange: #FF9900;
@@ -114,8 +116,7 @@ def main():
         margin-top: 3rem;
         border-radius: 15px;
     }
-    </style>
-    """, unsafe_allow_html=True)
+    """)
 
 
 with st.sidebar:
@@ -68,9 +68,9 @@ fi
 echo "Logging in to Amazon ECR..."
 aws ecr get-login-password --region $AWS_REGION | docker login --username AWS --password-stdin $ECR_URI
 
-# Build Docker image
+# Build Docker image from the repository root so the shared package is in the context
 echo "Building Docker image..."
-docker build -t $APP_NAME:$IMAGE_TAG .
+docker build -f Dockerfile -t $APP_NAME:$IMAGE_TAG ..
 
 # Tag image for ECR
 echo "Tagging image for ECR..."
@@ -1,15 +1,18 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import utils.common as common
+import utils.catalog as catalog
 import utils.authenticate as authenticate
 import json
 import base64
 from datetime import datetime, timedelta
 
+# Heavy libraries are imported when a tab first uses them
+pd = common.lazy_import("pandas")
+np = common.lazy_import("numpy")
+px = common.lazy_import("plotly.express")
+go = common.lazy_import("plotly.graph_objects")
+make_subplots = common.lazy_import("plotly.subplots", "make_subplots")
+
 # Page configuration
 st.set_page_config(
     page_title="AWS Security & Identity Hub",
@@ -32,8 +35,7 @@ AWS_COLORS = {
 
 def apply_custom_styles():
     """Apply custom CSS styling with AWS color scheme"""
-    st.markdown(f"""
-    <style>
+    common.stylesheet(f"""
         .main {{
             background-color: {AWS_COLORS['light_gray']};
         }}
@@ -146,8 +148,7 @@ def apply_custom_styles():
                 width: 100% !important;
                 max-width: none !important; /* Or remove max-width if present */
             }}
-    </style>
-    """, unsafe_allow_html=True)
+    """)
 
 def create_sidebar():
     """Create sidebar with app information and controls"""
@@ -393,6 +394,7 @@ def create_s3_security_mermaid():
         style L fill:#232F3E,stroke:#FF9900,color:#fff
     """
 
+@common.profiled
 def aws_waf_tab():
     """Content for AWS WAF tab"""
     st.markdown("## 🛡️ AWS WAF (Web Application Firewall)")
@@ -530,26 +532,7 @@ def aws_waf_tab():
     # Common Attack Types
     st.markdown("### 🎯 Common Web Application Attacks & WAF Protection")
     
-    attack_data = {
-        'Attack Type': ['SQL Injection', 'Cross-Site Scripting (XSS)', 'DDoS Attack', 'Bot Traffic', 'Geographic Attacks'],
-        'Description': [
-            'Malicious SQL code injection into database queries',
-            'Malicious scripts injected into web pages',
-            'Overwhelming traffic to disrupt service', 
-            'Automated requests from bots',
-            'Attacks from specific geographic regions'
-        ],
-        'WAF Protection': [
-            'SQL injection rule sets',
-            'XSS filtering and validation',
-            'Rate limiting and IP blocking',
-            'Bot detection and CAPTCHA',
-            'Geographic IP blocking'
-        ],
-        'Effectiveness': ['99%', '95%', '90%', '85%', '100%']
-    }
-    
-    df_attacks = pd.DataFrame(attack_data)
+    df_attacks = catalog.table("aws_waf.attack")
     st.dataframe(df_attacks, use_container_width=True)
     
     # WAF Metrics Simulation
@@ -899,6 +882,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def secrets_manager_tab():
     """Content for AWS Secrets Manager tab"""
     st.markdown("## 🔐 AWS Secrets Manager")
@@ -1043,20 +1027,7 @@ def secrets_manager_tab():
     # Secret Types and Use Cases
     st.markdown("### 🎯 Secret Types and Use Cases")
     
-    secret_types_data = {
-        'Secret Type': ['Database Credentials', 'API Keys', 'OAuth Tokens', 'SSL Certificates', 'SSH Keys'],
-        'Rotation Support': ['✅ Full', '⚠️ Manual', '✅ Full', '⚠️ Manual', '⚠️ Manual'],
-        'Use Cases': [
-            'RDS, Aurora, self-managed databases',
-            'Third-party service integration',
-            'Authentication with external services',
-            'Web server certificates',
-            'Server access credentials'
-        ],
-        'Recommended Rotation': ['30-90 days', '60-180 days', '24-48 hours', '1 year', '90-180 days']
-    }
-    
-    df_secret_types = pd.DataFrame(secret_types_data)
+    df_secret_types = catalog.table("secrets_manager.secret_types")
     st.dataframe(df_secret_types, use_container_width=True)
     
     # Cost Analysis
@@ -1065,22 +1036,26 @@ def secrets_manager_tab():
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown("### 📊 Cost Calculator")
-        num_secrets = st.slider("Number of Secrets:", 1, 1000, 50)
-        api_calls_per_month = st.slider("API Calls per Month:", 1000, 1000000, 100000)
-        
-        # AWS Secrets Manager pricing (as of 2025)
-        secret_cost = num_secrets * 0.40  # $0.40 per secret per month
-        api_cost = (api_calls_per_month / 10000) * 0.05  # $0.05 per 10,000 API calls
-        total_cost = secret_cost + api_cost
-        
-        col3, col4 = st.columns(2)
-        with col3:
-            st.metric("Secret Storage Cost", f"${secret_cost:.2f}/month")
-            st.metric("API Call Cost", f"${api_cost:.2f}/month")
-        with col4:
-            st.metric("Total Monthly Cost", f"${total_cost:.2f}")
-            st.metric("Cost per Secret", f"${total_cost/num_secrets:.3f}")
+        @common.fragment
+        def secrets_cost_calculator():
+            st.markdown("### 📊 Cost Calculator")
+            num_secrets = st.slider("Number of Secrets:", 1, 1000, 50)
+            api_calls_per_month = st.slider("API Calls per Month:", 1000, 1000000, 100000)
+        
+            # AWS Secrets Manager pricing (as of 2025)
+            secret_cost = num_secrets * 0.40  # $0.40 per secret per month
+            api_cost = (api_calls_per_month / 10000) * 0.05  # $0.05 per 10,000 API calls
+            total_cost = secret_cost + api_cost
+        
+            col3, col4 = st.columns(2)
+            with col3:
+                st.metric("Secret Storage Cost", f"${secret_cost:.2f}/month")
+                st.metric("API Call Cost", f"${api_cost:.2f}/month")
+            with col4:
+                st.metric("Total Monthly Cost", f"${total_cost:.2f}")
+                st.metric("Cost per Secret", f"${total_cost/num_secrets:.3f}")
+
+        secrets_cost_calculator()
     
     with col2:
         # Cost comparison chart
@@ -1428,6 +1403,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def kms_tab():
     """Content for AWS KMS tab"""
     st.markdown("## 🔑 AWS Key Management Service (KMS)")
@@ -1589,24 +1565,7 @@ def kms_tab():
     # Encryption Methods Comparison
     st.markdown("### 🔐 KMS Encryption Methods")
     
-    encryption_data = {
-        'Method': ['Envelope Encryption', 'Direct Encryption', 'Client-Side Encryption'],
-        'Data Limit': ['Unlimited', '4 KB', 'Unlimited'],
-        'Performance': ['High', 'Low', 'Medium'],
-        'Use Case': [
-            'Large files, databases',
-            'Small secrets, passwords',
-            'Browser/mobile apps'
-        ],
-        'Network Calls': ['1 per operation', '1 per 4KB', 'Initial setup only'],
-        'Best For': [
-            'S3, RDS, EBS encryption',
-            'Secrets Manager',
-            'Client applications'
-        ]
-    }
-    
-    df_encryption = pd.DataFrame(encryption_data)
+    df_encryption = catalog.table("kms.encryption")
     st.dataframe(df_encryption, use_container_width=True)
     
     # KMS Integration with AWS Services
@@ -1630,22 +1589,26 @@ def kms_tab():
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown("### 📊 Cost Calculator")
-        num_keys = st.slider("Number of Customer Keys:", 1, 100, 10)
-        requests_per_month = st.slider("API Requests per Month:", 1000, 10000000, 100000)
-        
-        # KMS pricing calculation
-        key_cost = num_keys * 1.00  # $1 per key per month
-        request_cost = (requests_per_month / 20000) * 0.03  # $0.03 per 20,000 requests
-        total_monthly_cost = key_cost + request_cost
-        
-        col3, col4 = st.columns(2)
-        with col3:
-            st.metric("Key Storage Cost", f"${key_cost:.2f}/month")
-            st.metric("Request Cost", f"${request_cost:.2f}/month")
-        with col4:
-            st.metric("Total Monthly Cost", f"${total_monthly_cost:.2f}")
-            st.metric("Cost per Key", f"${total_monthly_cost/num_keys:.2f}")
+        @common.fragment
+        def kms_cost_calculator():
+            st.markdown("### 📊 Cost Calculator")
+            num_keys = st.slider("Number of Customer Keys:", 1, 100, 10)
+            requests_per_month = st.slider("API Requests per Month:", 1000, 10000000, 100000)
+        
+            # KMS pricing calculation
+            key_cost = num_keys * 1.00  # $1 per key per month
+            request_cost = (requests_per_month / 20000) * 0.03  # $0.03 per 20,000 requests
+            total_monthly_cost = key_cost + request_cost
+        
+            col3, col4 = st.columns(2)
+            with col3:
+                st.metric("Key Storage Cost", f"${key_cost:.2f}/month")
+                st.metric("Request Cost", f"${request_cost:.2f}/month")
+            with col4:
+                st.metric("Total Monthly Cost", f"${total_monthly_cost:.2f}")
+                st.metric("Cost per Key", f"${total_monthly_cost/num_keys:.2f}")
+
+        kms_cost_calculator()
     
     with col2:
         # Cost optimization recommendations
@@ -2065,6 +2028,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def privatelink_tab():
     """Content for AWS PrivateLink tab"""
     st.markdown("## 🔗 AWS PrivateLink")
@@ -2246,21 +2210,7 @@ def privatelink_tab():
     # PrivateLink Use Cases
     st.markdown("### 🌟 Common PrivateLink Use Cases")
     
-    use_cases_data = {
-        'Use Case': ['Database Access', 'API Gateway', 'Microservices', 'Data Analytics', 'Compliance'],
-        'Service Type': ['Interface Endpoint', 'Interface Endpoint', 'Custom Service', 'Gateway Endpoint', 'Interface Endpoint'],
-        'Primary Benefit': ['Security', 'Performance', 'Isolation', 'Cost', 'Compliance'],
-        'Example Services': [
-            'RDS, Aurora via EC2 API',
-            'API Gateway REST APIs',
-            'Cross-VPC service calls',
-            'S3, DynamoDB access',
-            'CloudTrail, Config access'
-        ],
-        'Cost Impact': ['Medium', 'Low', 'High', 'None', 'Low']
-    }
-    
-    df_use_cases = pd.DataFrame(use_cases_data)
+    df_use_cases = catalog.table("privatelink.use_cases")
     st.dataframe(df_use_cases, use_container_width=True)
     
     # Performance Comparison
@@ -2699,6 +2649,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def certificate_manager_tab():
     """Content for AWS Certificate Manager tab"""
     st.markdown("## 📜 AWS Certificate Manager (ACM)")
@@ -2839,21 +2790,7 @@ def certificate_manager_tab():
     # Certificate Usage by Service
     st.markdown("### 🔗 ACM Certificate Usage by AWS Service")
     
-    service_usage_data = {
-        'AWS Service': ['CloudFront', 'Application Load Balancer', 'API Gateway', 'Elastic Beanstalk', 'CloudFormation'],
-        'Certificate Type': ['Public/Private', 'Public/Private', 'Public', 'Public', 'Public/Private'],
-        'Automatic Deployment': ['✅ Yes', '✅ Yes', '✅ Yes', '✅ Yes', '⚠️ Template Required'],
-        'Renewal Handling': ['Automatic', 'Automatic', 'Automatic', 'Automatic', 'Automatic'],
-        'Regional Requirement': [
-            'us-east-1 (Global)',
-            'Same region as ALB',
-            'us-east-1 (Edge)',
-            'Same region as app',
-            'Template specified'
-        ]
-    }
-    
-    df_service_usage = pd.DataFrame(service_usage_data)
+    df_service_usage = catalog.table("certificate_manager.service_usage")
     st.dataframe(df_service_usage, use_container_width=True)
     
     # Validation Methods Comparison
@@ -3403,6 +3340,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def s3_security_tab():
     """Content for Amazon S3 Security tab"""
     st.markdown("## 🗂️ Amazon S3 - Presigned URLs, CORS, & OAI")
@@ -3626,85 +3564,74 @@ def s3_security_tab():
         st.markdown('</div>', unsafe_allow_html=True)
     
     with col2:
-        st.markdown("### 🛠️ OAI Setup Simulator")
+        @common.fragment
+        def oai_setup_simulator():
+            st.markdown("### 🛠️ OAI Setup Simulator")
         
-        cloudfront_dist_id = st.text_input("CloudFront Distribution ID:", "E1234567890ABC")
-        s3_bucket_for_oai = st.text_input("S3 Bucket Name:", "my-content-bucket")
-        oai_comment = st.text_input("OAI Comment:", "OAI for my website content")
+            cloudfront_dist_id = st.text_input("CloudFront Distribution ID:", "E1234567890ABC")
+            s3_bucket_for_oai = st.text_input("S3 Bucket Name:", "my-content-bucket")
+            oai_comment = st.text_input("OAI Comment:", "OAI for my website content")
         
-        block_public_access = st.checkbox("Block Public Access to S3", value=True)
+            block_public_access = st.checkbox("Block Public Access to S3", value=True)
         
-        if st.button("🔐 Configure OAI", use_container_width=True):
-            oai_id = f"E{np.random.randint(100000000000, 999999999999)}"
+            if st.button("🔐 Configure OAI", use_container_width=True):
+                oai_id = f"E{np.random.randint(100000000000, 999999999999)}"
             
-            # Generate bucket policy for OAI
-            bucket_policy = {
-                "Version": "2012-10-17",
-                "Statement": [
-                    {
-                        "Effect": "Allow",
-                        "Principal": {
-                            "AWS": f"arn:aws:iam::cloudfront:user/CloudFront Origin Access Identity {oai_id}"
-                        },
-                        "Action": "s3:GetObject",
-                        "Resource": f"arn:aws:s3:::{s3_bucket_for_oai}/*"
-                    }
-                ]
-            }
+                # Generate bucket policy for OAI
+                bucket_policy = {
+                    "Version": "2012-10-17",
+                    "Statement": [
+                        {
+                            "Effect": "Allow",
+                            "Principal": {
+                                "AWS": f"arn:aws:iam::cloudfront:user/CloudFront Origin Access Identity {oai_id}"
+                            },
+                            "Action": "s3:GetObject",
+                            "Resource": f"arn:aws:s3:::{s3_bucket_for_oai}/*"
+                        }
+                    ]
+                }
             
-            if block_public_access:
-                bucket_policy["Statement"].append({
-                    "Effect": "Deny",
-                    "Principal": "*",
-                    "Action": "s3:*",
-                    "Resource": [
-                        f"arn:aws:s3:::{s3_bucket_for_oai}",
-                        f"arn:aws:s3:::{s3_bucket_for_oai}/*"
-                    ],
-                    "Condition": {
-                        "StringNotEquals": {
-                            "AWS:SourceAccount": "123456789012"
+                if block_public_access:
+                    bucket_policy["Statement"].append({
+                        "Effect": "Deny",
+                        "Principal": "*",
+                        "Action": "s3:*",
+                        "Resource": [
+                            f"arn:aws:s3:::{s3_bucket_for_oai}",
+                            f"arn:aws:s3:::{s3_bucket_for_oai}/*"
+                        ],
+                        "Condition": {
+                            "StringNotEquals": {
+                                "AWS:SourceAccount": "123456789012"
+                            }
                         }
-                    }
-                })
+                    })
             
             
-            st.markdown('<div class="security-box">', unsafe_allow_html=True)
-            st.markdown(f"""
-            ### ✅ OAI Configuration Complete!
+                st.markdown('<div class="security-box">', unsafe_allow_html=True)
+                st.markdown(f"""
+                ### ✅ OAI Configuration Complete!
             
-            **OAI Details:**
-            - **OAI ID**: {oai_id}
-            - **Distribution**: {cloudfront_dist_id}
-            - **Bucket**: {s3_bucket_for_oai}
-            - **Public Access**: {'Blocked' if block_public_access else 'Allowed'}
+                **OAI Details:**
+                - **OAI ID**: {oai_id}
+                - **Distribution**: {cloudfront_dist_id}
+                - **Bucket**: {s3_bucket_for_oai}
+                - **Public Access**: {'Blocked' if block_public_access else 'Allowed'}
             
-            **Required Bucket Policy:**
-            ```json
-            {bucket_policy}
-            ```
-            """)
-            st.markdown('</div>', unsafe_allow_html=True)
+                **Required Bucket Policy:**
+                ```json
+                {bucket_policy}
+                ```
+                """)
+                st.markdown('</div>', unsafe_allow_html=True)
+
+        oai_setup_simulator()
     
     # Security Features Comparison
     st.markdown("### 🔍 S3 Security Features Comparison")
     
-    security_comparison = {
-        'Feature': ['Presigned URLs', 'CORS', 'OAI', 'Bucket Policies', 'IAM Policies'],
-        'Access Control': ['Temporary', 'Browser-based', 'CloudFront-only', 'Resource-level', 'Identity-based'],
-        'Use Case': [
-            'File sharing, uploads',
-            'Web app integration',
-            'CDN content delivery',
-            'Resource permissions',
-            'User/role permissions'
-        ],
-        'Duration': ['Time-limited', 'Permanent', 'Permanent', 'Permanent', 'Permanent'],
-        'Complexity': ['Low', 'Medium', 'Medium', 'High', 'High'],
-        'Security Level': ['High', 'Medium', 'Very High', 'Very High', 'Very High']
-    }
-    
-    df_security = pd.DataFrame(security_comparison)
+    df_security = catalog.table("s3_security.security_comparison")
     st.dataframe(df_security, use_container_width=True)
     
     # Best Practices
@@ -4241,6 +4168,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def main():
     """Main application function"""
     # Apply styling
@@ -4264,32 +4192,14 @@ def main():
                 </div>""", unsafe_allow_html=True)
     
     # Create tabs
-    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
-        "🛡️ AWS WAF", 
-        "🔐 Secrets Manager", 
-        "🔑 AWS KMS",
-        "🔗 AWS PrivateLink",
-        "📜 Certificate Manager",
-        "🗂️ S3 Security"
-    ])
-    
-    with tab1:
-        aws_waf_tab()
-    
-    with tab2:
-        secrets_manager_tab()
-    
-    with tab3:
-        kms_tab()
-    
-    with tab4:
-        privatelink_tab()
-        
-    with tab5:
-        certificate_manager_tab()
-        
-    with tab6:
-        s3_security_tab()
+    common.tab_router({
+        "🛡️ AWS WAF": aws_waf_tab,
+        "🔐 Secrets Manager": secrets_manager_tab,
+        "🔑 AWS KMS": kms_tab,
+        "🔗 AWS PrivateLink": privatelink_tab,
+        "📜 Certificate Manager": certificate_manager_tab,
+        "🗂️ S3 Security": s3_security_tab,
+    })
     
     # Footer
     st.markdown("""
@@ -1,14 +1,16 @@
 
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import json
 import utils.common as common
+import utils.catalog as catalog
 import utils.authenticate as authenticate
 
+# Heavy libraries are imported when a tab first uses them
+np = common.lazy_import("numpy")
+px = common.lazy_import("plotly.express")
+go = common.lazy_import("plotly.graph_objects")
+make_subplots = common.lazy_import("plotly.subplots", "make_subplots")
+
 # Page configuration
 st.set_page_config(
     page_title="AWS IAM & Security Hub",
@@ -31,8 +33,7 @@ AWS_COLORS = {
 
 def apply_custom_styles():
     """Apply custom CSS styling with AWS color scheme"""
-    st.markdown(f"""
-    <style>
+    common.stylesheet(f"""
         .main {{
             background-color: {AWS_COLORS['light_gray']};
         }}
@@ -159,8 +160,7 @@ def apply_custom_styles():
             border-radius: 8px;
             margin: 5px 0;
         }}
-    </style>
-    """, unsafe_allow_html=True)
+    """)
 
 def create_sidebar():
     """Create sidebar with app information and controls"""
@@ -331,6 +331,7 @@ def create_policy_types_mermaid():
         style K fill:#3FB34F,stroke:#232F3E,color:#fff
     """
 
+@common.profiled
 def aws_iam_tab():
     """Content for AWS Identity and Access Management tab"""
     st.markdown("## 🔐 AWS Identity and Access Management")
@@ -478,53 +479,57 @@ def aws_iam_tab():
     common.mermaid(create_policy_types_mermaid(), height=1250)
     
     # Interactive Permission Calculator
-    st.markdown("### 🧮 Permission Effectiveness Calculator")
+    @common.fragment
+    def permission_effectiveness_calculator():
+        st.markdown("### 🧮 Permission Effectiveness Calculator")
     
-    col1, col2, col3 = st.columns(3)
+        col1, col2, col3 = st.columns(3)
     
-    with col1:
-        st.markdown("**Identity-based Policy**")
-        identity_allow = st.selectbox("Identity Policy:", ["Allow", "Deny", "Not Specified"], key="identity")
+        with col1:
+            st.markdown("**Identity-based Policy**")
+            identity_allow = st.selectbox("Identity Policy:", ["Allow", "Deny", "Not Specified"], key="identity")
         
-    with col2:
-        st.markdown("**Resource-based Policy**")
-        resource_allow = st.selectbox("Resource Policy:", ["Allow", "Deny", "Not Specified"], key="resource")
+        with col2:
+            st.markdown("**Resource-based Policy**")
+            resource_allow = st.selectbox("Resource Policy:", ["Allow", "Deny", "Not Specified"], key="resource")
         
-    with col3:
-        st.markdown("**Permission Boundary**")
-        boundary_allow = st.selectbox("Permission Boundary:", ["Allow", "Deny", "Not Specified"], key="boundary")
-    
-    if st.button("🔍 Calculate Final Permission"):
-        # IAM evaluation logic
-        if identity_allow == "Deny" or resource_allow == "Deny" or boundary_allow == "Deny":
-            result = "❌ DENIED"
-            reason = "Explicit deny always wins"
-            color_class = "permission-denied"
-        elif identity_allow == "Allow" or resource_allow == "Allow":
-            if boundary_allow == "Allow" or boundary_allow == "Not Specified":
-                result = "✅ ALLOWED"
-                reason = "Permission granted by policy"
-                color_class = "permission-granted"
+        with col3:
+            st.markdown("**Permission Boundary**")
+            boundary_allow = st.selectbox("Permission Boundary:", ["Allow", "Deny", "Not Specified"], key="boundary")
+    
+        if st.button("🔍 Calculate Final Permission"):
+            # IAM evaluation logic
+            if identity_allow == "Deny" or resource_allow == "Deny" or boundary_allow == "Deny":
+                result = "❌ DENIED"
+                reason = "Explicit deny always wins"
+                color_class = "permission-denied"
+            elif identity_allow == "Allow" or resource_allow == "Allow":
+                if boundary_allow == "Allow" or boundary_allow == "Not Specified":
+                    result = "✅ ALLOWED"
+                    reason = "Permission granted by policy"
+                    color_class = "permission-granted"
+                else:
+                    result = "❌ DENIED"
+                    reason = "Permission boundary restricts access"
+                    color_class = "permission-denied"
             else:
                 result = "❌ DENIED"
-                reason = "Permission boundary restricts access"
+                reason = "No explicit allow (implicit deny)"
                 color_class = "permission-denied"
-        else:
-            result = "❌ DENIED"
-            reason = "No explicit allow (implicit deny)"
-            color_class = "permission-denied"
         
-        st.markdown(f'<div class="{color_class}">', unsafe_allow_html=True)
-        st.markdown(f"""
-        ### {result}
-        **Reason**: {reason}
+            st.markdown(f'<div class="{color_class}">', unsafe_allow_html=True)
+            st.markdown(f"""
+            ### {result}
+            **Reason**: {reason}
         
-        **Evaluation Order**:
-        1. Check for explicit deny → {identity_allow}, {resource_allow}, {boundary_allow}
-        2. Check for explicit allow → {identity_allow}, {resource_allow}
-        3. Apply permission boundaries → {boundary_allow}
-        """)
-        st.markdown('</div>', unsafe_allow_html=True)
+            **Evaluation Order**:
+            1. Check for explicit deny → {identity_allow}, {resource_allow}, {boundary_allow}
+            2. Check for explicit allow → {identity_allow}, {resource_allow}
+            3. Apply permission boundaries → {boundary_allow}
+            """)
+            st.markdown('</div>', unsafe_allow_html=True)
+
+    permission_effectiveness_calculator()
     
     # Code Example
     st.markdown("### 💻 Code Example: IAM User and Role Management")
@@ -796,6 +801,7 @@ print("  - Monitor usage with CloudTrail")
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def iam_policy_interpretation_tab():
     """Content for IAM Policy Interpretation tab"""
     st.markdown("## 📜 IAM Policy Interpretation")
@@ -997,64 +1003,49 @@ def iam_policy_interpretation_tab():
     # Common Policy Patterns
     st.markdown("### 🎨 Common Policy Patterns")
     
-    patterns_data = {
-        'Pattern': ['Read-Only Access', 'Time-Based Access', 'IP Restriction', 'MFA Required', 'Tag-Based Access'],
-        'Use Case': [
-            'Auditors, reporting users',
-            'Business hours only',
-            'Office network only', 
-            'Administrative actions',
-            'Environment-based access'
-        ],
-        'Key Condition': [
-            'Only Get/List actions',
-            'DateGreaterThan/LessThan',
-            'IpAddress condition',
-            'aws:MultiFactorAuthPresent',
-            'aws:ResourceTag/Environment'
-        ],
-        'Security Level': ['Low', 'Medium', 'High', 'High', 'Medium']
-    }
-    
-    df_patterns = pd.DataFrame(patterns_data)
+    df_patterns = catalog.table("iam_policy_interpretation.patterns")
     st.dataframe(df_patterns, use_container_width=True)
     
     # Policy Testing Simulator
-    st.markdown("### 🧪 Policy Testing Simulator")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("**Test Parameters**")
-        sim_user = st.text_input("User:", "arn:aws:iam::123456789012:user/developer")
-        sim_action = st.text_input("Action:", "s3:GetObject") 
-        sim_resource = st.text_input("Resource:", "arn:aws:s3:::my-bucket/file.txt")
-    
-    with col2:
-        st.markdown("**Context**")
-        sim_time = st.selectbox("Time:", ["Business Hours", "After Hours", "Weekend"])
-        sim_ip = st.text_input("Source IP:", "192.168.1.100")
-        sim_mfa = st.selectbox("MFA Status:", ["Present", "Not Present"])
-    
-    with col3:
-        st.markdown("**Environment**")
-        sim_region = st.selectbox("Region:", ["us-east-1", "us-west-2", "eu-west-1"])
-        sim_instance_type = st.text_input("Instance Type:", "t3.micro")
-        
-    if st.button("🎯 Simulate Policy Evaluation"):
-        # Simulate policy evaluation logic
-        result = simulate_policy_evaluation(selected_policy, {
-            'user': sim_user,
-            'action': sim_action,
-            'resource': sim_resource,
-            'time': sim_time,
-            'ip': sim_ip,
-            'mfa': sim_mfa,
-            'region': sim_region,
-            'instance_type': sim_instance_type
-        })
-        
-        display_simulation_result(result)
+    @common.fragment
+    def policy_testing_simulator():
+        st.markdown("### 🧪 Policy Testing Simulator")
+    
+        col1, col2, col3 = st.columns(3)
+    
+        with col1:
+            st.markdown("**Test Parameters**")
+            sim_user = st.text_input("User:", "arn:aws:iam::123456789012:user/developer")
+            sim_action = st.text_input("Action:", "s3:GetObject") 
+            sim_resource = st.text_input("Resource:", "arn:aws:s3:::my-bucket/file.txt")
+    
+        with col2:
+            st.markdown("**Context**")
+            sim_time = st.selectbox("Time:", ["Business Hours", "After Hours", "Weekend"])
+            sim_ip = st.text_input("Source IP:", "192.168.1.100")
+            sim_mfa = st.selectbox("MFA Status:", ["Present", "Not Present"])
+    
+        with col3:
+            st.markdown("**Environment**")
+            sim_region = st.selectbox("Region:", ["us-east-1", "us-west-2", "eu-west-1"])
+            sim_instance_type = st.text_input("Instance Type:", "t3.micro")
+        
+        if st.button("🎯 Simulate Policy Evaluation"):
+            # Simulate policy evaluation logic
+            result = simulate_policy_evaluation(selected_policy, {
+                'user': sim_user,
+                'action': sim_action,
+                'resource': sim_resource,
+                'time': sim_time,
+                'ip': sim_ip,
+                'mfa': sim_mfa,
+                'region': sim_region,
+                'instance_type': sim_instance_type
+            })
+        
+            display_simulation_result(result)
+
+    policy_testing_simulator()
     
     # Code Example
     st.markdown("### 💻 Code Example: Policy Analysis and Testing")
@@ -1532,6 +1523,7 @@ def display_simulation_result(simulation):
         else:
             st.markdown(f"⏭️ **Statement {step['statement']}**: {step['reason']}")
 
+@common.profiled
 def resource_policy_interpretation_tab():
     """Content for Resource Policy Interpretation tab"""
     st.markdown("## 🛡️ Resource Policy Interpretation")
@@ -2186,6 +2178,7 @@ def generate_resource_policy(resource_type, purpose, principal_type, principal_v
     
     return policy
 
+@common.profiled
 def iam_permissions_example_tab():
     """Content for IAM Permissions Example tab"""
     st.markdown("## ⚙️ IAM Permissions – Example")
@@ -2330,66 +2323,39 @@ def iam_permissions_example_tab():
         """)
     
     # Interactive Permission Tester
-    st.markdown("### 🧪 Permission Testing Simulator")
+    @common.fragment
+    def permission_testing_simulator():
+        st.markdown("### 🧪 Permission Testing Simulator")
     
-    col1, col2, col3 = st.columns(3)
+        col1, col2, col3 = st.columns(3)
     
-    with col1:
-        st.markdown("**Trust Policy Check**")
-        trust_service = st.selectbox("Service in Trust Policy:", [
-            "vpc-flow-logs.amazonaws.com", "ec2.amazonaws.com", "lambda.amazonaws.com", "None"
-        ])
+        with col1:
+            st.markdown("**Trust Policy Check**")
+            trust_service = st.selectbox("Service in Trust Policy:", [
+                "vpc-flow-logs.amazonaws.com", "ec2.amazonaws.com", "lambda.amazonaws.com", "None"
+            ])
         
-    with col2:
-        st.markdown("**Permissions Check**")
-        permissions = st.multiselect("Granted Permissions:", [
-            "logs:CreateLogGroup", "logs:CreateLogStream", "logs:PutLogEvents",
-            "logs:DescribeLogGroups", "s3:PutObject"
-        ])
+        with col2:
+            st.markdown("**Permissions Check**")
+            permissions = st.multiselect("Granted Permissions:", [
+                "logs:CreateLogGroup", "logs:CreateLogStream", "logs:PutLogEvents",
+                "logs:DescribeLogGroups", "s3:PutObject"
+            ])
     
-    with col3:
-        st.markdown("**Resource Access**")
-        log_group_access = st.selectbox("Log Group Access:", ["Full Access (*)", "Specific ARN", "Denied"])
+        with col3:
+            st.markdown("**Resource Access**")
+            log_group_access = st.selectbox("Log Group Access:", ["Full Access (*)", "Specific ARN", "Denied"])
     
-    if st.button("🎯 Test Permissions"):
-        test_result = test_flow_logs_permissions(trust_service, permissions, log_group_access)
-        display_permission_test_result(test_result)
+        if st.button("🎯 Test Permissions"):
+            test_result = test_flow_logs_permissions(trust_service, permissions, log_group_access)
+            display_permission_test_result(test_result)
+
+    permission_testing_simulator()
     
     # Common IAM Issues and Solutions
     st.markdown("### 🚨 Common IAM Issues & Solutions")
     
-    issues_data = {
-        'Issue': [
-            'AccessDenied for logs:PutLogEvents',
-            'Role cannot be assumed',
-            'Flow logs created but no data',
-            'Partial log delivery',
-            'Rate limiting errors'
-        ],
-        'Root Cause': [
-            'Missing CloudWatch permissions',
-            'Incorrect trust policy',
-            'Wrong log group ARN',
-            'Insufficient permissions',
-            'Too many requests'
-        ],
-        'Solution': [
-            'Add logs:* permissions to role',
-            'Fix trust policy to allow vpc-flow-logs service',
-            'Verify log group exists and ARN is correct',
-            'Add DescribeLogGroups permission',
-            'Implement exponential backoff'
-        ],
-        'Prevention': [
-            'Use AWS managed policies when possible',
-            'Always test trust relationships',
-            'Validate resource ARNs',
-            'Grant all required permissions',
-            'Monitor CloudWatch metrics'
-        ]
-    }
-    
-    df_issues = pd.DataFrame(issues_data)
+    df_issues = catalog.table("iam_permissions_example.issues")
     st.dataframe(df_issues, use_container_width=True)
     
     # Real-world Troubleshooting Guide
@@ -2936,6 +2902,7 @@ def display_permission_test_result(result):
         """)
         st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def main():
     """Main application function"""
     # Apply styling
@@ -2956,24 +2923,12 @@ def main():
                 </div>""", unsafe_allow_html=True)
     
     # Create tabs
-    tab1, tab2, tab3, tab4 = st.tabs([
-        "🔐 AWS Identity and Access Management",
-        "📜 IAM Policy Interpretation", 
-        "🛡️ Resource Policy Interpretation",
-        "⚙️ IAM Permissions – Example"
-    ])
-    
-    with tab1:
-        aws_iam_tab()
-    
-    with tab2:
-        iam_policy_interpretation_tab()
-    
-    with tab3:
-        resource_policy_interpretation_tab()
-    
-    with tab4:
-        iam_permissions_example_tab()
+    common.tab_router({
+        "🔐 AWS Identity and Access Management": aws_iam_tab,
+        "📜 IAM Policy Interpretation": iam_policy_interpretation_tab,
+        "🛡️ Resource Policy Interpretation": resource_policy_interpretation_tab,
+        "⚙️ IAM Permissions – Example": iam_permissions_example_tab,
+    })
     
     # Footer
     st.markdown("""
@@ -1,15 +1,18 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import utils.common as common
+import utils.catalog as catalog
 import utils.authenticate as authenticate
 import json
 from datetime import datetime, timedelta
 import random
 
+# Heavy libraries are imported when a tab first uses them
+pd = common.lazy_import("pandas")
+np = common.lazy_import("numpy")
+px = common.lazy_import("plotly.express")
+go = common.lazy_import("plotly.graph_objects")
+make_subplots = common.lazy_import("plotly.subplots", "make_subplots")
+
 # Page configuration
 st.set_page_config(
     page_title="AWS X-Ray Monitoring Hub",
@@ -33,8 +36,7 @@ AWS_COLORS = {
 
 def apply_custom_styles():
     """Apply custom CSS styling with AWS color scheme"""
-    st.markdown(f"""
-    <style>
+    common.stylesheet(f"""
         .main {{
             background-color: {AWS_COLORS['light_gray']};
         }}
@@ -161,8 +163,7 @@ def apply_custom_styles():
             margin: 10px 0;
             box-shadow: 0 2px 6px rgba(0,0,0,0.1);
         }}
-    </style>
-    """, unsafe_allow_html=True)
+    """)
 
 def create_sidebar():
     """Create sidebar with app information and controls"""
@@ -293,6 +294,7 @@ def create_error_classification_mermaid():
         style G fill:#F39C12,stroke:#232F3E,color:#fff
     """
 
+@common.profiled
 def aws_xray_tab():
     """Content for AWS X-Ray tab"""
     st.markdown("## 🔍 AWS X-Ray")
@@ -450,36 +452,14 @@ def aws_xray_tab():
     # Supported Services
     st.markdown("### 🛠️ AWS Services with X-Ray Integration")
     
-    services_data = {
-        'Service Category': ['Compute', 'Compute', 'Storage', 'Database', 'Integration', 'Analytics'],
-        'AWS Service': ['Amazon EC2', 'AWS Lambda', 'Amazon S3', 'Amazon DynamoDB', 'Amazon API Gateway', 'Amazon Kinesis'],
-        'Integration Type': ['SDK/Agent', 'Built-in', 'SDK', 'Built-in', 'Built-in', 'SDK'],
-        'Tracing Capability': ['Full', 'Full', 'Basic', 'Full', 'Full', 'Basic'],
-        'Common Use Cases': [
-            'Web applications, APIs',
-            'Serverless functions', 
-            'File operations tracking',
-            'Database performance',
-            'API request tracing',
-            'Stream processing'
-        ]
-    }
-    
-    df_services = pd.DataFrame(services_data)
+    df_services = catalog.table("aws_xray.services")
     st.dataframe(df_services, use_container_width=True)
     
     # Sample Trace Visualization
     st.markdown("### 📈 Sample Trace Timeline")
     
     # Create a sample trace timeline
-    trace_data = {
-        'Service': ['ALB', 'EC2 Web App', 'DynamoDB', 'S3', 'Lambda', 'RDS'],
-        'Start_Time': [0, 5, 15, 20, 35, 40],
-        'Duration': [5, 40, 10, 15, 10, 8],
-        'Status': ['Success', 'Success', 'Success', 'Success', 'Success', 'Success']
-    }
-    
-    df_trace = pd.DataFrame(trace_data)
+    df_trace = catalog.table("aws_xray.trace")
     df_trace['End_Time'] = df_trace['Start_Time'] + df_trace['Duration']
     
     fig = px.timeline(df_trace, x_start='Start_Time', x_end='End_Time', y='Service', 
@@ -701,6 +681,7 @@ if __name__ == '__main__':
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def xray_key_concepts_tab():
     """Content for AWS X-Ray Key Concepts tab"""
     st.markdown("## 🧩 AWS X-Ray - Key Concepts")
@@ -1292,6 +1273,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def xray_errors_tab():
     """Content for AWS X-Ray Errors, Faults, and Exceptions tab"""
     st.markdown("## ⚠️ AWS X-Ray - Errors, Faults, and Exceptions")
@@ -1377,136 +1359,140 @@ def xray_errors_tab():
         st.markdown('</div>', unsafe_allow_html=True)
     
     # Interactive Error Simulator
-    st.markdown("### 🎮 Interactive Error Analysis Simulator")
-    
-    col1, col2 = st.columns(2)
+    @common.fragment
+    def interactive_error_analysis_simulator():
+        st.markdown("### 🎮 Interactive Error Analysis Simulator")
     
-    with col1:
-        st.markdown("### 🔧 Error Scenario Configuration")
-        error_scenario = st.selectbox("Select Error Scenario:", [
-            "Database Connection Failure",
-            "Invalid User Input", 
-            "API Rate Limiting",
-            "Downstream Service Timeout",
-            "Authentication Failure",
-            "Resource Not Found",
-            "Payment Processing Error"
-        ])
-        
-        error_frequency = st.slider("Error Rate (%):", 1, 50, 5)
-        simulate_duration = st.selectbox("Simulation Duration:", [
-            "1 hour", "6 hours", "24 hours", "1 week"
-        ])
+        col1, col2 = st.columns(2)
     
-    with col2:
-        st.markdown("### 📊 Application Context")
-        app_type = st.selectbox("Application Type:", [
-            "E-commerce Website", "REST API", "Mobile Backend", "Data Pipeline"
-        ])
-        
-        traffic_volume = st.selectbox("Traffic Volume:", [
-            "Low (< 1K req/hour)", "Medium (1K-10K req/hour)", 
-            "High (10K-100K req/hour)", "Very High (> 100K req/hour)"
-        ])
+        with col1:
+            st.markdown("### 🔧 Error Scenario Configuration")
+            error_scenario = st.selectbox("Select Error Scenario:", [
+                "Database Connection Failure",
+                "Invalid User Input", 
+                "API Rate Limiting",
+                "Downstream Service Timeout",
+                "Authentication Failure",
+                "Resource Not Found",
+                "Payment Processing Error"
+            ])
+        
+            error_frequency = st.slider("Error Rate (%):", 1, 50, 5)
+            simulate_duration = st.selectbox("Simulation Duration:", [
+                "1 hour", "6 hours", "24 hours", "1 week"
+            ])
     
-    if st.button("🚀 Simulate Error Analysis", use_container_width=True):
-        # Generate error analysis based on scenario
-        error_mappings = {
-            "Database Connection Failure": {
-                "primary_type": "Fault", "status_code": 503, "avg_duration": 5000,
-                "impact": "High", "urgency": "Critical"
-            },
-            "Invalid User Input": {
-                "primary_type": "Error", "status_code": 400, "avg_duration": 50,
-                "impact": "Low", "urgency": "Low"
-            },
-            "API Rate Limiting": {
-                "primary_type": "Throttle", "status_code": 429, "avg_duration": 100,
-                "impact": "Medium", "urgency": "Medium"
-            },
-            "Downstream Service Timeout": {
-                "primary_type": "Fault", "status_code": 504, "avg_duration": 30000,
-                "impact": "High", "urgency": "High"
-            },
-            "Authentication Failure": {
-                "primary_type": "Error", "status_code": 401, "avg_duration": 25,
-                "impact": "Medium", "urgency": "Medium"
-            },
-            "Resource Not Found": {
-                "primary_type": "Error", "status_code": 404, "avg_duration": 10,
-                "impact": "Low", "urgency": "Low"
-            },
-            "Payment Processing Error": {
-                "primary_type": "Fault", "status_code": 502, "avg_duration": 2000,
-                "impact": "Critical", "urgency": "Critical"
+        with col2:
+            st.markdown("### 📊 Application Context")
+            app_type = st.selectbox("Application Type:", [
+                "E-commerce Website", "REST API", "Mobile Backend", "Data Pipeline"
+            ])
+        
+            traffic_volume = st.selectbox("Traffic Volume:", [
+                "Low (< 1K req/hour)", "Medium (1K-10K req/hour)", 
+                "High (10K-100K req/hour)", "Very High (> 100K req/hour)"
+            ])
+    
+        if st.button("🚀 Simulate Error Analysis", use_container_width=True):
+            # Generate error analysis based on scenario
+            error_mappings = {
+                "Database Connection Failure": {
+                    "primary_type": "Fault", "status_code": 503, "avg_duration": 5000,
+                    "impact": "High", "urgency": "Critical"
+                },
+                "Invalid User Input": {
+                    "primary_type": "Error", "status_code": 400, "avg_duration": 50,
+                    "impact": "Low", "urgency": "Low"
+                },
+                "API Rate Limiting": {
+                    "primary_type": "Throttle", "status_code": 429, "avg_duration": 100,
+                    "impact": "Medium", "urgency": "Medium"
+                },
+                "Downstream Service Timeout": {
+                    "primary_type": "Fault", "status_code": 504, "avg_duration": 30000,
+                    "impact": "High", "urgency": "High"
+                },
+                "Authentication Failure": {
+                    "primary_type": "Error", "status_code": 401, "avg_duration": 25,
+                    "impact": "Medium", "urgency": "Medium"
+                },
+                "Resource Not Found": {
+                    "primary_type": "Error", "status_code": 404, "avg_duration": 10,
+                    "impact": "Low", "urgency": "Low"
+                },
+                "Payment Processing Error": {
+                    "primary_type": "Fault", "status_code": 502, "avg_duration": 2000,
+                    "impact": "Critical", "urgency": "Critical"
+                }
             }
-        }
-        
-        error_data = error_mappings[error_scenario]
         
-        # Calculate impact metrics
-        traffic_multipliers = {
-            "Low": 500, "Medium": 5000, "High": 50000, "Very High": 500000
-        }
+            error_data = error_mappings[error_scenario]
         
-        hourly_requests = traffic_multipliers[traffic_volume.split()[0]]
-        affected_requests = int(hourly_requests * (error_frequency / 100))
+            # Calculate impact metrics
+            traffic_multipliers = {
+                "Low": 500, "Medium": 5000, "High": 50000, "Very High": 500000
+            }
         
-        # Determine cost impact
-        error_cost_impact = {
-            "Low": 0.1, "Medium": 0.5, "High": 2.0, "Critical": 10.0
-        }
+            hourly_requests = traffic_multipliers[traffic_volume.split()[0]]
+            affected_requests = int(hourly_requests * (error_frequency / 100))
         
-        daily_cost_impact = error_cost_impact[error_data["impact"]] * 24
+            # Determine cost impact
+            error_cost_impact = {
+                "Low": 0.1, "Medium": 0.5, "High": 2.0, "Critical": 10.0
+            }
         
-        st.markdown('<div class="highlight-box">', unsafe_allow_html=True)
-        st.markdown(f"""
-        ### 📊 Error Analysis Results
-        
-        **Error Classification:**
-        - **Type**: {error_data['primary_type']} ({error_data['status_code']})
-        - **Scenario**: {error_scenario}
-        - **Average Duration**: {error_data['avg_duration']}ms
-        - **Business Impact**: {error_data['impact']}
-        - **Response Urgency**: {error_data['urgency']}
-        
-        **Impact Metrics:**
-        - **Affected Requests/Hour**: {affected_requests:,}
-        - **Error Rate**: {error_frequency}%
-        - **Estimated Daily Cost Impact**: ${daily_cost_impact:.2f}
-        
-        **Recommended Actions:**
-        - Set up X-Ray error alerts for {error_data['status_code']} responses
-        - Monitor error trends in X-Ray service map
-        - Implement retry logic for transient failures
-        """)
-        st.markdown('</div>', unsafe_allow_html=True)
+            daily_cost_impact = error_cost_impact[error_data["impact"]] * 24
         
-        # Generate sample error timeline
-        hours = list(range(24))
-        base_errors = [affected_requests] * 24
+            st.markdown('<div class="highlight-box">', unsafe_allow_html=True)
+            st.markdown(f"""
+            ### 📊 Error Analysis Results
+        
+            **Error Classification:**
+            - **Type**: {error_data['primary_type']} ({error_data['status_code']})
+            - **Scenario**: {error_scenario}
+            - **Average Duration**: {error_data['avg_duration']}ms
+            - **Business Impact**: {error_data['impact']}
+            - **Response Urgency**: {error_data['urgency']}
+        
+            **Impact Metrics:**
+            - **Affected Requests/Hour**: {affected_requests:,}
+            - **Error Rate**: {error_frequency}%
+            - **Estimated Daily Cost Impact**: ${daily_cost_impact:.2f}
+        
+            **Recommended Actions:**
+            - Set up X-Ray error alerts for {error_data['status_code']} responses
+            - Monitor error trends in X-Ray service map
+            - Implement retry logic for transient failures
+            """)
+            st.markdown('</div>', unsafe_allow_html=True)
         
-        # Add some variation to make it realistic
-        error_counts = [int(base + np.random.normal(0, base * 0.2)) for base in base_errors]
-        error_counts = [max(0, count) for count in error_counts]  # Ensure non-negative
+            # Generate sample error timeline
+            hours = list(range(24))
+            base_errors = [affected_requests] * 24
         
-        df_errors = pd.DataFrame({
-            'Hour': hours,
-            'Error_Count': error_counts,
-            'Error_Type': [error_data['primary_type']] * 24
-        })
+            # Add some variation to make it realistic
+            error_counts = [int(base + np.random.normal(0, base * 0.2)) for base in base_errors]
+            error_counts = [max(0, count) for count in error_counts]  # Ensure non-negative
         
-        fig = px.line(df_errors, x='Hour', y='Error_Count', 
-                     title=f'24-Hour Error Timeline: {error_scenario}',
-                     color='Error_Type', 
-                     color_discrete_map={
-                         'Error': AWS_COLORS['error'],
-                         'Fault': AWS_COLORS['fault'], 
-                         'Throttle': AWS_COLORS['warning']
-                     })
+            df_errors = pd.DataFrame({
+                'Hour': hours,
+                'Error_Count': error_counts,
+                'Error_Type': [error_data['primary_type']] * 24
+            })
         
-        fig.update_layout(height=300, xaxis_title="Hour of Day", yaxis_title="Error Count")
-        st.plotly_chart(fig, use_container_width=True)
+            fig = px.line(df_errors, x='Hour', y='Error_Count', 
+                         title=f'24-Hour Error Timeline: {error_scenario}',
+                         color='Error_Type', 
+                         color_discrete_map={
+                             'Error': AWS_COLORS['error'],
+                             'Fault': AWS_COLORS['fault'], 
+                             'Throttle': AWS_COLORS['warning']
+                         })
+        
+            fig.update_layout(height=300, xaxis_title="Hour of Day", yaxis_title="Error Count")
+            st.plotly_chart(fig, use_container_width=True)
+
+    interactive_error_analysis_simulator()
     
     # Exception Handling in X-Ray
     st.markdown("### 🔍 Exception Details in X-Ray")
@@ -1593,38 +1579,7 @@ def xray_errors_tab():
     # Common Error Patterns
     st.markdown("### 🔍 Common Error Patterns & Solutions")
     
-    error_patterns = {
-        'Pattern': [
-            'Cascading Failures', 'Timeout Errors', 'Authentication Spikes',
-            'Resource Exhaustion', 'Rate Limit Breaches', 'Data Validation Errors'
-        ],
-        'X-Ray Signature': [
-            'Multiple 5xx faults across services',
-            '504 errors with long durations', 
-            'Sudden 401/403 error increase',
-            '503 errors during peak traffic',
-            '429 errors in specific time windows',
-            '400 errors with consistent patterns'
-        ],
-        'Root Cause': [
-            'One service failure triggers others',
-            'Network latency or service overload',
-            'Auth service issues or token expiry',
-            'Memory/CPU limits reached',
-            'Traffic exceeds configured limits', 
-            'Invalid input data or API changes'
-        ],
-        'Solution Strategy': [
-            'Implement circuit breakers',
-            'Add retry logic with backoff',
-            'Monitor auth service health',
-            'Scale resources or optimize code',
-            'Adjust rate limits or implement queuing',
-            'Validate input and improve error messages'
-        ]
-    }
-    
-    df_patterns = pd.DataFrame(error_patterns)
+    df_patterns = catalog.table("xray_errors.error_patterns")
     st.dataframe(df_patterns, use_container_width=True)
     
     # Alerting and Monitoring
@@ -1997,6 +1952,7 @@ if __name__ == "__main__":
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def main():
     """Main application function"""
     # Apply styling
@@ -2020,20 +1976,11 @@ def main():
                 </div>""", unsafe_allow_html=True)
     
     # Create tabs
-    tab1, tab2, tab3 = st.tabs([
-        "🔍 AWS X-Ray", 
-        "🧩 Key Concepts", 
-        "⚠️ Errors, Faults & Exceptions"
-    ])
-    
-    with tab1:
-        aws_xray_tab()
-    
-    with tab2:
-        xray_key_concepts_tab()
-    
-    with tab3:
-        xray_errors_tab()
+    common.tab_router({
+        "🔍 AWS X-Ray": aws_xray_tab,
+        "🧩 Key Concepts": xray_key_concepts_tab,
+        "⚠️ Errors, Faults & Exceptions": xray_errors_tab,
+    })
     
     # Footer
     st.markdown("""
@@ -1,13 +1,15 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import json
 import utils.common as common
+import utils.catalog as catalog
 import utils.authenticate as authenticate
 
+# Heavy libraries are imported when a tab first uses them
+np = common.lazy_import("numpy")
+px = common.lazy_import("plotly.express")
+go = common.lazy_import("plotly.graph_objects")
+make_subplots = common.lazy_import("plotly.subplots", "make_subplots")
+
 # Page configuration
 st.set_page_config(
     page_title="AWS S3 Storage Solutions Hub",
@@ -29,8 +31,7 @@ AWS_COLORS = {
 
 def apply_custom_styles():
     """Apply custom CSS styling with AWS color scheme"""
-    st.markdown(f"""
-    <style>
+    common.stylesheet(f"""
         .main {{
             background-color: {AWS_COLORS['light_gray']};
         }}
@@ -138,8 +139,7 @@ def apply_custom_styles():
             color: white;
             margin: 10px 0;
         }}
-    </style>
-    """, unsafe_allow_html=True)
+    """)
 
 def create_sidebar():
     """Create sidebar with app information and controls"""
@@ -301,6 +301,7 @@ def create_bucket_policy_flow_mermaid():
         style D fill:#FF9900,stroke:#232F3E,color:#fff
     """
 
+@common.profiled
 def s3_overview_tab():
     """Content for Amazon S3 Overview tab"""
     st.markdown("## 🗂️ Amazon Simple Storage Service (S3)")
@@ -456,112 +457,81 @@ def s3_overview_tab():
     # S3 Use Cases
     st.markdown("### 🌟 Common S3 Use Cases")
     
-    use_cases_data = {
-        'Use Case': [
-            'Static Website Hosting',
-            'Data Backup & Archive',
-            'Data Lake Storage',
-            'Content Distribution',
-            'Application Data Storage',
-            'Disaster Recovery'
-        ],
-        'Storage Class': [
-            'S3 Standard',
-            'S3 Glacier Deep Archive',
-            'S3 Intelligent-Tiering',
-            'S3 Standard + CloudFront',
-            'S3 Standard-IA',
-            'S3 Standard + Cross-Region Replication'
-        ],
-        'Key Benefits': [
-            'Low latency, high throughput',
-            'Lowest cost for long-term storage',
-            'Automatic cost optimization',
-            'Global content delivery',
-            'Cost-effective for infrequent access',
-            'Geographic redundancy'
-        ],
-        'Typical Size': [
-            '1GB - 100GB',
-            '100GB - 100TB+',
-            '1TB - 1PB+',
-            '10GB - 1TB',
-            '100MB - 10TB',
-            '1GB - 100TB'
-        ]
-    }
-    
-    df_use_cases = pd.DataFrame(use_cases_data)
+    df_use_cases = catalog.table("s3_overview.use_cases")
     st.dataframe(df_use_cases, use_container_width=True)
     
     # Interactive Object Upload Simulator
-    st.markdown("### 📤 Interactive Object Upload Simulator")
+    @common.fragment
+    def interactive_object_upload_simulator():
+        st.markdown("### 📤 Interactive Object Upload Simulator")
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        file_type = st.selectbox("File Type:", [
-            "Image (JPEG/PNG)", "Document (PDF)", "Video (MP4)", 
-            "Archive (ZIP)", "Code (Python)", "Data (JSON/CSV)"
-        ])
-        
-        file_size = st.slider("File Size (MB):", 0.1, 5000.0, 10.0)
-        upload_method = st.selectbox("Upload Method:", [
-            "Single PUT (< 5GB)", "Multipart Upload (> 100MB)", "Transfer Acceleration"
-        ])
+        col1, col2 = st.columns(2)
     
-    with col2:
-        storage_class = st.selectbox("Initial Storage Class:", [
-            "S3 Standard", "S3 Standard-IA", "S3 One Zone-IA", 
-            "S3 Intelligent-Tiering", "S3 Glacier Instant Retrieval"
-        ])
+        with col1:
+            file_type = st.selectbox("File Type:", [
+                "Image (JPEG/PNG)", "Document (PDF)", "Video (MP4)", 
+                "Archive (ZIP)", "Code (Python)", "Data (JSON/CSV)"
+            ])
         
-        metadata_tags = st.text_area("Custom Metadata (key=value):", 
-                                   "project=web-app\nenvironment=production\nowner=dev-team")
+            file_size = st.slider("File Size (MB):", 0.1, 5000.0, 10.0)
+            upload_method = st.selectbox("Upload Method:", [
+                "Single PUT (< 5GB)", "Multipart Upload (> 100MB)", "Transfer Acceleration"
+            ])
     
-    if st.button("📤 Simulate Upload", use_container_width=True):
-        # Calculate upload metrics
-        if file_size < 100:
-            upload_time = file_size * 0.1  # Fast upload for small files
-        elif upload_method == "Multipart Upload (> 100MB)":
-            upload_time = file_size * 0.05  # Faster with multipart
-        else:
-            upload_time = file_size * 0.08
-        
-        # Storage cost calculation
-        storage_costs = {
-            "S3 Standard": 0.023,
-            "S3 Standard-IA": 0.0125,
-            "S3 One Zone-IA": 0.01,
-            "S3 Intelligent-Tiering": 0.023,
-            "S3 Glacier Instant Retrieval": 0.004
-        }
+        with col2:
+            storage_class = st.selectbox("Initial Storage Class:", [
+                "S3 Standard", "S3 Standard-IA", "S3 One Zone-IA", 
+                "S3 Intelligent-Tiering", "S3 Glacier Instant Retrieval"
+            ])
+        
+            metadata_tags = st.text_area("Custom Metadata (key=value):", 
+                                       "project=web-app\nenvironment=production\nowner=dev-team")
+    
+        if st.button("📤 Simulate Upload", use_container_width=True):
+            # Calculate upload metrics
+            if file_size < 100:
+                upload_time = file_size * 0.1  # Fast upload for small files
+            elif upload_method == "Multipart Upload (> 100MB)":
+                upload_time = file_size * 0.05  # Faster with multipart
+            else:
+                upload_time = file_size * 0.08
+        
+            # Storage cost calculation
+            storage_costs = {
+                "S3 Standard": 0.023,
+                "S3 Standard-IA": 0.0125,
+                "S3 One Zone-IA": 0.01,
+                "S3 Intelligent-Tiering": 0.023,
+                "S3 Glacier Instant Retrieval": 0.004
+            }
         
-        monthly_cost = (file_size / 1024) * storage_costs.get(storage_class, 0.023)
+            monthly_cost = (file_size / 1024) * storage_costs.get(storage_class, 0.023)
         
-        st.markdown('<div class="highlight-box">', unsafe_allow_html=True)
-        st.markdown(f"""
-        ### ✅ Upload Completed Successfully!
+            st.markdown('<div class="highlight-box">', unsafe_allow_html=True)
+            st.markdown(f"""
+            ### ✅ Upload Completed Successfully!
         
-        **File Details:**
-        - **Type**: {file_type}
-        - **Size**: {file_size:.1f} MB
-        - **Storage Class**: {storage_class}
-        - **Upload Method**: {upload_method}
+            **File Details:**
+            - **Type**: {file_type}
+            - **Size**: {file_size:.1f} MB
+            - **Storage Class**: {storage_class}
+            - **Upload Method**: {upload_method}
         
-        **Performance Metrics:**
-        - **Upload Time**: {upload_time:.1f} seconds
-        - **Throughput**: {(file_size/upload_time):.1f} MB/s
-        - **Parts Used**: {max(1, int(file_size/100))} (for multipart)
+            **Performance Metrics:**
+            - **Upload Time**: {upload_time:.1f} seconds
+            - **Throughput**: {(file_size/upload_time):.1f} MB/s
+            - **Parts Used**: {max(1, int(file_size/100))} (for multipart)
         
-        **💰 Storage Cost**: ${monthly_cost:.4f}/month
+            **💰 Storage Cost**: ${monthly_cost:.4f}/month
         
-        **📋 Object Metadata Created**:
-        ```
-        {metadata_tags}
-        ```
-        """)
-        st.markdown('</div>', unsafe_allow_html=True)
+            **📋 Object Metadata Created**:
+            ```
+            {metadata_tags}
+            ```
+            """)
+            st.markdown('</div>', unsafe_allow_html=True)
+
+    interactive_object_upload_simulator()
     
     # Code Example
     st.markdown("### 💻 Code Example: Working with S3 Objects")
@@ -806,6 +776,41 @@ if create_s3_bucket_with_configuration(bucket_name, region):
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.cached_figure
+def create_storage_cost_chart():
+    """Log-log chart of monthly storage cost by data size for each storage class."""
+    # Cost comparison for different data sizes
+    data_sizes = [100, 1000, 10000, 100000]  # GB
+    storage_costs = {
+        'S3 Standard': [size * 0.023 for size in data_sizes],
+        'S3 Standard-IA': [size * 0.0125 for size in data_sizes],
+        'S3 One Zone-IA': [size * 0.01 for size in data_sizes],
+        'S3 Glacier Instant Retrieval': [size * 0.004 for size in data_sizes],
+        'S3 Glacier Deep Archive': [size * 0.00099 for size in data_sizes]
+    }
+    
+    fig = go.Figure()
+    
+    for storage_class, costs in storage_costs.items():
+        fig.add_trace(go.Scatter(
+            x=data_sizes,
+            y=costs,
+            mode='lines+markers',
+            name=storage_class,
+            line=dict(width=3)
+        ))
+    
+    fig.update_layout(
+        title='Monthly Storage Costs by Data Size',
+        xaxis_title='Data Size (GB)',
+        yaxis_title='Monthly Cost ($)',
+        xaxis_type='log',
+        yaxis_type='log',
+        height=400
+    )
+    return fig
+
+@common.profiled
 def storage_classes_tab():
     """Content for S3 Storage Classes tab"""
     st.markdown("## 📊 Amazon S3 Storage Classes")
@@ -916,96 +921,13 @@ def storage_classes_tab():
     # Detailed Storage Classes Comparison
     st.markdown("### 📋 Complete Storage Classes Comparison")
     
-    storage_classes_data = {
-        'Storage Class': [
-            'S3 Standard',
-            'S3 Intelligent-Tiering',
-            'S3 Express One Zone',
-            'S3 Standard-IA',
-            'S3 One Zone-IA',
-            'S3 Glacier Instant Retrieval',
-            'S3 Glacier Flexible Retrieval',
-            'S3 Glacier Deep Archive'
-        ],
-        'Use Case': [
-            'Frequently accessed data',
-            'Unknown/changing access patterns',
-            'High performance, frequently accessed',
-            'Infrequently accessed, millisecond access',
-            'Re-creatable infrequently accessed data',
-            'Long-lived data, accessed few times per year',
-            'Backup and archive, rarely accessed',
-            'Long-term data archiving, very rarely accessed'
-        ],
-        'Retrieval Time': [
-            'Milliseconds',
-            'Milliseconds',
-            'Single-digit milliseconds',
-            'Milliseconds',
-            'Milliseconds',
-            'Milliseconds',
-            '1 minute to 12 hours',
-            'Within 12 hours'
-        ],
-        'Monthly Cost ($/GB)': [
-            '$0.023',
-            '$0.023*',
-            '$0.16',
-            '$0.0125',
-            '$0.01',
-            '$0.004',
-            '$0.0036',
-            '$0.00099'
-        ],
-        'Min Storage Duration': [
-            'None',
-            '30 days',
-            '1 hour',
-            '30 days',
-            '30 days',
-            '90 days',
-            '90 days',
-            '180 days'
-        ]
-    }
-    
-    df_storage = pd.DataFrame(storage_classes_data)
+    df_storage = catalog.table("storage_classes.storage_classes")
     st.dataframe(df_storage, use_container_width=True)
     
     # Cost Comparison Visualization
     st.markdown("### 💰 Storage Cost Comparison")
     
-    # Cost comparison for different data sizes
-    data_sizes = [100, 1000, 10000, 100000]  # GB
-    storage_costs = {
-        'S3 Standard': [size * 0.023 for size in data_sizes],
-        'S3 Standard-IA': [size * 0.0125 for size in data_sizes],
-        'S3 One Zone-IA': [size * 0.01 for size in data_sizes],
-        'S3 Glacier Instant Retrieval': [size * 0.004 for size in data_sizes],
-        'S3 Glacier Deep Archive': [size * 0.00099 for size in data_sizes]
-    }
-    
-    fig = go.Figure()
-    
-    for storage_class, costs in storage_costs.items():
-        fig.add_trace(go.Scatter(
-            x=data_sizes,
-            y=costs,
-            mode='lines+markers',
-            name=storage_class,
-            line=dict(width=3)
-        ))
-    
-    fig.update_layout(
-        title='Monthly Storage Costs by Data Size',
-        xaxis_title='Data Size (GB)',
-        yaxis_title='Monthly Cost ($)',
-        xaxis_type='log',
-        yaxis_type='log',
-        height=400
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(create_storage_cost_chart(), use_container_width=True)
     
     # Storage Class Features Deep Dive
     st.markdown("### 🔍 Storage Class Features Deep Dive")
@@ -1309,6 +1231,39 @@ change_storage_class(bucket_name, 'images/old-photo.jpg', 'STANDARD_IA')
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.cached_figure
+def create_lifecycle_cost_chart(costs_without, costs_with):
+    """Line chart of monthly storage costs with and without a lifecycle policy."""
+    # Create visualization
+    fig = go.Figure()
+    
+    months_range = list(range(1, len(costs_without) + 1))
+    
+    fig.add_trace(go.Scatter(
+        x=months_range,
+        y=costs_without,
+        mode='lines',
+        name='Without Lifecycle',
+        line=dict(color=AWS_COLORS['warning'], width=3)
+    ))
+    
+    fig.add_trace(go.Scatter(
+        x=months_range,
+        y=costs_with,
+        mode='lines',
+        name='With Lifecycle Policy',
+        line=dict(color=AWS_COLORS['success'], width=3)
+    ))
+    
+    fig.update_layout(
+        title='Monthly Storage Costs Comparison',
+        xaxis_title='Month',
+        yaxis_title='Monthly Cost ($)',
+        height=400
+    )
+    return fig
+
+@common.profiled
 def lifecycle_management_tab():
     """Content for S3 Lifecycle Management tab"""
     st.markdown("## 🔄 Amazon S3 Lifecycle Management")
@@ -1435,35 +1390,7 @@ def lifecycle_management_tab():
             )
             costs_with.append(monthly_cost)
         
-        # Create visualization
-        fig = go.Figure()
-        
-        months_range = list(range(1, months + 1))
-        
-        fig.add_trace(go.Scatter(
-            x=months_range,
-            y=costs_without,
-            mode='lines',
-            name='Without Lifecycle',
-            line=dict(color=AWS_COLORS['warning'], width=3)
-        ))
-        
-        fig.add_trace(go.Scatter(
-            x=months_range,
-            y=costs_with,
-            mode='lines',
-            name='With Lifecycle Policy',
-            line=dict(color=AWS_COLORS['success'], width=3)
-        ))
-        
-        fig.update_layout(
-            title='Monthly Storage Costs Comparison',
-            xaxis_title='Month',
-            yaxis_title='Monthly Cost ($)',
-            height=400
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(create_lifecycle_cost_chart(costs_without, costs_with), use_container_width=True)
         
         # Summary metrics
         total_savings = sum(costs_without) - sum(costs_with)
@@ -1530,34 +1457,7 @@ def lifecycle_management_tab():
     # Advanced Lifecycle Features
     st.markdown("### 🔧 Advanced Lifecycle Features")
     
-    features_data = {
-        'Feature': [
-            'Filter by Object Size',
-            'Multiple Transitions',
-            'Abort Incomplete Multipart Uploads',
-            'Delete Expired Object Delete Markers',
-            'Transition Current/Noncurrent Versions',
-            'Filter by Object Tags'
-        ],
-        'Description': [
-            'Apply rules only to objects larger/smaller than specified size',
-            'Chain multiple storage class transitions over time',
-            'Clean up incomplete uploads to avoid charges',
-            'Remove unnecessary delete markers in versioned buckets',
-            'Different rules for current vs previous object versions',
-            'Apply rules based on object tags for fine-grained control'
-        ],
-        'Use Case': [
-            'Skip archiving small files (<1MB)',
-            'Gradual cost reduction over object lifetime',
-            'Prevent accumulation of failed uploads',
-            'Maintain clean versioned bucket',
-            'Faster deletion of old versions',
-            'Different policies per data classification'
-        ]
-    }
-    
-    df_features = pd.DataFrame(features_data)
+    df_features = catalog.table("lifecycle_management.features")
     st.dataframe(df_features, use_container_width=True)
     
     # Real-world Examples
@@ -1941,6 +1841,7 @@ if create_lifecycle_configuration(bucket_name, lifecycle_rules):
     ''', language='python')
     st.markdown('</div>', unsafe_allow_html=True)
 
+@common.profiled
 def bucket_policies_tab():
     """Content for S3 Bucket Policies tab"""
     st.markdown("## 🔒 S3 Bucket Policies")
@@ -2209,66 +2110,70 @@ def bucket_policies_tab():
             st.markdown('</div>', unsafe_allow_html=True)
     
     # Policy Testing Tool
-    st.markdown("### 🧪 Policy Testing Simulator")
+    @common.fragment
+    def policy_testing_simulator():
+        st.markdown("### 🧪 Policy Testing Simulator")
     
-    st.markdown('<div class="s3-bucket">', unsafe_allow_html=True)
-    st.markdown("#### Test Access Scenarios")
+        st.markdown('<div class="s3-bucket">', unsafe_allow_html=True)
+        st.markdown("#### Test Access Scenarios")
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        test_principal = st.selectbox("Test as:", [
-            "Anonymous User (Public)",
-            "Specific AWS Account", 
-            "IAM User",
-            "IAM Role",
-            "AWS Service"
-        ])
-        
-        if test_principal != "Anonymous User (Public)":
-            principal_arn = st.text_input("Principal ARN:", "arn:aws:iam::123456789012:user/testuser")
+        col1, col2 = st.columns(2)
     
-    with col2:
-        test_action = st.selectbox("Action to Test:", [
-            "s3:GetObject",
-            "s3:PutObject",
-            "s3:DeleteObject",
-            "s3:ListBucket"
-        ])
+        with col1:
+            test_principal = st.selectbox("Test as:", [
+                "Anonymous User (Public)",
+                "Specific AWS Account", 
+                "IAM User",
+                "IAM Role",
+                "AWS Service"
+            ])
         
-        test_conditions = st.multiselect("Additional Conditions:", [
-            "HTTPS Connection",
-            "MFA Present",
-            "Specific IP Address",
-            "Time Restriction"
-        ])
+            if test_principal != "Anonymous User (Public)":
+                principal_arn = st.text_input("Principal ARN:", "arn:aws:iam::123456789012:user/testuser")
     
-    if st.button("🔍 Test Policy Access"):
-        # Simulate policy evaluation
-        access_result = simulate_policy_access(test_principal, test_action, test_conditions)
-        
-        if access_result["allowed"]:
-            st.markdown('<div class="highlight-box">', unsafe_allow_html=True)
-            st.markdown(f"""
-            ### ✅ Access Granted
+        with col2:
+            test_action = st.selectbox("Action to Test:", [
+                "s3:GetObject",
+                "s3:PutObject",
+                "s3:DeleteObject",
+                "s3:ListBucket"
+            ])
+        
+            test_conditions = st.multiselect("Additional Conditions:", [
+                "HTTPS Connection",
+                "MFA Present",
+                "Specific IP Address",
+                "Time Restriction"
+            ])
+    
+        if st.button("🔍 Test Policy Access"):
+            # Simulate policy evaluation
+            access_result = simulate_policy_access(test_principal, test_action, test_conditions)
+        
+            if access_result["allowed"]:
+                st.markdown('<div class="highlight-box">', unsafe_allow_html=True)
+                st.markdown(f"""
+                ### ✅ Access Granted
             
-            **Result**: {test_principal} can perform {test_action}
-            **Reason**: {access_result['reason']}
-            **Policy Statement**: {access_result['matching_statement']}
-            """)
-            st.markdown('</div>', unsafe_allow_html=True)
-        else:
-            st.markdown('<div class="warning-box">', unsafe_allow_html=True)
-            st.markdown(f"""
-            ### ❌ Access Denied
+                **Result**: {test_principal} can perform {test_action}
+                **Reason**: {access_result['reason']}
+                **Policy Statement**: {access_result['matching_statement']}
+                """)
+                st.markdown('</div>', unsafe_allow_html=True)
+            else:
+                st.markdown('<div class="warning-box">', unsafe_allow_html=True)
+                st.markdown(f"""
+                ### ❌ Access Denied
             
-            **Result**: {test_principal} cannot perform {test_action}
-            **Reason**: {access_result['reason']}
-            **Recommendation**: {access_result['recommendation']}
-            """)
-            st.markdown('</div>', unsafe_allow_html=True)
+                **Result**: {test_principal} cannot perform {test_action}
+                **Reason**: {access_result['reason']}
+                **Recommendation**: {access_result['recommendation']}
+                """)
+                st.markdown('</div>', unsafe_allow_html=True)
     
-    st.markdown('</div>', unsafe_allow_html=True)
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    policy_testing_simulator()
     
     # Best Practices
     st.markdown("### 💡 Bucket Policy Best Practices")
@@ -2751,6 +2656,7 @@ def simulate_policy_access(principal, action, conditions):
         "matching_statement": "TestStatement"
     }
 
+@common.profiled
 def main():
     """Main application function"""
     # Apply styling
@@ -2773,24 +2679,12 @@ def main():
                 </div>""", unsafe_allow_html=True)
     
     # Create tabs
-    tab1, tab2, tab3, tab4 = st.tabs([
-        "🗂️ Amazon S3",
-        "📊 Storage Classes", 
-        "🔄 Lifecycle Management",
-        "🔒 Bucket Policies"
-    ])
-    
-    with tab1:
-        s3_overview_tab()
-    
-    with tab2:
-        storage_classes_tab()
-    
-    with tab3:
-        lifecycle_management_tab()
-        
-    with tab4:
-        bucket_policies_tab()
+    common.tab_router({
+        "🗂️ Amazon S3": s3_overview_tab,
+        "📊 Storage Classes": storage_classes_tab,
+        "🔄 Lifecycle Management": lifecycle_management_tab,
+        "🔒 Bucket Policies": bucket_policies_tab,
+    })
     
     # Footer
     st.markdown("""
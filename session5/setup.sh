@@ -237,6 +237,25 @@ rebuild_venv() {
     return $?
 }
 
+# Function to precompile the static Mermaid diagrams to SVG
+precompile_diagrams() {
+    local mmdc="${MMDC:-}"
+    if [ -z "$mmdc" ]; then
+        if command -v mmdc &> /dev/null; then
+            mmdc="mmdc"
+        elif command -v npx &> /dev/null; then
+            mmdc="npx -y @mermaid-js/mermaid-cli"
+        else
+            log "WARNING" "Mermaid CLI not found, diagrams will render in the browser"
+            return 0
+        fi
+    fi
+    
+    log "INFO" "Precompiling Mermaid diagrams..."
+    run_as_user python "${DIRECTORY}/../scripts/precompile_mermaid.py" --mmdc "$mmdc" >> "$LOG_FILE" 2>&1 || \
+        log "WARNING" "Some diagrams were not precompiled and will render in the browser (see $LOG_FILE)"
+}
+
 # Function to start the application
 start_app() {
     log "INFO" "Starting Streamlit application on port $PORT..."
@@ -338,6 +357,9 @@ else
     setup_venv || { log "ERROR" "Failed to setup virtual environment"; exit 1; }
 fi
 
+# Diagrams missing from the cache render in the browser, so failures here are not fatal
+precompile_diagrams
+
 # Start the application
 if ! start_app; then
     # 4. If application fails to start, rebuild the venv
@@ -0,0 +1,26 @@
+"""
+Shared code for the APCR DVA session apps.
+
+Every session app (session1 .. session5) imports these modules through thin
+wrappers in its own utils/ package, which bind them to the app with
+configure(). Those settings (app directory, redirect URI, data directory)
+are module globals, so each app runs in its own process, as `streamlit run`
+does; configuring a second app in the same process raises RuntimeError.
+Process-wide caches (Cognito credentials, JWKS keys, the Cognito HTTP
+session, the session store, boto3 clients and rendered Mermaid assets)
+are shared by every session of that app.
+
+Modules:
+    - common: Mermaid diagrams, session state, sidebar, styles, cached figures,
+      lazy imports and rerun profiling
+    - aws_clients: Shared boto3 clients with tuned retries, timeouts and
+      connection pools, and per-operation call counters
+    - authenticate: Cognito OAuth login, token verification and session resume
+    - catalog: Reference tables loaded once per process from data/catalog.json
+    - cognito_credentials: Cached Cognito credentials from Secrets Manager
+    - local_backend: Local AWS emulator and Redis for offline development
+      and load tests (DVA_AWS_BACKEND=local)
+    - session_lifecycle: Persistent and capped session keys, per-session
+      resources evicted when idle, and a per-session memory report
+    - session_store: Server-side store for authenticated sessions
+"""
@@ -0,0 +1,877 @@
+"""
+AWS Cognito Authentication Module for Streamlit Applications
+
+This module provides functions to handle authentication with AWS Cognito in a Streamlit application.
+It manages the OAuth 2.0 flow, token management, and user session handling.
+
+Functions:
+    - initialize_session: Initialize Streamlit session state variables
+    - authenticate_user: Main function to handle the full authentication process
+    - get_auth_code: Extract authorization code from query parameters
+    - exchange_code_for_tokens: Exchange authorization code for access and ID tokens
+    - exchange_code_for_token_set: Exchange authorization code for the full token set
+    - refresh_tokens: Renew access and ID tokens with a refresh token
+    - get_user_info: Retrieve user information using access token
+    - verify_token: Verify an ID or access token locally against the user pool JWKS
+    - user_info_from_claims: Build user information from verified ID token claims
+    - decode_cognito_groups: Extract Cognito groups from verified ID token claims
+    - render_login_button: Display AWS-styled login button
+    - render_logout_button: Display AWS-styled logout button
+    - get_http_metrics: Latency and retry counters for calls to the Cognito domain
+    - restore_session: Resume an authenticated session from the server-side store
+    - configure: Select the redirect URI of the app using this module
+"""
+
+import streamlit as st
+import requests
+from requests.adapters import HTTPAdapter
+import jwt
+import base64
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+from typing import Dict, List, Tuple, Optional, Any
+from .cognito_credentials import get_cognito_credentials
+from .session_store import (
+    SESSION_TTL, get_session_store, new_session_id, sign_session_id, unsign_session_id
+)
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, 
+                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# AWS color scheme
+AWS_ORANGE = "#FF9900"
+AWS_HOVER = "#EC7211"
+AWS_ACTIVE = "#D05C17"
+AWS_TEXT = "#FFFFFF"
+
+# HTTP client settings for the Cognito OAuth endpoints
+HTTP_POOL_SIZE = int(os.getenv("COGNITO_HTTP_POOL_SIZE", "10"))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("COGNITO_HTTP_CONNECT_TIMEOUT", "3.05"))
+HTTP_READ_TIMEOUT = float(os.getenv("COGNITO_HTTP_READ_TIMEOUT", "10"))
+HTTP_MAX_RETRIES = int(os.getenv("COGNITO_HTTP_MAX_RETRIES", "2"))
+HTTP_BACKOFF_BASE = 0.2
+HTTP_BACKOFF_MAX = 2.0
+RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
+
+# JWKS cache settings for local token verification
+JWKS_TTL = int(os.getenv("COGNITO_JWKS_TTL", "86400"))
+JWKS_MIN_REFRESH_INTERVAL = int(os.getenv("COGNITO_JWKS_MIN_REFRESH_INTERVAL", "60"))
+JWT_LEEWAY = int(os.getenv("COGNITO_JWT_LEEWAY", "30"))
+# ID token claims copied into user info (same fields the userInfo endpoint returns)
+USER_INFO_CLAIMS = (
+    "sub", "email", "email_verified", "name", "given_name", "family_name",
+    "preferred_username", "phone_number", "phone_number_verified",
+)
+
+# Secret key holding this app's OAuth redirect URI (see configure())
+REDIRECT_URI_KEY = os.getenv("COGNITO_REDIRECT_URI_KEY", "COGNITO_REDIRECT_URI_1")
+_configured_redirect_uri_key: Optional[str] = None
+
+# Session continuation settings
+# Accepted from older links only; the session cookie carries the token
+SESSION_QUERY_PARAM = "session"
+LOGOUT_QUERY_PARAM = "logout"
+ACCESS_TOKEN_RENEW_MARGIN = int(os.getenv("AUTH_ACCESS_TOKEN_RENEW_MARGIN", "120"))
+
+_http_session: Optional[requests.Session] = None
+_http_lock = threading.Lock()
+_http_metrics: Dict[str, Dict[str, float]] = {}
+
+def get_http_session() -> requests.Session:
+    """
+    Return the process-wide HTTP session used for Cognito calls.
+    
+    The session keeps TLS connections to the Cognito domain alive, so every
+    worker pays for one handshake instead of one per request.
+    
+    Returns:
+        Shared requests.Session with a pooled HTTPS adapter
+    """
+    global _http_session
+    if _http_session is None:
+        with _http_lock:
+            if _http_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _http_session = session
+    return _http_session
+
+def _record_latency(name: str, elapsed: float, ok: bool, retries: int) -> None:
+    """Accumulate per-call latency metrics."""
+    with _http_lock:
+        metric = _http_metrics.setdefault(
+            name, {"calls": 0, "errors": 0, "retries": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+        )
+        metric["calls"] += 1
+        metric["retries"] += retries
+        metric["total_seconds"] += elapsed
+        metric["max_seconds"] = max(metric["max_seconds"], elapsed)
+        if not ok:
+            metric["errors"] += 1
+
+def get_http_metrics() -> Dict[str, Dict[str, float]]:
+    """
+    Return latency metrics for calls made to the Cognito domain.
+    
+    Returns:
+        Dictionary keyed by call name with call, error and retry counts,
+        total, average and maximum latency in seconds
+    """
+    with _http_lock:
+        return {
+            name: dict(metric, avg_seconds=metric["total_seconds"] / metric["calls"] if metric["calls"] else 0.0)
+            for name, metric in _http_metrics.items()
+        }
+
+def _http_request(name: str, method: str, url: str, max_retries: int = HTTP_MAX_RETRIES,
+                  **kwargs) -> requests.Response:
+    """
+    Send a request through the shared session with timeouts and retries.
+    
+    Connection failures and throttling/gateway errors are retried with
+    exponential backoff and full jitter. Read timeouts are not retried.
+    Requests that must not be sent twice, such as redeeming a single-use
+    authorization code, pass max_retries=0.
+    
+    Args:
+        name: Metric name for the call
+        method: HTTP method
+        url: Request URL
+        max_retries: Retries after the first attempt
+        **kwargs: Passed through to requests.Session.request
+        
+    Returns:
+        The final response
+        
+    Raises:
+        requests.exceptions.RequestException: If the request ultimately fails
+    """
+    kwargs.setdefault("timeout", (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT))
+    session = get_http_session()
+    start = time.perf_counter()
+    attempt = 0
+    ok = False
+    
+    try:
+        while True:
+            try:
+                response = session.request(method, url, **kwargs)
+                if response.status_code not in RETRYABLE_STATUS_CODES or attempt >= max_retries:
+                    response.raise_for_status()
+                    ok = True
+                    return response
+                # Return the connection to the pool before retrying
+                response.close()
+            except requests.exceptions.ConnectionError:
+                if attempt >= max_retries:
+                    raise
+            
+            attempt += 1
+            delay = random.uniform(0, min(HTTP_BACKOFF_MAX, HTTP_BACKOFF_BASE * (2 ** attempt)))
+            logger.warning(f"Retrying {name} (attempt {attempt}/{max_retries}) in {delay:.2f}s")
+            time.sleep(delay)
+    finally:
+        _record_latency(name, time.perf_counter() - start, ok, attempt)
+
+class JWKSCache:
+    """
+    In-process cache of user pool signing keys.
+    
+    Key sets are refetched after JWKS_TTL seconds, or earlier when a token is
+    signed with an unknown key ID (key rotation). Refetches triggered by
+    unknown key IDs are rate limited so forged tokens cannot hammer the
+    JWKS endpoint.
+    
+    Key sets are fetched outside the cache lock, one fetch per URL at a
+    time. While an expired set is being refetched, tokens signed with a key
+    it already holds are verified against it instead of waiting.
+    """
+    
+    def __init__(self, ttl: int = JWKS_TTL, min_refresh_interval: int = JWKS_MIN_REFRESH_INTERVAL):
+        self.ttl = ttl
+        self.min_refresh_interval = min_refresh_interval
+        self._key_sets: Dict[str, Dict[str, Any]] = {}
+        self._fetch_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+    
+    def _fetch(self, jwks_url: str) -> Dict[str, Any]:
+        response = _http_request("jwks", "GET", jwks_url)
+        keys = {}
+        for jwk in response.json().get("keys", []):
+            try:
+                keys[jwk["kid"]] = jwt.PyJWK(jwk)
+            except (KeyError, jwt.PyJWKError) as e:
+                logger.warning(f"Skipping unusable JWKS key: {str(e)}")
+        return {"keys": keys, "fetched_at": time.monotonic()}
+    
+    def _needs_fetch(self, key_set: Optional[Dict[str, Any]], kid: str) -> bool:
+        if key_set is None:
+            return True
+        age = time.monotonic() - key_set["fetched_at"]
+        if age > self.ttl:
+            return True
+        return kid not in key_set["keys"] and age > self.min_refresh_interval
+    
+    def get_signing_key(self, jwks_url: str, kid: str) -> jwt.PyJWK:
+        """
+        Return the signing key for a key ID.
+        
+        Args:
+            jwks_url: URL of the user pool JWKS document
+            kid: Key ID from the token header
+            
+        Returns:
+            The matching PyJWK
+            
+        Raises:
+            jwt.InvalidTokenError: If no key with that ID exists
+        """
+        with self._lock:
+            key_set = self._key_sets.get(jwks_url)
+            fetch_lock = self._fetch_locks.setdefault(jwks_url, threading.Lock())
+        
+        if self._needs_fetch(key_set, kid):
+            # Only tokens the cached keys cannot verify wait for a fetch in progress
+            if fetch_lock.acquire(blocking=key_set is None or kid not in key_set["keys"]):
+                try:
+                    # Another thread may have refreshed the keys while this one waited
+                    with self._lock:
+                        key_set = self._key_sets.get(jwks_url)
+                    if self._needs_fetch(key_set, kid):
+                        if key_set is not None and kid not in key_set["keys"]:
+                            logger.info("Unknown signing key ID, refreshing JWKS")
+                        fetched = self._fetch(jwks_url)
+                        with self._lock:
+                            self._key_sets[jwks_url] = key_set = fetched
+                finally:
+                    fetch_lock.release()
+        
+        key = key_set["keys"].get(kid)
+        if key is None:
+            raise jwt.InvalidTokenError(f"Unknown signing key: {kid}")
+        return key
+
+_jwks_cache = JWKSCache()
+
+def configure(redirect_uri_key: str) -> None:
+    """
+    Select the redirect URI used by the app importing this module.
+    
+    Each session app registers its own callback URL with the user pool and
+    calls this from its utils/authenticate.py. The setting is per process,
+    so a process serves a single app.
+    
+    Args:
+        redirect_uri_key: Secret key of the app's redirect URI, e.g. "COGNITO_REDIRECT_URI_1"
+        
+    Raises:
+        RuntimeError: If the process is already configured for another app
+    """
+    global REDIRECT_URI_KEY, _configured_redirect_uri_key
+    if _configured_redirect_uri_key is not None and _configured_redirect_uri_key != redirect_uri_key:
+        raise RuntimeError(f"dva_shared.authenticate is already configured for {_configured_redirect_uri_key}; "
+                           "run each app in its own process")
+    _configured_redirect_uri_key = REDIRECT_URI_KEY = redirect_uri_key
+
+def set_st_state_vars() -> None:
+    """
+    Initialize Streamlit session state variables for authentication flow.
+    """
+    if "auth_code" not in st.session_state:
+        st.session_state["auth_code"] = ""
+    if "authenticated" not in st.session_state:
+        st.session_state["authenticated"] = False
+    if "user_cognito_groups" not in st.session_state:
+        st.session_state["user_cognito_groups"] = []
+    if "user_info" not in st.session_state:
+        st.session_state["user_info"] = {}
+
+def load_cognito_config() -> Dict[str, str]:
+    """
+    Load Cognito configuration from secrets.
+    
+    Returns:
+        Dict containing Cognito configuration parameters
+    
+    Raises:
+        RuntimeError: If required Cognito credentials are missing
+    """
+    try:
+        credentials = get_cognito_credentials()
+        
+        # Log successful credential retrieval with masked values
+        logger.info("Successfully retrieved Cognito credentials")
+        required_keys = ["COGNITO_DOMAIN", "COGNITO_APP_CLIENT_ID", "COGNITO_USER_POOL_ID",
+                         "COGNITO_APP_CLIENT_SECRET", REDIRECT_URI_KEY]
+        
+        # Check for required keys
+        missing_keys = [key for key in required_keys if not credentials.get(key)]
+        if missing_keys:
+            raise RuntimeError(f"Missing required Cognito credentials: {', '.join(missing_keys)}")
+            
+        user_pool_id = credentials.get("COGNITO_USER_POOL_ID")
+        region = user_pool_id.split("_", 1)[0]
+        issuer = f"https://cognito-idp.{region}.amazonaws.com/{user_pool_id}"
+            
+        return {
+            "domain": credentials.get("COGNITO_DOMAIN"),
+            "client_id": credentials.get("COGNITO_APP_CLIENT_ID"),
+            "client_secret": credentials.get("COGNITO_APP_CLIENT_SECRET"),
+            "redirect_uri": credentials.get(REDIRECT_URI_KEY),
+            "issuer": issuer,
+            "jwks_url": f"{issuer}/.well-known/jwks.json",
+        }
+    except Exception as e:
+        logger.error(f"Failed to retrieve Cognito credentials: {str(e)}")
+        raise RuntimeError(f"Authentication configuration error: {str(e)}")
+
+def get_auth_code() -> str:
+    """
+    Extract authorization code from query parameters.
+    
+    Returns:
+        Authorization code string or empty string if not found
+    """
+    try:
+        auth_query_params = st.query_params
+        return auth_query_params.get("code", "")
+    except Exception as e:
+        logger.error(f"Error extracting auth code: {str(e)}")
+        return ""
+
+def _token_request(body: Dict[str, str], config: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Call the Cognito token endpoint with client credentials.
+    
+    Args:
+        body: Form parameters for the grant
+        config: Dictionary containing Cognito configuration
+        
+    Returns:
+        Token response as a dictionary, or an empty dictionary on failure
+    """
+    token_url = f"{config['domain']}/oauth2/token"
+    client_secret_string = f"{config['client_id']}:{config['client_secret']}"
+    client_secret_encoded = str(
+        base64.b64encode(client_secret_string.encode("utf-8")), "utf-8"
+    )
+    
+    headers = {
+        "Content-Type": "application/x-www-form-urlencoded",
+        "Authorization": f"Basic {client_secret_encoded}",
+    }
+    
+    # An authorization code is single-use: if the server consumed it before
+    # failing, a retry could only get invalid_grant
+    max_retries = 0 if body.get("grant_type") == "authorization_code" else HTTP_MAX_RETRIES
+    
+    try:
+        token_response = _http_request("token", "POST", token_url, max_retries=max_retries,
+                                       headers=headers, data=body)
+        return token_response.json()
+    except requests.exceptions.RequestException as e:
+        logger.error(f"Token request ({body.get('grant_type')}) failed: {str(e)}")
+        if getattr(e, 'response', None) is not None:
+            logger.error(f"Response status: {e.response.status_code}")
+            logger.error(f"Response body: {e.response.text}")
+        return {}
+
+def exchange_code_for_token_set(auth_code: str, config: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Exchange authorization code for access, ID and refresh tokens.
+    
+    Args:
+        auth_code: Authorization code from Cognito server
+        config: Dictionary containing Cognito configuration
+        
+    Returns:
+        Token response dictionary, or an empty dictionary on failure
+    """
+    if not auth_code:
+        return {}
+    
+    return _token_request({
+        "grant_type": "authorization_code",
+        "client_id": config['client_id'],
+        "code": auth_code,
+        "redirect_uri": config['redirect_uri'],
+    }, config)
+
+def exchange_code_for_tokens(auth_code: str, config: Dict[str, str]) -> Tuple[str, str]:
+    """
+    Exchange authorization code for access and ID tokens.
+    
+    Args:
+        auth_code: Authorization code from Cognito server
+        config: Dictionary containing Cognito configuration
+        
+    Returns:
+        Tuple containing access_token and id_token
+    """
+    token_set = exchange_code_for_token_set(auth_code, config)
+    return token_set.get("access_token", ""), token_set.get("id_token", "")
+
+def refresh_tokens(refresh_token: str, config: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Renew access and ID tokens using a refresh token.
+    
+    Args:
+        refresh_token: Refresh token from the original code exchange
+        config: Dictionary containing Cognito configuration
+        
+    Returns:
+        Token response dictionary, or an empty dictionary on failure
+    """
+    if not refresh_token:
+        return {}
+    
+    return _token_request({
+        "grant_type": "refresh_token",
+        "client_id": config['client_id'],
+        "refresh_token": refresh_token,
+    }, config)
+
+def revoke_refresh_token(refresh_token: str, config: Dict[str, str]) -> None:
+    """
+    Revoke a refresh token at Cognito (best effort).
+    
+    Args:
+        refresh_token: Refresh token to revoke
+        config: Dictionary containing Cognito configuration
+    """
+    if not refresh_token:
+        return
+    
+    client_secret_string = f"{config['client_id']}:{config['client_secret']}"
+    headers = {
+        "Content-Type": "application/x-www-form-urlencoded",
+        "Authorization": "Basic " + str(base64.b64encode(client_secret_string.encode("utf-8")), "utf-8"),
+    }
+    try:
+        _http_request("revoke", "POST", f"{config['domain']}/oauth2/revoke",
+                      headers=headers, data={"token": refresh_token})
+    except requests.exceptions.RequestException as e:
+        logger.warning(f"Failed to revoke refresh token: {str(e)}")
+
+def get_user_info(access_token: str, config: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Retrieve user information from AWS Cognito.
+    
+    Args:
+        access_token: Access token from successful authentication
+        config: Dictionary containing Cognito configuration
+        
+    Returns:
+        Dictionary containing user information
+    """
+    if not access_token:
+        return {}
+        
+    userinfo_url = f"{config['domain']}/oauth2/userInfo"
+    headers = {
+        "Content-Type": "application/json;charset=UTF-8",
+        "Authorization": f"Bearer {access_token}",
+    }
+    
+    try:
+        response = _http_request("userinfo", "GET", userinfo_url, headers=headers)
+        return response.json()
+    except requests.exceptions.RequestException as e:
+        logger.error(f"Failed to get user info: {str(e)}")
+        return {}
+
+def verify_token(token: str, config: Dict[str, str], token_use: str = "id") -> Dict[str, Any]:
+    """
+    Verify a Cognito ID or access token locally.
+    
+    Checks the RS256 signature against the cached user pool JWKS, the issuer,
+    expiry, the token_use claim and that the token was issued to this app
+    client.
+    
+    Args:
+        token: Encoded JWT
+        config: Dictionary containing Cognito configuration
+        token_use: Expected token type, "id" or "access"
+        
+    Returns:
+        Dictionary of verified claims
+        
+    Raises:
+        jwt.InvalidTokenError: If the token fails verification
+    """
+    header = jwt.get_unverified_header(token)
+    signing_key = _jwks_cache.get_signing_key(config["jwks_url"], header.get("kid", ""))
+    
+    # ID tokens carry the app client in "aud", access tokens in "client_id"
+    claims = jwt.decode(
+        token,
+        signing_key.key,
+        algorithms=["RS256"],
+        issuer=config["issuer"],
+        audience=config["client_id"] if token_use == "id" else None,
+        leeway=JWT_LEEWAY,
+        options={"verify_aud": token_use == "id", "require": ["exp", "iat", "iss", "token_use"]},
+    )
+    
+    if claims.get("token_use") != token_use:
+        raise jwt.InvalidTokenError(f"Expected {token_use} token, got {claims.get('token_use')}")
+    if token_use == "access" and claims.get("client_id") != config["client_id"]:
+        raise jwt.InvalidTokenError("Access token was issued to a different client")
+    
+    return claims
+
+def user_info_from_claims(id_claims: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build user information from verified ID token claims.
+    
+    Args:
+        id_claims: Claims returned by verify_token for an ID token
+        
+    Returns:
+        Dictionary with the same fields the userInfo endpoint returns
+    """
+    user_info = {claim: id_claims[claim] for claim in USER_INFO_CLAIMS if claim in id_claims}
+    user_info["username"] = id_claims.get("cognito:username", id_claims.get("sub", ""))
+    return user_info
+
+def decode_cognito_groups(id_claims: Dict[str, Any]) -> List[str]:
+    """
+    Extract the user's Cognito groups from verified ID token claims.
+    
+    Args:
+        id_claims: Claims returned by verify_token for an ID token
+        
+    Returns:
+        List of Cognito groups the user belongs to
+    """
+    return list(id_claims.get("cognito:groups", []))
+
+def _session_signing_key(config: Dict[str, str]) -> str:
+    """Return the key used to sign session tokens."""
+    return os.getenv("AUTH_SESSION_SECRET") or hashlib.sha256(
+        f"session:{config['client_secret']}".encode("utf-8")
+    ).hexdigest()
+
+def _session_cookie_name(config: Dict[str, str]) -> str:
+    """
+    Return the session cookie name for this app.
+    
+    Cookies are shared by every port on a host. A shared (Redis) store can
+    serve all session apps from one cookie; a per-process store needs one
+    cookie per app so the apps do not overwrite each other's sessions.
+    """
+    if getattr(get_session_store(), "shared", False):
+        return "dva_session"
+    return "dva_session_" + hashlib.sha256(config["redirect_uri"].encode("utf-8")).hexdigest()[:8]
+
+def _set_session_cookie(name: str, value: str, max_age: int) -> None:
+    """Set or clear the session cookie in the browser."""
+    import streamlit.components.v1 as components
+    
+    components.html(f"""
+    <script>
+        const secure = window.parent.location.protocol === 'https:' ? '; Secure' : '';
+        window.parent.document.cookie = {json.dumps(name)} + '=' + {json.dumps(value)} +
+            '; Path=/; Max-Age={max_age}; SameSite=Lax' + secure;
+    </script>
+    """, height=0)
+
+def _apply_token_set(token_set: Dict[str, Any], config: Dict[str, str],
+                     record: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """
+    Verify a token response and merge it into a session record.
+    
+    Args:
+        token_set: Response from the token endpoint
+        config: Dictionary containing Cognito configuration
+        record: Existing session record to update, if any
+        
+    Returns:
+        Updated session record, or None if the tokens fail verification
+    """
+    access_token = token_set.get("access_token", "")
+    id_token = token_set.get("id_token", "")
+    if not access_token or not id_token:
+        return None
+    
+    try:
+        id_claims = verify_token(id_token, config, "id")
+        access_claims = verify_token(access_token, config, "access")
+    except (jwt.InvalidTokenError, requests.exceptions.RequestException) as e:
+        logger.error(f"Token verification failed: {str(e)}")
+        return None
+    
+    record = dict(record or {})
+    record.update({
+        "access_token": access_token,
+        "id_token": id_token,
+        "access_expires_at": access_claims["exp"],
+        "user_info": user_info_from_claims(id_claims),
+        "user_cognito_groups": decode_cognito_groups(id_claims),
+    })
+    # Cognito only returns a new refresh token when rotation is enabled
+    if token_set.get("refresh_token"):
+        record["refresh_token"] = token_set["refresh_token"]
+    return record
+
+def _request_session_id(config: Dict[str, str]) -> Optional[str]:
+    """
+    Return the verified session ID sent with the request, if any.
+    
+    The session cookie carries the token. A ``session`` query parameter,
+    from links that predate the cookie, is still accepted but removed from
+    the URL at once, since a bearer token there leaks through browser
+    history, Referer headers and shared links.
+    """
+    url_token = st.query_params.pop(SESSION_QUERY_PARAM, None)
+    token = st.context.cookies.get(_session_cookie_name(config)) or url_token
+    return unsign_session_id(token, _session_signing_key(config)) if token else None
+
+def _load_session_into_state(session_id: str, record: Dict[str, Any]) -> None:
+    """Copy a session record into Streamlit session state."""
+    st.session_state["auth_session_id"] = session_id
+    st.session_state["auth_code"] = record.get("auth_code", "")
+    st.session_state["authenticated"] = True
+    st.session_state["user_cognito_groups"] = record["user_cognito_groups"]
+    st.session_state["user_info"] = record["user_info"]
+    st.session_state["auth_access_expires_at"] = record["access_expires_at"]
+
+def _renew_if_expiring(session_id: str, record: Dict[str, Any], config: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    """
+    Silently renew the access token when it is about to expire.
+    
+    Returns:
+        The current or renewed record, or None if the session can no longer be renewed
+    """
+    if record["access_expires_at"] - time.time() > ACCESS_TOKEN_RENEW_MARGIN:
+        return record
+    
+    renewed = _apply_token_set(refresh_tokens(record.get("refresh_token", ""), config), config, record)
+    store = get_session_store()
+    if renewed is None:
+        logger.info("Refresh token rejected, session ended")
+        store.delete(session_id)
+        return None
+    
+    store.put(session_id, renewed, SESSION_TTL)
+    logger.info("Access token renewed from refresh token")
+    return renewed
+
+def restore_session(config: Dict[str, str]) -> bool:
+    """
+    Resume an authenticated session without the OAuth flow.
+    
+    Looks up the signed session token from the session cookie in the
+    server-side store, and renews the
+    access token with the stored refresh token when it is about to expire.
+    
+    Args:
+        config: Dictionary containing Cognito configuration
+        
+    Returns:
+        Boolean indicating whether a session was restored
+    """
+    store = get_session_store()
+    
+    # Already signed in on this websocket: only renew when needed
+    session_id = st.session_state.get("auth_session_id")
+    if st.session_state.get("authenticated") and session_id:
+        if st.session_state.get("auth_access_expires_at", 0) - time.time() > ACCESS_TOKEN_RENEW_MARGIN:
+            return True
+        record = store.get(session_id)
+        record = _renew_if_expiring(session_id, record, config) if record else None
+        if record is None:
+            st.session_state["authenticated"] = False
+            return False
+        _load_session_into_state(session_id, record)
+        return True
+    
+    session_id = _request_session_id(config)
+    if not session_id:
+        return False
+    
+    record = store.get(session_id)
+    record = _renew_if_expiring(session_id, record, config) if record else None
+    if record is None:
+        return False
+    
+    _load_session_into_state(session_id, record)
+    # Restored from a session link: move the token into the cookie
+    if not st.context.cookies.get(_session_cookie_name(config)):
+        _set_session_cookie(_session_cookie_name(config), sign_session_id(session_id, _session_signing_key(config)),
+                            SESSION_TTL)
+    logger.info("Session restored from server-side store")
+    return True
+
+def _start_session(auth_code: str, token_set: Dict[str, Any], config: Dict[str, str]) -> bool:
+    """Verify a fresh token set, persist it and issue the session cookie."""
+    record = _apply_token_set(token_set, config, {"auth_code": auth_code})
+    if record is None:
+        return False
+    
+    session_id = new_session_id()
+    get_session_store().put(session_id, record, SESSION_TTL)
+    _load_session_into_state(session_id, record)
+    
+    signed = sign_session_id(session_id, _session_signing_key(config))
+    _set_session_cookie(_session_cookie_name(config), signed, SESSION_TTL)
+    # The single-use code is spent; the session continues through the cookie
+    st.query_params.pop("code", None)
+    
+    logger.info(f"User authenticated successfully. Groups: {record['user_cognito_groups']}")
+    return True
+
+def _end_session(config: Dict[str, str], logout_url: str) -> None:
+    """Drop the server-side session, clear the cookie and continue to Cognito logout."""
+    import streamlit.components.v1 as components
+    
+    store = get_session_store()
+    # The sign-out link reloads the page, so session state is usually empty here
+    session_id = st.session_state.get("auth_session_id") or _request_session_id(config)
+    if session_id:
+        record = store.get(session_id)
+        if record:
+            revoke_refresh_token(record.get("refresh_token", ""), config)
+        store.delete(session_id)
+    
+    for key in ("auth_session_id", "auth_access_expires_at"):
+        st.session_state.pop(key, None)
+    st.session_state["authenticated"] = False
+    st.session_state["user_cognito_groups"] = []
+    st.session_state["user_info"] = {}
+    
+    _set_session_cookie(_session_cookie_name(config), "", 0)
+    components.html(f"<script>window.parent.location.href = {json.dumps(logout_url)};</script>", height=0)
+
+def render_login_button(login_url: str) -> None:
+    """
+    Render AWS-styled login button.
+    
+    Args:
+        login_url: URL to initiate Cognito login flow
+    """
+    css = f"""
+    <style>
+    .aws-button {{
+        background-color: {AWS_ORANGE};
+        color: {AWS_TEXT} !important;
+        padding: 0.75em 1.25em;
+        font-weight: bold;
+        border-radius: 4px;
+        text-decoration: none;
+        text-align: center;
+        display: inline-block;
+        border: none;
+        font-family: "Amazon Ember", Arial, sans-serif;
+        transition: background-color 0.3s;
+    }}
+    .aws-button:hover {{
+        background-color: {AWS_HOVER};
+        text-decoration: none;
+    }}
+    .aws-button:active {{
+        background-color: {AWS_ACTIVE};
+    }}
+    </style>
+    """
+    html = css + f"<a href='{login_url}' class='aws-button' target='_self'>Sign In</a>"
+    st.markdown(html, unsafe_allow_html=True)
+
+def render_logout_button(logout_url: str) -> None:
+    """
+    Render AWS-styled logout button.
+    
+    Args:
+        logout_url: URL to initiate Cognito logout
+    """
+    css = f"""
+    <style>
+    .aws-button {{
+        background-color: {AWS_ORANGE};
+        color: {AWS_TEXT} !important;
+        padding: 0.75em 1.25em;
+        font-weight: bold;
+        border-radius: 4px;
+        text-decoration: none;
+        text-align: center;
+        display: inline-block;
+        border: none;
+        font-family: "Amazon Ember", Arial, sans-serif;
+        transition: background-color 0.3s;
+    }}
+    .aws-button:hover {{
+        background-color: {AWS_HOVER};
+        text-decoration: none;
+    }}
+    .aws-button:active {{
+        background-color: {AWS_ACTIVE};
+    }}
+    </style>
+    """
+    html = css + f"<a href='{logout_url}' class='aws-button' target='_self'>Sign Out</a>"
+    st.sidebar.markdown(html, unsafe_allow_html=True)
+
+def login() -> bool:
+    """
+    Main authentication function to handle Cognito auth flow.
+    
+    Returns:
+        Boolean indicating whether user is authenticated
+        
+    Raises:
+        RuntimeError: If authentication configuration fails
+    """
+    # Initialize session state
+    set_st_state_vars()
+    
+    try:
+        # Load configuration
+        config = load_cognito_config()
+        
+        # Set up login/logout URLs
+        login_url = (
+            f"{config['domain']}/login?client_id={config['client_id']}"
+            f"&response_type=code&scope=email+openid&redirect_uri={config['redirect_uri']}"
+        )
+        logout_url = (
+            f"{config['domain']}/logout?client_id={config['client_id']}"
+            f"&logout_uri={config['redirect_uri']}"
+        )
+        
+        # Sign-out goes through the app first so the stored session is dropped
+        if st.query_params.get(LOGOUT_QUERY_PARAM):
+            _end_session(config, logout_url)
+            return False
+        
+        # Check for authorization code in URL
+        auth_code = get_auth_code()
+        
+        # If we have a new auth code, process it
+        if auth_code and auth_code != st.session_state.get("auth_code", ""):
+            _start_session(auth_code, exchange_code_for_token_set(auth_code, config), config)
+        else:
+            # Resume from the server-side store on reconnects and page switches
+            restore_session(config)
+        
+        # Render appropriate UI based on authentication state
+        if st.session_state.get("authenticated", False):
+            render_logout_button(f"?{LOGOUT_QUERY_PARAM}=1")
+            return True
+        else:
+            st.info("Please sign in to access this application.")
+            render_login_button(login_url)
+            return False
+            
+    except RuntimeError as e:
+        st.error(f"Authentication error: {str(e)}")
+        logger.error(f"Authentication error: {str(e)}")
+        return False
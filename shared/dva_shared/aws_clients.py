@@ -0,0 +1,246 @@
+"""
+Process-wide registry of boto3 clients shared by every page and session.
+
+Creating a boto3 client loads the service model, resolves credentials and
+opens a new connection pool, which costs tens of milliseconds and a few MiB
+each time. Pages used to do it on every rerun. aws_client() builds each
+client once per service, region, endpoint and credentials, with a tuned
+botocore configuration (connection pool, adaptive retries, timeouts and TCP
+keepalive), and hands the same client to every caller. botocore clients are
+thread-safe, so concurrent sessions can share them.
+
+boto3 sessions and resources are not thread-safe, so aws_session() and
+aws_resource() keep one per Streamlit session instead (see
+session_lifecycle.session_resource()), for libraries that want a session
+and for pages using the resource API.
+
+With DVA_AWS_BACKEND=local, clients, sessions and resources call the
+local AWS emulator with dummy credentials instead (see local_backend).
+
+Every client counts its calls, errors, retries and time per operation;
+aws_client_stats() reports them.
+
+Functions:
+    - aws_client: Shared client for a service, region and credentials
+    - aws_resource: Resource for the current Streamlit session
+    - aws_session: boto3 session for the current Streamlit session
+    - aws_client_stats: Call counters of every shared client
+    - aws_endpoint_url: Endpoint override for code building its own clients
+    - client_config: botocore settings of the shared clients
+"""
+
+import functools
+import hashlib
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from . import local_backend
+from .session_lifecycle import session_resource
+
+if TYPE_CHECKING:  # boto3 is imported when the first client is built
+    import boto3
+    from botocore.config import Config
+
+# Connections each client keeps open; one per concurrent request to a service
+AWS_MAX_POOL_CONNECTIONS = int(os.getenv("DVA_AWS_MAX_POOL_CONNECTIONS", "50"))
+# Total attempts per call, with client-side rate limiting when AWS throttles
+AWS_MAX_ATTEMPTS = int(os.getenv("DVA_AWS_MAX_ATTEMPTS", "5"))
+AWS_CONNECT_TIMEOUT = float(os.getenv("DVA_AWS_CONNECT_TIMEOUT", "5"))
+# Above the 20 second SQS long poll and Bedrock's slower responses
+AWS_READ_TIMEOUT = float(os.getenv("DVA_AWS_READ_TIMEOUT", "60"))
+
+_clients: Dict[Tuple, Any] = {}
+_sessions: Dict[Tuple, "boto3.Session"] = {}
+_stats: Dict[Tuple, Dict[str, Dict[str, float]]] = {}
+# boto3 sessions are not thread-safe, so clients are created one at a time
+_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def client_config() -> "Config":
+    """botocore settings of every shared client and resource."""
+    from botocore.config import Config
+
+    return Config(
+        max_pool_connections=AWS_MAX_POOL_CONNECTIONS,
+        retries={"mode": "adaptive", "total_max_attempts": AWS_MAX_ATTEMPTS},
+        connect_timeout=AWS_CONNECT_TIMEOUT,
+        read_timeout=AWS_READ_TIMEOUT,
+        tcp_keepalive=True,
+    )
+
+
+def _credentials_key(profile_name: Optional[str], aws_access_key_id: Optional[str],
+                     aws_secret_access_key: Optional[str], aws_session_token: Optional[str]) -> Tuple:
+    """Registry key part for explicit credentials, without keeping the secret itself."""
+    secret = f"{aws_secret_access_key or ''}:{aws_session_token or ''}"
+    digest = hashlib.sha256(secret.encode("utf-8")).hexdigest()[:16] if secret != ":" else ""
+    return profile_name or "", aws_access_key_id or "", digest
+
+
+def _shared_session(region_name: Optional[str], profile_name: Optional[str], aws_access_key_id: Optional[str],
+                    aws_secret_access_key: Optional[str], aws_session_token: Optional[str]) -> "boto3.Session":
+    """The session the shared clients of a region and credentials are built from.
+
+    Callers must hold _lock.
+    """
+    key = (region_name or "",) + _credentials_key(
+        profile_name, aws_access_key_id, aws_secret_access_key, aws_session_token)
+    session = _sessions.get(key)
+    if session is None:
+        import boto3
+
+        session = boto3.Session(
+            region_name=region_name, profile_name=profile_name, aws_access_key_id=aws_access_key_id,
+            aws_secret_access_key=aws_secret_access_key, aws_session_token=aws_session_token)
+        _sessions[key] = session
+    return session
+
+
+def aws_session(region_name: Optional[str] = None, *, profile_name: Optional[str] = None) -> "boto3.Session":
+    """Return a boto3 session for the current Streamlit session.
+
+    For libraries that take a session and build their own clients or
+    resources from it. Use aws_client() for clients.
+
+    Args:
+        region_name: AWS region (defaults to the environment's region)
+        profile_name: Named profile to use instead of the default chain
+
+    Returns:
+        The Streamlit session's boto3 session
+    """
+    def build() -> "boto3.Session":
+        import boto3
+
+        if local_backend.enabled():
+            return boto3.Session(region_name=region_name, **local_backend.credentials())
+        return boto3.Session(region_name=region_name, profile_name=profile_name)
+
+    return session_resource(f"aws_session:{region_name}:{profile_name}", build)
+
+
+def aws_endpoint_url() -> Optional[str]:
+    """Endpoint to pass to code that builds its own clients; None means AWS itself."""
+    return local_backend.endpoint_url()
+
+
+def _count_calls(client: Any, stats: Dict[str, Dict[str, float]]) -> None:
+    """Count the calls, errors, retries and time of each operation of a client."""
+    def before_call(context: Dict[str, Any], **kwargs: Any) -> None:
+        context["_dva_started"] = time.perf_counter()
+
+    def after_call(event_name: str, context: Dict[str, Any], parsed: Optional[Dict[str, Any]] = None,
+                   http_response: Any = None, exception: Optional[Exception] = None, **kwargs: Any) -> None:
+        # after-call-error (connection failures, timeouts) carries no operation model
+        operation = event_name.rsplit(".", 1)[-1]
+        elapsed = time.perf_counter() - context.get("_dva_started", time.perf_counter())
+        metadata = (parsed or {}).get("ResponseMetadata", {})
+        failed = exception is not None or (http_response is not None and http_response.status_code >= 300)
+        with _lock:
+            counters = stats.setdefault(operation, {"calls": 0, "errors": 0, "retries": 0, "seconds": 0.0})
+            counters["calls"] += 1
+            counters["errors"] += failed
+            counters["retries"] += metadata.get("RetryAttempts", 0)
+            counters["seconds"] += elapsed
+
+    client.meta.events.register("before-call.*.*", before_call)
+    client.meta.events.register("after-call.*.*", after_call)
+    client.meta.events.register("after-call-error.*.*", after_call)
+
+
+def aws_client(service_name: str, region_name: Optional[str] = None, *, endpoint_url: Optional[str] = None,
+               config: Optional["Config"] = None, profile_name: Optional[str] = None,
+               aws_access_key_id: Optional[str] = None, aws_secret_access_key: Optional[str] = None,
+               aws_session_token: Optional[str] = None) -> Any:
+    """Return the shared client for a service, region and credentials.
+
+    The client is built on first use with client_config() and reused by every
+    caller asking for the same service, region, endpoint, credentials and
+    config. Use it in place of boto3.client().
+
+    Args:
+        service_name: Service, e.g. "s3" or "bedrock-runtime"
+        region_name: AWS region (defaults to the environment's region)
+        endpoint_url: Endpoint to call instead of the service's own (the
+            local emulator with DVA_AWS_BACKEND=local)
+        config: Settings merged over client_config()
+        profile_name: Named profile to use instead of the default chain
+        aws_access_key_id: Explicit access key
+        aws_secret_access_key: Explicit secret key
+        aws_session_token: Explicit session token
+
+    Returns:
+        The shared botocore client
+    """
+    if endpoint_url is None and local_backend.enabled():
+        endpoint_url = local_backend.endpoint_url()
+        local = local_backend.credentials()
+        profile_name = aws_session_token = None
+        aws_access_key_id, aws_secret_access_key = local["aws_access_key_id"], local["aws_secret_access_key"]
+    credentials = _credentials_key(profile_name, aws_access_key_id, aws_secret_access_key, aws_session_token)
+    # Configs are keyed by their settings, so equal configs built on each rerun share a client
+    settings = repr(sorted(config._user_provided_options.items())) if config else ""
+    key = (service_name, region_name or "", endpoint_url or "", credentials, settings)
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            session = _shared_session(region_name, profile_name, aws_access_key_id,
+                                      aws_secret_access_key, aws_session_token)
+            client = session.client(service_name, endpoint_url=endpoint_url,
+                                    config=client_config().merge(config) if config else client_config())
+            _count_calls(client, _stats.setdefault(key, {}))
+            _clients[key] = client
+    return client
+
+
+def aws_resource(service_name: str, region_name: Optional[str] = None, *,
+                 endpoint_url: Optional[str] = None, profile_name: Optional[str] = None) -> Any:
+    """Return a boto3 resource for the current Streamlit session.
+
+    Resources are not thread-safe, so each session gets its own, built
+    with client_config() and dropped with the session's other resources when
+    the session goes idle.
+
+    Args:
+        service_name: Service, e.g. "dynamodb" or "s3"
+        region_name: AWS region (defaults to the environment's region)
+        endpoint_url: Endpoint to call instead of the service's own (the
+            local emulator with DVA_AWS_BACKEND=local)
+        profile_name: Named profile to use instead of the default chain
+
+    Returns:
+        The session's resource
+    """
+    def build() -> Any:
+        session = aws_session(region_name, profile_name=profile_name)
+        return session.resource(service_name, endpoint_url=endpoint_url or aws_endpoint_url(),
+                                config=client_config())
+
+    return session_resource(f"aws_resource:{service_name}:{region_name}:{endpoint_url}:{profile_name}", build)
+
+
+def aws_client_stats() -> List[Dict[str, Any]]:
+    """Call counters of every shared client, busiest first.
+
+    Returns:
+        One entry per client and operation with its calls, errors, retries
+        and mean milliseconds per call
+    """
+    with _lock:
+        report = [{
+            "service": key[0],
+            "region": key[1] or _clients[key].meta.region_name,
+            "operation": operation,
+            "calls": counters["calls"],
+            "errors": counters["errors"],
+            "retries": counters["retries"],
+            "mean_ms": round(counters["seconds"] / counters["calls"] * 1000, 1) if counters["calls"] else 0.0,
+        } for key, operations in _stats.items() for operation, counters in operations.items()]
+    return sorted(report, key=lambda entry: entry["calls"], reverse=True)
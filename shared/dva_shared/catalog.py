@@ -0,0 +1,143 @@
+"""
+Data catalog for the reference tables shown on the session pages.
+
+Each app keeps its static tables (service comparisons, pricing tables,
+region lists, ...) in data/catalog.json as named, versioned datasets:
+
+    {
+      "fargate.comparison": {
+        "version": 1,
+        "columns": {"Feature": [...], "AWS Fargate": [...]}
+      }
+    }
+
+On first use a dataset is written to an Arrow IPC file under data/.arrow/,
+named after its version and a hash of its content, and read back through a
+memory map. The resulting frame is built once per process and shared by
+every session; pages get it through table() instead of rebuilding the same
+pd.DataFrame on each rerun.
+"""
+import functools
+import hashlib
+import json
+import threading
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:  # pandas and pyarrow are imported on first lookup
+    import pandas as pd
+    import pyarrow as pa
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+# Data directory bound by configure(); one app per process
+_configured_data_dir = None
+CATALOG_FILE = "catalog.json"
+
+# Memory-mapped Arrow copies of the datasets, rebuilt when a dataset changes
+ARROW_DIR_NAME = ".arrow"
+
+_frames: Dict[str, "pd.DataFrame"] = {}
+_frames_lock = threading.Lock()
+
+
+def configure(data_dir: Path) -> None:
+    """Bind the catalog to the app importing it.
+
+    Called once from each app's utils/catalog.py. A process serves a single
+    app; binding a second app raises.
+
+    Args:
+        data_dir: Directory holding the app's catalog.json
+
+    Raises:
+        RuntimeError: If the process is already bound to another app
+    """
+    global DATA_DIR, _configured_data_dir
+    data_dir = Path(data_dir).resolve()
+    if _configured_data_dir is not None and _configured_data_dir != data_dir:
+        raise RuntimeError(f"dva_shared.catalog is already configured for {_configured_data_dir}; "
+                           "run each app in its own process")
+    _configured_data_dir = DATA_DIR = data_dir
+    _catalog.cache_clear()
+    with _frames_lock:
+        _frames.clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _catalog() -> Dict[str, Dict[str, Any]]:
+    """Read the app's catalog.json once per process."""
+    return json.loads((DATA_DIR / CATALOG_FILE).read_text(encoding="utf-8"))
+
+
+def _arrow_path(name: str, entry: Dict[str, Any]) -> Path:
+    """Location of the Arrow copy of a dataset for its current version and content."""
+    content = json.dumps(entry["columns"], sort_keys=True, ensure_ascii=False)
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
+    return DATA_DIR / ARROW_DIR_NAME / f"{name}.v{entry.get('version', 1)}.{digest}.arrow"
+
+
+def _read_table(name: str, entry: Dict[str, Any]) -> "pa.Table":
+    """Load a dataset from its Arrow file, writing the file first if needed.
+
+    Falls back to building the table in memory if the data folder is not
+    writable.
+    """
+    import pyarrow as pa
+
+    path = _arrow_path(name, entry)
+    if not path.exists():
+        table = pa.table(entry["columns"])
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{uuid.uuid4().hex[:8]}.tmp")
+            with pa.OSFile(str(tmp), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+            tmp.replace(path)
+        except OSError:
+            return table
+    # The mapping stays open for as long as the table's buffers are alive
+    return pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+
+
+def _copy_on_write() -> bool:
+    """Whether pandas copies shared data on write (always from pandas 3, opt-in before)."""
+    import pandas as pd
+
+    return int(pd.__version__.split(".", 1)[0]) >= 3 or pd.get_option("mode.copy_on_write") is True
+
+
+def table(name: str) -> "pd.DataFrame":
+    """Return a catalog dataset as a DataFrame.
+
+    The frame built from the catalog is shared by every session. Each call
+    returns a copy a page may change freely: a shallow one under
+    copy-on-write (pandas 3, or pandas 2 with mode.copy_on_write enabled),
+    where a change copies only the touched columns, and a deep one
+    otherwise, since writing to a shallow copy would alter the shared data.
+
+    Args:
+        name: Dataset name, e.g. "fargate.comparison"
+
+    Returns:
+        The dataset as a DataFrame
+
+    Raises:
+        KeyError: If the catalog has no dataset of that name
+    """
+    frame = _frames.get(name)
+    if frame is None:
+        with _frames_lock:
+            frame = _frames.get(name)
+            if frame is None:
+                entry = _catalog().get(name)
+                if entry is None:
+                    raise KeyError(f"Unknown dataset: {name}")
+                frame = _read_table(name, entry).to_pandas()
+                _frames[name] = frame
+    return frame.copy(deep=not _copy_on_write())
+
+
+def names() -> List[str]:
+    """Names of all datasets in the app's catalog."""
+    return list(_catalog())
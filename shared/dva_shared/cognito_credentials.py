@@ -0,0 +1,185 @@
+import json
+import os
+import time
+import logging
+import threading
+from botocore.exceptions import ClientError
+
+from .aws_clients import aws_client
+
+logger = logging.getLogger(__name__)
+
+# Seconds a fetched secret is served from the process-wide cache
+CREDENTIALS_TTL = int(os.getenv("COGNITO_CREDENTIALS_TTL", "900"))
+# Start a background refresh when less than this many seconds are left
+CREDENTIALS_REFRESH_AHEAD = int(os.getenv("COGNITO_CREDENTIALS_REFRESH_AHEAD", "60"))
+# How long an expired entry may still be served while Secrets Manager is failing
+CREDENTIALS_MAX_STALE = int(os.getenv("COGNITO_CREDENTIALS_MAX_STALE", "3600"))
+
+
+def _fetch_cognito_credentials(secret_name, region_name):
+    """
+    Fetch Cognito credentials from AWS Secrets Manager (uncached)
+
+    Returns:
+        dict: Dictionary containing Cognito credentials
+    """
+
+    # Shared Secrets Manager client
+    client = aws_client('secretsmanager', region_name=region_name)
+
+    try:
+        # Get the secret value
+        response = client.get_secret_value(SecretId=secret_name)
+
+        # Parse the secret string to a dictionary
+        if 'SecretString' in response:
+            secret = json.loads(response['SecretString'])
+
+            # Extract required credentials
+            cognito_credentials = {
+                'COGNITO_DOMAIN': secret.get('COGNITO_DOMAIN'),
+                'COGNITO_USER_POOL_ID': secret.get('COGNITO_USER_POOL_ID'),
+                'COGNITO_APP_CLIENT_SECRET': secret.get('COGNITO_APP_CLIENT_SECRET'),
+                'COGNITO_APP_CLIENT_ID': secret.get('COGNITO_APP_CLIENT_ID'),
+                'COGNITO_REDIRECT_URI_1': secret.get('COGNITO_REDIRECT_URI_1'),
+                'COGNITO_REDIRECT_URI_2': secret.get('COGNITO_REDIRECT_URI_2'),
+                'COGNITO_REDIRECT_URI_3': secret.get('COGNITO_REDIRECT_URI_3'),
+                'COGNITO_REDIRECT_URI_4': secret.get('COGNITO_REDIRECT_URI_4'),
+                'COGNITO_REDIRECT_URI_5': secret.get('COGNITO_REDIRECT_URI_5'),
+            }
+
+            return cognito_credentials
+        else:
+            # Binary secret
+            raise ValueError("Binary secrets not supported for this function")
+
+    except ClientError as e:
+        # Handle exceptions
+        error_code = e.response['Error']['Code']
+        error_msg = e.response['Error']['Message']
+        print(f"Error retrieving secret: {error_code} - {error_msg}")
+        raise
+
+
+class CredentialCache:
+    """Process-wide TTL cache for secrets with background refresh.
+
+    Entries are served from memory until they expire. Shortly before expiry a
+    single background thread refreshes the entry while callers keep getting
+    the current value. Once expired, the last good value is still served for
+    up to ``max_stale`` seconds while a refresh runs in the background, so a
+    slow or failing Secrets Manager never blocks a rerun.
+    """
+
+    def __init__(self, fetch, ttl=CREDENTIALS_TTL, refresh_ahead=CREDENTIALS_REFRESH_AHEAD,
+                 max_stale=CREDENTIALS_MAX_STALE):
+        self._fetch = fetch
+        self.ttl = ttl
+        self.refresh_ahead = refresh_ahead
+        self.max_stale = max_stale
+        self._entries = {}
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "refreshes": 0, "stale_hits": 0, "errors": 0}
+
+    def get(self, secret_name, region_name):
+        """Return the cached value for a secret, fetching it if needed."""
+        key = (secret_name, region_name)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and now < entry["expires_at"]:
+                self._stats["hits"] += 1
+                if entry["expires_at"] - now <= self.refresh_ahead:
+                    self._start_refresh(key)
+                return dict(entry["value"])
+            if entry and now < entry["expires_at"] + self.max_stale:
+                # Stale-while-revalidate: never block a rerun on Secrets Manager
+                # while a recent value is still available
+                self._stats["stale_hits"] += 1
+                self._start_refresh(key)
+                return dict(entry["value"])
+            self._stats["misses"] += 1
+
+        # Serialise cold misses so a burst of reruns triggers a single fetch
+        with self._load_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry and time.monotonic() < entry["expires_at"]:
+                    return dict(entry["value"])
+            try:
+                return dict(self._load(key))
+            except Exception:
+                with self._lock:
+                    self._stats["errors"] += 1
+                raise
+
+    def _start_refresh(self, key):
+        # Caller must hold self._lock
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+        threading.Thread(
+            target=self._refresh, args=(key,), name="cognito-credentials-refresh", daemon=True
+        ).start()
+
+    def _load(self, key):
+        value = self._fetch(*key)
+        with self._lock:
+            self._entries[key] = {"value": value, "expires_at": time.monotonic() + self.ttl}
+        return value
+
+    def _refresh(self, key):
+        try:
+            self._load(key)
+            with self._lock:
+                self._stats["refreshes"] += 1
+        except Exception as e:
+            with self._lock:
+                self._stats["errors"] += 1
+            logger.warning(f"Background refresh of Cognito credentials failed: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def invalidate(self, secret_name=None, region_name=None):
+        """Drop one cached secret, or all of them when no name is given."""
+        with self._lock:
+            if secret_name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop((secret_name, region_name), None)
+
+    def stats(self):
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return dict(self._stats, entries=len(self._entries))
+
+
+_credential_cache = CredentialCache(_fetch_cognito_credentials)
+
+
+def get_cognito_credentials(secret_name="apcr/dva/secrets",region_name="us-east-1"):
+    """
+    Retrieve Cognito credentials from AWS Secrets Manager
+
+    The secret is cached process-wide for ``COGNITO_CREDENTIALS_TTL`` seconds,
+    so Streamlit reruns do not each make a Secrets Manager round trip.
+
+    Returns:
+        dict: Dictionary containing Cognito credentials
+    """
+    return _credential_cache.get(secret_name, region_name)
+
+
+def get_credential_cache_stats():
+    """
+    Return hit/miss counters for the Cognito credential cache
+
+    Returns:
+        dict: Counters for hits, misses, refreshes, stale hits and errors
+    """
+    return _credential_cache.stats()
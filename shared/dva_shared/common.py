@@ -0,0 +1,1694 @@
+import streamlit as st
+import streamlit.components.v1 as components
+import functools
+import base64
+import cProfile
+import hashlib
+import html
+import importlib
+import io
+import json
+import os
+import pickle
+import pstats
+import re
+import shutil
+import sys
+import textwrap
+import threading
+import time
+import types
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from . import local_backend, session_lifecycle
+from .aws_clients import (  # noqa: F401  re-exported to the pages
+    aws_client,
+    aws_client_stats,
+    aws_endpoint_url,
+    aws_resource,
+    aws_session,
+)
+from .session_lifecycle import (  # noqa: F401  re-exported to the pages
+    BoundedList,
+    declare_session_key,
+    session_memory_report,
+    session_resource,
+)
+
+# Number of rendered diagram HTML documents kept per process
+MERMAID_HTML_CACHE_SIZE = 256
+
+# Pinned Mermaid runtime, vendored in vendor/mermaid/ by scripts/vendor_mermaid.py.
+# The integrity hash also guards the CDN fallback; update both with the bundle.
+MERMAID_VERSION = "11.4.1"
+MERMAID_INTEGRITY = "sha384-rbtjAdnIQE/aQJGEgXrVUlMibdfTSa4PQju4HDhN3sR2PmaKFzhEafuePsl9H/9I"
+MERMAID_CDN_URL = f"https://cdn.jsdelivr.net/npm/mermaid@{MERMAID_VERSION}/dist/mermaid.min.js"
+# Directory of the app's Home.py, set by configure(); the vendored bundle is
+# published from its static/ folder
+APP_DIR = Path(__file__).resolve().parent.parent
+# App bound by configure(); settings are per process, so one app per process
+_configured_app_dir: Optional[Path] = None
+MERMAID_VENDOR_DIR = APP_DIR.parent / "vendor" / "mermaid"
+# SVGs rendered offline by scripts/precompile_mermaid.py, keyed by settings and source hash
+MERMAID_SVG_CACHE_DIR = Path(os.getenv("MERMAID_SVG_CACHE_DIR", APP_DIR.parent / "mermaid_cache"))
+
+# Mermaid settings used for browser rendering, unless the app passes its own
+# to configure(). scripts/precompile_mermaid.py renders each app's static
+# diagrams with the settings that app uses.
+MERMAID_CONFIG = {
+    "startOnLoad": False,
+    "theme": "default",
+    "flowchart": {"useMaxWidth": False, "htmlLabels": True},
+    "sequence": {"useMaxWidth": False},
+    "gantt": {"useMaxWidth": False},
+    "journey": {"useMaxWidth": False},
+    "timeline": {"useMaxWidth": False},
+}
+
+# Session state flag set once the diagram host has been emitted in this run
+_MERMAID_HOST_KEY = "mermaid_host_rendered"
+
+# Whether initialize_session_state() clears the session when the learner moves
+# to another page (see configure())
+RESET_SESSION_ON_INIT = False
+
+# Session state prefix for tab_router() selections; kept by reset_session()
+_TAB_ROUTER_PREFIX = "_tab_router_"
+
+# Distinct stylesheets published per process by stylesheet()
+STYLESHEET_CACHE_SIZE = 64
+
+# Bounds of the process-wide cache of built Plotly figures (see cached_figure())
+FIGURE_CACHE_ENTRIES = 256
+FIGURE_CACHE_BYTES = 64 * 1024 * 1024
+
+# Profiling mode (see profiled()): DVA_PROFILE=1 or ?profile=1 times the page
+# functions; "cprofile" also writes a pstats dump of each rerun to PROFILE_DIR
+PROFILE_ENV_VAR = "DVA_PROFILE"
+PROFILE_QUERY_PARAM = "profile"
+PROFILE_DIR = Path(os.getenv("DVA_PROFILE_DIR", APP_DIR / "profiles"))
+PROFILE_HISTORY = 20
+PROFILE_DUMPS_KEPT = 100
+PROFILE_TOP_CALLS = 25
+_PROFILE_RUNS_KEY = "_profile_runs"
+
+# Bounds for auto-height diagrams, and the column width assumed for diagram
+# types drawn with useMaxWidth
+MERMAID_MIN_HEIGHT = 200
+MERMAID_MAX_HEIGHT = 1200
+MERMAID_COLUMN_WIDTH = 700
+# The host records the height each diagram actually rendered at in this
+# cookie; the server learns from it so later runs size the diagram exactly
+MERMAID_HEIGHTS_COOKIE = "mermaid_heights"
+MERMAID_HEIGHTS_COOKIE_ENTRIES = 150
+MERMAID_MEASURED_HEIGHTS_SIZE = 2048
+
+# Measured heights by diagram source hash, shared by every session
+_measured_heights: Dict[str, int] = {}
+
+# Flowchart edge operators, including inline and |pipe| labels
+_FLOW_EDGE = re.compile(
+    r"\s*(?:--\s[^-]+?-->|==\s[^=]+?==>|<?-{2,}[->ox]?|<?={2,}>?|-\.+->?|~~~)\s*(?:\|[^|]*\|)?\s*"
+)
+_FLOW_NODE = re.compile(r"\s*([A-Za-z0-9_]+)")
+_SEQUENCE_MESSAGE = re.compile(r"^([^-+:]+?)\s*(?:-{1,2}>>|-{1,2}>|-{1,2}x|-{1,2}\))\s*[+-]?([^:]+?)\s*:")
+_GANTT_KEYWORDS = {"title", "dateFormat", "axisFormat", "tickInterval", "section", "excludes",
+                   "includes", "todayMarker", "weekday"}
+
+# Loads Mermaid once into the Streamlit page and shares it with every diagram
+# on it: the vendored bundle from app/static/, else the pinned CDN build, both
+# checked against the integrity hash.
+_MERMAID_LOADER_JS = """
+function loadMermaidScript(host, src, integrity) {
+    return new Promise((resolve, reject) => {
+        const script = host.document.createElement('script');
+        script.src = src;
+        if (integrity) {
+            script.integrity = integrity;
+            script.crossOrigin = 'anonymous';
+        }
+        script.onload = resolve;
+        script.onerror = () => {
+            script.remove();
+            reject(new Error('Failed to load Mermaid from ' + src));
+        };
+        host.document.head.appendChild(script);
+    });
+}
+
+function loadMermaid() {
+    let host = window;
+    try {
+        if (window.parent && window.parent.document) host = window.parent;
+    } catch (e) {}
+    if (host.mermaid) return Promise.resolve(host.mermaid);
+    if (!host.__mermaidLoader) {
+        host.__mermaidLoader = (async () => {
+            const runtime = MERMAID_RUNTIME;
+            if (runtime.local) {
+                try {
+                    await loadMermaidScript(host, runtime.local, runtime.integrity);
+                    if (host.mermaid) return host.mermaid;
+                } catch (error) {
+                    console.warn('Vendored Mermaid bundle unavailable, falling back to CDN', error);
+                }
+            }
+            await loadMermaidScript(host, runtime.cdn, runtime.integrity);
+            return host.mermaid;
+        })();
+        host.__mermaidLoader.catch(() => { delete host.__mermaidLoader; });
+    }
+    return host.__mermaidLoader;
+}
+"""
+
+# Runs in the Streamlit page itself, installed once by the host component.
+# Diagram placeholders written by mermaid() are picked up as they appear,
+# rendered one at a time when they scroll into view (diagrams in hidden tabs
+# wait until the tab is opened) and given their zoom and pan handlers.
+_MERMAID_HOST_JS = """
+const ZOOM_MIN = 0.5;
+const ZOOM_MAX = 3.0;
+const ZOOM_STEP = 0.2;
+let renderQueue = Promise.resolve();
+let renderCount = 0;
+
+const style = document.createElement('style');
+style.textContent = MERMAID_CSS;
+document.head.appendChild(style);
+
+function decode(value) {
+    const bytes = Uint8Array.from(atob(value || ''), (c) => c.charCodeAt(0));
+    return new TextDecoder().decode(bytes);
+}
+
+async function renderDiagram(wrapper) {
+    const diagram = wrapper.querySelector('.mermaid-diagram');
+    if (!diagram) return;
+    try {
+        if (wrapper.dataset.svg) {
+            diagram.innerHTML = decode(wrapper.dataset.svg);
+        } else {
+            const mermaid = await loadMermaid();
+            mermaid.initialize(MERMAID_CONFIG);
+            renderCount += 1;
+            const { svg } = await mermaid.render('mermaid-svg-' + renderCount, decode(wrapper.dataset.source));
+            diagram.innerHTML = svg;
+        }
+    } catch (error) {
+        console.error('Error rendering Mermaid diagram:', error);
+        const message = document.createElement('div');
+        message.className = 'mermaid-error';
+        message.textContent = 'Error rendering diagram: ' + error.message;
+        diagram.replaceChildren(message);
+    }
+    if (wrapper.dataset.autoHeight === 'true') recordHeight(wrapper, diagram);
+    setupInteractions(wrapper);
+}
+
+// Fit auto-height diagrams to their rendered size and remember that size, so
+// the server can reserve the right height the next time the diagram is drawn
+function recordHeight(wrapper, diagram) {
+    if (!diagram.querySelector('svg') || !diagram.offsetHeight) return;
+    const measured = Math.max(MERMAID_HEIGHTS.min, Math.min(MERMAID_HEIGHTS.max, Math.ceil(diagram.offsetHeight)));
+    wrapper.style.height = (measured + Number(wrapper.dataset.heightOffset || 0)) + 'px';
+
+    const heights = new Map();
+    const prefix = MERMAID_HEIGHTS.cookie + '=';
+    const cookie = document.cookie.split('; ').find((item) => item.startsWith(prefix));
+    if (cookie) {
+        cookie.slice(prefix.length).split('.').forEach((item) => {
+            const [digest, value] = item.split(':');
+            if (digest && value) heights.set(digest, value);
+        });
+    }
+    heights.delete(wrapper.dataset.sourceHash);
+    heights.set(wrapper.dataset.sourceHash, String(measured));
+    while (heights.size > MERMAID_HEIGHTS.entries) heights.delete(heights.keys().next().value);
+    const value = Array.from(heights, ([digest, height]) => digest + ':' + height).join('.');
+    document.cookie = prefix + value + '; path=/; max-age=2592000; SameSite=Lax';
+}
+
+function setupInteractions(wrapper) {
+    if (wrapper.__mermaidInteractive) return;
+    wrapper.__mermaidInteractive = true;
+    const container = wrapper.querySelector('.mermaid-container');
+    const content = wrapper.querySelector('.mermaid-content');
+    if (!container || !content) return;
+
+    if (wrapper.dataset.zoom === 'true') {
+        const zoomInBtn = wrapper.querySelector('[data-action="zoom-in"]');
+        const zoomOutBtn = wrapper.querySelector('[data-action="zoom-out"]');
+        const zoomLevel = wrapper.querySelector('.mermaid-zoom-level');
+        let currentZoom = 1.0;
+
+        function updateZoom(newZoom) {
+            currentZoom = Math.max(ZOOM_MIN, Math.min(ZOOM_MAX, newZoom));
+            content.style.transform = 'scale(' + currentZoom + ')';
+            if (zoomLevel) zoomLevel.textContent = Math.round(currentZoom * 100) + '%';
+            if (zoomInBtn) zoomInBtn.disabled = currentZoom >= ZOOM_MAX;
+            if (zoomOutBtn) zoomOutBtn.disabled = currentZoom <= ZOOM_MIN;
+        }
+
+        wrapper.addEventListener('click', (e) => {
+            const button = e.target.closest('.mermaid-zoom-btn');
+            if (!button) return;
+            if (button.dataset.action === 'zoom-in') updateZoom(currentZoom + ZOOM_STEP);
+            else if (button.dataset.action === 'zoom-out') updateZoom(currentZoom - ZOOM_STEP);
+            else updateZoom(1.0);
+        });
+
+        container.addEventListener('wheel', (e) => {
+            if (e.ctrlKey || e.metaKey) {
+                e.preventDefault();
+                updateZoom(currentZoom + (e.deltaY > 0 ? -ZOOM_STEP : ZOOM_STEP));
+            }
+        });
+
+        updateZoom(1.0);
+        container.setAttribute('tabindex', '0');
+    }
+
+    if (wrapper.dataset.pan === 'true') {
+        let isPanning = false;
+        let startX, startY, scrollLeft, scrollTop;
+
+        container.addEventListener('mousedown', (e) => {
+            if (e.button !== 0) return;
+            isPanning = true;
+            startX = e.pageX;
+            startY = e.pageY;
+            scrollLeft = container.scrollLeft;
+            scrollTop = container.scrollTop;
+            container.classList.add('panning');
+        });
+
+        const stopPanning = () => {
+            isPanning = false;
+            container.classList.remove('panning');
+        };
+        container.addEventListener('mouseleave', stopPanning);
+        container.addEventListener('mouseup', stopPanning);
+
+        container.addEventListener('mousemove', (e) => {
+            if (!isPanning) return;
+            e.preventDefault();
+            container.scrollLeft = scrollLeft - (e.pageX - startX);
+            container.scrollTop = scrollTop - (e.pageY - startY);
+        });
+    }
+}
+
+// Streamlit reuses the placeholder element when a diagram changes, so the
+// rendered diagram ID is tracked on the element rather than in its markup
+function schedule(wrapper) {
+    const diagramId = wrapper.dataset.diagramId;
+    if (wrapper.__mermaidQueued === diagramId) return;
+    wrapper.__mermaidQueued = diagramId;
+    visibility.unobserve(wrapper);
+    renderQueue = renderQueue.then(() => renderDiagram(wrapper));
+}
+
+const visibility = new IntersectionObserver((entries) => {
+    entries.forEach((entry) => {
+        if (entry.isIntersecting) schedule(entry.target);
+    });
+}, { rootMargin: '200px 0px' });
+
+function scan() {
+    document.querySelectorAll('.mermaid-wrapper[data-diagram-id]').forEach((wrapper) => {
+        if (wrapper.__mermaidQueued !== wrapper.dataset.diagramId) visibility.observe(wrapper);
+    });
+}
+
+let scanPending = false;
+new MutationObserver(() => {
+    if (scanPending) return;
+    scanPending = true;
+    requestAnimationFrame(() => {
+        scanPending = false;
+        scan();
+    });
+}).observe(document.body, {
+    childList: true,
+    subtree: true,
+    attributes: true,
+    attributeFilter: ['data-diagram-id'],
+});
+scan();
+"""
+
+# Styles for diagram placeholders, added to the page once by the host
+_MERMAID_CSS = """
+.mermaid-wrapper {
+    position: relative;
+    box-sizing: border-box;
+    border: 1px solid #e1e5e9;
+    border-radius: 6px;
+    background: #fafafa;
+    font-family: Arial, sans-serif;
+}
+.mermaid-controls {
+    position: absolute;
+    top: 10px;
+    right: 10px;
+    display: flex;
+    gap: 5px;
+    align-items: center;
+    background: rgba(255, 255, 255, 0.9);
+    padding: 5px 8px;
+    border-radius: 20px;
+    box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
+    z-index: 10;
+    backdrop-filter: blur(4px);
+}
+.mermaid-zoom-btn {
+    background: #fff;
+    border: 1px solid #ddd;
+    border-radius: 4px;
+    width: 28px;
+    height: 28px;
+    padding: 0;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    cursor: pointer;
+    transition: all 0.2s ease;
+    color: #555;
+}
+.mermaid-zoom-btn:hover:not(:disabled) {
+    background: #f0f0f0;
+    border-color: #bbb;
+    transform: translateY(-1px);
+}
+.mermaid-zoom-btn:active {
+    transform: translateY(0);
+}
+.mermaid-zoom-btn:disabled {
+    opacity: 0.5;
+    cursor: not-allowed;
+}
+.mermaid-zoom-level {
+    font-size: 12px;
+    color: #666;
+    font-weight: 500;
+    min-width: 35px;
+    text-align: center;
+    margin-left: 5px;
+}
+.mermaid-container {
+    box-sizing: border-box;
+    height: 100%;
+    padding: 20px;
+    display: flex;
+    justify-content: center;
+    align-items: flex-start;
+    position: relative;
+}
+.mermaid-container.panning {
+    cursor: grabbing !important;
+}
+.mermaid-content {
+    transform-origin: top center;
+    transition: transform 0.3s ease;
+    min-width: 100%;
+    display: flex;
+    justify-content: center;
+}
+.mermaid-diagram {
+    width: 100%;
+    display: flex;
+    justify-content: center;
+    align-items: center;
+}
+.mermaid-error {
+    color: red;
+    padding: 20px;
+}
+.mermaid-container::-webkit-scrollbar {
+    width: 8px;
+    height: 8px;
+}
+.mermaid-container::-webkit-scrollbar-track {
+    background: #f1f1f1;
+    border-radius: 4px;
+}
+.mermaid-container::-webkit-scrollbar-thumb {
+    background: #c1c1c1;
+    border-radius: 4px;
+}
+.mermaid-container::-webkit-scrollbar-thumb:hover {
+    background: #a8a8a8;
+}
+@media (max-width: 640px) {
+    .mermaid-controls {
+        top: 5px;
+        right: 5px;
+        padding: 3px 6px;
+    }
+    .mermaid-zoom-btn {
+        width: 24px;
+        height: 24px;
+    }
+    .mermaid-zoom-level {
+        font-size: 11px;
+    }
+}
+"""
+
+_ZOOM_IN_ICON = (
+    '<svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">'
+    '<circle cx="11" cy="11" r="8"></circle><path d="m21 21-4.35-4.35"></path>'
+    '<line x1="8" y1="11" x2="14" y2="11"></line><line x1="11" y1="8" x2="11" y2="14"></line></svg>'
+)
+_ZOOM_OUT_ICON = (
+    '<svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">'
+    '<circle cx="11" cy="11" r="8"></circle><path d="m21 21-4.35-4.35"></path>'
+    '<line x1="8" y1="11" x2="14" y2="11"></line></svg>'
+)
+_ZOOM_RESET_ICON = (
+    '<svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">'
+    '<path d="M3 3l18 18"></path><path d="M9 9h6v6"></path><circle cx="12" cy="12" r="3"></circle></svg>'
+)
+
+
+def configure(app_dir: Path, mermaid_config: Optional[Dict[str, Any]] = None,
+              reset_session_on_init: bool = False) -> None:
+    """Bind the shared helpers to the app importing them.
+
+    Called once from each app's utils/common.py. The settings are module
+    globals, so a process serves a single app; binding a second app raises.
+
+    Args:
+        app_dir: Directory holding the app's Home.py and static/ folder
+        mermaid_config: Mermaid settings replacing MERMAID_CONFIG
+        reset_session_on_init: Clear the session state in initialize_session_state()
+            when the learner moves to another page
+
+    Raises:
+        RuntimeError: If the process is already bound to another app
+    """
+    global APP_DIR, MERMAID_VENDOR_DIR, MERMAID_SVG_CACHE_DIR, MERMAID_CONFIG, RESET_SESSION_ON_INIT, PROFILE_DIR
+    global _configured_app_dir
+    app_dir = Path(app_dir).resolve()
+    if _configured_app_dir is not None and _configured_app_dir != app_dir:
+        raise RuntimeError(f"dva_shared.common is already configured for {_configured_app_dir}; "
+                           "run each app in its own process")
+    _configured_app_dir = APP_DIR = app_dir
+    MERMAID_VENDOR_DIR = APP_DIR.parent / "vendor" / "mermaid"
+    MERMAID_SVG_CACHE_DIR = Path(os.getenv("MERMAID_SVG_CACHE_DIR", APP_DIR.parent / "mermaid_cache"))
+    PROFILE_DIR = Path(os.getenv("DVA_PROFILE_DIR", APP_DIR / "profiles"))
+    if mermaid_config is not None:
+        MERMAID_CONFIG = dict(mermaid_config)
+    RESET_SESSION_ON_INIT = reset_session_on_init
+    for cached in (_mermaid_runtime, _mermaid_host_html, _mermaid_config_hash, _predict_diagram_size,
+                   _render_mermaid_html, _publish_stylesheet):
+        cached.cache_clear()
+
+def initialize_mermaid() -> None:
+    """Start a new diagram run.
+
+    All diagrams on a page are rendered by one host component, emitted
+    together with the first diagram of each script run. Called from
+    initialize_session_state(); pages that skip that should call this
+    before their first diagram.
+
+    Also picks up the diagram heights the browser measured on earlier
+    renders (see _record_measured_heights).
+    """
+    st.session_state[_MERMAID_HOST_KEY] = False
+    try:
+        cookie = st.context.cookies.get(MERMAID_HEIGHTS_COOKIE)
+    except Exception:
+        cookie = None
+    if isinstance(cookie, str):
+        _record_measured_heights(cookie)
+
+def _record_measured_heights(cookie: str) -> None:
+    """Merge heights measured in the browser into the process-wide table.
+
+    The host stores ``<source hash>:<height>`` pairs in a cookie after each
+    diagram renders. Values are clamped, since they come from the client.
+    """
+    for entry in _parse_measured_heights(cookie):
+        digest, measured = entry
+        _measured_heights.pop(digest, None)
+        _measured_heights[digest] = measured
+    while len(_measured_heights) > MERMAID_MEASURED_HEIGHTS_SIZE:
+        _measured_heights.pop(next(iter(_measured_heights)))
+
+@functools.lru_cache(maxsize=64)
+def _parse_measured_heights(cookie: str) -> Tuple[Tuple[str, int], ...]:
+    entries = []
+    for item in cookie.split("."):
+        digest, _, value = item.partition(":")
+        if len(digest) == 16 and value.isdigit():
+            entries.append((digest, max(MERMAID_MIN_HEIGHT, min(MERMAID_MAX_HEIGHT, int(value)))))
+    return tuple(entries)
+
+def _flowchart_layout(lines: List[str], direction: str) -> Dict[str, int]:
+    """Count nodes, edges, ranks and subgraph nesting of a flowchart."""
+    edges = set()
+    nodes = set()
+    subgraphs = depth = max_depth = 0
+    for line in lines:
+        keyword = line.split()[0]
+        if keyword == "subgraph":
+            subgraphs += 1
+            depth += 1
+            max_depth = max(max_depth, depth)
+            continue
+        if keyword == "end":
+            depth = max(0, depth - 1)
+            continue
+        if keyword in ("direction", "style", "linkStyle", "click", "class", "classDef"):
+            continue
+        groups = []
+        for segment in _FLOW_EDGE.split(line):
+            ids = [m.group(1) for m in (_FLOW_NODE.match(part) for part in segment.split("&")) if m]
+            if ids:
+                groups.append(ids)
+                nodes.update(ids)
+        for sources, targets in zip(groups, groups[1:]):
+            edges.update((s, t) for s in sources for t in targets)
+
+    # Longest path gives the number of ranks along the flow direction
+    children: Dict[str, List[str]] = {}
+    for source, target in edges:
+        children.setdefault(source, []).append(target)
+    rank: Dict[str, int] = {}
+
+    def longest(node: str, visiting: frozenset) -> int:
+        if node in rank:
+            return rank[node]
+        depth_below = max((longest(child, visiting | {node})
+                           for child in children.get(node, []) if child not in visiting), default=0)
+        rank[node] = depth_below + 1
+        return rank[node]
+
+    for node in nodes:
+        longest(node, frozenset())
+    ranks = max(rank.values(), default=1)
+    breadth: Dict[int, int] = {}
+    for value in rank.values():
+        breadth[value] = breadth.get(value, 0) + 1
+
+    return {
+        "nodes": len(nodes),
+        "edges": len(edges),
+        "ranks": ranks,
+        "breadth": max(breadth.values(), default=1),
+        "subgraphs": subgraphs,
+        "subgraph_depth": max_depth,
+    }
+
+def _analyze_mermaid(code: str) -> Dict[str, Any]:
+    """Parse the parts of a Mermaid source that drive its rendered size.
+
+    Returns:
+        Dictionary with the diagram type, its direction and the counts
+        relevant to that type (nodes, ranks, subgraphs, participants, ...)
+    """
+    lines = [line.strip() for line in code.strip().split('\n')
+             if line.strip() and not line.strip().startswith('%%')]
+    if not lines:
+        return {"type": "unknown"}
+    header = lines[0].split()
+    diagram_type = header[0].lower()
+    body = lines[1:]
+
+    if diagram_type in ("graph", "flowchart"):
+        direction = header[1].upper() if len(header) > 1 else "TB"
+        return {"type": "flowchart", "direction": direction, **_flowchart_layout(body, direction)}
+    if diagram_type.startswith("statediagram"):
+        return {"type": "flowchart", "direction": "TB", **_flowchart_layout(body, "TB")}
+
+    if diagram_type == "sequencediagram":
+        participants = []
+        messages = notes = blocks = 0
+        for line in body:
+            keyword = line.split()[0].lower()
+            if keyword in ("participant", "actor"):
+                name = line.split(None, 1)[1].split(" as ")[0].strip()
+                if name not in participants:
+                    participants.append(name)
+            elif keyword == "note":
+                notes += 1
+            elif keyword in ("loop", "alt", "opt", "par", "critical", "break", "rect", "else", "and"):
+                blocks += 1
+            else:
+                match = _SEQUENCE_MESSAGE.match(line)
+                if match:
+                    messages += 1
+                    for name in (match.group(1).strip(), match.group(2).strip()):
+                        if name not in participants:
+                            participants.append(name)
+        return {"type": "sequence", "participants": len(participants),
+                "messages": messages, "notes": notes, "blocks": blocks}
+
+    if diagram_type == "gantt":
+        sections = sum(1 for line in body if line.startswith("section"))
+        tasks = sum(1 for line in body if ":" in line and line.split()[0] not in _GANTT_KEYWORDS)
+        return {"type": "gantt", "sections": sections, "tasks": tasks}
+
+    return {"type": diagram_type, "lines": len(body)}
+
+@functools.lru_cache(maxsize=MERMAID_HTML_CACHE_SIZE)
+def _predict_diagram_size(code: str) -> Tuple[int, int]:
+    """Predict the rendered (width, height) of a diagram from its source."""
+    info = _analyze_mermaid(code)
+    kind = info["type"]
+    if kind == "flowchart":
+        nesting = info["subgraph_depth"] * 50 + info["subgraphs"] * 20
+        if info["direction"] in ("LR", "RL"):
+            width = info["ranks"] * 180 + nesting
+            height = info["breadth"] * 75 + nesting + 40
+        else:
+            width = info["breadth"] * 180 + nesting
+            height = info["ranks"] * 95 + nesting + 40
+    elif kind == "sequence":
+        width = max(1, info["participants"]) * 160
+        height = 150 + info["messages"] * 45 + info["notes"] * 40 + info["blocks"] * 35
+    elif kind == "gantt":
+        width = 800
+        height = 90 + info["tasks"] * 28 + info["sections"] * 10
+    elif kind == "pie":
+        width, height = 600, 450
+    else:
+        width, height = 600, 150 + info.get("lines", 0) * 30
+
+    # Types drawn with useMaxWidth are scaled down to fit the column
+    config_key = {"flowchart": "flowchart", "sequence": "sequence", "gantt": "gantt"}.get(kind)
+    if config_key and MERMAID_CONFIG.get(config_key, {}).get("useMaxWidth") and width > MERMAID_COLUMN_WIDTH:
+        height = int(height * MERMAID_COLUMN_WIDTH / width)
+        width = MERMAID_COLUMN_WIDTH
+    return width, height
+
+def _estimate_diagram_height(mermaid_code: str) -> int:
+    """Estimate the rendered height of a diagram for auto-height containers.
+
+    Uses the height measured in the browser when this diagram has been
+    rendered before, otherwise the size predicted from its source.
+    """
+    measured = _measured_heights.get(_mermaid_source_hash(mermaid_code))
+    if measured:
+        return measured
+    height = _predict_diagram_size(mermaid_code)[1]
+    return max(MERMAID_MIN_HEIGHT, min(MERMAID_MAX_HEIGHT, height))
+
+@functools.lru_cache(maxsize=1)
+def _mermaid_runtime() -> Dict[str, str]:
+    """Locate the Mermaid bundle to load.
+    
+    The vendored bundle is copied into this app's static/ folder once per
+    process and served by Streamlit from app/static/. Without a vendored
+    copy the pinned CDN build is used. Either way the browser checks it
+    against the integrity hash.
+    
+    Returns:
+        Dictionary with the local URL (empty if not vendored), the CDN URL
+        and the integrity hash
+    """
+    runtime = {"local": "", "cdn": MERMAID_CDN_URL, "integrity": MERMAID_INTEGRITY}
+    try:
+        manifest = json.loads((MERMAID_VENDOR_DIR / "manifest.json").read_text())
+        target = APP_DIR / "static" / "mermaid" / manifest["file"]
+        if not target.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(MERMAID_VENDOR_DIR / manifest["file"], target)
+        runtime["local"] = f"app/static/mermaid/{manifest['file']}"
+        runtime["integrity"] = manifest["integrity"]
+        if manifest.get("version") != MERMAID_VERSION:
+            runtime["cdn"] = MERMAID_CDN_URL.replace(MERMAID_VERSION, manifest["version"])
+    except (OSError, ValueError, KeyError):
+        pass
+    return runtime
+
+@functools.lru_cache(maxsize=1)
+def _mermaid_host_html() -> str:
+    """Build the host component that installs the diagram renderer in the page.
+
+    The document is identical on every run, so Streamlit keeps the existing
+    iframe. The renderer itself lives in the parent page and survives reruns
+    and page switches; the iframe only installs it once per browser tab.
+    """
+    host_script = "\n".join([
+        "(function () {",
+        "if (window.__mermaidHost) return;",
+        "window.__mermaidHost = true;",
+        f"const MERMAID_RUNTIME = {json.dumps(_mermaid_runtime())};",
+        f"const MERMAID_CONFIG = {json.dumps(MERMAID_CONFIG)};",
+        f"const MERMAID_CSS = {json.dumps(_MERMAID_CSS)};",
+        "const MERMAID_HEIGHTS = " + json.dumps({
+            "cookie": MERMAID_HEIGHTS_COOKIE,
+            "entries": MERMAID_HEIGHTS_COOKIE_ENTRIES,
+            "min": MERMAID_MIN_HEIGHT,
+            "max": MERMAID_MAX_HEIGHT,
+        }) + ";",
+        _MERMAID_LOADER_JS,
+        _MERMAID_HOST_JS,
+        "})();",
+    ])
+    host_script_js = json.dumps(host_script).replace("</", "<\\/")
+    return f"""
+    <script>
+        (function () {{
+            const host = window.parent;
+            if (host.__mermaidHost) return;
+            const script = host.document.createElement('script');
+            script.textContent = {host_script_js};
+            host.document.head.appendChild(script);
+        }})();
+    </script>
+    """
+
+def _mermaid_source_hash(code: str) -> str:
+    """Content hash of a diagram source, for measured heights and the precompiled SVG cache.
+    
+    Must match source_hash() in scripts/precompile_mermaid.py.
+    """
+    return hashlib.sha256(code.strip().encode("utf-8")).hexdigest()[:16]
+
+@functools.lru_cache(maxsize=1)
+def _mermaid_config_hash() -> str:
+    """Hash of MERMAID_CONFIG, so SVGs precompiled with other settings are not used.
+    
+    Must match config_hash() in scripts/precompile_mermaid.py.
+    """
+    return hashlib.sha256(json.dumps(MERMAID_CONFIG, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+def _svg_cache_version() -> int:
+    """Change marker of the precompiled SVG cache; moves when SVGs are added or removed."""
+    try:
+        return MERMAID_SVG_CACHE_DIR.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+def _precompiled_svg(code: str) -> Optional[str]:
+    """Return the SVG rendered by scripts/precompile_mermaid.py with this app's settings, if any."""
+    try:
+        svg_file = MERMAID_SVG_CACHE_DIR / f"{_mermaid_config_hash()}-{_mermaid_source_hash(code)}.svg"
+        svg = svg_file.read_text(encoding="utf-8")
+    except OSError:
+        return None
+    start = svg.find("<svg")
+    return svg[start:] if start >= 0 else None
+
+def _generate_unique_id(code: str, key: Optional[str] = None, options: tuple = ()) -> str:
+    """Generate a deterministic ID for the mermaid diagram.
+
+    The ID depends only on the diagram source and render options, so an
+    unchanged diagram produces identical markup on every rerun and the
+    page keeps the already rendered diagram instead of drawing it again.
+    """
+    content_hash = hashlib.sha256(repr((code, options)).encode()).hexdigest()[:12]
+    if key:
+        return f"mermaid_{key}_{content_hash}"
+    return f"mermaid_{content_hash}"
+
+def mermaid(
+    code: str,
+    width: str = "auto",
+    height: str = "auto",
+    pan: bool = True,
+    zoom: bool = True,
+    show_controls: bool = True,
+    key: Optional[str] = None
+) -> None:
+    """Render a Mermaid diagram in Streamlit with configurable dimensions and interactive controls.
+
+    The diagram is written as a lightweight placeholder; a single host
+    component per page renders every placeholder once it becomes visible.
+
+    Args:
+        code: The Mermaid diagram code to render
+        width: Width of the container ("auto", "100%", "500px", etc.)
+        height: Height of the container ("auto", "100%", "400px", etc.)
+        pan: Enable panning functionality
+        zoom: Enable zoom functionality
+        show_controls: Show zoom control buttons
+        key: Optional unique key for the component
+    """
+    if not st.session_state.get(_MERMAID_HOST_KEY):
+        components.html(_mermaid_host_html(), height=0)
+        st.session_state[_MERMAID_HOST_KEY] = True
+
+    auto_height = _estimate_diagram_height(code) if height == "auto" else 0
+    st.markdown(
+        _render_mermaid_html(code, width, height, pan, zoom, show_controls, key, auto_height,
+                             _svg_cache_version()),
+        unsafe_allow_html=True
+    )
+
+
+@functools.lru_cache(maxsize=MERMAID_HTML_CACHE_SIZE)
+def _render_mermaid_html(
+    code: str,
+    width: str,
+    height: str,
+    pan: bool,
+    zoom: bool,
+    show_controls: bool,
+    key: Optional[str],
+    auto_height: int = 0,
+    svg_cache_version: int = 0
+) -> str:
+    """Build the placeholder markup for a diagram.
+
+    Cached by source, options and the state of the precompiled SVG cache,
+    so unchanged diagrams skip the string building on reruns and a diagram
+    precompiled after the app started is picked up. The diagram source, or the SVG precompiled by
+    scripts/precompile_mermaid.py, travels base64-encoded in a data
+    attribute and is drawn by the page's diagram host. The markup is kept
+    on a single line so Markdown passes it through as one HTML block.
+
+    Args:
+        auto_height: Estimated diagram height in pixels, used when height is "auto"
+        svg_cache_version: _svg_cache_version() at call time, part of the cache key only
+
+    Returns:
+        The placeholder HTML
+    """
+    # Generate unique ID
+    unique_id = _generate_unique_id(code, key, (width, height, pan, zoom, show_controls))
+
+    # Handle dimensions
+    container_width = width if width != "auto" else "100%"
+
+    # Calculate height; auto-height containers leave room for the padding
+    # and controls, and are refitted once the browser has measured the diagram
+    height_offset = 60 if show_controls else 40
+    if height == "auto":
+        container_height = f"{(auto_height or _estimate_diagram_height(code)) + height_offset}px"
+    else:
+        height_str = str(height)
+        if height_str.endswith('px'):
+            container_height = height_str
+        else:
+            try:
+                container_height = f"{int(height_str)}px"
+            except ValueError:
+                # Percentages have nothing to resolve against in the page flow
+                container_height = "400px"
+
+    # Precompiled diagrams only need to be inserted; the rest are rendered
+    # in the browser from their source
+    precompiled_svg = _precompiled_svg(code)
+    payload_kind = "svg" if precompiled_svg else "source"
+    payload = base64.b64encode((precompiled_svg or code.strip()).encode("utf-8")).decode("ascii")
+
+    controls = ""
+    if show_controls and zoom:
+        controls = (
+            '<div class="mermaid-controls">'
+            f'<button class="mermaid-zoom-btn" data-action="zoom-in" title="Zoom In">{_ZOOM_IN_ICON}</button>'
+            f'<button class="mermaid-zoom-btn" data-action="zoom-out" title="Zoom Out">{_ZOOM_OUT_ICON}</button>'
+            f'<button class="mermaid-zoom-btn" data-action="zoom-reset" title="Reset Zoom">{_ZOOM_RESET_ICON}</button>'
+            '<span class="mermaid-zoom-level">100%</span>'
+            '</div>'
+        )
+
+    container_style = f"overflow: {'auto' if pan else 'hidden'}; cursor: {'grab' if pan else 'default'};"
+    wrapper_style = html.escape(f"width: {container_width}; height: {container_height};")
+
+    auto_attrs = ""
+    if height == "auto":
+        auto_attrs = (
+            f'data-auto-height="true" data-height-offset="{height_offset}" '
+            f'data-source-hash="{_mermaid_source_hash(code)}" '
+        )
+
+    return (
+        f'<div class="mermaid-wrapper" data-diagram-id="{html.escape(unique_id)}" data-{payload_kind}="{payload}" '
+        f'{auto_attrs}data-zoom="{str(zoom).lower()}" data-pan="{str(pan).lower()}" style="{wrapper_style}">'
+        f'{controls}'
+        f'<div class="mermaid-container" style="{container_style}">'
+        '<div class="mermaid-content"><div class="mermaid-diagram"></div></div>'
+        '</div></div>'
+    )
+
+
+
+
+def reset_session():
+    """Reset the session state, keeping the login and the keys declared persistent"""
+    persistent = session_lifecycle.persistent_keys()
+    for key in list(st.session_state.keys()):
+        if key not in persistent and not key.startswith(_TAB_ROUTER_PREFIX):
+            del st.session_state[key]
+    session_lifecycle.drop_session_resources()
+    
+def render_sidebar():
+    """Render the sidebar with session information and reset button"""
+    st.markdown("#### 🔑 Session Info")
+    if 'auth_code' not in st.session_state:
+        st.caption(f"**Session ID:** {st.session_state.session_id[:8]}")
+    else:
+        st.caption(f"**Session ID:** {st.session_state['auth_code'][:8]}")
+
+    if st.button("🔄 Reset Session", use_container_width=True):
+        reset_session()
+        st.success("Session has been reset successfully!")
+        st.rerun()  # Force a rerun to refresh the page
+
+    if profiling_mode():
+        _render_profile_panel()
+
+def initialize_session_state():
+    """Initialize session state variables if they don't exist."""
+    page = Path(sys._getframe(1).f_code.co_filename).name
+    if session_lifecycle.on_rerun(page) and RESET_SESSION_ON_INIT:
+        reset_session()
+    
+    if "session_id" not in st.session_state:
+        st.session_state.session_id = str(uuid.uuid4())[:8]
+    
+    if "start_time" not in st.session_state:
+        st.session_state.start_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    initialize_mermaid()
+
+
+def _section_slug(label: str) -> str:
+    """URL-friendly form of a tab label, e.g. "⚡ AWS Compute Offerings" -> "aws-compute-offerings"."""
+    return re.sub(r"[^a-z0-9]+", "-", label.lower()).strip("-")
+
+def tab_router(sections: Dict[str, Callable[[], None]], key: str = "tab") -> str:
+    """Render a tab bar that runs only the selected section.
+
+    Replacement for st.tabs() when each tab body is a function. st.tabs()
+    executes every tab on each rerun; here only the selected section's
+    function runs, so a widget change in one tab no longer re-renders the
+    others. The selection is kept in session state and mirrored to the
+    ``?<key>=`` query parameter, so links can open a specific section.
+
+    Widgets in sections that are not shown are not rendered, so their
+    values reset when the user switches away and back.
+
+    Args:
+        sections: Tab labels mapped to the functions rendering them
+        key: Session state key and query parameter for the selection;
+            must be unique per router on a page
+
+    Returns:
+        The label of the selected section
+    """
+    labels = list(sections)
+    slugs = {_section_slug(label): label for label in labels}
+    state_key = f"{_TAB_ROUTER_PREFIX}{key}"
+    last_key = f"{state_key}_last"
+
+    if st.session_state.get(state_key) not in sections:
+        linked = slugs.get(st.query_params.get(key, ""))
+        st.session_state[state_key] = linked or st.session_state.get(last_key) or labels[0]
+    st.session_state[last_key] = st.session_state[state_key]
+
+    def keep_selection() -> None:
+        # Clicking the active segment clears it; keep showing that section
+        if st.session_state[state_key] is None:
+            st.session_state[state_key] = st.session_state[last_key]
+
+    if hasattr(st, "segmented_control"):
+        st.segmented_control("Section", labels, key=state_key, on_change=keep_selection,
+                             label_visibility="collapsed")
+    else:
+        st.radio("Section", labels, key=state_key, horizontal=True, label_visibility="collapsed")
+
+    selected = st.session_state[state_key] or st.session_state[last_key]
+    slug = _section_slug(selected)
+    if st.query_params.get(key) != slug:
+        st.query_params[key] = slug
+
+    sections[selected]()
+    return selected
+
+
+def fragment(func: Optional[Callable] = None, *, run_every: Optional[Any] = None) -> Callable:
+    """Run a calculator or simulator as a partial-rerun fragment.
+
+    Changing a widget inside the decorated function reruns only that
+    function, not the whole page, so the tab router, diagrams and the rest
+    of the section stay as they are. Use it on a function that owns both
+    its inputs and the outputs computed from them; anything it writes to
+    session state is seen by the rest of the page on the next full rerun.
+
+    Falls back to st.experimental_fragment on older Streamlit releases and
+    to a plain call when neither is available. The function is wrapped with
+    profiled(), so calculators show up in the profiling panel.
+
+    Args:
+        func: Function rendering the calculator; the decorator may also be
+            used as ``@fragment(run_every=...)``
+        run_every: Optional interval for rerunning the fragment on its own
+
+    Returns:
+        The wrapped function
+    """
+    decorator = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+
+    def wrap(f: Callable) -> Callable:
+        f = profiled(f)
+        if decorator is None:
+            return f
+        return decorator(f, run_every=run_every) if run_every is not None else decorator(f)
+
+    return wrap(func) if func is not None else wrap
+
+
+# def reset_session():
+#     """Reset all session state variables."""
+    
+#     # Keep only the session ID but generate a new one
+#     st.session_state.session_id = str(uuid.uuid4())[:8]
+#     st.session_state.start_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    
+#     # Reset all game scores and submissions
+#     for i in range(1, 9):  # 8 games
+#         st.session_state[f"game{i}_score"] = 0
+#         st.session_state[f"game{i}_submitted"] = [False] * 5
+
+def show_tip(tip_text):
+    """Display a formatted tip box with the provided text."""
+    
+    st.markdown(f"""
+    <div class="tip-box">
+        <strong>💡 Learning Tip:</strong> {tip_text}
+    </div>
+    """, unsafe_allow_html=True)
+
+       
+_lazy_imports: List[Dict[str, Any]] = []
+_lazy_imports_lock = threading.Lock()
+
+def _load_lazy(name: str, caller: Optional[types.FrameType]) -> types.ModuleType:
+    """Import a deferred module and record how long it took and who asked for it."""
+    already_loaded = name in sys.modules
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    elapsed = time.perf_counter() - start
+    with _lazy_imports_lock:
+        if not any(entry["module"] == name for entry in _lazy_imports):
+            _lazy_imports.append({
+                "module": name,
+                "seconds": 0.0 if already_loaded else elapsed,
+                "page": Path(caller.f_code.co_filename).name if caller else "",
+                "function": caller.f_code.co_name if caller else "",
+            })
+    return module
+
+class _LazyModule(types.ModuleType):
+    """Stand-in for a module that is imported on first attribute access."""
+
+    def __getattr__(self, attr: str) -> Any:
+        module = _load_lazy(self.__name__, sys._getframe(1))
+        # Later lookups find the attributes directly and skip __getattr__
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+class _LazyAttribute:
+    """Stand-in for a class or function of a deferred module, resolved on first use."""
+
+    def __init__(self, module: str, attribute: str):
+        self._module = module
+        self._attribute = attribute
+        self._target = None
+
+    def _resolve(self, caller: Optional[types.FrameType]) -> Any:
+        if self._target is None:
+            self._target = getattr(_load_lazy(self._module, caller), self._attribute)
+        return self._target
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._resolve(sys._getframe(1))(*args, **kwargs)
+
+    def __getattr__(self, attr: str) -> Any:
+        if attr.startswith("_"):
+            raise AttributeError(attr)
+        return getattr(self._resolve(sys._getframe(1)), attr)
+
+def lazy_import(name: str, attribute: Optional[str] = None) -> Any:
+    """Defer importing a heavy module until a page first uses it.
+
+    Replaces ``import plotly.express as px`` at the top of a page with
+    ``px = common.lazy_import("plotly.express")``: the module is imported
+    the first time one of its attributes is used, so a cold page load only
+    pays for the libraries the selected tab needs. Modules that are already
+    imported are returned as they are.
+
+    With ``attribute``, stands in for ``from <name> import <attribute>``;
+    the proxy can be called and its attributes read, but it is not the
+    class itself, so use the real import where the name is subclassed or
+    passed to isinstance().
+
+    Each deferred import is recorded with its duration and the page and
+    function that triggered it; see lazy_import_report().
+
+    Args:
+        name: Dotted module name
+        attribute: Optional class or function to take from the module
+
+    Returns:
+        The module, a lazy stand-in for it, or a lazy stand-in for the attribute
+    """
+    if attribute is not None:
+        return _LazyAttribute(name, attribute)
+    return sys.modules.get(name) or _LazyModule(name)
+
+def lazy_import_report() -> List[Dict[str, Any]]:
+    """Deferred imports loaded by this process so far, in load order.
+
+    Returns:
+        One entry per module with its import time in seconds (0 if another
+        import had already loaded it) and the page file and function that
+        first used it
+    """
+    with _lazy_imports_lock:
+        return [dict(entry) for entry in _lazy_imports]
+
+session_lifecycle.declare_session_key(_PROFILE_RUNS_KEY, persist=True)
+
+_profile_local = threading.local()
+_profile_hooks_lock = threading.Lock()
+_profile_hooks: Dict[str, bool] = {}
+
+def profiling_mode() -> str:
+    """Profiling mode for this rerun, from DVA_PROFILE or the ?profile= query parameter.
+
+    Returns:
+        "" when profiling is off, "cprofile" when a pstats dump is wanted,
+        "timing" for any other value
+    """
+    value = os.getenv(PROFILE_ENV_VAR) or st.query_params.get(PROFILE_QUERY_PARAM, "")
+    value = value.strip().lower()
+    if value in ("", "0", "off", "false", "no"):
+        return ""
+    return "cprofile" if value == "cprofile" else "timing"
+
+def _install_profile_hooks() -> None:
+    """Count Streamlit deltas and AWS API calls made while a rerun is profiled.
+
+    The hooks only count on the thread running a profiled rerun and are
+    installed the first time profiling is used. botocore is hooked once a
+    page has imported it.
+    """
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    with _profile_hooks_lock:
+        ctx = get_script_run_ctx()
+        if ctx is not None and "elements" not in _profile_hooks:
+            context_class = type(ctx)
+            enqueue = context_class.enqueue
+
+            def counted_enqueue(self, msg):
+                run = getattr(_profile_local, "run", None)
+                if run is not None and msg.WhichOneof("type") == "delta":
+                    run["elements"] += 1
+                return enqueue(self, msg)
+
+            context_class.enqueue = counted_enqueue
+            _profile_hooks["elements"] = True
+
+        botocore_client = sys.modules.get("botocore.client")
+        if botocore_client is not None and "aws_calls" not in _profile_hooks:
+            make_api_call = botocore_client.BaseClient._make_api_call
+
+            def counted_api_call(self, operation_name, api_params):
+                run = getattr(_profile_local, "run", None)
+                if run is not None:
+                    run["aws_calls"] += 1
+                return make_api_call(self, operation_name, api_params)
+
+            botocore_client.BaseClient._make_api_call = counted_api_call
+            _profile_hooks["aws_calls"] = True
+
+def _profile_call(run: Dict[str, Any], name: str, func: Callable, args: tuple, kwargs: Dict[str, Any]) -> Any:
+    """Call a profiled function and add its time, elements and AWS calls to the rerun."""
+    row = run["rows"].get(name)
+    if row is None:
+        row = run["rows"][name] = {"function": name, "calls": 0, "seconds": 0.0, "elements": 0, "aws_calls": 0}
+    elements, aws_calls = run["elements"], run["aws_calls"]
+    start = time.perf_counter()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        row["calls"] += 1
+        row["seconds"] += time.perf_counter() - start
+        row["elements"] += run["elements"] - elements
+        row["aws_calls"] += run["aws_calls"] - aws_calls
+
+def _dump_profile(profiler: cProfile.Profile, func: Callable, name: str) -> Dict[str, str]:
+    """Write a rerun's cProfile data to PROFILE_DIR and summarize its hottest calls."""
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).strip_dirs().sort_stats("cumulative").print_stats(PROFILE_TOP_CALLS)
+    result = {"pstats": stream.getvalue().strip(), "dump": ""}
+    page = Path(func.__code__.co_filename).stem if hasattr(func, "__code__") else "page"
+    try:
+        PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+        path = PROFILE_DIR / f"{page}.{datetime.now():%Y%m%d-%H%M%S-%f}.{name}.pstats"
+        profiler.dump_stats(str(path))
+        result["dump"] = str(path)
+        dumps = sorted(PROFILE_DIR.glob("*.pstats"), key=lambda dump: dump.stat().st_mtime)
+        for old in dumps[:-PROFILE_DUMPS_KEPT]:
+            old.unlink(missing_ok=True)
+    except OSError:
+        pass
+    return result
+
+def _profile_run(mode: str, name: str, func: Callable, args: tuple, kwargs: Dict[str, Any]) -> Any:
+    """Profile one rerun, entered through the outermost profiled function."""
+    _install_profile_hooks()
+    run: Dict[str, Any] = {"function": name, "started": datetime.now().strftime("%H:%M:%S"),
+                           "elements": 0, "aws_calls": 0, "rows": {}}
+    profiler = cProfile.Profile() if mode == "cprofile" else None
+    if profiler is not None:
+        try:
+            profiler.enable()
+        except ValueError:  # another profiler is already active
+            profiler = None
+    _profile_local.run = run
+    start = time.perf_counter()
+    try:
+        return _profile_call(run, name, func, args, kwargs)
+    finally:
+        _profile_local.run = None
+        run["seconds"] = time.perf_counter() - start
+        if profiler is not None:
+            profiler.disable()
+            run.update(_dump_profile(profiler, func, name))
+        run["rows"] = sorted(run["rows"].values(), key=lambda row: row["seconds"], reverse=True)
+        runs = st.session_state.setdefault(_PROFILE_RUNS_KEY, [])
+        runs.append(run)
+        del runs[:-PROFILE_HISTORY]
+
+def profiled(func: Callable) -> Callable:
+    """Time a page function when profiling is on.
+
+    Decorate a page's main() and its *_tab() functions with it. When
+    DVA_PROFILE is set or the page is opened with ``?profile=1``, each call
+    is timed and the Streamlit elements it emits and the AWS API calls it
+    makes are counted; the outermost profiled call of a rerun (main(), or a
+    fragment on a partial rerun) records the breakdown in session state,
+    and render_sidebar() shows the last reruns below the session info. With
+    ``cprofile`` as the value, each rerun is also run under cProfile and
+    its pstats dump written to PROFILE_DIR.
+
+    When profiling is off the function is called as is.
+
+    Args:
+        func: Page function to profile
+
+    Returns:
+        The wrapped function
+    """
+    name = func.__qualname__.replace(".<locals>", "")
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        run = getattr(_profile_local, "run", None)
+        if run is not None:
+            return _profile_call(run, name, func, args, kwargs)
+        mode = profiling_mode()
+        if not mode:
+            return func(*args, **kwargs)
+        return _profile_run(mode, name, func, args, kwargs)
+
+    return wrapper
+
+def _render_profile_panel() -> None:
+    """Show the last profiled reruns in the sidebar (see profiled())."""
+    st.markdown("#### ⏱️ Rerun Profile")
+    runs = st.session_state.get(_PROFILE_RUNS_KEY)
+    if not runs:
+        st.caption("Timings appear here after the first profiled rerun.")
+        return
+
+    last = runs[-1]
+    st.caption(f"**Last rerun** ({last['function']}, {last['started']}): {last['seconds'] * 1000:.0f} ms, "
+               f"{last['elements']} elements, {last['aws_calls']} AWS calls")
+    st.dataframe([{"Function": row["function"], "Calls": row["calls"], "ms": round(row["seconds"] * 1000, 1),
+                   "Elements": row["elements"], "AWS calls": row["aws_calls"]} for row in last["rows"]],
+                 hide_index=True)
+
+    with st.expander("Recent reruns"):
+        st.dataframe([{"At": run["started"], "Entry": run["function"], "ms": round(run["seconds"] * 1000, 1),
+                       "Elements": run["elements"], "AWS calls": run["aws_calls"]} for run in reversed(runs)],
+                     hide_index=True)
+    if last.get("pstats"):
+        with st.expander("cProfile"):
+            if last["dump"]:
+                st.caption(f"Saved to {last['dump']}")
+            st.code(last["pstats"], language=None)
+    with st.expander("Session memory"):
+        st.dataframe([{"Session": entry["session"], "Page": entry["page"], "Idle s": entry["idle_seconds"],
+                       "Keys": entry["keys"], "KiB": entry["state_kib"], "Resources": ", ".join(entry["resources"])}
+                      for entry in session_memory_report()], hide_index=True)
+    aws_calls = aws_client_stats()
+    if aws_calls:
+        with st.expander("AWS clients"):
+            st.dataframe([{"Service": entry["service"], "Region": entry["region"], "Operation": entry["operation"],
+                           "Calls": entry["calls"], "Errors": entry["errors"], "Retries": entry["retries"],
+                           "Mean ms": entry["mean_ms"]} for entry in aws_calls], hide_index=True)
+    deferred = lazy_import_report()
+    if deferred:
+        with st.expander("Deferred imports"):
+            st.dataframe([{"Module": entry["module"], "ms": round(entry["seconds"] * 1000, 1),
+                           "First used by": f"{entry['page']}:{entry['function']}"} for entry in deferred],
+                         hide_index=True)
+
+_figure_cache: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+_figure_cache_bytes = 0
+_figure_cache_lock = threading.Lock()
+
+def _figure_key(func: Callable, args: tuple, kwargs: Dict[str, Any]) -> Optional[str]:
+    """Hash a figure builder and its arguments; None if an argument can't be pickled."""
+    try:
+        payload = pickle.dumps((args, sorted(kwargs.items())), protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None
+    digest = hashlib.sha256(f"{func.__code__.co_filename}:{func.__qualname__}".encode("utf-8"))
+    digest.update(payload)
+    return digest.hexdigest()
+
+@functools.lru_cache(maxsize=1)
+def _frozen_figure_class() -> type:
+    """Figure subclass holding a prebuilt dict; plotly is only imported on first use."""
+    import plotly.graph_objects as go
+
+    class FrozenFigure(go.Figure):
+        """Display-only figure that hands Streamlit its stored dict as is."""
+
+        def __init__(self, spec: Dict[str, Any]):
+            super().__init__()
+            self._frozen_spec = spec
+
+        def to_dict(self) -> Dict[str, Any]:
+            return self._frozen_spec
+
+        def to_plotly_json(self) -> Dict[str, Any]:
+            return self._frozen_spec
+
+    return FrozenFigure
+
+def _estimate_spec_bytes(value: Any) -> int:
+    """Approximate size of a figure dict without serializing it.
+
+    Arrays count their buffer, lists of scalars their length times the size
+    of the first item and strings their length; nested containers are walked.
+    """
+    if isinstance(value, dict):
+        return sum(len(str(name)) + _estimate_spec_bytes(item) for name, item in value.items())
+    if isinstance(value, (list, tuple)):
+        if not value:
+            return 2
+        if isinstance(value[0], (dict, list, tuple)):
+            return sum(_estimate_spec_bytes(item) for item in value)
+        return len(value) * _estimate_spec_bytes(value[0])
+    if isinstance(value, str):
+        return len(value) + 2
+    # numpy arrays and scalars
+    return int(getattr(value, "nbytes", 8))
+
+def _freeze_figure(figure: Any) -> Tuple[Any, int]:
+    """Turn a built figure into a shareable display-only copy and its approximate size."""
+    spec = figure.to_dict()
+    return _frozen_figure_class()(spec), _estimate_spec_bytes(spec)
+
+def cached_figure(func: Callable) -> Callable:
+    """Memoize a Plotly figure builder on a hash of its arguments.
+
+    The first call with a given set of arguments builds the figure and
+    converts it to its plain dict form once; later calls, from any session,
+    return the stored copy without running the builder, so Plotly skips
+    trace construction, validation and the figure-to-dict walk. Entries are
+    evicted least-recently-used once FIGURE_CACHE_ENTRIES figures or
+    about FIGURE_CACHE_BYTES of figure data are held. Calls whose arguments can't
+    be pickled are not cached.
+
+    The returned figure is for display only: pass it to st.plotly_chart()
+    and do not modify it. Builders must be pure functions of their
+    arguments.
+
+    Args:
+        func: Function returning a plotly Figure
+
+    Returns:
+        The memoized builder
+    """
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        global _figure_cache_bytes
+        key = _figure_key(func, args, kwargs)
+        if key is not None:
+            with _figure_cache_lock:
+                entry = _figure_cache.get(key)
+                if entry is not None:
+                    _figure_cache.move_to_end(key)
+                    return entry[0]
+        entry = _freeze_figure(func(*args, **kwargs))
+        if key is None:
+            return entry[0]
+        with _figure_cache_lock:
+            if key not in _figure_cache:
+                _figure_cache[key] = entry
+                _figure_cache_bytes += entry[1]
+            while _figure_cache and (len(_figure_cache) > FIGURE_CACHE_ENTRIES
+                                     or _figure_cache_bytes > FIGURE_CACHE_BYTES):
+                _, (_, size) = _figure_cache.popitem(last=False)
+                _figure_cache_bytes -= size
+        return entry[0]
+
+    return wrapper
+
+@functools.lru_cache(maxsize=STYLESHEET_CACHE_SIZE)
+def _publish_stylesheet(css: str) -> str:
+    """Write a stylesheet to this app's static/css/ folder and return its URL.
+
+    The file is named after a hash of its content, so pages with the same
+    CSS share one cached file and a changed stylesheet gets a new URL that
+    no browser holds a stale copy of. Files are written once per process.
+    Streamlit serves app/static/ files with their guessed content type
+    (text/css) only from 1.56, hence the minimum version in requirements.txt.
+    """
+    file_name = f"{hashlib.sha256(css.encode('utf-8')).hexdigest()[:16]}.css"
+    target = APP_DIR / "static" / "css" / file_name
+    if not target.exists():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_suffix(f".{uuid.uuid4().hex[:8]}.tmp")
+        tmp.write_text(css, encoding="utf-8")
+        tmp.replace(target)
+    return f"app/static/css/{file_name}"
+
+def stylesheet(css: str) -> None:
+    """Apply a block of CSS through a cached static stylesheet.
+
+    Instead of sending the whole <style> block on every rerun, the CSS is
+    published once as app/static/css/<hash>.css and the page only gets a
+    one-line <link> element. The element is identical on each run,
+    so the browser fetches the file once and keeps it across reruns.
+    Falls back to an inline <style> block if the file cannot be written.
+
+    Args:
+        css: CSS rules, without <style> tags
+    """
+    css = textwrap.dedent(css).strip() + "\n"
+    try:
+        href = _publish_stylesheet(css)
+    except OSError:
+        st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
+        return
+    st.markdown(f'<link rel="stylesheet" href="{href}">', unsafe_allow_html=True)
+
+def apply_styles():
+    """Apply custom styling to the Streamlit app."""
+    
+    # AWS color scheme
+    aws_orange = "#FF9900"
+    aws_dark = "#232F3E"
+    aws_blue = "#1A73E8"
+    aws_background = "#FFFFFF"
+    
+    # CSS for styling
+    stylesheet(f"""
+        .main-header {{
+            font-size: 2.5rem;
+            font-weight: bold;
+            color: #FF9900;
+            margin-bottom: 1rem;
+        }}
+        .sub-header {{
+            font-size: 1.8rem;
+            font-weight: bold;
+            color: #232F3E;
+            margin-top: 1rem;
+            margin-bottom: 0.5rem;
+        }}
+        .section-header {{
+            font-size: 1.5rem;
+            font-weight: bold;
+            color: #232F3E;
+            margin-top: 0.8rem;
+            margin-bottom: 0.3rem;
+        }}
+        .info-box {{
+            background-color: #F0F2F6;
+            border-radius: 10px;
+            padding: 20px;
+            margin-bottom: 20px;
+        }}
+        .success-box {{
+            background-color: #D1FAE5;
+            border-radius: 10px;
+            padding: 20px;
+            margin-bottom: 20px;
+        }}
+        .warning-box {{
+            background-color: #FEF3C7;
+            border-radius: 10px;
+            padding: 20px;
+            margin-bottom: 20px;
+        }}
+        .tip-box {{
+            background-color: #E0F2FE;
+            border-radius: 10px;
+            padding: 20px;
+            margin-bottom: 20px;
+            border-left: 5px solid #0EA5E9;
+        }}
+        .step-box {{
+            background-color: #FFFFFF;
+            border-radius: 5px;
+            padding: 15px;
+            margin-bottom: 15px;
+            border: 1px solid #E5E7EB;
+            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
+        }}
+        .card {{
+            border-radius: 10px;
+            padding: 20px;
+            margin-bottom: 20px;
+            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+            background-color: white;
+            transition: transform 0.3s;
+        }}
+        .card:hover {{
+            transform: translateY(-5px);
+        }}
+        .aws-orange {{
+            color: #FF9900;
+        }}
+        .aws-blue {{
+            color: #232F3E;
+        }}
+        hr {{
+            margin-top: 1.5rem;
+            margin-bottom: 1.5rem;
+        }}
+        /* Make the tab content container take full height */
+        .stTabs [data-baseweb="tab-list"] {{
+            gap: 8px;
+        }}
+        .stTabs [data-baseweb="tab"] {{
+            height: 50px;
+            white-space: pre-wrap;
+            background-color: #F8F9FA;
+            border-radius: 4px 4px 0px 0px;
+            gap: 1px;
+            padding-left: 16px;
+            padding-right: 16px;
+        }}
+        .stTabs [aria-selected="true"] {{
+            background-color: #FF9900 !important;
+            color: white !important;
+        }}
+        .definition {{
+            background-color: #EFF6FF;
+            border-left: 5px solid #3B82F6;
+            padding: 10px 15px;
+            margin: 15px 0;
+            border-radius: 0 5px 5px 0;
+        }}
+        .code-box {{
+            background-color: #F8F9FA;
+            padding: 15px;
+            border-radius: 5px;
+            font-family: monospace;
+            margin: 15px 0;
+            border: 1px solid #E5E7EB;
+        }}
+        .stButton>button {{
+            background-color: #FF9900;
+            color: white;
+        }}
+        .stButton>button:hover {{
+            background-color: #FFAC31;
+        }}    
+        .stApp {{
+            color: {aws_dark};
+            background-color: {aws_background};
+            font-family: 'Amazon Ember', Arial, sans-serif;
+        }}
+        
+        
+        /* Success styling */
+        .correct-answer {{
+            background-color: #D4EDDA;
+            color: #155724;
+            padding: 10px;
+            border-radius: 5px;
+            margin: 10px 0;
+        }}
+        
+        /* Error styling */
+        .incorrect-answer {{
+            background-color: #F8D7DA;
+            color: #721C24;
+            padding: 10px;
+            border-radius: 5px;
+            margin: 10px 0;
+        }}
+        
+        /* Custom card styling */
+        .game-card {{
+            border: 1px solid #ddd;
+            padding: 20px;
+            border-radius: 10px;
+            margin: 10px 0;
+            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
+        }}
+        
+        /* Progress bar styling */
+        .stProgress > div > div > div {{
+            background-color: {aws_orange};
+        }}
+        
+        /* Tip box styling */
+        .tip-box {{
+            background-color: #E7F3FE;
+            border-left: 6px solid {aws_blue};
+            padding: 10px;
+            border-radius: 4px;
+            margin: 10px 0;
+        }}
+        
+        /* Make images responsive */
+        img {{
+            max-width: 100%;
+            height: auto;
+        }}
+        
+        /* Score display */
+        .score-display {{
+            font-size: 1.2rem;
+            font-weight: bold;
+            padding: 10px;
+            border-radius: 5px;
+            text-align: center;
+            margin: 15px 0;
+            background-color: #F1F8FF;
+        }}
+    """)
+
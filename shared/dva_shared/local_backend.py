@@ -0,0 +1,254 @@
+"""
+Local stand-ins for AWS and Redis, for offline development and load tests.
+
+Set DVA_AWS_BACKEND=local and every client from aws_clients calls a local
+AWS emulator instead of AWS, with dummy credentials:
+
+    - with DVA_LOCAL_ENDPOINT_URL set, the emulator already running there
+      (scripts/local_aws.py, moto_server or LocalStack), shared by every app
+    - otherwise an in-process moto server, started on the first client and
+      seeded then; each app process gets its own
+
+The emulator runs as account LOCAL_ACCOUNT_ID, the account in the queue
+URLs, topic ARNs and bucket names the pages default to, so those work
+unchanged. seed() creates the queues, topics, event bus, buckets, tables,
+log groups and secret listed in LOCAL_RESOURCES.
+
+redis_client() is the matching Redis: DVA_LOCAL_REDIS_URL, or an in-process
+fakeredis server.
+
+Bedrock has no local emulator; pages calling it still fail offline.
+
+Needs the "local" extra of the shared package (moto[server], fakeredis).
+
+Functions:
+    - enabled: Whether the apps use the local backend
+    - endpoint_url: URL of the local AWS emulator, starting it if needed
+    - credentials: Dummy credentials accepted by the emulator
+    - seed: Create the resources the pages expect
+    - redis_client: Client for the local Redis
+"""
+
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+AWS_BACKEND = os.getenv("DVA_AWS_BACKEND", "aws").lower()
+LOCAL_ENDPOINT_URL = os.getenv("DVA_LOCAL_ENDPOINT_URL", "")
+LOCAL_REDIS_URL = os.getenv("DVA_LOCAL_REDIS_URL", "")
+
+# Account of the hard-coded queue URLs, topic ARNs and bucket names
+LOCAL_ACCOUNT_ID = "875692608981"
+
+# What the pages expect to find, by region
+LOCAL_RESOURCES: Dict[str, Dict[str, Any]] = {
+    "ap-southeast-1": {
+        # SQS page: main queue with its dead-letter queue
+        "queues": {
+            "dev-dlq": {},
+            "dev-main-queue": {"dead_letter_queue": "dev-dlq", "max_receive_count": 3},
+            # SNS page: one queue per subscriber
+            "dev-subscriber-1-queue": {},
+            "dev-subscriber-2-queue": {},
+            "dev-subscriber-3-queue": {},
+        },
+        "topics": {
+            "dev-message-topic": ["dev-subscriber-1-queue", "dev-subscriber-2-queue", "dev-subscriber-3-queue"],
+        },
+        # EventBridge page
+        "event_buses": ["ecommerce-order-bus"],
+        "log_groups": [
+            "/aws/lambda/InventoryProcessorFunction",
+            "/aws/lambda/EmailProcessorFunction",
+            "/aws/lambda/PaymentProcessorFunction",
+            "smart-image-resizer",
+        ],
+        # Image resizing page
+        "buckets": [f"demo-{LOCAL_ACCOUNT_ID}"],
+    },
+    "us-east-1": {
+        # DynamoDB chatbot
+        "tables": {"SessionTable": "SessionId"},
+        # Cognito settings read by the login; localhost skips the login
+        "secrets": {
+            "apcr/dva/secrets": {
+                "COGNITO_DOMAIN": "local.auth.localhost",
+                "COGNITO_USER_POOL_ID": "local_pool",
+                "COGNITO_APP_CLIENT_ID": "local-client",
+                "COGNITO_APP_CLIENT_SECRET": "local-secret",
+                "COGNITO_REDIRECT_URI_1": "http://localhost:8501",
+            },
+        },
+    },
+}
+
+_server = None
+_server_url = ""
+_redis = None
+_lock = threading.Lock()
+
+
+def enabled() -> bool:
+    """Whether DVA_AWS_BACKEND selects the local backend."""
+    return AWS_BACKEND == "local"
+
+
+def credentials() -> Dict[str, str]:
+    """Dummy credentials for the emulator, as boto3 client keyword arguments."""
+    return {"aws_access_key_id": "testing", "aws_secret_access_key": "testing"}
+
+
+def _start_server() -> str:
+    """Start an in-process moto server on a free port, seed it and return its URL."""
+    global _server
+    os.environ.setdefault("MOTO_ACCOUNT_ID", LOCAL_ACCOUNT_ID)
+    from moto.server import ThreadedMotoServer
+
+    # The emulator logs every request it serves
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+    _server = ThreadedMotoServer(ip_address="127.0.0.1", port=0, verbose=False)
+    _server.start()
+    host, port = _server.get_host_and_port()
+    url = f"http://{host}:{port}"
+    created = seed(url)
+    logger.info(f"Local AWS emulator running at {url}, created {len(created)} resources")
+    return url
+
+
+def endpoint_url() -> Optional[str]:
+    """URL of the local AWS emulator, or None when the apps use AWS.
+
+    Starts and seeds the in-process emulator on first use when
+    DVA_LOCAL_ENDPOINT_URL is not set.
+    """
+    global _server_url
+    if not enabled():
+        return None
+    if LOCAL_ENDPOINT_URL:
+        return LOCAL_ENDPOINT_URL
+    if not _server_url:
+        with _lock:
+            if not _server_url:
+                _server_url = _start_server()
+    return _server_url
+
+
+def seed(url: str) -> List[str]:
+    """Create the resources in LOCAL_RESOURCES on an emulator.
+
+    Safe to run again: existing resources are left as they are.
+
+    Args:
+        url: Endpoint of the emulator
+
+    Returns:
+        Names of the resources created or confirmed
+    """
+    from botocore.exceptions import ClientError
+
+    from .aws_clients import aws_client
+
+    def client(service: str, region: str) -> Any:
+        return aws_client(service, region_name=region, endpoint_url=url, **credentials())
+
+    done = []
+    for region, resources in LOCAL_RESOURCES.items():
+        sqs = client("sqs", region)
+        queue_arns = {}
+        for name, options in resources.get("queues", {}).items():
+            attributes = {}
+            if options.get("dead_letter_queue"):
+                attributes["RedrivePolicy"] = json.dumps({
+                    "deadLetterTargetArn": queue_arns[options["dead_letter_queue"]],
+                    "maxReceiveCount": str(options["max_receive_count"]),
+                })
+            queue_url = sqs.create_queue(QueueName=name, Attributes=attributes)["QueueUrl"]
+            queue_arns[name] = sqs.get_queue_attributes(
+                QueueUrl=queue_url, AttributeNames=["QueueArn"])["Attributes"]["QueueArn"]
+            done.append(f"sqs:{name}")
+
+        sns = client("sns", region)
+        for name, subscribers in resources.get("topics", {}).items():
+            topic_arn = sns.create_topic(Name=name)["TopicArn"]
+            subscribed = {subscription["Endpoint"] for subscription in
+                          sns.list_subscriptions_by_topic(TopicArn=topic_arn)["Subscriptions"]}
+            for queue in subscribers:
+                if queue_arns[queue] not in subscribed:
+                    sns.subscribe(TopicArn=topic_arn, Protocol="sqs", Endpoint=queue_arns[queue])
+            done.append(f"sns:{name}")
+
+        events = client("events", region)
+        for name in resources.get("event_buses", []):
+            try:
+                events.create_event_bus(Name=name)
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "ResourceAlreadyExistsException":
+                    raise
+            done.append(f"events:{name}")
+
+        logs = client("logs", region)
+        for name in resources.get("log_groups", []):
+            try:
+                logs.create_log_group(logGroupName=name)
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "ResourceAlreadyExistsException":
+                    raise
+            done.append(f"logs:{name}")
+
+        s3 = client("s3", region)
+        for name in resources.get("buckets", []):
+            try:
+                s3.create_bucket(Bucket=name, **({} if region == "us-east-1" else {
+                    "CreateBucketConfiguration": {"LocationConstraint": region}}))
+            except ClientError as e:
+                if e.response["Error"]["Code"] not in ("BucketAlreadyOwnedByYou", "BucketAlreadyExists"):
+                    raise
+            done.append(f"s3:{name}")
+
+        dynamodb = client("dynamodb", region)
+        for name, key in resources.get("tables", {}).items():
+            try:
+                dynamodb.create_table(
+                    TableName=name,
+                    KeySchema=[{"AttributeName": key, "KeyType": "HASH"}],
+                    AttributeDefinitions=[{"AttributeName": key, "AttributeType": "S"}],
+                    BillingMode="PAY_PER_REQUEST",
+                )
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "ResourceInUseException":
+                    raise
+            done.append(f"dynamodb:{name}")
+
+        secrets = client("secretsmanager", region)
+        for name, value in resources.get("secrets", {}).items():
+            try:
+                secrets.create_secret(Name=name, SecretString=json.dumps(value))
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "ResourceExistsException":
+                    raise
+            done.append(f"secretsmanager:{name}")
+    return done
+
+
+def redis_client() -> Any:
+    """Client for the local Redis, shared by the whole process.
+
+    Connects to DVA_LOCAL_REDIS_URL when set, otherwise to an in-process
+    fakeredis server. Responses are decoded to str.
+    """
+    global _redis
+    with _lock:
+        if _redis is None:
+            if LOCAL_REDIS_URL:
+                import redis
+
+                _redis = redis.Redis.from_url(LOCAL_REDIS_URL, decode_responses=True)
+            else:
+                import fakeredis
+
+                _redis = fakeredis.FakeRedis(server=fakeredis.FakeServer(), decode_responses=True)
+    return _redis
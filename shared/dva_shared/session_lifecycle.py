@@ -0,0 +1,279 @@
+"""
+Lifecycle of the per-learner session state.
+
+Pages declare how their session keys behave instead of every app sharing
+one hard-coded list:
+
+    - persistent keys survive reset_session() (the login, tab selections,
+      anything a page declares with persist=True)
+    - capped keys hold lists, or dicts of lists, that keep only their newest
+      max_items entries (BoundedList), so message logs and chat transcripts
+      stop growing with the session
+    - session resources (service objects, clients and other heavy objects)
+      are kept per session outside st.session_state and dropped once the
+      session has been idle for SESSION_IDLE_SECONDS; the next rerun
+      builds them again
+
+Each rerun registers the session here (see on_rerun(), called from
+common.initialize_session_state()), which also applies the caps, measures
+the session state now and then, and evicts idle sessions' resources.
+session_memory_report() lists what every session in the process holds.
+
+Classes:
+    - BoundedList: List that drops its oldest entries beyond a size cap
+
+Functions:
+    - declare_session_key: Declare a key persistent and/or capped
+    - persistent_keys: Keys reset_session() keeps
+    - session_resource: Per-session heavy object, built on first use
+    - drop_session_resources: Forget a session's resources
+    - on_rerun: Register a rerun and apply the declared policies
+    - session_memory_report: Per-session state size and resources
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+import streamlit as st
+
+# Sessions that have not rerun for this long lose their session resources
+SESSION_IDLE_SECONDS = int(os.getenv("DVA_SESSION_IDLE_SECONDS", str(30 * 60)))
+# How often idle sessions are looked for, and how often a session's state is measured
+SWEEP_INTERVAL = 60
+MEASURE_INTERVAL = 30
+# Objects visited when measuring one session's state
+MEASURE_MAX_OBJECTS = 50_000
+
+# Login state kept by reset_session()
+LOGIN_KEYS = {"authenticated", "user_cognito_groups", "auth_code", "user_info",
+              "auth_session_id", "auth_access_expires_at"}
+
+# Session state key holding the page of the session's last rerun
+PAGE_KEY = "_lifecycle_page"
+
+_policies: Dict[str, Dict[str, Any]] = {}
+_sessions: Dict[str, Dict[str, Any]] = {}
+_resources: Dict[str, Dict[str, Any]] = {}
+_lock = threading.Lock()
+_last_sweep = 0.0
+
+
+class BoundedList(list):
+    """List that keeps only its newest ``max_items`` entries.
+
+    Appending past the cap drops entries from the front, like a ring buffer,
+    while slicing, iteration, remove() and the other list operations keep
+    working as pages expect.
+    """
+
+    # Unpickling appends the items before the instance attributes are restored
+    max_items: Optional[int] = None
+
+    def __init__(self, items: Iterable[Any] = (), max_items: int = 100):
+        super().__init__(items)
+        self.max_items = max_items
+        self._trim()
+
+    def _trim(self) -> None:
+        if self.max_items is not None and len(self) > self.max_items:
+            del self[:len(self) - self.max_items]
+
+    def append(self, item: Any) -> None:
+        super().append(item)
+        self._trim()
+
+    def extend(self, items: Iterable[Any]) -> None:
+        super().extend(items)
+        self._trim()
+
+    def insert(self, index: int, item: Any) -> None:
+        super().insert(index, item)
+        self._trim()
+
+    def __iadd__(self, items: Iterable[Any]) -> "BoundedList":
+        self.extend(items)
+        return self
+
+
+def _bounded(value: Any, max_items: int) -> Any:
+    """Cap a list, or each list in a dict, returning the value to store."""
+    if isinstance(value, list) and not (isinstance(value, BoundedList) and value.max_items == max_items):
+        return BoundedList(value, max_items)
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if isinstance(item, list):
+                value[key] = _bounded(item, max_items)
+    return value
+
+
+def _apply_cap(key: str, max_items: int) -> None:
+    if key in st.session_state:
+        value = st.session_state[key]
+        bounded = _bounded(value, max_items)
+        if bounded is not value:
+            st.session_state[key] = bounded
+
+
+def declare_session_key(key: str, *, persist: bool = False, max_items: Optional[int] = None) -> None:
+    """Declare how a session state key is kept.
+
+    Call at module level in the page that owns the key. Declaring again
+    replaces the earlier declaration.
+
+    Args:
+        key: Session state key
+        persist: Keep the key when reset_session() clears the session
+        max_items: Keep only the newest entries of the list stored under
+            the key (or of each list in a dict stored under it)
+    """
+    with _lock:
+        _policies[key] = {"persist": persist, "max_items": max_items}
+    if max_items is not None:
+        _apply_cap(key, max_items)
+
+
+def persistent_keys() -> Set[str]:
+    """Keys reset_session() keeps: the login and every key declared with persist=True."""
+    with _lock:
+        declared = {key for key, policy in _policies.items() if policy["persist"]}
+    return LOGIN_KEYS | declared | {PAGE_KEY}
+
+
+def _session_id() -> str:
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else "bare"
+
+
+def session_resource(key: str, factory: Callable[[], Any]) -> Any:
+    """Return a heavy per-session object, building it on first use.
+
+    Use for service objects and clients a page keeps per learner. Unlike
+    st.session_state, the object is dropped once the session has been idle
+    for SESSION_IDLE_SECONDS, and rebuilt by the next call.
+
+    Args:
+        key: Name of the resource within the session
+        factory: Builds the object; called outside the registry lock
+
+    Returns:
+        The session's object
+    """
+    session_id = _session_id()
+    with _lock:
+        resources = _resources.get(session_id)
+        if resources is not None and key in resources:
+            return resources[key]
+    value = factory()
+    with _lock:
+        return _resources.setdefault(session_id, {}).setdefault(key, value)
+
+
+def drop_session_resources(session_id: Optional[str] = None) -> None:
+    """Forget the resources of a session (the current one by default)."""
+    with _lock:
+        _resources.pop(session_id or _session_id(), None)
+
+
+def _approx_size(value: Any, seen: Set[int], budget: List[int]) -> int:
+    """Approximate deep size of a value, following containers only.
+
+    Objects such as DataFrames report their own deep size; clients and
+    other objects are counted shallowly, as most of what they reference is
+    shared by every session.
+    """
+    if id(value) in seen or budget[0] <= 0:
+        return 0
+    seen.add(id(value))
+    budget[0] -= 1
+    size = sys.getsizeof(value, 0)
+    if isinstance(value, dict):
+        size += sum(_approx_size(k, seen, budget) + _approx_size(v, seen, budget) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset, deque)):
+        size += sum(_approx_size(item, seen, budget) for item in value)
+    return size
+
+
+def _measure_state() -> Dict[str, Any]:
+    seen: Set[int] = set()
+    budget = [MEASURE_MAX_OBJECTS]
+    keys = list(st.session_state.keys())
+    return {"keys": len(keys), "bytes": sum(_approx_size(st.session_state[key], seen, budget) for key in keys)}
+
+
+def _sweep(now: float) -> None:
+    """Drop the resources and records of sessions idle for SESSION_IDLE_SECONDS."""
+    with _lock:
+        idle = [session_id for session_id, info in _sessions.items()
+                if now - info["last_seen"] > SESSION_IDLE_SECONDS]
+        for session_id in idle:
+            _sessions.pop(session_id, None)
+            _resources.pop(session_id, None)
+        for session_id in [session_id for session_id in _resources if session_id not in _sessions]:
+            del _resources[session_id]
+
+
+def on_rerun(page: str) -> bool:
+    """Register a rerun of the current session and apply the declared policies.
+
+    Caps the declared keys, measures the session state every
+    MEASURE_INTERVAL seconds and evicts idle sessions every SWEEP_INTERVAL.
+
+    Args:
+        page: File name of the page being run
+
+    Returns:
+        True if the session's previous rerun was on another page
+    """
+    global _last_sweep
+    now = time.monotonic()
+    session_id = _session_id()
+    with _lock:
+        info = _sessions.setdefault(session_id, {"keys": 0, "bytes": 0, "measured": 0.0})
+        info.update(page=page, last_seen=now)
+        measure = now - info["measured"] > MEASURE_INTERVAL
+        sweep = now - _last_sweep > SWEEP_INTERVAL
+        if sweep:
+            _last_sweep = now
+        caps = [(key, policy["max_items"]) for key, policy in _policies.items() if policy["max_items"]]
+
+    for key, max_items in caps:
+        _apply_cap(key, max_items)
+    if measure:
+        measured = _measure_state()
+        if measured["keys"]:  # a new session has nothing to measure yet
+            info.update(measured, measured=now)
+    if sweep:
+        _sweep(now)
+
+    previous = st.session_state.get(PAGE_KEY)
+    st.session_state[PAGE_KEY] = page
+    return previous is not None and previous != page
+
+
+def session_memory_report() -> List[Dict[str, Any]]:
+    """What each session in this process holds, largest first.
+
+    Sizes are approximate and measured at most every MEASURE_INTERVAL
+    seconds, on the session's own reruns.
+
+    Returns:
+        One entry per session with its ID prefix, current page, idle
+        seconds, session state keys and KiB, and resource names
+    """
+    now = time.monotonic()
+    with _lock:
+        report = [{
+            "session": session_id[:8],
+            "page": info.get("page", ""),
+            "idle_seconds": round(now - info["last_seen"]),
+            "keys": info["keys"],
+            "state_kib": round(info["bytes"] / 1024, 1),
+            "resources": sorted(_resources.get(session_id, {})),
+        } for session_id, info in _sessions.items()]
+    return sorted(report, key=lambda entry: entry["state_kib"], reverse=True)
@@ -0,0 +1,143 @@
+"""
+Server-side store for authenticated sessions.
+
+Holds the Cognito token set for a signed-in browser so reconnects and page
+switches can resume the session without repeating the OAuth flow. Records
+live in an in-process LRU by default, or in Redis when AUTH_SESSION_REDIS_URL
+is set so several app processes can share them.
+
+Classes:
+    - MemorySessionStore: Thread-safe in-process LRU with per-record expiry
+    - RedisSessionStore: Redis-backed store shared between processes
+
+Functions:
+    - get_session_store: Return the process-wide store
+    - new_session_id: Generate a random session ID
+    - sign_session_id: Append an HMAC signature to a session ID
+    - unsign_session_id: Validate a signed session token
+"""
+
+import hashlib
+import hmac
+import json
+import logging
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+SESSION_TTL = int(os.getenv("AUTH_SESSION_TTL", str(12 * 3600)))
+SESSION_MAX_ENTRIES = int(os.getenv("AUTH_SESSION_MAX_ENTRIES", "1000"))
+SESSION_REDIS_URL = os.getenv("AUTH_SESSION_REDIS_URL", "")
+SESSION_REDIS_PREFIX = os.getenv("AUTH_SESSION_REDIS_PREFIX", "dva:session:")
+
+
+class MemorySessionStore:
+    """In-process LRU of session records with per-record expiry."""
+
+    shared = False
+
+    def __init__(self, max_entries: int = SESSION_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._records: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            item = self._records.get(session_id)
+            if item is None:
+                return None
+            if item["expires_at"] <= time.time():
+                del self._records[session_id]
+                return None
+            self._records.move_to_end(session_id)
+            return dict(item["record"])
+
+    def put(self, session_id: str, record: Dict[str, Any], ttl: int = SESSION_TTL) -> None:
+        with self._lock:
+            self._records[session_id] = {"record": dict(record), "expires_at": time.time() + ttl}
+            self._records.move_to_end(session_id)
+            while len(self._records) > self.max_entries:
+                self._records.popitem(last=False)
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            self._records.pop(session_id, None)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+
+class RedisSessionStore:
+    """Session records stored in Redis, shared by every app process."""
+
+    shared = True
+
+    def __init__(self, url: str, prefix: str = SESSION_REDIS_PREFIX):
+        import redis
+
+        self.prefix = prefix
+        self._client = redis.Redis.from_url(url, socket_timeout=2, socket_connect_timeout=2)
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        raw = self._client.get(self.prefix + session_id)
+        return json.loads(raw) if raw else None
+
+    def put(self, session_id: str, record: Dict[str, Any], ttl: int = SESSION_TTL) -> None:
+        self._client.setex(self.prefix + session_id, ttl, json.dumps(record))
+
+    def delete(self, session_id: str) -> None:
+        self._client.delete(self.prefix + session_id)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_session_store():
+    """
+    Return the process-wide session store.
+
+    Uses Redis when AUTH_SESSION_REDIS_URL is set and the redis package is
+    installed, otherwise an in-memory LRU.
+    """
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                if SESSION_REDIS_URL:
+                    try:
+                        _store = RedisSessionStore(SESSION_REDIS_URL)
+                    except ImportError:
+                        logger.warning("redis package not installed, using in-memory session store")
+                if _store is None:
+                    _store = MemorySessionStore()
+    return _store
+
+
+def new_session_id() -> str:
+    """Generate a random, URL-safe session ID."""
+    return secrets.token_urlsafe(32)
+
+
+def _signature(session_id: str, key: str) -> str:
+    return hmac.new(key.encode("utf-8"), session_id.encode("utf-8"), hashlib.sha256).hexdigest()[:32]
+
+
+def sign_session_id(session_id: str, key: str) -> str:
+    """Return ``<session_id>.<signature>`` for use in the session cookie."""
+    return f"{session_id}.{_signature(session_id, key)}"
+
+
+def unsign_session_id(token: str, key: str) -> Optional[str]:
+    """Return the session ID from a signed token, or None if the signature is invalid."""
+    if not isinstance(token, str):
+        return None
+    session_id, _, signature = token.rpartition(".")
+    if not session_id or not hmac.compare_digest(signature, _signature(session_id, key)):
+        return None
+    return session_id